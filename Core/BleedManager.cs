@@ -18,6 +18,7 @@ namespace DOT.Core
         private readonly List<BleedEffect> _effectsToRemove = new List<BleedEffect>(8);
         private readonly List<int> _creatureIds = new List<int>(32); // For safe iteration
         private float _lastStatusLogTime = 0f;
+        private float _damageThisTick; // Summed by ApplyBleedDamage for PerformanceMetrics
         private const float STATUS_LOG_INTERVAL = 5f; // Log status every 5s when effects are active
 
         // Fire DOT status effect constants
@@ -55,6 +56,11 @@ namespace DOT.Core
                 if (_activeEffects.Count == 0)
                     return;
 
+                var metrics = PerformanceMetrics.Instance;
+                metrics.StartTickProcessing();
+                _damageThisTick = 0f;
+                int activeEffectCount = 0;
+
                 float deltaTime = Time.unscaledDeltaTime;
                 bool debugLogging = DOTModOptions.DebugLogging; // Cache for this frame
 
@@ -134,6 +140,8 @@ namespace DOT.Core
                         }
                     }
 
+                    activeEffectCount += effects.Count;
+
                     // Mark creature for removal if no effects remain
                     if (effects.Count == 0)
                     {
@@ -147,6 +155,8 @@ namespace DOT.Core
                     _activeEffects.Remove(_creaturesToRemove[i]);
                 }
 
+                metrics.EndTickProcessing(activeEffectCount, _activeEffects.Count, _damageThisTick);
+
                 // Periodic status logging
                 if (debugLogging && _activeEffects.Count > 0)
                 {
@@ -329,6 +339,7 @@ namespace DOT.Core
 
                 healthBefore = target.currentHealth;
                 float newHealth = healthBefore - damage;
+                _damageThisTick += damage;
                 
                 // Check if this will kill the creature
                 if (newHealth <= 0f)
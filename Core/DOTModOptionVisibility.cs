@@ -1,5 +1,4 @@
 using System;
-using System.Collections.Generic;
 using System.Reflection;
 using DOT.Configuration;
 using ThunderRoad;
@@ -19,10 +18,8 @@ namespace DOT.Core
         private DOTModOptions.FrequencyPreset? _lastFrequencyPreset;
         private DOTModOptions.ChancePreset? _lastChancePreset;
 
-        private readonly Dictionary<string, ModOption> _modOptionsByKey =
-            new Dictionary<string, ModOption>(StringComparer.Ordinal);
-
-        private const string OptionKeySeparator = "||";
+        // Menu option per OptionGraph slot, resolved once when the mod data is available
+        private readonly ModOption[] _slotOptions = new ModOption[OptionGraph.SlotCount];
 
         private static readonly BodyZone[] AllZones =
         {
@@ -30,54 +27,6 @@ namespace DOT.Core
             BodyZone.Arm, BodyZone.Leg, BodyZone.Dismemberment
         };
 
-        // Option key mappings for Chance
-        private static readonly Dictionary<BodyZone, string> ChanceKeys = new Dictionary<BodyZone, string>
-        {
-            { BodyZone.Throat, MakeKey(DOTModOptions.CategoryZoneThroat, DOTModOptions.OptionThroatChance) },
-            { BodyZone.Head, MakeKey(DOTModOptions.CategoryZoneHead, DOTModOptions.OptionHeadChance) },
-            { BodyZone.Neck, MakeKey(DOTModOptions.CategoryZoneNeck, DOTModOptions.OptionNeckChance) },
-            { BodyZone.Torso, MakeKey(DOTModOptions.CategoryZoneTorso, DOTModOptions.OptionTorsoChance) },
-            { BodyZone.Arm, MakeKey(DOTModOptions.CategoryZoneArm, DOTModOptions.OptionArmChance) },
-            { BodyZone.Leg, MakeKey(DOTModOptions.CategoryZoneLeg, DOTModOptions.OptionLegChance) },
-            { BodyZone.Dismemberment, MakeKey(DOTModOptions.CategoryZoneDismemberment, DOTModOptions.OptionDismembermentChance) }
-        };
-
-        // Option key mappings for Damage
-        private static readonly Dictionary<BodyZone, string> DamageKeys = new Dictionary<BodyZone, string>
-        {
-            { BodyZone.Throat, MakeKey(DOTModOptions.CategoryZoneThroat, DOTModOptions.OptionThroatDamage) },
-            { BodyZone.Head, MakeKey(DOTModOptions.CategoryZoneHead, DOTModOptions.OptionHeadDamage) },
-            { BodyZone.Neck, MakeKey(DOTModOptions.CategoryZoneNeck, DOTModOptions.OptionNeckDamage) },
-            { BodyZone.Torso, MakeKey(DOTModOptions.CategoryZoneTorso, DOTModOptions.OptionTorsoDamage) },
-            { BodyZone.Arm, MakeKey(DOTModOptions.CategoryZoneArm, DOTModOptions.OptionArmDamage) },
-            { BodyZone.Leg, MakeKey(DOTModOptions.CategoryZoneLeg, DOTModOptions.OptionLegDamage) },
-            { BodyZone.Dismemberment, MakeKey(DOTModOptions.CategoryZoneDismemberment, DOTModOptions.OptionDismembermentDamage) }
-        };
-
-        // Option key mappings for Duration
-        private static readonly Dictionary<BodyZone, string> DurationKeys = new Dictionary<BodyZone, string>
-        {
-            { BodyZone.Throat, MakeKey(DOTModOptions.CategoryZoneThroat, DOTModOptions.OptionThroatDuration) },
-            { BodyZone.Head, MakeKey(DOTModOptions.CategoryZoneHead, DOTModOptions.OptionHeadDuration) },
-            { BodyZone.Neck, MakeKey(DOTModOptions.CategoryZoneNeck, DOTModOptions.OptionNeckDuration) },
-            { BodyZone.Torso, MakeKey(DOTModOptions.CategoryZoneTorso, DOTModOptions.OptionTorsoDuration) },
-            { BodyZone.Arm, MakeKey(DOTModOptions.CategoryZoneArm, DOTModOptions.OptionArmDuration) },
-            { BodyZone.Leg, MakeKey(DOTModOptions.CategoryZoneLeg, DOTModOptions.OptionLegDuration) },
-            { BodyZone.Dismemberment, MakeKey(DOTModOptions.CategoryZoneDismemberment, DOTModOptions.OptionDismembermentDuration) }
-        };
-
-        // Option key mappings for Frequency
-        private static readonly Dictionary<BodyZone, string> FrequencyKeys = new Dictionary<BodyZone, string>
-        {
-            { BodyZone.Throat, MakeKey(DOTModOptions.CategoryZoneThroat, DOTModOptions.OptionThroatFrequency) },
-            { BodyZone.Head, MakeKey(DOTModOptions.CategoryZoneHead, DOTModOptions.OptionHeadFrequency) },
-            { BodyZone.Neck, MakeKey(DOTModOptions.CategoryZoneNeck, DOTModOptions.OptionNeckFrequency) },
-            { BodyZone.Torso, MakeKey(DOTModOptions.CategoryZoneTorso, DOTModOptions.OptionTorsoFrequency) },
-            { BodyZone.Arm, MakeKey(DOTModOptions.CategoryZoneArm, DOTModOptions.OptionArmFrequency) },
-            { BodyZone.Leg, MakeKey(DOTModOptions.CategoryZoneLeg, DOTModOptions.OptionLegFrequency) },
-            { BodyZone.Dismemberment, MakeKey(DOTModOptions.CategoryZoneDismemberment, DOTModOptions.OptionDismembermentFrequency) }
-        };
-
         public void Initialize()
         {
             _initialized = false;
@@ -86,7 +35,7 @@ namespace DOT.Core
             _lastDurationPreset = null;
             _lastFrequencyPreset = null;
             _lastChancePreset = null;
-            _modOptionsByKey.Clear();
+            Array.Clear(_slotOptions, 0, _slotOptions.Length);
 
             TryInitialize();
             if (_initialized)
@@ -98,7 +47,7 @@ namespace DOT.Core
         public void Shutdown()
         {
             _initialized = false;
-            _modOptionsByKey.Clear();
+            Array.Clear(_slotOptions, 0, _slotOptions.Length);
             _instance = null;
         }
 
@@ -125,11 +74,19 @@ namespace DOT.Core
             if (_modData?.modOptions == null || _modData.modOptions.Count == 0)
                 return;
 
-            // Cache all mod options by key
+            // Resolve the preset-driven options once; preset changes then index straight into _slotOptions
             foreach (var option in _modData.modOptions)
             {
                 if (option == null || string.IsNullOrEmpty(option.name)) continue;
-                _modOptionsByKey[MakeKey(option.category, option.name)] = option;
+                for (int slot = 0; slot < OptionGraph.SlotCount; slot++)
+                {
+                    if (option.name == OptionGraph.SlotNames[slot] &&
+                        (option.category ?? "") == OptionGraph.SlotCategories[slot])
+                    {
+                        _slotOptions[slot] = option;
+                        break;
+                    }
+                }
             }
 
             _initialized = true;
@@ -155,7 +112,7 @@ namespace DOT.Core
             {
                 float value = GetPresetDamageValue(zone, preset);
                 DOTModOptions.SetZoneDamage(zone, value);
-                SyncOption(DamageKeys[zone], value);
+                SyncOption(OptionGraph.Damage, zone, (int)preset);
             }
 
             _lastDamagePreset = preset;
@@ -173,7 +130,7 @@ namespace DOT.Core
             {
                 float value = GetPresetDurationValue(zone, preset);
                 DOTModOptions.SetZoneDuration(zone, value);
-                SyncOption(DurationKeys[zone], value);
+                SyncOption(OptionGraph.Duration, zone, (int)preset);
             }
 
             _lastDurationPreset = preset;
@@ -192,7 +149,7 @@ namespace DOT.Core
             {
                 float value = GetPresetFrequencyValue(zone, preset);
                 DOTModOptions.SetZoneFrequency(zone, value);
-                SyncOption(FrequencyKeys[zone], value);
+                SyncOption(OptionGraph.Frequency, zone, (int)preset);
             }
 
             _lastFrequencyPreset = preset;
@@ -210,7 +167,7 @@ namespace DOT.Core
             {
                 float value = GetPresetChanceValue(zone, preset);
                 DOTModOptions.SetZoneChance(zone, value);
-                SyncOption(ChanceKeys[zone], value);
+                SyncOption(OptionGraph.Chance, zone, (int)preset);
             }
 
             _lastChancePreset = preset;
@@ -218,350 +175,57 @@ namespace DOT.Core
 
         #region UI Sync
 
-        private static string MakeKey(string category, string name)
+        private void SyncOption(int slider, BodyZone zone, int presetIndex)
         {
-            return (category ?? "") + OptionKeySeparator + (name ?? "");
-        }
+            int slot = OptionGraph.Slot(slider, zone);
+            if (slot < 0)
+                return;
+            var option = _slotOptions[slot];
+            if (option == null)
+                return;
 
-        private void SyncOption(string key, float value)
-        {
-            if (!_modOptionsByKey.TryGetValue(key, out var option))
+            if ((uint)presetIndex >= PresetTables.PresetCount)
+                presetIndex = PresetTables.DefaultPresetIndex;
+            // Precomputed by _agent/gen_option_graph.py; -1 when the preset value is not on the slider
+            int index = OptionGraph.ParameterIndex[slot * PresetTables.PresetCount + presetIndex];
+            if (index < 0 || option.currentValueIndex == index)
                 return;
 
             // Load parameter values if not already loaded
             if (option.parameterValues == null || option.parameterValues.Length == 0)
                 option.LoadModOptionParameters();
+            if (option.parameterValues == null || index >= option.parameterValues.Length)
+                return;
 
-            // Find the index that matches this value
-            int index = FindParameterIndex(option.parameterValues, value);
-            if (index >= 0 && option.currentValueIndex != index)
-            {
-                option.Apply(index);
-                option.RefreshUI();
-            }
-        }
-
-        private static int FindParameterIndex(ModOptionParameter[] parameters, float value)
-        {
-            if (parameters == null) return -1;
-            for (int i = 0; i < parameters.Length; i++)
-            {
-                var pv = parameters[i]?.value;
-                if ((pv is float fv && Mathf.Abs(fv - value) < 0.0001f) ||
-                    (pv is double dv && Mathf.Abs((float)dv - value) < 0.0001f) ||
-                    (pv is int iv && Mathf.Abs(iv - value) < 0.0001f))
-                    return i;
-            }
-            return -1;
+            option.Apply(index);
+            option.RefreshUI();
         }
 
         #endregion
 
         #region Preset Value Tables
 
-        // ========== DAMAGE PRESET VALUES ==========
-        // 5 presets: Minimal (0), Low (1), Default (2), High (3), Extreme (4)
-        // Each zone has specific values per preset
+        // Values live in PresetTables.g.cs, generated from _agent/preset_tables.py
+        // by _agent/gen_preset_tables.py. Out-of-range presets fall back to Default.
 
         public static float GetPresetDamageValue(BodyZone zone, DOTModOptions.DamagePreset preset)
         {
-            switch (zone)
-            {
-                case BodyZone.Throat:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 0.5f;
-                        case DOTModOptions.DamagePreset.Low: return 1.25f;
-                        case DOTModOptions.DamagePreset.Default: return 2.5f;
-                        case DOTModOptions.DamagePreset.High: return 5.0f;
-                        case DOTModOptions.DamagePreset.Extreme: return 10.0f;
-                        default: return 2.5f;
-                    }
-                case BodyZone.Head:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 0.25f;
-                        case DOTModOptions.DamagePreset.Low: return 0.75f;
-                        case DOTModOptions.DamagePreset.Default: return 1.5f;
-                        case DOTModOptions.DamagePreset.High: return 3.0f;
-                        case DOTModOptions.DamagePreset.Extreme: return 6.0f;
-                        default: return 1.5f;
-                    }
-                case BodyZone.Neck:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 0.5f;
-                        case DOTModOptions.DamagePreset.Low: return 1.0f;
-                        case DOTModOptions.DamagePreset.Default: return 2.0f;
-                        case DOTModOptions.DamagePreset.High: return 4.0f;
-                        case DOTModOptions.DamagePreset.Extreme: return 8.0f;
-                        default: return 2.0f;
-                    }
-                case BodyZone.Torso:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 0.25f;
-                        case DOTModOptions.DamagePreset.Low: return 0.5f;
-                        case DOTModOptions.DamagePreset.Default: return 1.0f;
-                        case DOTModOptions.DamagePreset.High: return 2.0f;
-                        case DOTModOptions.DamagePreset.Extreme: return 4.0f;
-                        default: return 1.0f;
-                    }
-                case BodyZone.Arm:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 0.25f;
-                        case DOTModOptions.DamagePreset.Low: return 0.25f;
-                        case DOTModOptions.DamagePreset.Default: return 0.5f;
-                        case DOTModOptions.DamagePreset.High: return 1.0f;
-                        case DOTModOptions.DamagePreset.Extreme: return 2.0f;
-                        default: return 0.5f;
-                    }
-                case BodyZone.Leg:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 0.25f;
-                        case DOTModOptions.DamagePreset.Low: return 0.5f;
-                        case DOTModOptions.DamagePreset.Default: return 0.75f;
-                        case DOTModOptions.DamagePreset.High: return 1.5f;
-                        case DOTModOptions.DamagePreset.Extreme: return 3.0f;
-                        default: return 0.75f;
-                    }
-                case BodyZone.Dismemberment:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DamagePreset.Minimal: return 1.0f;
-                        case DOTModOptions.DamagePreset.Low: return 2.0f;
-                        case DOTModOptions.DamagePreset.Default: return 3.0f;
-                        case DOTModOptions.DamagePreset.High: return 6.0f;
-                        case DOTModOptions.DamagePreset.Extreme: return 12.0f;
-                        default: return 3.0f;
-                    }
-                default:
-                    return 1.0f;
-            }
+            return PresetTables.Lookup(PresetTables.Damage, zone, (int)preset);
         }
 
-        // ========== DURATION PRESET VALUES ==========
-        // 5 presets: VeryShort (0), Short (1), Default (2), Long (3), Extended (4)
-
         public static float GetPresetDurationValue(BodyZone zone, DOTModOptions.DurationPreset preset)
         {
-            switch (zone)
-            {
-                case BodyZone.Throat:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 2.0f;
-                        case DOTModOptions.DurationPreset.Short: return 4.0f;
-                        case DOTModOptions.DurationPreset.Default: return 6.0f;
-                        case DOTModOptions.DurationPreset.Long: return 10.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 15.0f;
-                        default: return 6.0f;
-                    }
-                case BodyZone.Head:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 1.5f;
-                        case DOTModOptions.DurationPreset.Short: return 3.0f;
-                        case DOTModOptions.DurationPreset.Default: return 5.0f;
-                        case DOTModOptions.DurationPreset.Long: return 8.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 12.0f;
-                        default: return 5.0f;
-                    }
-                case BodyZone.Neck:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 2.0f;
-                        case DOTModOptions.DurationPreset.Short: return 3.5f;
-                        case DOTModOptions.DurationPreset.Default: return 5.5f;
-                        case DOTModOptions.DurationPreset.Long: return 9.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 14.0f;
-                        default: return 5.5f;
-                    }
-                case BodyZone.Torso:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 1.5f;
-                        case DOTModOptions.DurationPreset.Short: return 2.5f;
-                        case DOTModOptions.DurationPreset.Default: return 4.0f;
-                        case DOTModOptions.DurationPreset.Long: return 7.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 10.0f;
-                        default: return 4.0f;
-                    }
-                case BodyZone.Arm:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 1.0f;
-                        case DOTModOptions.DurationPreset.Short: return 2.0f;
-                        case DOTModOptions.DurationPreset.Default: return 3.0f;
-                        case DOTModOptions.DurationPreset.Long: return 5.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 8.0f;
-                        default: return 3.0f;
-                    }
-                case BodyZone.Leg:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 1.0f;
-                        case DOTModOptions.DurationPreset.Short: return 2.5f;
-                        case DOTModOptions.DurationPreset.Default: return 3.5f;
-                        case DOTModOptions.DurationPreset.Long: return 6.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 9.0f;
-                        default: return 3.5f;
-                    }
-                case BodyZone.Dismemberment:
-                    switch (preset)
-                    {
-                        case DOTModOptions.DurationPreset.VeryShort: return 3.0f;
-                        case DOTModOptions.DurationPreset.Short: return 5.0f;
-                        case DOTModOptions.DurationPreset.Default: return 8.0f;
-                        case DOTModOptions.DurationPreset.Long: return 12.0f;
-                        case DOTModOptions.DurationPreset.Extended: return 20.0f;
-                        default: return 8.0f;
-                    }
-                default:
-                    return 4.0f;
-            }
+            return PresetTables.Lookup(PresetTables.Duration, zone, (int)preset);
         }
 
-        // ========== FREQUENCY PRESET VALUES ==========
-        // 5 presets: VerySlow (0), Slow (1), Default (2), Fast (3), Rapid (4)
-        // Returns tick interval in seconds per zone
-
         public static float GetPresetFrequencyValue(BodyZone zone, DOTModOptions.FrequencyPreset preset)
         {
-            switch (zone)
-            {
-                case BodyZone.Throat:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 2.0f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 1.0f;
-                        case DOTModOptions.FrequencyPreset.Default: return 0.5f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.3f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.1f;
-                        default: return 0.5f;
-                    }
-                case BodyZone.Head:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 2.5f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 1.2f;
-                        case DOTModOptions.FrequencyPreset.Default: return 0.6f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.3f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.1f;
-                        default: return 0.6f;
-                    }
-                case BodyZone.Neck:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 2.0f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 1.0f;
-                        case DOTModOptions.FrequencyPreset.Default: return 0.5f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.25f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.1f;
-                        default: return 0.5f;
-                    }
-                case BodyZone.Torso:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 3.0f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 1.5f;
-                        case DOTModOptions.FrequencyPreset.Default: return 0.8f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.4f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.2f;
-                        default: return 0.8f;
-                    }
-                case BodyZone.Arm:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 3.5f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 1.8f;
-                        case DOTModOptions.FrequencyPreset.Default: return 1.0f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.5f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.2f;
-                        default: return 1.0f;
-                    }
-                case BodyZone.Leg:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 3.0f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 1.5f;
-                        case DOTModOptions.FrequencyPreset.Default: return 0.8f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.4f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.2f;
-                        default: return 0.8f;
-                    }
-                case BodyZone.Dismemberment:
-                    switch (preset)
-                    {
-                        case DOTModOptions.FrequencyPreset.VerySlow: return 1.5f;
-                        case DOTModOptions.FrequencyPreset.Slow: return 0.8f;
-                        case DOTModOptions.FrequencyPreset.Default: return 0.4f;
-                        case DOTModOptions.FrequencyPreset.Fast: return 0.2f;
-                        case DOTModOptions.FrequencyPreset.Rapid: return 0.1f;
-                        default: return 0.4f;
-                    }
-                default:
-                    return 0.5f;
-            }
+            return PresetTables.Lookup(PresetTables.Frequency, zone, (int)preset);
         }
 
-        // ========== CHANCE PRESET VALUES ==========
-        // 5 presets: Off (0), Rare (1), Default (2), Frequent (3), Always (4)
-
         public static float GetPresetChanceValue(BodyZone zone, DOTModOptions.ChancePreset preset)
         {
-            switch (preset)
-            {
-                case DOTModOptions.ChancePreset.Off:
-                    return 0f;
-
-                case DOTModOptions.ChancePreset.Rare:
-                    switch (zone)
-                    {
-                        case BodyZone.Throat: return 30f;
-                        case BodyZone.Head: return 20f;
-                        case BodyZone.Neck: return 25f;
-                        case BodyZone.Torso: return 15f;
-                        case BodyZone.Arm: return 10f;
-                        case BodyZone.Leg: return 15f;
-                        case BodyZone.Dismemberment: return 40f;
-                        default: return 15f;
-                    }
-
-                case DOTModOptions.ChancePreset.Default:
-                    switch (zone)
-                    {
-                        case BodyZone.Throat: return 60f;
-                        case BodyZone.Head: return 40f;
-                        case BodyZone.Neck: return 55f;
-                        case BodyZone.Torso: return 35f;
-                        case BodyZone.Arm: return 25f;
-                        case BodyZone.Leg: return 30f;
-                        case BodyZone.Dismemberment: return 80f;
-                        default: return 35f;
-                    }
-
-                case DOTModOptions.ChancePreset.Frequent:
-                    switch (zone)
-                    {
-                        case BodyZone.Throat: return 85f;
-                        case BodyZone.Head: return 65f;
-                        case BodyZone.Neck: return 80f;
-                        case BodyZone.Torso: return 55f;
-                        case BodyZone.Arm: return 45f;
-                        case BodyZone.Leg: return 50f;
-                        case BodyZone.Dismemberment: return 95f;
-                        default: return 60f;
-                    }
-
-                case DOTModOptions.ChancePreset.Always:
-                    return 100f;
-
-                default:
-                    return 35f;
-            }
+            return PresetTables.Lookup(PresetTables.Chance, zone, (int)preset);
         }
 
         #endregion
@@ -0,0 +1,104 @@
+// <auto-generated>
+// Generated by _agent/gen_option_graph.py from Configuration/DOTModOptions.cs,
+// Core/DOTModOptionVisibility.cs and _agent/preset_tables.py. Do not edit by hand.
+// </auto-generated>
+using DOT.Configuration;
+
+namespace DOT.Core
+{
+    /// <summary>
+    /// Preset -> custom option graph used to sync the menu when a preset changes.
+    /// Slot = slider * ZoneCount + ZoneIndex(zone); the parameter index of a preset is
+    /// ParameterIndex[slot * PresetCount + presetIndex], -1 if the value is not on the slider.
+    /// </summary>
+    public static class OptionGraph
+    {
+        public const int Damage = 0;
+        public const int Duration = 1;
+        public const int Frequency = 2;
+        public const int Chance = 3;
+        public const int SliderCount = 4;
+        public const int SlotCount = SliderCount * PresetTables.ZoneCount;
+
+        public static int Slot(int slider, BodyZone zone)
+        {
+            int zoneIndex = PresetTables.ZoneIndex(zone);
+            if ((uint)slider >= SliderCount || zoneIndex >= PresetTables.ZoneCount)
+                return -1;
+            return slider * PresetTables.ZoneCount + zoneIndex;
+        }
+
+        public static readonly string[] SlotCategories =
+        {
+            DOTModOptions.CategoryZoneThroat, DOTModOptions.CategoryZoneHead, DOTModOptions.CategoryZoneNeck, DOTModOptions.CategoryZoneTorso, DOTModOptions.CategoryZoneArm, DOTModOptions.CategoryZoneLeg, DOTModOptions.CategoryZoneDismemberment, // Damage
+            DOTModOptions.CategoryZoneThroat, DOTModOptions.CategoryZoneHead, DOTModOptions.CategoryZoneNeck, DOTModOptions.CategoryZoneTorso, DOTModOptions.CategoryZoneArm, DOTModOptions.CategoryZoneLeg, DOTModOptions.CategoryZoneDismemberment, // Duration
+            DOTModOptions.CategoryZoneThroat, DOTModOptions.CategoryZoneHead, DOTModOptions.CategoryZoneNeck, DOTModOptions.CategoryZoneTorso, DOTModOptions.CategoryZoneArm, DOTModOptions.CategoryZoneLeg, DOTModOptions.CategoryZoneDismemberment, // Frequency
+            DOTModOptions.CategoryZoneThroat, DOTModOptions.CategoryZoneHead, DOTModOptions.CategoryZoneNeck, DOTModOptions.CategoryZoneTorso, DOTModOptions.CategoryZoneArm, DOTModOptions.CategoryZoneLeg, DOTModOptions.CategoryZoneDismemberment, // Chance
+        };
+
+        public static readonly string[] SlotNames =
+        {
+            DOTModOptions.OptionThroatDamage,
+            DOTModOptions.OptionHeadDamage,
+            DOTModOptions.OptionNeckDamage,
+            DOTModOptions.OptionTorsoDamage,
+            DOTModOptions.OptionArmDamage,
+            DOTModOptions.OptionLegDamage,
+            DOTModOptions.OptionDismembermentDamage,
+            DOTModOptions.OptionThroatDuration,
+            DOTModOptions.OptionHeadDuration,
+            DOTModOptions.OptionNeckDuration,
+            DOTModOptions.OptionTorsoDuration,
+            DOTModOptions.OptionArmDuration,
+            DOTModOptions.OptionLegDuration,
+            DOTModOptions.OptionDismembermentDuration,
+            DOTModOptions.OptionThroatFrequency,
+            DOTModOptions.OptionHeadFrequency,
+            DOTModOptions.OptionNeckFrequency,
+            DOTModOptions.OptionTorsoFrequency,
+            DOTModOptions.OptionArmFrequency,
+            DOTModOptions.OptionLegFrequency,
+            DOTModOptions.OptionDismembermentFrequency,
+            DOTModOptions.OptionThroatChance,
+            DOTModOptions.OptionHeadChance,
+            DOTModOptions.OptionNeckChance,
+            DOTModOptions.OptionTorsoChance,
+            DOTModOptions.OptionArmChance,
+            DOTModOptions.OptionLegChance,
+            DOTModOptions.OptionDismembermentChance,
+        };
+
+        // 5 presets per slot, in preset enum order
+        public static readonly int[] ParameterIndex =
+        {
+            1, 4, 9, 19, 39, // Throat Damage
+            0, 2, 5, 11, 23, // Head Damage
+            1, 3, 7, 15, 31, // Neck Damage
+            0, 1, 3, 7, 15, // Torso Damage
+            0, 0, 1, 3, 7, // Arm Damage
+            0, 1, 2, 5, 11, // Leg Damage
+            3, 7, 11, 23, 47, // Dismemberment Damage
+            3, 7, 11, 19, 29, // Throat Duration
+            2, 5, 9, 15, 23, // Head Duration
+            3, 6, 10, 17, 27, // Neck Duration
+            2, 4, 7, 13, 19, // Torso Duration
+            1, 3, 5, 9, 15, // Arm Duration
+            1, 4, 6, 11, 17, // Leg Duration
+            5, 9, 15, 23, 39, // Dismemberment Duration
+            19, 9, 4, 2, 0, // Throat Frequency
+            24, 11, 5, 2, 0, // Head Frequency
+            19, 9, 4, -1, 0, // Neck Frequency
+            29, 14, 7, 3, 1, // Torso Frequency
+            34, 17, 9, 4, 1, // Arm Frequency
+            29, 14, 7, 3, 1, // Leg Frequency
+            14, 7, 3, 1, 0, // Dismemberment Frequency
+            0, 6, 12, 17, 20, // Throat Chance
+            0, 4, 8, 13, 20, // Head Chance
+            0, 5, 11, 16, 20, // Neck Chance
+            0, 3, 7, 11, 20, // Torso Chance
+            0, 2, 5, 9, 20, // Arm Chance
+            0, 3, 6, 10, 20, // Leg Chance
+            0, 8, 16, 19, 20, // Dismemberment Chance
+        };
+    }
+}
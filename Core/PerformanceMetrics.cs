@@ -1,13 +1,19 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
 using DOT.Configuration;
 using UnityEngine;
+using Debug = UnityEngine.Debug;
 
 namespace DOT.Core
 {
     /// <summary>
     /// Tracks performance metrics for bleed effect processing.
     /// Monitors tick processing times and effect counts.
+    /// Every tick is also appended to a binary telemetry ring; on PCVR with
+    /// debug logging on, the ring is flushed in bulk to a file under
+    /// persistentDataPath (see TelemetryRing for the format).
     /// </summary>
     public class PerformanceMetrics
     {
@@ -16,7 +22,7 @@ namespace DOT.Core
 
         // Tracking state
         private bool _isInitialized;
-        private float _lastTickTime;
+        private long _tickStartTimestamp;
         private float _worstTickTime;
         private float _totalTickTime;
         private int _tickCount;
@@ -30,6 +36,15 @@ namespace DOT.Core
 
         private float _lastLogTime;
 
+        // Per-tick telemetry (16 bytes per record, allocated once)
+        private const int TELEMETRY_CAPACITY = 8192;
+        private readonly TelemetryRing _telemetry = new TelemetryRing(TELEMETRY_CAPACITY);
+#if !NOMAD
+        private FileStream _telemetryStream;
+        private bool _telemetryFailed;
+#endif
+        private static readonly double MsPerTimestamp = 1000.0 / Stopwatch.Frequency;
+
         public void Initialize()
         {
             Reset();
@@ -40,7 +55,7 @@ namespace DOT.Core
 
         public void Reset()
         {
-            _lastTickTime = 0f;
+            _tickStartTimestamp = 0;
             _worstTickTime = 0f;
             _totalTickTime = 0f;
             _tickCount = 0;
@@ -48,6 +63,7 @@ namespace DOT.Core
             _currentActiveEffects = 0;
             _totalDamageApplied = 0;
             _lastLogTime = Time.unscaledTime;
+            _telemetry.Clear();
         }
 
         /// <summary>
@@ -56,17 +72,18 @@ namespace DOT.Core
         public void StartTickProcessing()
         {
             if (!_isInitialized) return;
-            _lastTickTime = Time.unscaledTime;
+            _tickStartTimestamp = Stopwatch.GetTimestamp();
         }
 
         /// <summary>
         /// Record the end of a bleed tick processing cycle.
         /// </summary>
-        public void EndTickProcessing(int activeEffects, float damageThisTick)
+        public void EndTickProcessing(int activeEffects, int creatures, float damageThisTick)
         {
-            if (!_isInitialized || _lastTickTime == 0f) return;
+            if (!_isInitialized || _tickStartTimestamp == 0) return;
 
-            float tickDuration = (Time.unscaledTime - _lastTickTime) * 1000f; // Convert to ms
+            float tickDuration = (float)((Stopwatch.GetTimestamp() - _tickStartTimestamp) * MsPerTimestamp);
+            _tickStartTimestamp = 0;
             _tickCount++;
             _totalTickTime += tickDuration;
             _currentActiveEffects = activeEffects;
@@ -78,6 +95,12 @@ namespace DOT.Core
             if (activeEffects > _peakActiveEffects)
                 _peakActiveEffects = activeEffects;
 
+            _telemetry.Append(Time.frameCount, tickDuration, activeEffects, creatures, damageThisTick);
+#if !NOMAD
+            if (_telemetry.IsFull && DOTModOptions.DebugLogging)
+                FlushTelemetry();
+#endif
+
             // Warn on slow ticks
             if (tickDuration > TICK_WARN_THRESHOLD_MS && DOTModOptions.DebugLogging)
             {
@@ -108,6 +131,34 @@ namespace DOT.Core
             // Tracked through activeEffects in EndTickProcessing
         }
 
+#if !NOMAD
+        /// <summary>
+        /// Append the buffered telemetry records to this session's file in one write.
+        /// </summary>
+        private void FlushTelemetry()
+        {
+            if (_telemetryFailed || _telemetry.Count == 0) return;
+
+            try
+            {
+                if (_telemetryStream == null)
+                {
+                    string path = Path.Combine(Application.persistentDataPath, $"DOT_telemetry_{DateTime.Now:yyyyMMdd_HHmmss}.bin");
+                    _telemetryStream = new FileStream(path, FileMode.Create, FileAccess.Write, FileShare.Read, TELEMETRY_CAPACITY * TelemetryRing.RecordSize);
+                    TelemetryRing.WriteHeader(_telemetryStream, 0);
+                    Debug.Log($"[DOT] Telemetry: writing {path}");
+                }
+                _telemetry.FlushTo(_telemetryStream);
+                _telemetryStream.Flush();
+            }
+            catch (Exception ex)
+            {
+                _telemetryFailed = true;
+                Debug.LogWarning($"[DOT] Telemetry disabled: {ex.Message}");
+            }
+        }
+#endif
+
         private void LogSummary()
         {
             if (_tickCount == 0) return;
@@ -128,7 +179,16 @@ namespace DOT.Core
         public void Shutdown()
         {
             if (DOTModOptions.DebugLogging)
+            {
                 LogSummary();
+#if !NOMAD
+                FlushTelemetry();
+#endif
+            }
+#if !NOMAD
+            _telemetryStream?.Dispose();
+            _telemetryStream = null;
+#endif
             _isInitialized = false;
             _instance = null;
         }
@@ -0,0 +1,93 @@
+// <auto-generated>
+// Generated by _agent/gen_preset_tables.py from _agent/preset_tables.py.
+// Do not edit by hand: change preset_tables.py and rerun the generator.
+// </auto-generated>
+using DOT.Configuration;
+
+namespace DOT.Core
+{
+    /// <summary>
+    /// Flat zone x preset lookup tables for the preset system.
+    /// Index = ZoneIndex(zone) * PresetCount + presetIndex; the last row holds the Unknown zone fallback.
+    /// </summary>
+    public static class PresetTables
+    {
+        public const int PresetCount = 5;
+        public const int DefaultPresetIndex = 2;
+        public const int ZoneCount = 7;
+
+        public static int ZoneIndex(BodyZone zone)
+        {
+            switch (zone)
+            {
+                case BodyZone.Throat: return 0;
+                case BodyZone.Head: return 1;
+                case BodyZone.Neck: return 2;
+                case BodyZone.Torso: return 3;
+                case BodyZone.Arm: return 4;
+                case BodyZone.Leg: return 5;
+                case BodyZone.Dismemberment: return 6;
+                default: return ZoneCount;
+            }
+        }
+
+        public static float Lookup(float[] table, BodyZone zone, int presetIndex)
+        {
+            if ((uint)presetIndex >= PresetCount)
+                presetIndex = DefaultPresetIndex;
+            return table[ZoneIndex(zone) * PresetCount + presetIndex];
+        }
+
+        // Minimal | Low | Default | High | Extreme
+        public static readonly float[] Damage =
+        {
+            0.5f, 1.25f, 2.5f, 5.0f, 10.0f, // Throat
+            0.25f, 0.75f, 1.5f, 3.0f, 6.0f, // Head
+            0.5f, 1.0f, 2.0f, 4.0f, 8.0f, // Neck
+            0.25f, 0.5f, 1.0f, 2.0f, 4.0f, // Torso
+            0.25f, 0.25f, 0.5f, 1.0f, 2.0f, // Arm
+            0.25f, 0.5f, 0.75f, 1.5f, 3.0f, // Leg
+            1.0f, 2.0f, 3.0f, 6.0f, 12.0f, // Dismemberment
+            1.0f, 1.0f, 1.0f, 1.0f, 1.0f, // Unknown
+        };
+
+        // Very Short | Short | Default | Long | Extended
+        public static readonly float[] Duration =
+        {
+            2.0f, 4.0f, 6.0f, 10.0f, 15.0f, // Throat
+            1.5f, 3.0f, 5.0f, 8.0f, 12.0f, // Head
+            2.0f, 3.5f, 5.5f, 9.0f, 14.0f, // Neck
+            1.5f, 2.5f, 4.0f, 7.0f, 10.0f, // Torso
+            1.0f, 2.0f, 3.0f, 5.0f, 8.0f, // Arm
+            1.0f, 2.5f, 3.5f, 6.0f, 9.0f, // Leg
+            3.0f, 5.0f, 8.0f, 12.0f, 20.0f, // Dismemberment
+            4.0f, 4.0f, 4.0f, 4.0f, 4.0f, // Unknown
+        };
+
+        // Very Slow | Slow | Default | Fast | Rapid
+        public static readonly float[] Frequency =
+        {
+            2.0f, 1.0f, 0.5f, 0.3f, 0.1f, // Throat
+            2.5f, 1.2f, 0.6f, 0.3f, 0.1f, // Head
+            2.0f, 1.0f, 0.5f, 0.25f, 0.1f, // Neck
+            3.0f, 1.5f, 0.8f, 0.4f, 0.2f, // Torso
+            3.5f, 1.8f, 1.0f, 0.5f, 0.2f, // Arm
+            3.0f, 1.5f, 0.8f, 0.4f, 0.2f, // Leg
+            1.5f, 0.8f, 0.4f, 0.2f, 0.1f, // Dismemberment
+            0.5f, 0.5f, 0.5f, 0.5f, 0.5f, // Unknown
+        };
+
+        // Off | Rare | Default | Frequent | Always
+        public static readonly float[] Chance =
+        {
+            0.0f, 30.0f, 60.0f, 85.0f, 100.0f, // Throat
+            0.0f, 20.0f, 40.0f, 65.0f, 100.0f, // Head
+            0.0f, 25.0f, 55.0f, 80.0f, 100.0f, // Neck
+            0.0f, 15.0f, 35.0f, 55.0f, 100.0f, // Torso
+            0.0f, 10.0f, 25.0f, 45.0f, 100.0f, // Arm
+            0.0f, 15.0f, 30.0f, 50.0f, 100.0f, // Leg
+            0.0f, 40.0f, 80.0f, 95.0f, 100.0f, // Dismemberment
+            0.0f, 15.0f, 35.0f, 60.0f, 100.0f, // Unknown
+        };
+    }
+}
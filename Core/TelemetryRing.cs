@@ -0,0 +1,136 @@
+using System;
+using System.IO;
+using System.Runtime.InteropServices;
+
+namespace DOT.Core
+{
+    /// <summary>
+    /// Fixed-size binary telemetry records held in a preallocated ring buffer.
+    /// Records are encoded straight into one byte array, so Append never allocates
+    /// and a flush is a single (or, after a wrap, two) Stream.Write calls.
+    ///
+    /// File layout (little-endian, read by _agent/telemetry.py):
+    ///   header  16 bytes: "DOTT", u16 version, u16 record size, u32 flags, u32 reserved
+    ///   records 16 bytes: u32 frame, f32 tick ms, u16 active effects, u16 creatures, f32 damage
+    /// </summary>
+    public sealed class TelemetryRing
+    {
+        public const int RecordSize = 16;
+        public const int HeaderSize = 16;
+        public const ushort FormatVersion = 1;
+        public const uint FlagNomad = 1;
+
+        private readonly byte[] _buffer;
+        private readonly int _capacity;
+        private int _head;   // Next record slot
+        private int _count;  // Records held (<= capacity)
+        private long _dropped;
+
+        public TelemetryRing(int capacity)
+        {
+            if (capacity <= 0)
+                throw new ArgumentOutOfRangeException(nameof(capacity));
+            _capacity = capacity;
+            _buffer = new byte[capacity * RecordSize];
+        }
+
+        public int Capacity => _capacity;
+        public int Count => _count;
+        public bool IsFull => _count == _capacity;
+
+        /// <summary>Records overwritten before they could be flushed.</summary>
+        public long Dropped => _dropped;
+
+        public void Append(int frame, float tickMs, int activeEffects, int creatures, float damage)
+        {
+            int offset = _head * RecordSize;
+            WriteUInt32(_buffer, offset, (uint)frame);
+            WriteUInt32(_buffer, offset + 4, FloatBits(tickMs));
+            WriteUInt16(_buffer, offset + 8, Saturate(activeEffects));
+            WriteUInt16(_buffer, offset + 10, Saturate(creatures));
+            WriteUInt32(_buffer, offset + 12, FloatBits(damage));
+
+            _head = _head + 1 == _capacity ? 0 : _head + 1;
+            if (_count < _capacity)
+                _count++;
+            else
+                _dropped++;
+        }
+
+        /// <summary>
+        /// Write the held records oldest first and empty the ring.
+        /// </summary>
+        public void FlushTo(Stream stream)
+        {
+            if (_count == 0)
+                return;
+
+            int start = _head - _count;
+            if (start < 0)
+            {
+                // Wrapped: tail segment first, then the front of the buffer
+                start += _capacity;
+                stream.Write(_buffer, start * RecordSize, (_capacity - start) * RecordSize);
+                stream.Write(_buffer, 0, _head * RecordSize);
+            }
+            else
+            {
+                stream.Write(_buffer, start * RecordSize, _count * RecordSize);
+            }
+            _count = 0;
+        }
+
+        public void Clear()
+        {
+            _head = 0;
+            _count = 0;
+            _dropped = 0;
+        }
+
+        public static void WriteHeader(Stream stream, uint flags)
+        {
+            var header = new byte[HeaderSize];
+            header[0] = (byte)'D';
+            header[1] = (byte)'O';
+            header[2] = (byte)'T';
+            header[3] = (byte)'T';
+            WriteUInt16(header, 4, FormatVersion);
+            WriteUInt16(header, 6, RecordSize);
+            WriteUInt32(header, 8, flags);
+            stream.Write(header, 0, HeaderSize);
+        }
+
+        private static ushort Saturate(int value)
+        {
+            if (value < 0) return 0;
+            return value > ushort.MaxValue ? ushort.MaxValue : (ushort)value;
+        }
+
+        private static void WriteUInt16(byte[] buffer, int offset, ushort value)
+        {
+            buffer[offset] = (byte)value;
+            buffer[offset + 1] = (byte)(value >> 8);
+        }
+
+        private static void WriteUInt32(byte[] buffer, int offset, uint value)
+        {
+            buffer[offset] = (byte)value;
+            buffer[offset + 1] = (byte)(value >> 8);
+            buffer[offset + 2] = (byte)(value >> 16);
+            buffer[offset + 3] = (byte)(value >> 24);
+        }
+
+        private static uint FloatBits(float value)
+        {
+            var bits = new FloatUnion { Float = value };
+            return bits.UInt;
+        }
+
+        [StructLayout(LayoutKind.Explicit)]
+        private struct FloatUnion
+        {
+            [FieldOffset(0)] public float Float;
+            [FieldOffset(0)] public uint UInt;
+        }
+    }
+}
@@ -0,0 +1,264 @@
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using DOT.Configuration;
+using DOT.Core;
+using NUnit.Framework;
+using ThunderRoad;
+
+namespace DOT.Tests
+{
+    /// <summary>
+    /// Drives a real BleedEffect (no creature or hit part, so no VFX) through every
+    /// row of the bleed golden tables and compares the floats exactly.
+    /// </summary>
+    [TestFixture]
+    public class BleedEffectGoldenTests
+    {
+        // Regenerate with: python _agent/bleed_golden.py
+        private const string IntensityFile = "Golden/bleed_intensity.bin.gz";
+        private const string IntensityClampFile = "Golden/bleed_intensity_clamp.bin.gz";
+        private const string TickDamageFile = "Golden/bleed_tick_damage.bin.gz";
+        private const string AddStackFile = "Golden/bleed_add_stack.bin.gz";
+        private const string TicksFile = "Golden/bleed_ticks.bin.gz";
+
+        // bleed_golden.GOLDEN_DURATION: intensity rows start here and run one Update(dt)
+        private const float GoldenDuration = 10f;
+        private const float OtherTypeMultiplier = 7.7f; // Catches a multiplier read from the wrong option
+        private const int MaxReported = 10;
+
+        private static readonly string[] BloodAmountPresets = { "Very Low", "Low", "Default", "High", "Extreme" };
+
+        // bleed_golden.DAMAGE_TYPE_CODES
+        private static readonly DamageType[] DamageTypeCodes =
+        {
+            DamageType.Unknown, DamageType.Pierce, DamageType.Slash, DamageType.Blunt, DamageType.Fire, DamageType.Lightning
+        };
+
+        private string _bloodAmount;
+        private float _pierce, _slash, _fire, _lightning;
+
+        [SetUp]
+        public void SaveOptions()
+        {
+            _bloodAmount = DOTModOptions.BloodAmountPresetSetting;
+            _pierce = DOTModOptions.PierceMultiplier;
+            _slash = DOTModOptions.SlashMultiplier;
+            _fire = DOTModOptions.FireMultiplier;
+            _lightning = DOTModOptions.LightningMultiplier;
+        }
+
+        [TearDown]
+        public void RestoreOptions()
+        {
+            DOTModOptions.BloodAmountPresetSetting = _bloodAmount;
+            DOTModOptions.PierceMultiplier = _pierce;
+            DOTModOptions.SlashMultiplier = _slash;
+            DOTModOptions.FireMultiplier = _fire;
+            DOTModOptions.LightningMultiplier = _lightning;
+        }
+
+        private static IEnumerable<TestCaseData> Blocks(string file)
+        {
+            var table = GoldenTable.Load(file);
+            string name = Path.GetFileName(file).Replace(".bin.gz", "");
+            for (int block = 0; block < table.BlockCount; block++)
+            {
+                yield return new TestCaseData(block)
+                    .SetName($"{name}[{table.AxisNames[0]}={table.AxisValues[0][block]:R}]");
+            }
+        }
+
+        private static IEnumerable<TestCaseData> IntensityBlocks() => Blocks(IntensityFile);
+        private static IEnumerable<TestCaseData> IntensityClampBlocks() => Blocks(IntensityClampFile);
+        private static IEnumerable<TestCaseData> TickDamageBlocks() => Blocks(TickDamageFile);
+        private static IEnumerable<TestCaseData> AddStackBlocks() => Blocks(AddStackFile);
+        private static IEnumerable<TestCaseData> TicksBlocks() => Blocks(TicksFile);
+
+        private static BleedEffect Stacked(BodyZone zone, DamageType type, float damage, float duration, int hits, int maxStacks)
+        {
+            var effect = new BleedEffect(null, zone, type, null, damage, duration, 1f);
+            for (int i = 1; i < hits; i++)
+                effect.AddStack(damage, duration, maxStacks);
+            return effect;
+        }
+
+        [Test]
+        [TestCaseSource(nameof(IntensityBlocks))]
+        public void CalculateBloodIntensity_MatchesGolden(int block)
+        {
+            var table = GoldenTable.Load(IntensityFile);
+            int zone = table.Axis("zone"), blood = table.Axis("blood"), stacks = table.Axis("stacks");
+            int damage = table.Axis("damage"), dt = table.Axis("dt");
+            int expected = table.Column("intensity");
+            var mismatches = new Mismatches(table);
+
+            int end = (block + 1) * table.BlockSize;
+            for (int row = block * table.BlockSize; row < end; row++)
+            {
+                DOTModOptions.BloodAmountPresetSetting = BloodAmountPresets[(int)table.Input(row, blood)];
+                int stackCount = (int)table.Input(row, stacks);
+                var effect = Stacked((BodyZone)(int)table.Input(row, zone), DamageType.Pierce,
+                    table.Input(row, damage), GoldenDuration, stackCount, stackCount);
+                effect.Update(table.Input(row, dt));
+                mismatches.Check(row, "intensity", effect.CalculateBloodIntensity(), table.Value(row, expected));
+            }
+            mismatches.AssertNone();
+        }
+
+        [Test]
+        [TestCaseSource(nameof(IntensityClampBlocks))]
+        public void CalculateBloodIntensity_ClampEdgesMatchGolden(int block)
+        {
+            var table = GoldenTable.Load(IntensityClampFile);
+            int zone = table.Axis("zone"), blood = table.Axis("blood"), stacks = table.Axis("stacks");
+            int damage = table.Column("damage"), expected = table.Column("intensity");
+            var mismatches = new Mismatches(table);
+
+            int end = (block + 1) * table.BlockSize;
+            for (int row = block * table.BlockSize; row < end; row++)
+            {
+                DOTModOptions.BloodAmountPresetSetting = BloodAmountPresets[(int)table.Input(row, blood)];
+                int stackCount = (int)table.Input(row, stacks);
+                var effect = Stacked((BodyZone)(int)table.Input(row, zone), DamageType.Pierce,
+                    table.Value(row, damage), GoldenDuration, stackCount, stackCount);
+                mismatches.Check(row, "intensity", effect.CalculateBloodIntensity(), table.Value(row, expected));
+            }
+            mismatches.AssertNone();
+        }
+
+        [Test]
+        [TestCaseSource(nameof(TickDamageBlocks))]
+        public void GetTickDamage_MatchesGolden(int block)
+        {
+            var table = GoldenTable.Load(TickDamageFile);
+            int type = table.Axis("damage_type"), multiplier = table.Axis("multiplier");
+            int maxStacks = table.Axis("max_stacks"), hits = table.Axis("hits"), damage = table.Axis("damage");
+            int expected = table.Column("tick_damage");
+            var mismatches = new Mismatches(table);
+
+            int end = (block + 1) * table.BlockSize;
+            for (int row = block * table.BlockSize; row < end; row++)
+            {
+                DamageType damageType = DamageTypeCodes[(int)table.Input(row, type)];
+                SetMultipliers(damageType, table.Input(row, multiplier));
+                var effect = Stacked(BodyZone.Torso, damageType, table.Input(row, damage), GoldenDuration,
+                    (int)table.Input(row, hits), (int)table.Input(row, maxStacks));
+                mismatches.Check(row, "tick_damage", effect.GetTickDamage(), table.Value(row, expected));
+            }
+            mismatches.AssertNone();
+        }
+
+        [Test]
+        [TestCaseSource(nameof(AddStackBlocks))]
+        public void AddStack_MatchesGolden(int block)
+        {
+            var table = GoldenTable.Load(AddStackFile);
+            int damage = table.Axis("damage"), stackDamage = table.Axis("stack_damage");
+            int duration = table.Axis("duration"), stackDuration = table.Axis("stack_duration");
+            int maxStacks = table.Axis("max_stacks"), hits = table.Axis("hits");
+            int stacks = table.Column("stacks"), perTick = table.Column("damage_per_tick");
+            int remaining = table.Column("remaining"), tickDamage = table.Column("tick_damage");
+            DOTModOptions.PierceMultiplier = 1.2f;
+            var mismatches = new Mismatches(table);
+
+            int end = (block + 1) * table.BlockSize;
+            for (int row = block * table.BlockSize; row < end; row++)
+            {
+                var effect = new BleedEffect(null, BodyZone.Torso, DamageType.Pierce, null,
+                    table.Input(row, damage), table.Input(row, duration), 1f);
+                int hitCount = (int)table.Input(row, hits);
+                for (int i = 1; i < hitCount; i++)
+                    effect.AddStack(table.Input(row, stackDamage), table.Input(row, stackDuration), (int)table.Input(row, maxStacks));
+
+                mismatches.Check(row, "stacks", effect.StackCount, table.Value(row, stacks));
+                mismatches.Check(row, "damage_per_tick", effect.DamagePerTick, table.Value(row, perTick));
+                mismatches.Check(row, "remaining", effect.RemainingDuration, table.Value(row, remaining));
+                mismatches.Check(row, "tick_damage", effect.GetTickDamage(), table.Value(row, tickDamage));
+            }
+            mismatches.AssertNone();
+        }
+
+        [Test]
+        [TestCaseSource(nameof(TicksBlocks))]
+        public void UpdateLoop_TickCountsMatchGolden(int block)
+        {
+            var table = GoldenTable.Load(TicksFile);
+            int hz = table.Axis("hz"), interval = table.Axis("interval"), duration = table.Axis("duration");
+            int refreshFrame = table.Column("refresh_frame"), ticks = table.Column("ticks");
+            int frames = table.Column("frames"), remaining = table.Column("remaining");
+            var mismatches = new Mismatches(table);
+
+            int end = (block + 1) * table.BlockSize;
+            for (int row = block * table.BlockSize; row < end; row++)
+            {
+                float deltaTime = 1f / (int)table.Input(row, hz);
+                float length = table.Input(row, duration);
+                int refreshAt = (int)table.Value(row, refreshFrame);
+                int frameLimit = (int)table.Value(row, frames) + 1;
+                var effect = new BleedEffect(null, BodyZone.Torso, DamageType.Pierce, null, 1f, length, table.Input(row, interval));
+
+                // BleedManager.Update for a single effect; the refresh hit lands before the frame's Update
+                int frame = 0, tickCount = 0;
+                while (frame < frameLimit)
+                {
+                    frame++;
+                    if (frame == refreshAt)
+                        effect.AddStack(1f, length, 5);
+                    effect.Update(deltaTime);
+                    if (effect.IsExpired)
+                        break;
+                    if (effect.TimeSinceLastTick >= effect.TickInterval)
+                    {
+                        tickCount++;
+                        effect.TimeSinceLastTick = 0f;
+                    }
+                }
+
+                mismatches.Check(row, "ticks", tickCount, table.Value(row, ticks));
+                mismatches.Check(row, "frames", frame, table.Value(row, frames));
+                mismatches.Check(row, "remaining", effect.RemainingDuration, table.Value(row, remaining));
+            }
+            mismatches.AssertNone();
+        }
+
+        /// <summary>Unknown/Blunt: every option set (result must still be 0); otherwise only the row's type.</summary>
+        private static void SetMultipliers(DamageType type, float value)
+        {
+            bool any = type != DamageType.Pierce && type != DamageType.Slash && type != DamageType.Fire && type != DamageType.Lightning;
+            DOTModOptions.PierceMultiplier = any || type == DamageType.Pierce ? value : OtherTypeMultiplier;
+            DOTModOptions.SlashMultiplier = any || type == DamageType.Slash ? value : OtherTypeMultiplier;
+            DOTModOptions.FireMultiplier = any || type == DamageType.Fire ? value : OtherTypeMultiplier;
+            DOTModOptions.LightningMultiplier = any || type == DamageType.Lightning ? value : OtherTypeMultiplier;
+        }
+
+        /// <summary>Counts exact-float mismatches and keeps the first few for the failure message.</summary>
+        private sealed class Mismatches
+        {
+            private readonly GoldenTable _table;
+            private readonly StringBuilder _examples = new StringBuilder();
+            private int _count;
+
+            public Mismatches(GoldenTable table)
+            {
+                _table = table;
+            }
+
+            public void Check(int row, string what, float actual, float expected)
+            {
+                if (actual == expected)
+                    return;
+                if (_count < MaxReported)
+                {
+                    _examples.AppendLine($"  {what}: expected {expected:R}, got {actual:R} ({_table.Describe(row)})");
+                }
+                _count++;
+            }
+
+            public void AssertNone()
+            {
+                Assert.That(_count, Is.EqualTo(0), $"{_count} mismatches, first {System.Math.Min(_count, MaxReported)}:\n{_examples}");
+            }
+        }
+    }
+}
@@ -0,0 +1,149 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.Compression;
+using System.Text;
+using NUnit.Framework;
+
+namespace DOT.Tests
+{
+    /// <summary>
+    /// Reader for the gzip-compressed float grids written by _agent/bleed_golden.py.
+    /// Rows cover every combination of the axis values in C order (last axis fastest),
+    /// so a row's inputs are derived from its index and only the columns are stored.
+    /// Rows sharing a first-axis value are contiguous: one block per TestCaseSource case.
+    /// </summary>
+    internal sealed class GoldenTable
+    {
+        private const ushort FormatVersion = 1;
+        private static readonly byte[] Magic = Encoding.ASCII.GetBytes("DOTG");
+        private static readonly Dictionary<string, GoldenTable> Cache = new Dictionary<string, GoldenTable>();
+
+        private readonly float[] _data;
+        private readonly int[] _strides;
+
+        public string[] AxisNames { get; }
+        public float[][] AxisValues { get; }
+        public string[] Columns { get; }
+        public int RowCount { get; }
+        public int BlockCount => AxisValues[0].Length;
+        public int BlockSize => _strides[0];
+
+        private GoldenTable(string[] axisNames, float[][] axisValues, string[] columns, float[] data)
+        {
+            AxisNames = axisNames;
+            AxisValues = axisValues;
+            Columns = columns;
+            _data = data;
+            _strides = new int[axisValues.Length];
+            int stride = 1;
+            for (int i = axisValues.Length - 1; i >= 0; i--)
+            {
+                _strides[i] = stride;
+                stride *= axisValues[i].Length;
+            }
+            RowCount = stride;
+        }
+
+        /// <summary>Load (once per test run) a table relative to the test output directory.</summary>
+        public static GoldenTable Load(string relativePath)
+        {
+            lock (Cache)
+            {
+                if (!Cache.TryGetValue(relativePath, out var table))
+                {
+                    string path = Path.Combine(TestContext.CurrentContext.TestDirectory, relativePath);
+                    table = Read(path);
+                    Cache[relativePath] = table;
+                }
+                return table;
+            }
+        }
+
+        private static GoldenTable Read(string path)
+        {
+            using (var file = File.OpenRead(path))
+            using (var gzip = new GZipStream(file, CompressionMode.Decompress))
+            using (var reader = new BinaryReader(gzip, Encoding.ASCII))
+            {
+                byte[] magic = reader.ReadBytes(4);
+                ushort version = reader.ReadUInt16();
+                reader.ReadUInt16();
+                if (magic.Length != 4 || magic[0] != Magic[0] || magic[1] != Magic[1] || magic[2] != Magic[2] || magic[3] != Magic[3])
+                    throw new InvalidDataException($"{path}: not a golden table");
+                if (version != FormatVersion)
+                    throw new InvalidDataException($"{path}: unsupported version {version}");
+
+                var axisNames = new string[reader.ReadByte()];
+                var axisValues = new float[axisNames.Length][];
+                long rows = 1;
+                for (int i = 0; i < axisNames.Length; i++)
+                {
+                    axisNames[i] = ReadName(reader);
+                    axisValues[i] = ReadFloats(reader, reader.ReadInt32());
+                    rows *= axisValues[i].Length;
+                }
+
+                var columns = new string[reader.ReadByte()];
+                for (int i = 0; i < columns.Length; i++)
+                    columns[i] = ReadName(reader);
+
+                float[] data = ReadFloats(reader, checked((int)(rows * columns.Length)));
+                return new GoldenTable(axisNames, axisValues, columns, data);
+            }
+        }
+
+        private static string ReadName(BinaryReader reader)
+        {
+            return Encoding.ASCII.GetString(reader.ReadBytes(reader.ReadByte()));
+        }
+
+        private static float[] ReadFloats(BinaryReader reader, int count)
+        {
+            byte[] bytes = reader.ReadBytes(count * 4);
+            if (bytes.Length != count * 4)
+                throw new EndOfStreamException($"Expected {count} floats, got {bytes.Length / 4}");
+            var values = new float[count];
+            Buffer.BlockCopy(bytes, 0, values, 0, bytes.Length); // Little-endian host
+            return values;
+        }
+
+        public int Axis(string name)
+        {
+            int index = Array.IndexOf(AxisNames, name);
+            if (index < 0)
+                throw new ArgumentException($"No axis '{name}' (have {string.Join(", ", AxisNames)})");
+            return index;
+        }
+
+        public int Column(string name)
+        {
+            int index = Array.IndexOf(Columns, name);
+            if (index < 0)
+                throw new ArgumentException($"No column '{name}' (have {string.Join(", ", Columns)})");
+            return index;
+        }
+
+        public float Input(int row, int axis)
+        {
+            return AxisValues[axis][(row / _strides[axis]) % AxisValues[axis].Length];
+        }
+
+        public float Value(int row, int column)
+        {
+            return _data[row * Columns.Length + column];
+        }
+
+        public string Describe(int row)
+        {
+            var sb = new StringBuilder();
+            for (int i = 0; i < AxisNames.Length; i++)
+            {
+                if (i > 0)
+                    sb.Append(", ");
+                sb.Append(AxisNames[i]).Append('=').Append(Input(row, i).ToString("R"));
+            }
+            return sb.ToString();
+        }
+    }
+}
@@ -0,0 +1,89 @@
+using System;
+using DOT.Configuration;
+using DOT.Core;
+using NUnit.Framework;
+using ThunderRoad;
+
+namespace DOT.Tests
+{
+    [TestFixture]
+    public class OptionGraphTests
+    {
+        private static readonly BodyZone[] Zones =
+        {
+            BodyZone.Throat, BodyZone.Head, BodyZone.Neck, BodyZone.Torso,
+            BodyZone.Arm, BodyZone.Leg, BodyZone.Dismemberment
+        };
+
+        [Test]
+        public void OptionGraph_TablesMatchSlotCount()
+        {
+            Assert.That(OptionGraph.SlotCategories.Length, Is.EqualTo(OptionGraph.SlotCount));
+            Assert.That(OptionGraph.SlotNames.Length, Is.EqualTo(OptionGraph.SlotCount));
+            Assert.That(OptionGraph.ParameterIndex.Length, Is.EqualTo(OptionGraph.SlotCount * PresetTables.PresetCount));
+        }
+
+        [Test]
+        public void Slot_UnknownZoneOrSlider_ReturnsMinusOne()
+        {
+            Assert.That(OptionGraph.Slot(OptionGraph.Damage, BodyZone.Unknown), Is.EqualTo(-1));
+            Assert.That(OptionGraph.Slot(OptionGraph.SliderCount, BodyZone.Throat), Is.EqualTo(-1));
+        }
+
+        [Test]
+        [TestCase(OptionGraph.Damage, BodyZone.Throat, DOTModOptions.OptionThroatDamage)]
+        [TestCase(OptionGraph.Duration, BodyZone.Leg, DOTModOptions.OptionLegDuration)]
+        [TestCase(OptionGraph.Frequency, BodyZone.Neck, DOTModOptions.OptionNeckFrequency)]
+        [TestCase(OptionGraph.Chance, BodyZone.Dismemberment, DOTModOptions.OptionDismembermentChance)]
+        public void Slot_NamesTheDrivenOption(int slider, BodyZone zone, string expectedName)
+        {
+            Assert.That(OptionGraph.SlotNames[OptionGraph.Slot(slider, zone)], Is.EqualTo(expectedName));
+        }
+
+        [Test]
+        [TestCase(OptionGraph.Damage)]
+        [TestCase(OptionGraph.Duration)]
+        [TestCase(OptionGraph.Frequency)]
+        [TestCase(OptionGraph.Chance)]
+        public void ParameterIndex_PointsAtThePresetValue(int slider)
+        {
+            ModOptionFloat[] parameters = Provider(slider);
+            float[] table = Table(slider);
+            foreach (var zone in Zones)
+            {
+                int slot = OptionGraph.Slot(slider, zone);
+                for (int preset = 0; preset < PresetTables.PresetCount; preset++)
+                {
+                    int index = OptionGraph.ParameterIndex[slot * PresetTables.PresetCount + preset];
+                    if (index < 0)
+                        continue; // Preset value is not on the slider
+                    float expected = PresetTables.Lookup(table, zone, preset);
+                    Assert.That(Convert.ToSingle(parameters[index].value), Is.EqualTo(expected).Within(0.0001f),
+                        $"{OptionGraph.SlotNames[slot]} preset {preset}");
+                }
+            }
+        }
+
+        private static ModOptionFloat[] Provider(int slider)
+        {
+            switch (slider)
+            {
+                case OptionGraph.Damage: return DOTModOptions.DamageProvider();
+                case OptionGraph.Duration: return DOTModOptions.DurationProvider();
+                case OptionGraph.Frequency: return DOTModOptions.FrequencyProvider();
+                default: return DOTModOptions.ChanceProvider();
+            }
+        }
+
+        private static float[] Table(int slider)
+        {
+            switch (slider)
+            {
+                case OptionGraph.Damage: return PresetTables.Damage;
+                case OptionGraph.Duration: return PresetTables.Duration;
+                case OptionGraph.Frequency: return PresetTables.Frequency;
+                default: return PresetTables.Chance;
+            }
+        }
+    }
+}
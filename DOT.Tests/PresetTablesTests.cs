@@ -0,0 +1,47 @@
+using DOT.Configuration;
+using DOT.Core;
+using NUnit.Framework;
+
+namespace DOT.Tests
+{
+    [TestFixture]
+    public class PresetTablesTests
+    {
+        [Test]
+        public void PresetTables_AllTablesHaveFallbackRow()
+        {
+            int expected = (PresetTables.ZoneCount + 1) * PresetTables.PresetCount;
+            Assert.That(PresetTables.Damage.Length, Is.EqualTo(expected));
+            Assert.That(PresetTables.Duration.Length, Is.EqualTo(expected));
+            Assert.That(PresetTables.Frequency.Length, Is.EqualTo(expected));
+            Assert.That(PresetTables.Chance.Length, Is.EqualTo(expected));
+        }
+
+        [Test]
+        [TestCase(BodyZone.Throat, DOTModOptions.DamagePreset.Default, 2.5f)]
+        [TestCase(BodyZone.Arm, DOTModOptions.DamagePreset.Low, 0.25f)]
+        [TestCase(BodyZone.Dismemberment, DOTModOptions.DamagePreset.Extreme, 12.0f)]
+        [TestCase(BodyZone.Unknown, DOTModOptions.DamagePreset.Extreme, 1.0f)]
+        public void GetPresetDamageValue_ReturnsTableValue(BodyZone zone, DOTModOptions.DamagePreset preset, float expected)
+        {
+            Assert.That(DOTModOptionVisibility.GetPresetDamageValue(zone, preset), Is.EqualTo(expected));
+        }
+
+        [Test]
+        [TestCase(BodyZone.Neck, DOTModOptions.ChancePreset.Off, 0f)]
+        [TestCase(BodyZone.Neck, DOTModOptions.ChancePreset.Frequent, 80f)]
+        [TestCase(BodyZone.Unknown, DOTModOptions.ChancePreset.Rare, 15f)]
+        [TestCase(BodyZone.Unknown, DOTModOptions.ChancePreset.Always, 100f)]
+        public void GetPresetChanceValue_ReturnsTableValue(BodyZone zone, DOTModOptions.ChancePreset preset, float expected)
+        {
+            Assert.That(DOTModOptionVisibility.GetPresetChanceValue(zone, preset), Is.EqualTo(expected));
+        }
+
+        [Test]
+        public void Lookup_OutOfRangePreset_ReturnsZoneDefault()
+        {
+            Assert.That(PresetTables.Lookup(PresetTables.Duration, BodyZone.Torso, 99), Is.EqualTo(4.0f));
+            Assert.That(PresetTables.Lookup(PresetTables.Frequency, BodyZone.Head, -1), Is.EqualTo(0.6f));
+        }
+    }
+}
@@ -0,0 +1,81 @@
+using System;
+using System.IO;
+using DOT.Core;
+using NUnit.Framework;
+
+namespace DOT.Tests
+{
+    [TestFixture]
+    public class TelemetryRingTests
+    {
+        private static uint Frame(byte[] bytes, int record)
+        {
+            return BitConverter.ToUInt32(bytes, record * TelemetryRing.RecordSize);
+        }
+
+        [Test]
+        public void Append_EncodesLittleEndianRecord()
+        {
+            var ring = new TelemetryRing(4);
+            ring.Append(1234, 1.5f, 7, 3, 2.25f);
+
+            var stream = new MemoryStream();
+            ring.FlushTo(stream);
+            byte[] bytes = stream.ToArray();
+
+            Assert.That(bytes.Length, Is.EqualTo(TelemetryRing.RecordSize));
+            Assert.That(BitConverter.ToUInt32(bytes, 0), Is.EqualTo(1234u));
+            Assert.That(BitConverter.ToSingle(bytes, 4), Is.EqualTo(1.5f));
+            Assert.That(BitConverter.ToUInt16(bytes, 8), Is.EqualTo((ushort)7));
+            Assert.That(BitConverter.ToUInt16(bytes, 10), Is.EqualTo((ushort)3));
+            Assert.That(BitConverter.ToSingle(bytes, 12), Is.EqualTo(2.25f));
+            Assert.That(ring.Count, Is.EqualTo(0));
+        }
+
+        [Test]
+        public void FlushTo_AfterWrap_WritesOldestFirst()
+        {
+            var ring = new TelemetryRing(3);
+            for (int frame = 1; frame <= 5; frame++)
+                ring.Append(frame, 0f, 0, 0, 0f);
+
+            var stream = new MemoryStream();
+            ring.FlushTo(stream);
+            byte[] bytes = stream.ToArray();
+
+            Assert.That(bytes.Length, Is.EqualTo(3 * TelemetryRing.RecordSize));
+            Assert.That(Frame(bytes, 0), Is.EqualTo(3u));
+            Assert.That(Frame(bytes, 1), Is.EqualTo(4u));
+            Assert.That(Frame(bytes, 2), Is.EqualTo(5u));
+            Assert.That(ring.Dropped, Is.EqualTo(2));
+        }
+
+        [Test]
+        public void Append_SaturatesCounts()
+        {
+            var ring = new TelemetryRing(1);
+            ring.Append(0, 0f, 100000, -5, 0f);
+
+            var stream = new MemoryStream();
+            ring.FlushTo(stream);
+            byte[] bytes = stream.ToArray();
+
+            Assert.That(BitConverter.ToUInt16(bytes, 8), Is.EqualTo(ushort.MaxValue));
+            Assert.That(BitConverter.ToUInt16(bytes, 10), Is.EqualTo((ushort)0));
+        }
+
+        [Test]
+        public void WriteHeader_WritesMagicVersionAndRecordSize()
+        {
+            var stream = new MemoryStream();
+            TelemetryRing.WriteHeader(stream, TelemetryRing.FlagNomad);
+            byte[] bytes = stream.ToArray();
+
+            Assert.That(bytes.Length, Is.EqualTo(TelemetryRing.HeaderSize));
+            Assert.That(System.Text.Encoding.ASCII.GetString(bytes, 0, 4), Is.EqualTo("DOTT"));
+            Assert.That(BitConverter.ToUInt16(bytes, 4), Is.EqualTo(TelemetryRing.FormatVersion));
+            Assert.That(BitConverter.ToUInt16(bytes, 6), Is.EqualTo((ushort)TelemetryRing.RecordSize));
+            Assert.That(BitConverter.ToUInt32(bytes, 8), Is.EqualTo(TelemetryRing.FlagNomad));
+        }
+    }
+}
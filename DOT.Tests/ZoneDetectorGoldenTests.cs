@@ -0,0 +1,43 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using DOT.Configuration;
+using DOT.Core;
+using NUnit.Framework;
+using ThunderRoad;
+
+namespace DOT.Tests
+{
+    [TestFixture]
+    public class ZoneDetectorGoldenTests
+    {
+        // Regenerate with: python _agent/zone_detector.py golden
+        private const string GoldenFile = "Golden/zone_from_part_type.csv";
+
+        private static IEnumerable<TestCaseData> GoldenVectors()
+        {
+            string path = Path.Combine(TestContext.CurrentContext.TestDirectory, GoldenFile);
+            foreach (string line in File.ReadLines(path))
+            {
+                if (line.Length == 0 || line.StartsWith("#") || line.StartsWith("part_type,"))
+                    continue;
+
+                string[] fields = line.Split(',');
+                RagdollPart.Type partType = fields[0] == "None"
+                    ? 0
+                    : (RagdollPart.Type)Enum.Parse(typeof(RagdollPart.Type), fields[0].Replace('|', ','));
+                bool isSliced = bool.Parse(fields[1]);
+                BodyZone expected = (BodyZone)Enum.Parse(typeof(BodyZone), fields[2]);
+                yield return new TestCaseData(partType, isSliced, expected)
+                    .SetName($"GetZoneFromPartType({fields[0]}, {fields[1]}) = {fields[2]}");
+            }
+        }
+
+        [Test]
+        [TestCaseSource(nameof(GoldenVectors))]
+        public void GetZoneFromPartType_MatchesGoldenVector(RagdollPart.Type partType, bool isSliced, BodyZone expected)
+        {
+            Assert.That(ZoneDetector.GetZoneFromPartType(partType, isSliced), Is.EqualTo(expected));
+        }
+    }
+}
@@ -1,9 +1,19 @@
 # -*- coding: utf-8 -*-
-"""Build and release DOT mod."""
+"""Build and release DOT mod.
+
+Builds and zips go through release_builder.py (cached, parallel,
+deterministic zips in builds/). Pass --dry-run to see what would be
+rebuilt, or --build-only to stop before tagging and publishing.
+--profile writes a Chrome trace of the whole release (see profiling.py).
+"""
+import argparse
 import subprocess
 import json
 from pathlib import Path
 
+import profiling
+from release_builder import BUILDS_DIR, CONFIGS, release
+
 BASE = Path(__file__).parent.parent
 MANIFEST = BASE / "manifest.json"
 
@@ -13,22 +23,20 @@ def get_version():
 
 def run(cmd, cwd=None):
     print(f"$ {cmd}")
-    subprocess.run(cmd, shell=True, cwd=cwd or BASE, check=True)
+    with profiling.span(' '.join(cmd.split()[:2]), command=cmd):
+        subprocess.run(cmd, shell=True, cwd=cwd or BASE, check=True)
 
-def main():
+def publish(args):
     version = get_version()
     tag = f"v{version}"
 
     print(f"\n=== Building DOT {version} ===\n")
 
-    # Build both configurations
-    run("dotnet build -c Release")
-    run("dotnet build -c Nomad")
-
-    # Create zips
-    print("\n=== Creating release zips ===\n")
-    run(f'powershell -Command "Compress-Archive -Path bin/Release/PCVR/DOT -DestinationPath DOT-PCVR.zip -Force"')
-    run(f'powershell -Command "Compress-Archive -Path bin/Release/Nomad/DOT -DestinationPath DOT-Nomad.zip -Force"')
+    # Build both configurations (cached, concurrent) and create zips
+    release(list(CONFIGS), force=args.force, dry_run=args.dry_run, texts=args.texts)
+    if args.dry_run or args.build_only:
+        return
+    zips = ' '.join(str(Path(BUILDS_DIR, f"DOT-{name}.zip").relative_to(BASE)) for name in CONFIGS)
 
     # Git tag (if not exists)
     result = subprocess.run(f"git tag -l {tag}", shell=True, capture_output=True, text=True, cwd=BASE)
@@ -40,9 +48,21 @@ def main():
 
     # Create GitHub release
     print("\n=== Creating GitHub release ===\n")
-    run(f'gh release create {tag} DOT-PCVR.zip DOT-Nomad.zip --title "DOT {version}" --notes "Release {version}"')
+    run(f'gh release create {tag} {zips} --title "DOT {version}" --notes "Release {version}"')
 
     print(f"\n=== DOT {version} released! ===\n")
 
+def main():
+    parser = argparse.ArgumentParser(description="Build and release DOT.")
+    parser.add_argument('--dry-run', action='store_true', help="Show what would be rebuilt, then stop")
+    parser.add_argument('--build-only', action='store_true', help="Build and zip without tagging or publishing")
+    parser.add_argument('--force', action='store_true', help="Rebuild even on a cache hit")
+    parser.add_argument('--texts', action='store_true', help="Ship packed Text_*.json files in the zips")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    with profiling.session(args, 'release'):
+        publish(args)
+
 if __name__ == '__main__':
     main()
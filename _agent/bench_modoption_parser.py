@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark for modoption_parser on synthetic DOTModOptions-style files.
+
+Generates files with 1250..10000 ModOptions (constants, nameof value
+sources, LocalizationGroupId concatenation, casts), times a cold parse of
+each (best of --repeat) and a cache hit on the largest, and checks that
+parse time grows linearly: the log-log slope of time against option count,
+fitted over every size, must stay below LINEAR_TOLERANCE.
+
+Usage:
+    python bench_modoption_parser.py [--max 10000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import math
+import os
+import sys
+import tempfile
+import time
+
+from modoption_parser import load_mod_options, parse_sources
+
+# Largest time ~ size**slope exponent still considered linear (quadratic is 2)
+LINEAR_TOLERANCE = 1.3
+
+
+def synthetic_source(option_count, categories=50):
+    """Build a C# source with option_count ModOption fields spread over categories."""
+    lines = [
+        'using ThunderRoad;',
+        'namespace DOT.Configuration',
+        '{',
+        '    public static class SyntheticOptions',
+        '    {',
+        '        private const string LocalizationGroupId = "DOT_Options";',
+    ]
+    for c in range(categories):
+        lines.append(f'        public const string Category{c} = "Category {c}";')
+        lines.append(f'        private const int CategoryOrder{c} = {c * 10};')
+    lines.append('        public static ModOptionFloat[] Provider() { return null; }')
+    for i in range(option_count):
+        c = i % categories
+        lines.append(f'        public const string Option{i} = "Option " + "{i}";')
+        lines.append(
+            f'        [ModOption(name = Option{i}, nameLocalizationId = LocalizationGroupId + ".Option{i}", '
+            f'category = Category{c}, categoryLocalizationId = LocalizationGroupId + ".Category{c}", '
+            f'categoryOrder = CategoryOrder{c}, order = {i}, defaultValueIndex = {i % 20}, '
+            f'valueSourceName = nameof(Provider), interactionType = (ModOption.InteractionType)2, '
+            f'tooltip = "Synthetic option {i} // not a comment")]')
+        lines.append(f'        public static float Value{i} = {i % 7}.5f;')
+    lines += ['    }', '}', '']
+    return '\n'.join(lines)
+
+
+def time_parse(source, repeat):
+    """Best of repeat parses, with the cyclic GC off as in timeit (its passes grow with the heap)."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            options = parse_sources(source)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best, options
+
+
+def loglog_slope(sizes, seconds):
+    """Least-squares slope of log(seconds) against log(sizes)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in seconds]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ModOption parser.")
+    parser.add_argument('--max', type=int, default=10000, help="Largest option count")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per size (best is kept)")
+    args = parser.parse_args()
+
+    sizes = [args.max // 8, args.max // 4, args.max * 3 // 8, args.max // 2, args.max * 3 // 4, args.max]
+    print(f"{'options':>8} {'KB':>8} {'parse ms':>10} {'us/option':>10}")
+    timings = []
+    largest = None
+    for size in sizes:
+        source = synthetic_source(size)
+        elapsed, options = time_parse(source, args.repeat)
+        unresolved = sum(1 for o in options if o['unresolved'])
+        if len(options) != size or unresolved:
+            print(f"Error: parsed {len(options)} options ({unresolved} unresolved), expected {size}")
+            sys.exit(1)
+        timings.append(elapsed)
+        largest = source
+        print(f"{size:>8} {len(source) / 1024:>8.0f} {elapsed * 1000:>10.1f} {elapsed / size * 1e6:>10.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'SyntheticOptions.cs')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(largest)
+        cache_dir = os.path.join(tmp, 'cache')
+        start = time.perf_counter()
+        load_mod_options(path, constant_paths=[], cache_dir=cache_dir)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        load_mod_options(path, constant_paths=[], cache_dir=cache_dir)
+        warm = time.perf_counter() - start
+    print(f"\nCache ({sizes[-1]} options): miss {cold * 1000:.1f} ms, hit {warm * 1000:.1f} ms")
+
+    slope = loglog_slope(sizes, timings)
+    print(f"Parse time ~ options^{slope:.2f} over {sizes[0]}..{sizes[-1]} options")
+    if slope > LINEAR_TOLERANCE:
+        print(f"FAIL: scaling is worse than linear (exponent > {LINEAR_TOLERANCE})")
+        sys.exit(1)
+    print("OK: parse time scales linearly")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the _agent and _translations tools on scaled inputs.
+
+Generates synthetic inputs at 1x/10x/100x/1000x the current size
+(DOTModOptions.cs options, _translations.csv strings and language columns,
+preset table zones, settings.json zones), times each tool and records peak
+memory with tracemalloc in a separate run so tracing does not skew the
+timings. Each case is timed as the best of several runs after an untimed
+warm-up, with the cyclic GC off as in timeit. Results are compared with
+the baselines in bench_baselines.json; a run fails when time or peak
+memory regresses past --threshold and past a noise floor that grows with
+the scale.
+
+Usage:
+    python bench_suite.py                       # compare against baselines
+    python bench_suite.py --scales 1,10         # quick run
+    python bench_suite.py --only translations   # benchmarks whose name contains this
+    python bench_suite.py --update              # record new baselines
+"""
+
+import argparse
+import contextlib
+import csv
+import gc
+import io
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from registry import AGENT_DIR, TRANSLATIONS_DIR
+
+BASELINE_PATH = os.path.join(AGENT_DIR, "bench_baselines.json")
+
+sys.path.insert(0, TRANSLATIONS_DIR)
+
+import build_menu_mock_xlsx  # noqa: E402
+import build_presets_xlsx  # noqa: E402
+import debug_parse  # noqa: E402
+import loc_coverage  # noqa: E402
+from bench_modoption_parser import synthetic_source  # noqa: E402
+from modoption_parser import MOD_OPTIONS_PATH, load_mod_options  # noqa: E402
+from preset_tables import (  # noqa: E402
+    ZONES, DAMAGE_VALUES, DURATION_VALUES, FREQUENCY_VALUES, CHANCE_VALUES,
+)
+import _build_translations  # noqa: E402
+import _export_translations  # noqa: E402
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+# Timing differences below MIN_DELTA_SECONDS * sqrt(scale) are noise, whatever the ratio
+MIN_DELTA_SECONDS = 0.03
+MIN_DELTA_KB = 256
+# Scales at or above this skip the warm-up and time LARGE_REPEAT runs instead of --repeat
+LARGE_SCALE = 100
+LARGE_REPEAT = 2
+
+
+# ========== SYNTHETIC INPUTS ==========
+
+def current_sizes():
+    with open(_build_translations.INPUT, 'r', encoding='utf-8') as f:
+        strings = sum(1 for _ in csv.reader(f)) - 1
+    return {
+        'options': len(load_mod_options(MOD_OPTIONS_PATH)),
+        'strings': strings,
+        'zones': len(ZONES),
+    }
+
+
+def scaled_csv(path, scale):
+    """The real CSV with every row repeated scale times, plus extra language columns."""
+    with open(_build_translations.INPUT, 'r', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    header, body = rows[0], rows[1:]
+    extra = 2 * int(math.log10(scale)) if scale > 1 else 0
+    english = header.index('English')
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header + [f'Extra_{i}' for i in range(extra)])
+        for k in range(scale):
+            for row in body:
+                writer.writerow([f'{row[0]}_{k}'] + row[1:] + [row[english]] * extra)
+
+
+def scaled_tables(scale):
+    zones = [f'{zone}{k}' if k else zone for k in range(scale) for zone in ZONES]
+    tables = {}
+    for name, values in (('Damage', DAMAGE_VALUES), ('Duration', DURATION_VALUES),
+                         ('Frequency', FREQUENCY_VALUES), ('Chance', CHANCE_VALUES)):
+        tables[name] = {z: values[ZONES[i % len(ZONES)]] for i, z in enumerate(zones)}
+    return zones, tables
+
+
+def scaled_settings(path, scale):
+    zones = scaled_tables(scale)[0]
+    settings = {'Enabled': True, 'Zones': {
+        z: {'Enabled': True, 'Chance': 35.0, 'Damage': 1.0, 'Duration': 4.0, 'Frequency': 0.5, 'StackLimit': 3}
+        for z in zones}}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=2)
+
+
+# ========== BENCHMARKS ==========
+# Each benchmark is (name, setup(ctx), run(ctx)). setup builds inputs in
+# ctx['tmp'] and is not timed; run is timed and must be repeatable.
+
+def _fresh_dir(ctx, label):
+    ctx['runs'] = ctx.get('runs', 0) + 1
+    path = os.path.join(ctx['tmp'], f"{label}-{ctx['runs']}")
+    os.makedirs(path)
+    return path
+
+
+def setup_modoptions(ctx):
+    ctx['options_path'] = os.path.join(ctx['tmp'], 'DOTModOptions.cs')
+    with open(ctx['options_path'], 'w', encoding='utf-8') as f:
+        f.write(synthetic_source(ctx['sizes']['options'] * ctx['scale']))
+
+
+def run_parse_mod_options(ctx):
+    # Cold parse: a new cache directory each run
+    load_mod_options(ctx['options_path'], constant_paths=[], cache_dir=_fresh_dir(ctx, 'cache'))
+
+
+def setup_menu_mock(ctx):
+    setup_modoptions(ctx)
+    ctx['options'] = load_mod_options(ctx['options_path'], constant_paths=[],
+                                      cache_dir=os.path.join(ctx['tmp'], 'setup-cache'))
+
+
+def run_menu_mock(ctx):
+    build_menu_mock_xlsx.create_xlsx(list(ctx['options']), os.path.join(ctx['tmp'], 'MENU_MOCK.xlsx'), force=True)
+
+
+def setup_presets(ctx):
+    ctx['zones'], ctx['tables'] = scaled_tables(ctx['scale'])
+
+
+def run_presets(ctx):
+    build_presets_xlsx.create_xlsx(os.path.join(ctx['tmp'], 'PRESETS.xlsx'), ctx['zones'], ctx['tables'], force=True)
+
+
+def setup_translations(ctx):
+    ctx['csv_path'] = os.path.join(ctx['tmp'], '_translations.csv')
+    scaled_csv(ctx['csv_path'], ctx['scale'])
+
+
+def run_generate(ctx):
+    texts = _fresh_dir(ctx, 'Texts')
+    _build_translations.build(csv_path=ctx['csv_path'], texts_dir=texts,
+                              cache_dir=os.path.join(texts, '.cache'))
+
+
+def setup_generate_noop(ctx):
+    setup_translations(ctx)
+    ctx['texts'] = os.path.join(ctx['tmp'], 'Texts')
+    os.makedirs(ctx['texts'])
+    _build_translations.build(csv_path=ctx['csv_path'], texts_dir=ctx['texts'],
+                              cache_dir=os.path.join(ctx['texts'], '.cache'))
+
+
+def run_generate_noop(ctx):
+    _build_translations.build(csv_path=ctx['csv_path'], texts_dir=ctx['texts'],
+                              cache_dir=os.path.join(ctx['texts'], '.cache'))
+
+
+def run_import(ctx):
+    texts = _fresh_dir(ctx, 'Texts')
+    columns = [c for c in _build_translations.LANG_MAP if c != 'English']
+    _build_translations.build(columns, csv_path=ctx['csv_path'], texts_dir=texts,
+                              cache_dir=os.path.join(texts, '.cache'))
+
+
+def setup_export(ctx):
+    setup_generate_noop(ctx)
+    ctx['english_json'] = os.path.join(ctx['texts'], 'Text_English.json')
+
+
+def run_export(ctx):
+    entries = _export_translations.load_english_texts(ctx['english_json'])
+    _export_translations.export_csv(entries, os.path.join(ctx['tmp'], 'export.csv'))
+
+
+def setup_loc_coverage(ctx):
+    setup_generate_noop(ctx)
+    with open(ctx['csv_path'], 'r', encoding='utf-8') as f:
+        ids = [row[0] for row in csv.reader(f)][1:]
+    # Every other ID referenced from code: half the keys end up orphaned
+    ctx['cs_path'] = os.path.join(ctx['tmp'], 'Options.cs')
+    with open(ctx['cs_path'], 'w', encoding='utf-8') as f:
+        f.write('public static class Options\n{\n')
+        f.write(f'    private const string LocalizationGroupId = "{_build_translations.GROUP_ID}";\n')
+        for i, text_id in enumerate(ids[::2]):
+            f.write(f'    [ModOption(name = "O{i}", nameLocalizationId = LocalizationGroupId + ".{text_id}")]\n'
+                    f'    public static bool O{i};\n')
+        f.write('}\n')
+
+
+def run_loc_coverage(ctx):
+    references, _ = loc_coverage.extract_references([ctx['cs_path']])
+    loc_coverage.coverage(references, loc_coverage.load_languages(_build_translations.LANG_MAP.values(), ctx['texts']))
+
+
+def setup_settings(ctx):
+    ctx['settings_path'] = os.path.join(ctx['tmp'], 'settings.json')
+    scaled_settings(ctx['settings_path'], ctx['scale'])
+
+
+def run_settings(ctx):
+    if not debug_parse.validate_settings(ctx['settings_path']):
+        raise RuntimeError("validate_settings rejected the synthetic settings.json")
+
+
+BENCHMARKS = [
+    ('parse_mod_options', setup_modoptions, run_parse_mod_options),
+    ('menu_mock.create_xlsx', setup_menu_mock, run_menu_mock),
+    ('presets.create_xlsx', setup_presets, run_presets),
+    ('translations.generate', setup_translations, run_generate),
+    ('translations.generate_noop', setup_generate_noop, run_generate_noop),
+    ('translations.import', setup_translations, run_import),
+    ('translations.export', setup_export, run_export),
+    ('debug_parse.validate_settings', setup_settings, run_settings),
+    ('loc_coverage', setup_loc_coverage, run_loc_coverage),
+]
+
+
+# ========== RUNNER ==========
+
+def measure(setup, run, scale, sizes, repeat, warmup=True):
+    """Best wall time over repeat runs (after one untimed run), then peak traced memory of one more run."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = {'tmp': tmp, 'scale': scale, 'sizes': sizes}
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup(ctx)
+            if warmup:
+                run(ctx)
+            best = float('inf')
+            for _ in range(repeat):
+                gc.collect()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    run(ctx)
+                    best = min(best, time.perf_counter() - start)
+                finally:
+                    gc.enable()
+            gc.collect()
+            tracemalloc.start()
+            try:
+                run(ctx)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return {'seconds': round(best, 4), 'peak_kb': round(peak / 1024)}
+
+
+def compare(result, baseline, threshold, scale=1):
+    """Regression messages for one result against its baseline."""
+    problems = []
+    old_s, new_s = baseline['seconds'], result['seconds']
+    if new_s > old_s * (1 + threshold) and new_s - old_s > MIN_DELTA_SECONDS * math.sqrt(scale):
+        problems.append(f"time {old_s:.3f}s -> {new_s:.3f}s (+{(new_s / old_s - 1) * 100:.0f}%)")
+    old_m, new_m = baseline['peak_kb'], result['peak_kb']
+    if new_m > old_m * (1 + threshold) and new_m - old_m > MIN_DELTA_KB:
+        problems.append(f"peak {old_m} KB -> {new_m} KB (+{(new_m / old_m - 1) * 100:.0f}%)")
+    return problems
+
+
+def load_baselines(path=BASELINE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'machine': {}, 'results': {}}
+
+
+def save_baselines(baselines, path=BASELINE_PATH):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the _agent and _translations tools.")
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)), help="Comma separated multipliers")
+    parser.add_argument('--only', default='', help="Run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"Timed runs per benchmark below {LARGE_SCALE}x ({LARGE_REPEAT} at or above)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative regression (0.25 = 25%%)")
+    parser.add_argument('--update', action='store_true', help="Write results as the new baselines")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline JSON path")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    benchmarks = [b for b in BENCHMARKS if args.only in b[0]]
+    sizes = current_sizes()
+    baselines = load_baselines(args.baseline)
+    print(f"Current size: {sizes['options']} options, {sizes['strings']} strings, {sizes['zones']} zones")
+    print(f"\n{'benchmark':<32} {'scale':>6} {'seconds':>9} {'peak KB':>10}  vs baseline")
+
+    failures = []
+    for name, setup, run in benchmarks:
+        for scale in scales:
+            key = f"{name}@{scale}x"
+            large = scale >= LARGE_SCALE
+            repeat = LARGE_REPEAT if large else max(1, args.repeat)
+            result = measure(setup, run, scale, sizes, repeat, warmup=not large)
+            baseline = baselines['results'].get(key)
+            if baseline is None:
+                status = 'new'
+            else:
+                problems = compare(result, baseline, args.threshold, scale)
+                if problems:
+                    status = 'REGRESSION: ' + '; '.join(problems)
+                    failures.append(f"{key}: {'; '.join(problems)}")
+                elif baseline['seconds']:
+                    status = f"{(result['seconds'] / baseline['seconds'] - 1) * 100:+.0f}% time"
+                else:
+                    status = 'ok'
+            print(f"{name:<32} {scale:>5}x {result['seconds']:>9.3f} {result['peak_kb']:>10}  {status}")
+            if args.update:
+                baselines['results'][key] = result
+
+    if args.update:
+        baselines['machine'] = {
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'processor': platform.processor() or platform.machine(),
+        }
+        save_baselines(baselines, args.baseline)
+        print(f"\nBaselines written to {args.baseline}")
+        return
+
+    if failures:
+        print(f"\nFAIL: {len(failures)} regression(s) past {args.threshold * 100:.0f}%")
+        for f in failures:
+            print(f"  {f}")
+        sys.exit(1)
+    print("\nOK: no regressions")
+
+
+if __name__ == "__main__":
+    main()
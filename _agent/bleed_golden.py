@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Golden vectors for the BleedEffect arithmetic, checked bit for bit by
+DOT.Tests/BleedEffectGoldenTests.
+
+Every table is a full grid over its input axes, computed with vectorized
+float32 NumPy in the same operation order as the C# (so the expected values
+are the exact floats the JIT produces, not approximations):
+
+  intensity        CalculateBloodIntensity: BodyZone x BloodAmount preset x
+                   stacks 1-10 x every DamageProvider value x remaining
+                   duration after one Update (fade-out boundary, 0, < 0)
+  intensity_clamp  damage values within +-3 ulp of the 0.05 / 5.0 clamp
+                   edges for every zone, preset and stack count
+  tick_damage      GetTickDamage: damage type x multiplier (0.0-3.0x) x stack
+                   limit x hits (constructor + AddStack calls) x damage
+  add_stack        AddStack: stack limit, longer/shorter duration refresh and
+                   stronger/weaker damage across repeated hits
+  ticks            the BleedManager.Update loop for one effect: ticks fired,
+                   frames until expiry and the final RemainingDuration per
+                   frame rate x tick interval x duration x refresh hit
+
+File format (little-endian, the whole file gzip-compressed with mtime 0 so
+regenerating unchanged tables leaves the bytes unchanged):
+
+  b"DOTG", u16 version, u16 reserved
+  u8 axis count, per axis:     u8 name length, name, u32 count, f32 values
+  u8 column count, per column: u8 name length, name
+  rows: every axis combination in C order (last axis fastest), each row
+        column-count f32 values
+
+Columns hold the expected outputs plus any per-row inputs that are not a
+plain axis value (the clamp-edge damage, the refresh frame).
+
+Usage:
+    python bleed_golden.py                 # write every table
+    python bleed_golden.py --tables ticks
+    python bleed_golden.py --check         # exit 1 if a fixture is stale
+"""
+
+import argparse
+import gzip
+import io
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from preset_tables import DAMAGE_VALUES, DURATION_VALUES, FREQUENCY_VALUES, BLOOD_AMOUNT_MULTIPLIERS
+from registry import BODY_ZONES, PROJECT_ROOT
+from vfx_cost import (
+    INTENSITY_BASE_DIVISOR, MIN_BLOOD_INTENSITY, MAX_BLOOD_INTENSITY,
+    ZONE_INTENSITY_MULTIPLIERS, FADE_OUT_DURATION,
+)
+
+GOLDEN_DIR = os.path.join(PROJECT_ROOT, "DOT.Tests", "Golden")
+
+MAGIC = b'DOTG'
+FORMAT_VERSION = 1
+
+f32 = np.float32
+
+# ========== INPUT SPACE ==========
+
+# DOTModOptions value providers, computed the way C# does (i / 4f etc.)
+DAMAGE_OPTIONS = f32(np.arange(1, 81)) / f32(4)
+DURATION_OPTIONS = f32(np.arange(1, 61)) / f32(2)
+FREQUENCY_OPTIONS = f32(np.arange(1, 51)) / f32(10)
+MULTIPLIER_OPTIONS = f32(np.arange(0, 31)) / f32(10)
+STACK_LIMIT_OPTIONS = np.array([1, 2, 3, 4, 5, 10], dtype=np.float32)
+
+# DamageType codes by name; GetDamageTypeMultiplier returns 0 for the rest
+DAMAGE_TYPE_CODES = ['Unknown', 'Pierce', 'Slash', 'Blunt', 'Fire', 'Lightning']
+DOT_DAMAGE_TYPES = {'Pierce', 'Slash', 'Fire', 'Lightning'}
+
+# Intensity grid: one Update(dt) from GOLDEN_DURATION leaves these remaining
+GOLDEN_DURATION = f32(10.0)
+MAX_STACKS = 10
+CLAMP_ULPS = 3
+FRAME_RATES = [30, 45, 60, 72, 80, 90, 120, 144]
+REFRESH_AT = [0.0, 0.5, 0.9]  # Share of the duration at which a second hit lands (0 = none)
+
+
+def _union(*arrays):
+    return np.unique(np.concatenate([np.asarray(a, dtype=np.float32).ravel() for a in arrays]))
+
+
+def _update_steps():
+    """dt values for the single Update before CalculateBloodIntensity."""
+    fade = f32(GOLDEN_DURATION - f32(FADE_OUT_DURATION))
+    return _union([0.0, 5.0, 8.0, 8.4, fade, np.nextafter(fade, f32(0)), np.nextafter(fade, f32(20)),
+                   8.8, 9.25, 9.7, 9.99, 10.0, 10.5])
+
+
+def _presets(table):
+    return np.array([v for values in table.values() for v in values], dtype=np.float32)
+
+
+# ========== FORMULAS (float32, C# operation order) ==========
+
+def intensity(zone_mult, blood_mult, stacks, damage, remaining, fading):
+    """BleedEffect.CalculateBloodIntensity."""
+    base = (stacks.astype(np.float32) * damage * zone_mult) / f32(INTENSITY_BASE_DIVISOR)
+    final = base * blood_mult
+    fade = fading & (remaining > 0)
+    final = np.where(fade, final * (remaining / f32(FADE_OUT_DURATION)), final)
+    return np.clip(final, f32(MIN_BLOOD_INTENSITY), f32(MAX_BLOOD_INTENSITY)).astype(np.float32)
+
+
+def stack_count(hits, max_stacks):
+    """StackCount after the constructor and hits - 1 AddStack calls."""
+    return np.minimum(hits, np.maximum(max_stacks, 1)).astype(np.float32)
+
+
+def tick_damage(damage, stacks, type_mult):
+    """BleedEffect.GetTickDamage."""
+    return (damage * stacks.astype(np.float32)) * type_mult
+
+
+def _grid(*axes):
+    """Broadcastable views of the axes, one dimension each."""
+    out = []
+    for i, axis in enumerate(axes):
+        shape = [1] * len(axes)
+        shape[i] = len(axis)
+        out.append(np.asarray(axis, dtype=np.float32).reshape(shape))
+    return out
+
+
+# ========== TABLES ==========
+
+def table_intensity():
+    names = list(BODY_ZONES)
+    zones = np.array([BODY_ZONES[n] for n in names], dtype=np.float32)
+    zone_mult = np.array([ZONE_INTENSITY_MULTIPLIERS.get(n, 1.0) for n in names], dtype=np.float32)
+    blood = np.arange(len(BLOOD_AMOUNT_MULTIPLIERS), dtype=np.float32)
+    stacks = np.arange(1, MAX_STACKS + 1, dtype=np.float32)
+    damage = _union(DAMAGE_OPTIONS, _presets(DAMAGE_VALUES))
+    dt = _update_steps()
+
+    zm, bm, s, d, step = _grid(zone_mult, np.array(BLOOD_AMOUNT_MULTIPLIERS, dtype=np.float32), stacks, damage, dt)
+    remaining = GOLDEN_DURATION - step
+    expected = intensity(zm, bm, s, d, remaining, remaining <= f32(FADE_OUT_DURATION))
+    axes = [('zone', zones), ('blood', blood), ('stacks', stacks), ('damage', damage), ('dt', dt)]
+    return axes, [('intensity', expected)]
+
+
+def table_intensity_clamp():
+    names = list(BODY_ZONES)
+    zones = np.array([BODY_ZONES[n] for n in names], dtype=np.float32)
+    zone_mult = np.array([ZONE_INTENSITY_MULTIPLIERS.get(n, 1.0) for n in names], dtype=np.float32)
+    blood = np.arange(len(BLOOD_AMOUNT_MULTIPLIERS), dtype=np.float32)
+    stacks = np.arange(1, MAX_STACKS + 1, dtype=np.float32)
+    edges = np.array([MIN_BLOOD_INTENSITY, MAX_BLOOD_INTENSITY], dtype=np.float32)
+    offsets = np.arange(-CLAMP_ULPS, CLAMP_ULPS + 1, dtype=np.float32)
+
+    zm, bm, s, edge, off = _grid(zone_mult, np.array(BLOOD_AMOUNT_MULTIPLIERS, dtype=np.float32),
+                                 stacks, edges, offsets)
+    # Damage landing the unclamped intensity on the edge, then stepped by whole ulps
+    damage = (edge.astype(np.float64) * INTENSITY_BASE_DIVISOR / (s * zm * bm)).astype(np.float32)
+    damage = np.broadcast_to(damage, np.broadcast_shapes(damage.shape, off.shape)).copy()
+    for _ in range(CLAMP_ULPS):
+        damage = np.where(off > 0, np.nextafter(damage, f32(np.inf)), damage)
+        damage = np.where(off < 0, np.nextafter(damage, f32(0)), damage)
+        off = np.where(off > 0, off - 1, np.where(off < 0, off + 1, off))
+    expected = intensity(zm, bm, s, damage, GOLDEN_DURATION, np.False_)
+    axes = [('zone', zones), ('blood', blood), ('stacks', stacks), ('edge', edges), ('ulp', offsets)]
+    return axes, [('damage', damage), ('intensity', expected)]
+
+
+def table_tick_damage():
+    types = np.arange(len(DAMAGE_TYPE_CODES), dtype=np.float32)
+    applies = np.array([name in DOT_DAMAGE_TYPES for name in DAMAGE_TYPE_CODES])
+    hits = np.arange(1, 13, dtype=np.float32)
+    damage = _union(DAMAGE_OPTIONS, _presets(DAMAGE_VALUES))
+
+    t, m, limit, h, d = _grid(types, MULTIPLIER_OPTIONS, STACK_LIMIT_OPTIONS, hits, damage)
+    type_mult = np.where(applies[t.astype(np.intp)], m, f32(0))
+    expected = tick_damage(d, stack_count(h, limit), type_mult)
+    axes = [('damage_type', types), ('multiplier', MULTIPLIER_OPTIONS), ('max_stacks', STACK_LIMIT_OPTIONS),
+            ('hits', hits), ('damage', damage)]
+    return axes, [('tick_damage', expected)]
+
+
+def table_add_stack():
+    damage = np.array([0.25, 0.5, 1.0, 1.5, 2.5, 5.0, 12.0, 20.0], dtype=np.float32)
+    duration = np.array([0.5, 1.5, 2.0, 4.0, 7.5, 10.0, 20.0, 30.0], dtype=np.float32)
+    hits = np.array([1, 2, 3, 6, 12], dtype=np.float32)
+
+    d, sd, dur, sdur, limit, h = _grid(damage, damage, duration, duration, STACK_LIMIT_OPTIONS, hits)
+    stacked = h > 1
+    stacks = stack_count(h, limit)
+    per_tick = np.where(stacked & (sd > d), sd, d)
+    remaining = np.where(stacked & (sdur > dur), sdur, dur)
+    pierce = f32(1.2)  # DOTModOptions.PierceMultiplier default
+    axes = [('damage', damage), ('stack_damage', damage), ('duration', duration),
+            ('stack_duration', duration), ('max_stacks', STACK_LIMIT_OPTIONS), ('hits', hits)]
+    return axes, [('stacks', stacks), ('damage_per_tick', per_tick), ('remaining', remaining),
+                  ('tick_damage', tick_damage(per_tick, stacks, pierce))]
+
+
+def table_ticks():
+    """Run the Update loop for every combination at once, one frame per step."""
+    hz = np.array(FRAME_RATES, dtype=np.float32)
+    interval = _union(FREQUENCY_OPTIONS, _presets(FREQUENCY_VALUES))
+    duration = _union(DURATION_OPTIONS, _presets(DURATION_VALUES))
+    refresh = np.array(REFRESH_AT, dtype=np.float32)
+
+    rate, iv, dur, share = _grid(hz, interval, duration, refresh)
+    shape = np.broadcast_shapes(rate.shape, iv.shape, dur.shape, share.shape)
+    dt = np.broadcast_to(f32(1) / rate, shape).ravel()
+    iv = np.broadcast_to(iv, shape).ravel()
+    dur = np.broadcast_to(dur, shape).ravel()
+    # Frame (1-based) whose hit calls AddStack(damage, duration) before Update; 0 = never
+    refresh_frame = np.floor(share.astype(np.float64) * dur.reshape(shape) * rate).astype(np.int64)
+    refresh_frame = np.broadcast_to(refresh_frame, shape).ravel()
+
+    remaining = dur.copy()
+    since = np.zeros_like(remaining)
+    ticks = np.zeros(remaining.size, dtype=np.int64)
+    frames = np.zeros(remaining.size, dtype=np.int64)
+    live = np.arange(remaining.size)
+    frame = 0
+    while live.size:
+        frame += 1
+        # AddStack: duration > RemainingDuration refreshes it
+        hit = refresh_frame[live] == frame
+        if hit.any():
+            idx = live[hit]
+            remaining[idx] = np.where(dur[idx] > remaining[idx], dur[idx], remaining[idx])
+        remaining[live] -= dt[live]
+        since[live] += dt[live]
+        expired = remaining[live] <= 0
+        frames[live[expired]] = frame
+        live = live[~expired]
+        tick = since[live] >= iv[live]
+        ticks[live[tick]] += 1
+        since[live[tick]] = 0
+
+    axes = [('hz', hz), ('interval', interval), ('duration', duration), ('refresh', refresh)]
+    return axes, [('refresh_frame', refresh_frame.reshape(shape)), ('ticks', ticks.reshape(shape)),
+                  ('frames', frames.reshape(shape)), ('remaining', remaining.reshape(shape))]
+
+
+TABLES = {
+    'intensity': table_intensity,
+    'intensity_clamp': table_intensity_clamp,
+    'tick_damage': table_tick_damage,
+    'add_stack': table_add_stack,
+    'ticks': table_ticks,
+}
+
+
+# ========== FILES ==========
+
+def golden_path(name):
+    return os.path.join(GOLDEN_DIR, f"bleed_{name}.bin.gz")
+
+
+def _name(text):
+    raw = text.encode('ascii')
+    return struct.pack('<B', len(raw)) + raw
+
+
+def encode(axes, columns):
+    """Serialize a table (uncompressed bytes)."""
+    shape = tuple(len(values) for _, values in axes)
+    out = io.BytesIO()
+    out.write(MAGIC + struct.pack('<HH', FORMAT_VERSION, 0))
+    out.write(struct.pack('<B', len(axes)))
+    for name, values in axes:
+        out.write(_name(name) + struct.pack('<I', len(values)))
+        out.write(np.asarray(values, dtype='<f4').tobytes())
+    out.write(struct.pack('<B', len(columns)))
+    for name, _ in columns:
+        out.write(_name(name))
+    rows = np.empty(shape + (len(columns),), dtype='<f4')
+    for i, (name, values) in enumerate(columns):
+        values = np.broadcast_to(values, shape)
+        if values.dtype.kind in 'iu':
+            assert values.max(initial=0) < 1 << 24, f"{name}: integers too large for f32"
+        rows[..., i] = values
+    out.write(rows.tobytes())
+    return out.getvalue()
+
+
+def compress(raw):
+    out = io.BytesIO()
+    with gzip.GzipFile(fileobj=out, mode='wb', compresslevel=9, mtime=0) as f:
+        f.write(raw)
+    return out.getvalue()
+
+
+def build(name):
+    """(compressed bytes, row count) for one table."""
+    axes, columns = TABLES[name]()
+    rows = int(np.prod([len(values) for _, values in axes]))
+    return compress(encode(axes, columns)), rows
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the BleedEffect golden vectors for DOT.Tests.")
+    parser.add_argument('--tables', default=','.join(TABLES), help=f"Comma separated: {', '.join(TABLES)}")
+    parser.add_argument('--check', action='store_true', help="Verify the fixtures on disk are up to date")
+    args = parser.parse_args()
+
+    names = [t.strip() for t in args.tables.split(',') if t.strip()]
+    unknown = [t for t in names if t not in TABLES]
+    if unknown:
+        print(f"Error: unknown table(s) {', '.join(unknown)}. Expected: {', '.join(TABLES)}")
+        sys.exit(1)
+
+    stale = False
+    total = 0
+    for name in names:
+        start = time.perf_counter()
+        data, rows = build(name)
+        total += rows
+        path = golden_path(name)
+        rel = os.path.relpath(path, PROJECT_ROOT)
+        if args.check:
+            if _read(path) != data:
+                print(f"DRIFT: {rel} is out of date")
+                stale = True
+            continue
+        if _read(path) == data:
+            print(f"Unchanged: {rel} ({rows:,} rows)")
+            continue
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        print(f"Generated: {rel} ({rows:,} rows, {len(data) / 1024:.0f} KiB, "
+              f"{time.perf_counter() - start:.1f}s)")
+
+    if args.check:
+        if stale:
+            sys.exit(1)
+        print(f"Bleed golden vectors are in sync ({total:,} rows).")
+
+
+if __name__ == "__main__":
+    main()
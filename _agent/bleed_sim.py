@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Offline bleed-tick simulator mirroring BleedManager.Update and BleedEffect.
+
+Every (creature, zone) pair holds at most one BleedEffect, so the whole
+simulation is kept as NumPy arrays shaped (combos, creatures, zones) and
+stepped one frame at a time. Every requested preset combination shares the
+same random hit stream, so differences between combos come from the presets
+alone.
+
+Reports live effects, ticks fired and damage applications (the
+currentHealth write / Kill() in ApplyBleedDamage) per frame at 72/90/120 Hz.
+
+Usage:
+    python bleed_sim.py
+    python bleed_sim.py --damage High --frequency Fast,Rapid --creatures 2000
+    python bleed_sim.py --damage all --frequency all --hz 72 --seconds 30 --json sim.json
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from preset_tables import (
+    ZONES,
+    DAMAGE_PRESETS, DAMAGE_VALUES,
+    DURATION_PRESETS, DURATION_VALUES,
+    FREQUENCY_PRESETS, FREQUENCY_VALUES,
+    CHANCE_PRESETS, CHANCE_VALUES,
+    STACK_LIMITS,
+    DAMAGE_TYPES, DAMAGE_TYPE_MULTIPLIERS,
+)
+
+# Mirrors BleedEffect.FADE_OUT_DURATION
+FADE_OUT_DURATION = 1.5
+
+DEFAULT_HZ = [72, 90, 120]
+
+# Share of hits landing on each zone (roughly what a sword/spear fight produces)
+DEFAULT_ZONE_WEIGHTS = {
+    'Throat': 0.05,
+    'Head': 0.15,
+    'Neck': 0.10,
+    'Torso': 0.40,
+    'Arm': 0.15,
+    'Leg': 0.10,
+    'Dismemberment': 0.05,
+}
+
+DEFAULT_DAMAGE_TYPE_WEIGHTS = {
+    'Pierce': 0.40,
+    'Slash': 0.50,
+    'Fire': 0.05,
+    'Lightning': 0.05,
+}
+
+# (axis name, preset labels, per-zone values)
+PRESET_AXES = [
+    ('damage', DAMAGE_PRESETS, DAMAGE_VALUES),
+    ('duration', DURATION_PRESETS, DURATION_VALUES),
+    ('frequency', FREQUENCY_PRESETS, FREQUENCY_VALUES),
+    ('chance', CHANCE_PRESETS, CHANCE_VALUES),
+]
+
+
+def _normalize(label):
+    return label.replace(' ', '').lower()
+
+
+def parse_preset_list(arg, labels):
+    """Turn 'Default', 'High,Extreme' or 'all' into a list of preset indices."""
+    if arg.strip().lower() == 'all':
+        return list(range(len(labels)))
+    lookup = {_normalize(label): i for i, label in enumerate(labels)}
+    indices = []
+    for part in arg.split(','):
+        key = _normalize(part)
+        if key not in lookup:
+            raise ValueError(f"Unknown preset '{part}'. Expected one of: {', '.join(labels)}")
+        indices.append(lookup[key])
+    return indices
+
+
+def parse_weights(arg, names, defaults):
+    """Parse 'Torso=0.5,Head=0.2' into a normalized weight vector ordered by names."""
+    weights = dict(defaults)
+    if arg:
+        for part in arg.split(','):
+            key, _, value = part.partition('=')
+            key = key.strip()
+            if key not in weights:
+                raise ValueError(f"Unknown key '{key}'. Expected one of: {', '.join(names)}")
+            weights[key] = float(value)
+    vec = np.array([weights[name] for name in names], dtype=np.float64)
+    if vec.sum() <= 0:
+        raise ValueError("Weights must sum to a positive value")
+    return vec / vec.sum()
+
+
+def build_combo_params(combos):
+    """Build (combos, zones) float32 parameter arrays for each preset combination."""
+    combos = np.asarray(combos, dtype=np.intp).reshape(-1, len(PRESET_AXES))
+    params = {}
+    for axis, (name, _, values) in enumerate(PRESET_AXES):
+        table = np.array([values[zone] for zone in ZONES], dtype=np.float32)  # (zones, 5)
+        params[name] = table[:, combos[:, axis]].T.copy()
+    params['stack_limit'] = np.array([STACK_LIMITS[zone] for zone in ZONES], dtype=np.int16)
+    return params
+
+
+def combo_label(combo):
+    return ' / '.join(labels[i] for (_, labels, _), i in zip(PRESET_AXES, combo))
+
+
+def simulate(params, hz, seconds, creatures, hit_rate=0.5, zone_weights=None,
+             damage_type_weights=None, creature_hp=0.0, respawn_delay=5.0, seed=0):
+    """
+    Step the bleed model for `seconds` at a fixed frame rate.
+
+    Per frame, in BleedManager order: hits resolve through ApplyBleed (chance
+    roll, AddStack or new effect), then every effect runs Update(dt), expired
+    effects are removed, and effects whose TimeSinceLastTick reached
+    TickInterval tick once. creature_hp <= 0 makes creatures immortal.
+
+    Returns a dict of per-frame int32 arrays shaped (combos, frames).
+    """
+    rng = np.random.default_rng(seed)
+    n_combos, n_zones = params['damage'].shape
+    shape = (n_combos, creatures, n_zones)
+    n_frames = int(round(seconds * hz))
+    dt = np.float32(1.0 / hz)
+
+    if zone_weights is None:
+        zone_weights = parse_weights('', ZONES, DEFAULT_ZONE_WEIGHTS)
+    if damage_type_weights is None:
+        damage_type_weights = parse_weights('', DAMAGE_TYPES, DEFAULT_DAMAGE_TYPE_WEIGHTS)
+    type_mult = np.array([DAMAGE_TYPE_MULTIPLIERS[t] for t in DAMAGE_TYPES], dtype=np.float32)
+
+    damage = params['damage']
+    duration = params['duration']
+    interval = params['frequency'][:, None, :]
+    chance = params['chance']
+    stack_limit = params['stack_limit']
+
+    # Effect state
+    active = np.zeros(shape, dtype=bool)
+    remaining = np.zeros(shape, dtype=np.float32)
+    since_tick = np.zeros(shape, dtype=np.float32)
+    stacks = np.zeros(shape, dtype=np.int16)
+    per_tick = np.zeros(shape, dtype=np.float32)
+    mult = np.zeros(shape, dtype=np.float32)
+
+    # Creature state
+    mortal = creature_hp > 0
+    health = np.full((n_combos, creatures), creature_hp, dtype=np.float32)
+    killed = np.zeros((n_combos, creatures), dtype=bool)
+    dead_time = np.zeros((n_combos, creatures), dtype=np.float32)
+
+    out = {key: np.zeros((n_combos, n_frames), dtype=np.int32) for key in (
+        'live_effects', 'ticks', 'damage_calls', 'fading', 'bleeding_creatures',
+        'new_effects', 'stacks_added', 'expired', 'kills')}
+
+    combo_idx = np.arange(n_combos)[:, None]
+    hit_prob = hit_rate * float(dt)
+
+    for frame in range(n_frames):
+        # Respawn dead creatures after the delay
+        if mortal:
+            dead_time[killed] += dt
+            respawn = killed & (dead_time >= respawn_delay)
+            if respawn.any():
+                killed[respawn] = False
+                health[respawn] = creature_hp
+                dead_time[respawn] = 0.0
+
+        # Hits -> ApplyBleed (shared across combos: common random numbers)
+        hit_creatures = np.nonzero(rng.random(creatures) < hit_prob)[0]
+        if hit_creatures.size:
+            zones = rng.choice(n_zones, size=hit_creatures.size, p=zone_weights)
+            types = rng.choice(len(DAMAGE_TYPES), size=hit_creatures.size, p=damage_type_weights)
+            rolls = (rng.random(hit_creatures.size) * 100.0).astype(np.float32)
+
+            passed = (rolls[None, :] <= chance[:, zones]) & ~killed[:, hit_creatures]
+            sel = (combo_idx, hit_creatures[None, :], zones[None, :])
+            existing = active[sel]
+            is_new = passed & ~existing
+            is_stack = passed & existing
+
+            hit_damage = damage[:, zones]
+            hit_duration = duration[:, zones]
+            limit = stack_limit[zones][None, :]
+
+            cur_stacks = stacks[sel]
+            stacks[sel] = np.where(is_new, 1, np.where(is_stack & (cur_stacks < limit),
+                                                       cur_stacks + 1, cur_stacks))
+            remaining[sel] = np.where(is_new, hit_duration,
+                                      np.where(is_stack, np.maximum(remaining[sel], hit_duration),
+                                               remaining[sel]))
+            per_tick[sel] = np.where(is_new, hit_damage,
+                                     np.where(is_stack, np.maximum(per_tick[sel], hit_damage),
+                                              per_tick[sel]))
+            since_tick[sel] = np.where(is_new, 0.0, since_tick[sel])
+            mult[sel] = np.where(is_new, type_mult[types][None, :], mult[sel])
+            active[sel] = existing | is_new
+
+            out['new_effects'][:, frame] = is_new.sum(axis=1)
+            out['stacks_added'][:, frame] = is_stack.sum(axis=1)
+
+        # BleedEffect.Update
+        np.subtract(remaining, dt, out=remaining, where=active)
+        np.add(since_tick, dt, out=since_tick, where=active)
+
+        expired = active & (remaining <= 0.0)
+        ticking = active & ~expired & (since_tick >= interval)
+        since_tick[ticking] = 0.0
+
+        # ApplyBleedDamage: GetTickDamage = DamagePerTick * StackCount * type multiplier
+        tick_damage = np.where(ticking, per_tick * stacks * mult, np.float32(0.0))
+        calls = ticking & (tick_damage > 0.0)
+        if mortal:
+            # Effects after the killing tick see isKilled and return early
+            dealt_before = np.cumsum(tick_damage, axis=2) - tick_damage
+            calls &= (health[:, :, None] - dealt_before) > 0.0
+            health -= np.where(calls, tick_damage, 0.0).sum(axis=2)
+            newly_killed = ~killed & (health <= 0.0)
+            killed |= newly_killed
+            # onCreatureKill -> ClearCreature
+            cleared = active & newly_killed[:, :, None] & ~expired
+            active &= ~cleared
+            out['kills'][:, frame] = newly_killed.sum(axis=1)
+            out['expired'][:, frame] = cleared.sum(axis=(1, 2))
+
+        active &= ~expired
+
+        out['live_effects'][:, frame] = active.sum(axis=(1, 2))
+        out['ticks'][:, frame] = ticking.sum(axis=(1, 2))
+        out['damage_calls'][:, frame] = calls.sum(axis=(1, 2))
+        out['fading'][:, frame] = (active & (remaining <= FADE_OUT_DURATION)).sum(axis=(1, 2))
+        out['bleeding_creatures'][:, frame] = active.any(axis=2).sum(axis=1)
+        out['expired'][:, frame] += expired.sum(axis=(1, 2))
+
+    return out
+
+
+def summarize(frames, hz, warmup_seconds=0.0):
+    """Reduce per-frame arrays to per-combo load statistics."""
+    start = min(int(warmup_seconds * hz), frames['live_effects'].shape[1] - 1)
+    live = frames['live_effects'][:, start:]
+    ticks = frames['ticks'][:, start:]
+    calls = frames['damage_calls'][:, start:]
+    seconds = live.shape[1] / hz
+    return {
+        'live_mean': live.mean(axis=1),
+        'live_p95': np.percentile(live, 95, axis=1),
+        'live_max': live.max(axis=1),
+        'ticks_mean': ticks.mean(axis=1),
+        'ticks_max': ticks.max(axis=1),
+        'calls_mean': calls.mean(axis=1),
+        'calls_max': calls.max(axis=1),
+        'calls_per_sec': calls.sum(axis=1) / seconds,
+        'fading_max': frames['fading'][:, start:].max(axis=1),
+        'bleeding_max': frames['bleeding_creatures'][:, start:].max(axis=1),
+        'kills': frames['kills'][:, start:].sum(axis=1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate DOT bleed load per frame for preset combinations.")
+    parser.add_argument('--damage', default='Default', help="Damage preset(s), comma separated or 'all'")
+    parser.add_argument('--duration', default='Default', help="Duration preset(s), comma separated or 'all'")
+    parser.add_argument('--frequency', default='Default', help="Frequency preset(s), comma separated or 'all'")
+    parser.add_argument('--chance', default='Default', help="Chance preset(s), comma separated or 'all'")
+    parser.add_argument('--hz', default=','.join(str(h) for h in DEFAULT_HZ), help="Frame rates, comma separated")
+    parser.add_argument('--seconds', type=float, default=60.0, help="Simulated seconds per run")
+    parser.add_argument('--warmup', type=float, default=5.0, help="Seconds excluded from statistics")
+    parser.add_argument('--creatures', type=int, default=1000, help="Simulated creatures")
+    parser.add_argument('--hit-rate', type=float, default=0.5, help="Hits per creature per second")
+    parser.add_argument('--zone-weights', default='', help="e.g. Torso=0.5,Head=0.2 (others keep defaults)")
+    parser.add_argument('--damage-type-weights', default='', help="e.g. Pierce=1,Slash=1,Fire=0,Lightning=0")
+    parser.add_argument('--creature-hp', type=float, default=0.0, help="Creature health; 0 = immortal (worst case)")
+    parser.add_argument('--respawn-delay', type=float, default=5.0, help="Seconds before a killed creature respawns")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', default='', help="Write summaries to this JSON file")
+    parser.add_argument('--npz', default='', help="Write per-frame arrays to this .npz file")
+    args = parser.parse_args()
+
+    try:
+        axes = [parse_preset_list(getattr(args, name), labels) for name, labels, _ in PRESET_AXES]
+        zone_weights = parse_weights(args.zone_weights, ZONES, DEFAULT_ZONE_WEIGHTS)
+        type_weights = parse_weights(args.damage_type_weights, DAMAGE_TYPES, DEFAULT_DAMAGE_TYPE_WEIGHTS)
+        rates = [int(h) for h in args.hz.split(',')]
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    combos = list(itertools.product(*axes))
+    params = build_combo_params(combos)
+    print(f"Simulating {len(combos)} preset combination(s) x {args.creatures} creatures, "
+          f"{args.seconds:.0f}s at {', '.join(str(h) for h in rates)} Hz")
+
+    results = []
+    npz = {}
+    for hz in rates:
+        start = time.perf_counter()
+        frames = simulate(params, hz, args.seconds, args.creatures, args.hit_rate, zone_weights,
+                          type_weights, args.creature_hp, args.respawn_delay, args.seed)
+        wall = time.perf_counter() - start
+        stats = summarize(frames, hz, args.warmup)
+
+        print(f"\n=== {hz} Hz ({wall:.2f}s wall, {args.seconds * len(combos) / wall:.0f} sim-s/s) ===")
+        print(f"{'Preset (dmg / dur / freq / chance)':<44} {'live avg':>8} {'p95':>6} {'max':>6} "
+              f"{'ticks/f':>8} {'max':>5} {'calls/f':>8} {'max':>5} {'calls/s':>8}")
+        for i, combo in enumerate(combos):
+            print(f"{combo_label(combo):<44} {stats['live_mean'][i]:>8.1f} {stats['live_p95'][i]:>6.0f} "
+                  f"{stats['live_max'][i]:>6d} {stats['ticks_mean'][i]:>8.2f} {stats['ticks_max'][i]:>5d} "
+                  f"{stats['calls_mean'][i]:>8.2f} {stats['calls_max'][i]:>5d} {stats['calls_per_sec'][i]:>8.1f}")
+            results.append({
+                'hz': hz,
+                'presets': dict(zip([name for name, _, _ in PRESET_AXES],
+                                    [labels[j] for (_, labels, _), j in zip(PRESET_AXES, combo)])),
+                **{key: float(value[i]) for key, value in stats.items()},
+            })
+        if args.npz:
+            for key, value in frames.items():
+                npz[f"{key}_{hz}hz"] = value
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+    if args.npz:
+        np.savez_compressed(args.npz, **npz)
+        print(f"Wrote {args.npz}")
+
+
+if __name__ == "__main__":
+    main()
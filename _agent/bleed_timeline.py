@@ -0,0 +1,660 @@
+#!/usr/bin/env python3
+"""
+Per-creature bleed timelines rebuilt from DOT debug logging in Player.log.
+
+Turns the BleedManager/BleedEffect debug lines into one interval per bleed
+effect (creation -> expiry, with every stack increment) and indexes them
+so "what was live at t" and "how many effects at most, per creature" are
+answered in logarithmic time:
+  - "NEW BLEED: Zone on Creature" (+ its "Duration=..s" detail line)
+  - "STACK: Zone on Creature" (+ "Stacks: a -> b" and "Duration: a -> b")
+  - "EXPIRED: Zone on Creature (reason)"
+  - "--- Active Bleeds Status ---" dumps (LogActiveEffectsStatus)
+  - "Spawned/Released blood effect for Zone"
+  - "Slow tick: X ms (N effects)"
+
+Player.log has no timestamps, so the clock is rebuilt from the data: a
+bleed's remaining duration falls by exactly the unscaled time that passed,
+so the remaining durations in consecutive status dumps (at least
+STATUS_LOG_INTERVAL apart) fix the time between dumps, and each effect's
+NEW/STACK/dump/EXPIRED remainders place its own events relative to those
+dumps. Where no effect lives through a dump interval (the game went quiet)
+only a lower bound on its length is known; the report lists those spots.
+Effects that never reach a dump (shorter than the dump interval) and slow
+ticks are placed by their log position between placed events.
+Durations are printed with one decimal, so times are good to about 0.1 s.
+t is seconds since the session's first bleed.
+
+Creatures are known only by name, and most share one ("HumanMale(Clone)"):
+same-named creatures share a timeline row, and a line that could belong to
+several of their effects goes to the one whose stack count and remaining
+duration fit it best (re-checked in a second pass against the rebuilt clock).
+
+Usage:
+    python bleed_timeline.py Player.log
+    python bleed_timeline.py Player.log --at 312.4 --at 318
+    python bleed_timeline.py Player.log --window 310 315 --slow 5
+    python bleed_timeline.py Player.log --trace timeline.json --csv timeline.csv
+"""
+
+import argparse
+import csv
+import functools
+import json
+import mmap
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+
+from log_analyzer import STATUS_ENTRY_RE, _num
+
+STATUS_LOG_INTERVAL = 5.0  # BleedManager.STATUS_LOG_INTERVAL
+
+EVENT_RE = re.compile(
+    rb'\[DOT\] (?:'
+    rb'NEW BLEED: (?P<new_zone>\w+) on (?P<new_name>[^\r\n]*)'
+    rb'|  BaseDmg=[^\r\n]*?DamageType=(?P<new_type>\w+)[^\r\n]*?Duration=(?P<new_dur>[\d.,]+)s'
+    rb'|STACK: (?P<stack_zone>\w+) on (?P<stack_name>[^\r\n]*)'
+    rb'|  Stacks: (?P<stack_old>\d+) -> (?P<stack_new>\d+)'
+    rb'|  Duration: (?P<dur_old>-?[\d.,]+)s -> (?P<dur_new>-?[\d.,]+)s'
+    rb'|EXPIRED: (?P<exp_zone>\w+) on (?P<exp_name>.*?) \((?P<exp_reason>duration ended|target invalid/killed)\)'
+    rb'|Spawned blood effect for (?P<vfx_spawn>\w+)'
+    rb'|Released blood effect for (?P<vfx_release>\w+)'
+    rb'|Slow tick: (?P<slow_ms>[\d.,]+) ?ms \((?P<slow_n>\d+) effects\)'
+    rb'|(?P<status_start>--- Active Bleeds Status ---)'
+    rb'|(?P<status_end>-{32})'
+    rb'|  (?P<st_name>[^\r\n]+?): (?P<st_entries>\w+ x\d+ \([^\r\n]*)'
+    rb'|=== DOT v(?P<version>[\w.]+) \((?P<platform>[^)\r\n]+)\) ==='
+    rb')'
+)
+
+EXPIRED_DURATION = 'duration ended'
+EXPIRED_KILLED = 'target invalid/killed'
+END_OF_LOG = 'log ended'
+
+
+# ========== RECONSTRUCTION ==========
+
+class Effect:
+    """One BleedEffect: creation to expiry on one creature/zone."""
+
+    def __init__(self, creature, zone, seq, remaining, stacks=1, damage_type=None, seen_created=True):
+        self.creature = creature
+        self.zone = zone
+        self.damage_type = damage_type
+        self.seen_created = seen_created    # False: first seen in a status dump
+        # (seq, kind, remaining before, remaining after, stacks); remaining None = unknown
+        self.points = [(seq, 'new' if seen_created else 'seen', remaining, remaining, stacks)]
+        self.end_reason = None
+        self.vfx_spawned = False
+        self.vfx_released = False
+        self.start = None
+        self.end = None
+        self.stack_times = []               # (t, stacks after) per increment
+        self._local = None
+
+    @property
+    def max_stacks(self):
+        return max(p[4] for p in self.points)
+
+    def add(self, seq, kind, before, after, stacks=None):
+        self.points.append((seq, kind, before, after, self.points[-1][4] if stacks is None else stacks))
+
+    def local_times(self):
+        """Seconds since this effect's first point for each point (None where unknown)."""
+        if self._local is not None and len(self._local) == len(self.points):
+            return self._local
+        times = [0.0]
+        u, remaining = 0.0, self.points[0][3]
+        for _, _, before, after, _ in self.points[1:]:
+            if before is None or remaining is None or u is None:
+                times.append(None)
+                u = None
+            else:
+                u += max(remaining - before, 0.0)
+                times.append(u)
+            remaining = after
+        self._local = times
+        return times
+
+    def projected_end(self):
+        """Local time at which the remaining duration would reach zero."""
+        u = self.local_times()[-1]
+        remaining = self.points[-1][3]
+        return None if u is None or remaining is None else u + max(remaining, 0.0)
+
+
+class Session:
+    def __init__(self, version='?', platform='?'):
+        self.version = version
+        self.platform = platform
+        self.effects = []
+        self.dumps = []             # [(seq, {(creature, zone): [(stacks, remaining, effect)]})]
+        self.dump_times = []
+        self.unlinked_gaps = []     # dump times followed by an interval of unknown length
+        self.slow_ticks = []        # (seq, ms, effects) -> (t, ms, effects) after placement
+        self.unmatched = 0          # EXPIRED / STACK lines for effects not seen created
+        self.ambiguous = 0          # lines that matched several same-named creatures
+        self.clock = None           # seq -> t (before the origin shift)
+        self.index = None
+
+
+def _choose(live, seq, remaining, stacks=None, clock=None):
+    """Pick the effect a line refers to when same-named creatures share a zone.
+
+    Prefers the stack count the line reports, then the remaining duration
+    closest to the line's: each candidate's last known remainder, run down
+    by the elapsed time when a clock from a previous pass is available.
+    """
+    same = [e for e in live if e.points[-1][4] == stacks] if stacks is not None else []
+    candidates = same or live
+    if len(candidates) == 1 or remaining is None:
+        return candidates[0]
+    scores = []
+    for i, effect in enumerate(candidates):
+        last_seq, _, _, after, _ = effect.points[-1]
+        if after is not None:
+            expected = after - (clock(seq) - clock(last_seq)) if clock else after
+            scores.append((abs(expected - remaining), i))
+    return candidates[min(scores)[1]] if scores else candidates[0]
+
+
+def parse_log(path, clocks=None):
+    """Read the bleed events of one log into Sessions, in log order.
+
+    clocks: per-session seq -> t functions from an earlier pass, used to
+    tell same-named creatures' effects apart.
+    """
+    sessions = []
+    if os.path.getsize(path) == 0:
+        return sessions
+    session = None
+    open_effects = {}               # (creature, zone) -> [Effect] live, oldest first
+    new_effect = None               # NEW BLEED waiting for its Duration= line
+    stack = None                    # [creature, zone, seq, old stacks, new stacks] waiting for its Duration line
+    spawned, released = set(), set()
+    status = None
+
+    def current():
+        nonlocal session
+        if session is None:
+            session = Session()
+            sessions.append(session)
+        return session
+
+    def clock():
+        return clocks[len(sessions) - 1] if clocks and len(sessions) <= len(clocks) else None
+
+    def live_for(creature, zone):
+        live = open_effects.get((creature, zone))
+        if not live and creature == 'null':
+            # Target destroyed before the EXPIRED line: any creature with that zone
+            live = [e for (_, z), effects in open_effects.items() if z == zone for e in effects]
+        if live and len(live) > 1:
+            current().ambiguous += 1
+        return live
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for seq, m in enumerate(EVENT_RE.finditer(mm)):
+            group = m.group
+            if group('new_zone') is not None:
+                zone, creature = group('new_zone').decode(), group('new_name').decode('utf-8', 'replace')
+                new_effect = Effect(creature, zone, seq, None)
+                new_effect.vfx_spawned = zone in spawned
+                spawned.discard(zone)
+                current().effects.append(new_effect)
+                open_effects.setdefault((creature, zone), []).append(new_effect)
+            elif group('new_dur') is not None:
+                if new_effect is not None:
+                    duration = _num(group('new_dur'))
+                    new_effect.points[0] = new_effect.points[0][:2] + (duration, duration) + new_effect.points[0][4:]
+                    new_effect.damage_type = group('new_type').decode()
+                new_effect = None
+            elif group('stack_zone') is not None:
+                stack = [group('stack_name').decode('utf-8', 'replace'), group('stack_zone').decode(), seq, None, None]
+            elif group('stack_old') is not None:
+                if stack is not None:
+                    stack[3], stack[4] = int(group('stack_old')), int(group('stack_new'))
+            elif group('dur_old') is not None:
+                if stack is None:
+                    continue
+                creature, zone, stack_seq, old, new = stack
+                stack = None
+                before, after = _num(group('dur_old')), _num(group('dur_new'))
+                live = live_for(creature, zone)
+                if not live:
+                    current().unmatched += 1
+                    continue
+                effect = _choose(live, stack_seq, before, old, clock())
+                effect.add(stack_seq, 'stack', before, after, new)
+            elif group('exp_zone') is not None:
+                zone, creature = group('exp_zone').decode(), group('exp_name').decode('utf-8', 'replace')
+                reason = group('exp_reason').decode()
+                was_released = zone in released
+                released.discard(zone)
+                live = live_for(creature, zone)
+                if not live:
+                    current().unmatched += 1
+                    continue
+                effect = _choose(live, seq, 0.0 if reason == EXPIRED_DURATION else None, clock=clock())
+                open_effects[(effect.creature, zone)].remove(effect)
+                effect.end_reason = reason
+                effect.vfx_released = was_released
+                if reason == EXPIRED_DURATION:
+                    effect.add(seq, 'expired', 0.0, 0.0)
+                else:
+                    effect.add(seq, 'killed', None, None)
+            elif group('vfx_spawn') is not None:
+                spawned.add(group('vfx_spawn').decode())
+            elif group('vfx_release') is not None:
+                released.add(group('vfx_release').decode())
+            elif group('slow_ms') is not None:
+                current().slow_ticks.append((seq, _num(group('slow_ms')), int(group('slow_n'))))
+            elif group('status_start') is not None:
+                status = {}
+            elif status is not None and group('st_name') is not None:
+                creature = group('st_name').decode('utf-8', 'replace')
+                for zone, stacks, remaining in STATUS_ENTRY_RE.findall(group('st_entries')):
+                    status.setdefault((creature, zone.decode()), []).append((int(stacks), _num(remaining)))
+            elif group('status_end') is not None:
+                if status is not None:
+                    _record_dump(current(), seq, status, open_effects, clock())
+                status = None
+            elif group('version') is not None:
+                _close_session(session, open_effects)
+                session = Session(group('version').decode(), group('platform').decode())
+                sessions.append(session)
+                open_effects, new_effect, stack, status = {}, None, None, None
+                spawned.clear()
+                released.clear()
+    _close_session(session, open_effects)
+    return sessions
+
+
+def _record_dump(session, seq, status, open_effects, clock):
+    """Attach a status dump's remainders to the live effects they describe."""
+    matched = {}
+    for key, entries in status.items():
+        live = list(open_effects.get(key, ()))
+        if len(live) > 1:
+            session.ambiguous += 1
+        for stacks, remaining in entries:
+            if live:
+                effect = _choose(live, seq, remaining, stacks, clock)
+                live.remove(effect)
+                effect.add(seq, 'dump', remaining, remaining, stacks)
+            else:
+                effect = Effect(key[0], key[1], seq, remaining, stacks, seen_created=False)
+                session.effects.append(effect)
+                open_effects.setdefault(key, []).append(effect)
+            matched.setdefault(key, []).append((stacks, remaining, effect))
+    session.dumps.append((seq, matched))
+
+
+def _close_session(session, open_effects):
+    if session is None:
+        return
+    for live in open_effects.values():
+        for effect in live:
+            effect.end_reason = END_OF_LOG
+
+
+# ========== CLOCK ==========
+
+def _local_at(effect, seq):
+    """Local time of the effect's point at log position seq (None if unknown or absent)."""
+    for point, u in zip(effect.points, effect.local_times()):
+        if point[0] == seq:
+            return u
+    return None
+
+
+def _dump_times(session):
+    """Time of each status dump; consecutive dumps are linked through shared effects."""
+    times = []
+    for i, (seq, matched) in enumerate(session.dumps):
+        if i == 0:
+            times.append(0.0)
+            continue
+        previous_seq, previous = session.dumps[i - 1]
+        gaps, younger = [], []
+        for entries in matched.values():
+            for _, _, effect in entries:
+                here = _local_at(effect, seq)
+                before = _local_at(effect, previous_seq)
+                if here is not None and before is not None:
+                    gaps.append(here - before)
+                elif here is not None and effect.seen_created and effect.points[0][0] > previous_seq:
+                    younger.append((effect.points[0][0], here))
+        if gaps:
+            gaps.sort()
+            times.append(times[-1] + max(gaps[len(gaps) // 2], STATUS_LOG_INTERVAL))
+            continue
+
+        # Nothing lived through both dumps, so only a lower bound is known: the
+        # dump interval, the age of this dump's effects, and the time until the
+        # previous dump's effects ran out (plus the age of any effect created
+        # after such an expiry)
+        expiries = []
+        for entries in previous.values():
+            for _, _, effect in entries:
+                last = effect.points[-1]
+                if last[1] == 'expired' and last[0] < seq:
+                    elapsed, before = _local_at(effect, last[0]), _local_at(effect, previous_seq)
+                    if elapsed is not None and before is not None:
+                        expiries.append((last[0], elapsed - before))
+        bounds = [STATUS_LOG_INTERVAL] + [u for _, u in younger] + [e for _, e in expiries]
+        bounds += [e + u for created, u in younger for expired, e in expiries if expired < created]
+        session.unlinked_gaps.append(times[-1])
+        times.append(times[-1] + max(bounds))
+    return times
+
+
+def _interpolate(anchor_seqs, anchor_times, seq):
+    if not anchor_seqs:
+        return 0.0
+    i = bisect_left(anchor_seqs, seq)
+    if i < len(anchor_seqs) and anchor_seqs[i] == seq:
+        return anchor_times[i]
+    if i == 0:
+        return anchor_times[0]
+    if i == len(anchor_seqs):
+        return anchor_times[-1]
+    s0, s1 = anchor_seqs[i - 1], anchor_seqs[i]
+    t0, t1 = anchor_times[i - 1], anchor_times[i]
+    return t0 + (t1 - t0) * (seq - s0) / (s1 - s0)
+
+
+def place(session):
+    """Give every effect, stack increment and slow tick a session time."""
+    session.dump_times = _dump_times(session)
+    dump_time = {seq: t for (seq, _), t in zip(session.dumps, session.dump_times)}
+
+    # Effects seen in a dump are placed from it; their points become anchors
+    anchors = dict(dump_time)
+    unplaced = []
+    for effect in session.effects:
+        local = effect.local_times()
+        offsets = [dump_time[p[0]] - u for p, u in zip(effect.points, local)
+                   if p[1] in ('dump', 'seen') and p[0] in dump_time and u is not None]
+        if offsets:
+            effect.start = sum(offsets) / len(offsets)
+            for p, u in zip(effect.points, local):
+                if u is not None:
+                    anchors.setdefault(p[0], effect.start + u)
+        else:
+            unplaced.append(effect)
+
+    anchor_seqs = sorted(anchors)
+    anchor_times = []
+    for seq in anchor_seqs:
+        # Rounding can put a later line marginally earlier; keep the clock monotonic
+        t = anchors[seq]
+        anchor_times.append(max(t, anchor_times[-1]) if anchor_times else t)
+
+    session.clock = functools.partial(_interpolate, anchor_seqs, anchor_times)
+    for effect in unplaced:
+        effect.start = _interpolate(anchor_seqs, anchor_times, effect.points[0][0])
+
+    for effect in session.effects:
+        local = effect.local_times()
+        effect.stack_times = []
+        last = effect.start
+        for p, u in zip(effect.points, local):
+            t = effect.start + u if u is not None else max(_interpolate(anchor_seqs, anchor_times, p[0]), last)
+            if p[1] == 'stack':
+                effect.stack_times.append((t, p[4]))
+            last = t
+        if effect.end_reason == EXPIRED_KILLED or effect.end_reason is None:
+            effect.end = last
+        else:
+            projected = effect.projected_end()
+            effect.end = effect.start + projected if projected is not None else last
+        effect.end = max(effect.end, effect.start)
+
+    session.slow_ticks = [(_interpolate(anchor_seqs, anchor_times, seq), ms, n) for seq, ms, n in session.slow_ticks]
+
+    # t = 0 at the first bleed
+    origin = min([e.start for e in session.effects], default=0.0)
+    for effect in session.effects:
+        effect.start -= origin
+        effect.end -= origin
+        effect.stack_times = [(t - origin, s) for t, s in effect.stack_times]
+    session.dump_times = [t - origin for t in session.dump_times]
+    session.unlinked_gaps = [t - origin for t in session.unlinked_gaps]
+    session.slow_ticks = [(t - origin, ms, n) for t, ms, n in session.slow_ticks]
+    session.index = IntervalIndex([(e.start, e.end, e) for e in session.effects])
+    return session
+
+
+def load(path):
+    """Parse and place every session of a log file.
+
+    When same-named creatures made matches ambiguous, the log is parsed a
+    second time with the first pass's clock to redo those matches.
+    """
+    sessions = [place(session) for session in parse_log(path)]
+    if any(session.ambiguous for session in sessions):
+        sessions = [place(session) for session in parse_log(path, [s.clock for s in sessions])]
+    return sessions
+
+
+# ========== INDEX ==========
+
+class _Node:
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+
+class IntervalIndex:
+    """Static centered interval tree over half-open [start, end) intervals.
+
+    at(t) and overlapping(a, b) cost O(log n + k); count_at(t) costs
+    O(log n) from two sorted endpoint arrays.
+    """
+
+    def __init__(self, intervals):
+        self.intervals = sorted(intervals, key=lambda iv: (iv[0], iv[1]))
+        self.starts = [iv[0] for iv in self.intervals]
+        self.ends = sorted(iv[1] for iv in self.intervals)
+        self.root = self._build(self.intervals)
+
+    def _build(self, intervals):
+        if not intervals:
+            return None
+        node = _Node()
+        node.center = intervals[len(intervals) // 2][0]
+        here, left, right = [], [], []
+        for iv in intervals:
+            if iv[1] <= node.center and iv[0] < node.center:
+                left.append(iv)
+            elif iv[0] > node.center:
+                right.append(iv)
+            else:
+                here.append(iv)
+        node.by_start = here                # already sorted by start
+        node.by_end = sorted(here, key=lambda iv: -iv[1])
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def at(self, t):
+        """Payloads of the intervals with start <= t < end."""
+        found = []
+        node = self.root
+        while node is not None:
+            if t < node.center:
+                for iv in node.by_start:
+                    if iv[0] > t:
+                        break
+                    found.append(iv[2])
+                node = node.left
+            else:
+                for iv in node.by_end:
+                    if iv[1] <= t:
+                        break
+                    found.append(iv[2])
+                node = node.right
+        return found
+
+    def overlapping(self, a, b):
+        """Payloads of the intervals live at any point of [a, b)."""
+        found = [p for p in self.at(a)]
+        lo, hi = bisect_right(self.starts, a), bisect_left(self.starts, b)
+        found.extend(iv[2] for iv in self.intervals[lo:hi])
+        return found
+
+    def count_at(self, t):
+        return bisect_right(self.starts, t) - bisect_right(self.ends, t)
+
+    def max_concurrent(self):
+        """(count, t): the most intervals live at once and the first time it happens."""
+        best, best_t, live = 0, None, 0
+        events = sorted([(iv[0], 1) for iv in self.intervals] + [(iv[1], -1) for iv in self.intervals])
+        for t, delta in events:        # at equal t, ends (-1) sort before starts
+            live += delta
+            if live > best:
+                best, best_t = live, t
+        return best, best_t
+
+
+def by_creature(session):
+    """creature -> IntervalIndex of its effects."""
+    groups = {}
+    for effect in session.effects:
+        groups.setdefault(effect.creature, []).append((effect.start, effect.end, effect))
+    return {creature: IntervalIndex(intervals) for creature, intervals in sorted(groups.items())}
+
+
+# ========== OUTPUT ==========
+
+def describe(effect):
+    stacks = f" x{effect.max_stacks}" if effect.max_stacks > 1 else ""
+    return f"{effect.zone}{stacks} [{effect.start:.1f}-{effect.end:.1f}s]"
+
+
+def print_session(title, session, creatures, args):
+    effects = session.effects
+    print(f"--- {title} ---")
+    print(f"  Effects: {len(effects)} on {len(creatures)} creature(s) | status dumps: {len(session.dumps)}"
+          + (f" | unmatched lines: {session.unmatched}" if session.unmatched else ""))
+    if session.unlinked_gaps:
+        print("  No effect lived through the status interval after t="
+              + ", ".join(f"{t:.1f}" for t in session.unlinked_gaps) + "s: its length is a lower bound")
+    if not effects:
+        return
+    count, t = session.index.max_concurrent()
+    print(f"  Span: {max(e.end for e in effects):.1f}s"
+          + (f" | max concurrent: {count} at t={t:.1f}s" if count else ""))
+    print(f"  {'creature':<28} {'effects':>7} {'stacks':>6} {'max live':>8} {'at s':>8}")
+    for creature, index in creatures.items():
+        count, t = index.max_concurrent()
+        stacks = sum(e.max_stacks for _, _, e in index.intervals)
+        print(f"  {creature[:28]:<28} {len(index):>7} {stacks:>6} {count:>8} {t if t is not None else 0:>8.1f}")
+
+    for t in args.at:
+        live = session.index.at(t)
+        print(f"  Live at t={t:g}s: {len(live)}")
+        for effect in sorted(live, key=lambda e: (e.creature, e.start)):
+            print(f"    {effect.creature}: {describe(effect)}")
+    if args.window:
+        a, b = args.window
+        live = session.index.overlapping(a, b)
+        print(f"  Live during {a:g}-{b:g}s: {len(live)}")
+        for effect in sorted(live, key=lambda e: (e.creature, e.start)):
+            print(f"    {effect.creature}: {describe(effect)}")
+    if args.slow and session.slow_ticks:
+        print(f"  Slowest ticks (t approximate):")
+        for t, ms, n in sorted(session.slow_ticks, key=lambda s: -s[1])[:args.slow]:
+            print(f"    t={t:7.1f}s {ms:7.2f}ms {n:>4} effects | {session.index.count_at(t)} live per timeline")
+
+
+def chrome_trace(sessions):
+    """Timeline as Chrome trace events: one process per session, one row per creature."""
+    events = []
+    for pid, session in enumerate(sessions, 1):
+        events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                       'args': {'name': f"Session {pid}: v{session.version} ({session.platform})"}})
+        creatures = sorted({e.creature for e in session.effects})
+        tids = {creature: tid for tid, creature in enumerate(creatures, 1)}
+        for creature, tid in tids.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': creature}})
+        for effect in session.effects:
+            tid = tids[effect.creature]
+            events.append({'name': effect.zone, 'cat': 'bleed', 'ph': 'X', 'pid': pid, 'tid': tid,
+                           'ts': effect.start * 1e6, 'dur': (effect.end - effect.start) * 1e6,
+                           'args': {'stacks': effect.max_stacks, 'end': effect.end_reason,
+                                    'damage_type': effect.damage_type, 'vfx': effect.vfx_spawned}})
+            for t, stacks in effect.stack_times:
+                events.append({'name': f"{effect.zone} x{stacks}", 'cat': 'stack', 'ph': 'i', 's': 't',
+                               'pid': pid, 'tid': tid, 'ts': t * 1e6})
+        live = 0
+        for t, delta in sorted([(e.start, 1) for e in session.effects] + [(e.end, -1) for e in session.effects]):
+            live += delta
+            events.append({'name': 'Live effects', 'ph': 'C', 'pid': pid, 'tid': 0, 'ts': t * 1e6,
+                           'args': {'effects': live}})
+        for t, ms, n in session.slow_ticks:
+            events.append({'name': f"Slow tick {ms:.2f}ms", 'cat': 'tick', 'ph': 'i', 's': 'p',
+                           'pid': pid, 'tid': 0, 'ts': t * 1e6, 'args': {'ms': ms, 'effects': n}})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def write_csv(sessions, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['session', 'creature', 'zone', 'start_s', 'end_s', 'end_reason', 'max_stacks',
+                         'stack_times_s', 'damage_type', 'vfx_spawned', 'vfx_released', 'seen_created'])
+        for number, session in enumerate(sessions, 1):
+            for e in sorted(session.effects, key=lambda e: (e.start, e.creature)):
+                writer.writerow([number, e.creature, e.zone, f"{e.start:.2f}", f"{e.end:.2f}", e.end_reason,
+                                 e.max_stacks, ' '.join(f"{t:.2f}" for t, _ in e.stack_times),
+                                 e.damage_type or '', int(e.vfx_spawned), int(e.vfx_released),
+                                 int(e.seen_created)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild per-creature bleed timelines from Player.log debug output.")
+    parser.add_argument('log', help="Player.log with DOT debug logging enabled")
+    parser.add_argument('--session', type=int, default=0, help="Only this session (1-based); default: all")
+    parser.add_argument('--at', type=float, action='append', default=[], metavar='T',
+                        help="List the effects live at T seconds (repeatable)")
+    parser.add_argument('--window', type=float, nargs=2, metavar=('A', 'B'),
+                        help="List the effects live at any point between A and B seconds")
+    parser.add_argument('--slow', type=int, default=0, metavar='N',
+                        help="Show the N slowest ticks with the live effect count at their time")
+    parser.add_argument('--trace', default='', help="Write a Chrome/Perfetto timeline (JSON)")
+    parser.add_argument('--csv', default='', help="Write one row per effect interval")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.log):
+        print(f"Error: not found: {args.log}")
+        sys.exit(1)
+
+    sessions = load(args.log)
+    numbered = list(enumerate(sessions, 1))
+    if args.session:
+        numbered = [(n, s) for n, s in numbered if n == args.session]
+        if not numbered:
+            print(f"Error: {args.log} has {len(sessions)} session(s)")
+            sys.exit(1)
+
+    print(f"=== {args.log} ({len(sessions)} session(s)) ===")
+    for number, session in numbered:
+        print_session(f"Session {number}: v{session.version} ({session.platform})", session,
+                      by_creature(session), args)
+
+    selected = [s for _, s in numbered]
+    if args.trace:
+        with open(args.trace, 'w', encoding='utf-8') as f:
+            json.dump(chrome_trace(selected), f)
+        print(f"\nWrote {args.trace} (open in https://ui.perfetto.dev)")
+    if args.csv:
+        write_csv(selected, args.csv)
+        print(f"Wrote {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
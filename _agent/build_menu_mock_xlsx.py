@@ -2,150 +2,90 @@
 """
 Generates MENU_MOCK.xlsx from DOTModOptions.cs
 Parses ModOption attributes to build a spreadsheet of all menu options.
+The workbook is streamed (write-only) and only rewritten when the options
+or this script change; see xlsx_writer.py.
 """
 
+import argparse
+import itertools
 import os
-import re
 import sys
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-except ImportError:
-    print("Error: openpyxl not installed. Run: pip install openpyxl")
-    sys.exit(1)
+import profiling
+import xlsx_writer
+from modoption_parser import load_mod_options
+from registry import PROJECT_ROOT
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 MOD_OPTIONS_PATH = os.path.join(PROJECT_ROOT, "Configuration", "DOTModOptions.cs")
-OUTPUT_PATH = os.path.join(PROJECT_ROOT, "MENU_MOCK.xlsx")
+OUTPUT_PATH = os.path.join(PROJECT_ROOT, "_design", "MENU_MOCK.xlsx")
 
-
-def parse_constants(content):
-    """Parse constant definitions from the file."""
-    constants = {}
-    # Match const int patterns like: private const int CategoryOrderPreset = 10;
-    pattern = r'(?:private|public)?\s*const\s+int\s+(\w+)\s*=\s*(\d+)\s*;'
-    for match in re.finditer(pattern, content):
-        constants[match.group(1)] = int(match.group(2))
-    return constants
+HEADERS = ['Category', 'Order', 'Name', 'Type', 'Default', 'Tooltip', 'Value Source']
+COLUMN_WIDTHS = [20, 8, 25, 10, 15, 50, 25]
 
 
 def parse_mod_options(filepath):
-    """Parse DOTModOptions.cs and extract ModOption attributes."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Parse constants first
-    constants = parse_constants(content)
-
-    options = []
-
-    # Match ModOption attributes followed by field declarations
-    pattern = r'\[ModOption\(([^]]+)\)\]\s*public\s+static\s+(\w+)\s+(\w+)\s*=\s*([^;]+);'
-
-    for match in re.finditer(pattern, content):
-        attr_content = match.group(1)
-        field_type = match.group(2)
-        field_name = match.group(3)
-        default_value = match.group(4).strip()
-
-        option = {
-            'field_name': field_name,
-            'field_type': field_type,
-            'default_value': default_value,
-            'name': '',
-            'category': 'Main',
-            'categoryOrder': 0,
-            'order': 0,
-            'tooltip': '',
-            'valueSourceName': '',
-            'defaultValueIndex': 0,
-        }
-
-        # Parse attribute parameters
-        name_match = re.search(r'name\s*=\s*(\w+)', attr_content)
-        if name_match:
-            option['name'] = name_match.group(1)
-
-        category_match = re.search(r'category\s*=\s*(\w+)', attr_content)
-        if category_match:
-            option['category'] = category_match.group(1)
-
-        category_order_match = re.search(r'categoryOrder\s*=\s*(\w+)', attr_content)
-        if category_order_match:
-            order_val = category_order_match.group(1)
-            # Try to resolve constant, or use 0
-            option['categoryOrder'] = constants.get(order_val, 0)
-
-        order_match = re.search(r'order\s*=\s*(\d+)', attr_content)
-        if order_match:
-            option['order'] = int(order_match.group(1))
-
-        tooltip_match = re.search(r'tooltip\s*=\s*"([^"]*)"', attr_content)
-        if tooltip_match:
-            option['tooltip'] = tooltip_match.group(1)
-
-        source_match = re.search(r'valueSourceName\s*=\s*"(\w+)"', attr_content)
-        if source_match:
-            option['valueSourceName'] = source_match.group(1)
-
-        default_idx_match = re.search(r'defaultValueIndex\s*=\s*(\d+)', attr_content)
-        if default_idx_match:
-            option['defaultValueIndex'] = int(default_idx_match.group(1))
-
-        options.append(option)
-
+    """Parse DOTModOptions.cs and extract ModOption attributes (cached by content hash)."""
+    with profiling.span('parse options'):
+        options = load_mod_options(filepath)
+    for opt in options:
+        for key in opt['unresolved']:
+            print(f"Warning: {opt['field_name']}.{key} could not be resolved: {opt[key]}")
     return options
 
 
-def create_xlsx(options, output_path):
-    """Create MENU_MOCK.xlsx from parsed options."""
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Menu Options"
-
-    # Headers
-    headers = ['Category', 'Order', 'Name', 'Type', 'Default', 'Tooltip', 'Value Source']
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
-
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center')
-
-    # Sort options by category order, then by order
-    options.sort(key=lambda x: (x.get('categoryOrder', 0), x.get('order', 0)))
-
-    # Add data rows
-    for row, opt in enumerate(options, 2):
-        ws.cell(row=row, column=1, value=opt['category'])
-        ws.cell(row=row, column=2, value=opt['order'])
-        ws.cell(row=row, column=3, value=opt['name'])
-        ws.cell(row=row, column=4, value=opt['field_type'])
-        ws.cell(row=row, column=5, value=opt['default_value'])
-        ws.cell(row=row, column=6, value=opt['tooltip'])
-        ws.cell(row=row, column=7, value=opt['valueSourceName'])
-
-    # Adjust column widths
-    column_widths = [20, 8, 25, 10, 15, 50, 25]
-    for col, width in enumerate(column_widths, 1):
-        ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
-
-    wb.save(output_path)
+def option_rows(ordered):
+    """Yield sheet rows for options already sorted by sort_options()."""
+    for opt in ordered:
+        yield [opt['category'], opt['order'], opt['name'], opt['field_type'],
+               opt['default_value'], opt['tooltip'], opt['valueSourceName']]
+
+
+def sort_options(options):
+    """Options sorted by category order, then by order."""
+    return sorted(options, key=lambda x: (x.get('categoryOrder', 0), x.get('order', 0)))
+
+
+def create_xlsx(options, output_path, force=False):
+    """Create MENU_MOCK.xlsx from parsed options.
+
+    Skips writing (leaving the file byte-identical) when the stored source
+    hash matches, unless force is set. Returns True if the file was written.
+    """
+    ordered = sort_options(options)
+    with profiling.span('hash rows'):
+        digest = xlsx_writer.source_hash(itertools.chain([HEADERS, COLUMN_WIDTHS], option_rows(ordered)), __file__)
+    if not force and xlsx_writer.is_current(output_path, digest):
+        print(f"Up to date: {output_path}")
+        return False
+
+    with profiling.span('build rows'):
+        wb = xlsx_writer.new_workbook()
+        ws = wb.create_sheet("Menu Options")
+        xlsx_writer.set_widths(ws, COLUMN_WIDTHS)
+
+        ws.append([xlsx_writer.cell(ws, h, 'DOT Header') for h in HEADERS])
+        for row in option_rows(ordered):
+            ws.append(row)
+
+    xlsx_writer.save(wb, output_path, digest)
     print(f"Generated: {output_path}")
-    print(f"Total options: {len(options)}")
+    print(f"Total options: {len(ordered)}")
+    return True
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate _design/MENU_MOCK.xlsx from DOTModOptions.cs")
+    parser.add_argument('--force', action='store_true', help="Rewrite even if the inputs are unchanged")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
     if not os.path.exists(MOD_OPTIONS_PATH):
         print(f"Error: {MOD_OPTIONS_PATH} not found")
         sys.exit(1)
 
-    options = parse_mod_options(MOD_OPTIONS_PATH)
-    create_xlsx(options, OUTPUT_PATH)
+    with profiling.session(args, 'menu_mock'):
+        options = parse_mod_options(MOD_OPTIONS_PATH)
+        create_xlsx(options, OUTPUT_PATH, force=args.force)
 
 
 if __name__ == "__main__":
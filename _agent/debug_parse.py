@@ -1,49 +1,49 @@
 #!/usr/bin/env python3
 """
 Debug utility for parsing and validating DOT configuration files.
+
+Schema checks for every JSON file live in json_validator.py; this script
+runs them alongside the manifest summary and the optional settings.json.
+--profile writes a Chrome trace of each check (see profiling.py).
 """
 
+import argparse
 import os
 import json
 import sys
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+import json_validator
+import profiling
+from registry import PROJECT_ROOT, ZONES
 
 
 def validate_manifest():
-    """Validate manifest.json format."""
+    """Validate manifest.json against the shared manifest schema."""
     manifest_path = os.path.join(PROJECT_ROOT, "manifest.json")
 
     if not os.path.exists(manifest_path):
         print(f"ERROR: manifest.json not found at {manifest_path}")
         return False
 
-    try:
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-
-        required_fields = ['Name', 'Description', 'Author', 'ModVersion', 'GameVersion']
-        missing = [f for f in required_fields if f not in manifest]
-
-        if missing:
-            print(f"ERROR: manifest.json missing fields: {missing}")
-            return False
-
-        print("manifest.json: VALID")
-        print(f"  Name: {manifest['Name']}")
-        print(f"  Version: {manifest['ModVersion']}")
-        print(f"  GameVersion: {manifest['GameVersion']}")
-        return True
+    with open(manifest_path, 'rb') as f:
+        result = json_validator.check_file("manifest.json", f.read())
 
-    except json.JSONDecodeError as e:
-        print(f"ERROR: manifest.json parse error: {e}")
+    for d in result['diagnostics']:
+        print(f"{d['severity'].upper()}: manifest.json{'#' + d['pointer'] if d['pointer'] else ''}: {d['message']}")
+    if any(d['severity'] == json_validator.ERROR for d in result['diagnostics']):
         return False
 
+    facts = result['facts']
+    print("manifest.json: VALID")
+    print(f"  Name: {facts['Name']}")
+    print(f"  Version: {facts['ModVersion']}")
+    print(f"  GameVersion: {facts['GameVersion']}")
+    return True
+
 
-def validate_settings():
+def validate_settings(settings_path=None):
     """Validate settings.json format."""
-    settings_path = os.path.join(PROJECT_ROOT, "settings.json")
+    settings_path = settings_path or os.path.join(PROJECT_ROOT, "settings.json")
 
     if not os.path.exists(settings_path):
         print(f"ERROR: settings.json not found at {settings_path}")
@@ -61,8 +61,7 @@ def validate_settings():
             return False
 
         zones = settings['Zones']
-        expected_zones = ['Throat', 'Head', 'Neck', 'Torso', 'Arm', 'Leg', 'Dismemberment']
-        missing_zones = [z for z in expected_zones if z not in zones]
+        missing_zones = [z for z in ZONES if z not in zones]
 
         if missing_zones:
             print(f"WARNING: settings.json missing zones: {missing_zones}")
@@ -77,13 +76,33 @@ def validate_settings():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate the DOT configuration files.")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    with profiling.session(args, 'debug_parse'):
+        run_checks()
+
+
+def run_checks():
     print("DOT Configuration Validator")
     print("=" * 40)
 
     all_valid = True
-    all_valid &= validate_manifest()
+    with profiling.span('validate manifest'):
+        all_valid &= validate_manifest()
     print()
-    all_valid &= validate_settings()
+
+    with profiling.span('validate tree'):
+        report = json_validator.validate_tree()
+    json_validator.print_report(report)
+    all_valid &= report['errors'] == 0
+
+    # settings.json is not part of the shipped mod; check it only when present
+    if os.path.exists(os.path.join(PROJECT_ROOT, "settings.json")):
+        print()
+        with profiling.span('validate settings'):
+            all_valid &= validate_settings()
 
     print()
     if all_valid:
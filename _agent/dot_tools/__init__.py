@@ -0,0 +1,101 @@
+"""
+Single entry point for the _agent and _translations tools.
+
+    python -m dot_tools <command> [args]      (from _agent/)
+    python _agent/dot_tools <command> [args]  (from anywhere)
+
+Each command is the existing script's main(): its module is imported only
+when that command runs, with sys.argv set to the remaining arguments, so
+openpyxl, numpy and the like load only for the commands that use them and
+--help here costs no more than starting Python. Run
+`python -m dot_tools <command> --help` for a command's own options.
+"""
+
+import sys
+
+# dot_tools is imported from _agent/, so registry is always on the path here
+from registry import AGENT_DIR, TRANSLATIONS_DIR
+
+# (group, [(command, module, summary)]); every module exposes main()
+COMMANDS = [
+    ('Release', [
+        ('release', '_release', "Build, zip, tag and publish a GitHub release"),
+        ('build', 'release_builder', "Cached PCVR/Nomad builds, staged and zipped into builds/"),
+        ('snapshot', 'snapshot', "Content-addressed working-tree snapshots: create, diff, restore, export"),
+    ]),
+    ('Generators', [
+        ('presets', 'gen_preset_tables', "PresetTables.g.cs, PRESETS.md and PRESETS.xlsx from preset_tables.py"),
+        ('presets-xlsx', 'build_presets_xlsx', "Only _design/PRESETS.xlsx"),
+        ('option-graph', 'gen_option_graph', "OptionGraph.g.cs and the unreachable-options report"),
+        ('bleed-golden', 'bleed_golden', "DOT.Tests/Golden/bleed_*.bin.gz golden vectors"),
+        ('menu-mock', 'build_menu_mock_xlsx', "_design/MENU_MOCK.xlsx from DOTModOptions.cs"),
+        ('watch', 'watch', "Rebuild the affected artifacts on every save"),
+    ]),
+    ('Translations', [
+        ('translations-export', '_export_translations', "English texts -> _translations.csv"),
+        ('translations-import', '_import_translations', "Translated CSV columns -> Text_*.json"),
+        ('translations-generate', '_generate_all_translations', "Every language CSV column -> Text_*.json"),
+        ('translations-pack', '_pack_translations', "Minified Text_*.json for a build"),
+        ('translation-memory', '_translation_memory', "Fuzzy matches for untranslated CSV cells"),
+        ('loc-coverage', 'loc_coverage', "Localization IDs in code vs Text_*.json"),
+    ]),
+    ('Validation', [
+        ('validate', 'debug_parse', "manifest.json, every JSON file and settings.json"),
+        ('validate-json', 'json_validator', "Schema checks for every JSON file"),
+    ]),
+    ('Analysis', [
+        ('ttk', 'ttk_matrix', "Time-to-kill matrix over all preset combinations"),
+        ('solve', 'preset_solver', "Preset values that meet TTK / damage-call targets"),
+        ('sim', 'bleed_sim', "Offline bleed-tick simulation"),
+        ('hits', 'hit_trace', "Hit traces: scenario generators and batch replay through a bleed model"),
+        ('vfx-cost', 'vfx_cost', "Blood VFX spawn/refresh cost per preset combination"),
+        ('zones', 'zone_detector', "ZoneDetector replay, confusion matrices, golden vectors"),
+        ('logs', 'log_analyzer', "Player.log analysis"),
+        ('timeline', 'bleed_timeline', "Per-creature bleed intervals rebuilt from Player.log"),
+        ('telemetry', 'telemetry', "Binary telemetry summaries"),
+    ]),
+    ('Benchmarks', [
+        ('bench', 'bench_suite', "Scaled benchmark suite with baselines"),
+        ('bench-parser', 'bench_modoption_parser', "modoption_parser benchmark"),
+        ('bench-translations', '_bench_translations', "_build_translations benchmark"),
+        ('bench-text-formats', '_bench_text_formats', "Text_*.json layout load benchmark"),
+        ('bench-translation-memory', '_bench_translation_memory', "Translation memory benchmark"),
+    ]),
+]
+
+MODULES = {command: module for _, commands in COMMANDS for command, module, _ in commands}
+
+
+def print_help(out=sys.stdout):
+    out.write("usage: python -m dot_tools <command> [args]\n")
+    for group, commands in COMMANDS:
+        out.write(f"\n{group}:\n")
+        for command, _, summary in commands:
+            out.write(f"  {command:<26}{summary}\n")
+    out.write("\n`python -m dot_tools <command> --help` shows a command's options.\n")
+
+
+def run(command, args):
+    """Import the command's module and run its main() with args as the command line."""
+    sys.path[:0] = [p for p in (AGENT_DIR, TRANSLATIONS_DIR) if p not in sys.path]
+    import importlib
+    module = importlib.import_module(MODULES[command])
+    sys.argv = [f"dot_tools {command}"] + list(args)
+    return module.main()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help', 'help') and len(argv) < 2:
+        print_help()
+        return 0
+    if argv[0] == 'help':
+        argv = [argv[1], '--help']
+    command, args = argv[0], argv[1:]
+    if command not in MODULES:
+        import difflib
+        close = difflib.get_close_matches(command, MODULES, n=3)
+        hint = f" Did you mean: {', '.join(close)}?" if close else ''
+        sys.stderr.write(f"dot_tools: unknown command '{command}'.{hint}\n")
+        return 2
+    return run(command, args)
@@ -0,0 +1,10 @@
+import os
+import sys
+
+if __package__ in (None, ''):
+    # Run as `python _agent/dot_tools`: make the package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dot_tools import main  # noqa: E402
+
+sys.exit(main())
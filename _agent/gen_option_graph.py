@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Derives the preset -> custom option dependency graph and emits it as static
+index tables for DOTModOptionVisibility.
+
+The graph is read from the code, not declared by hand:
+  DOTModOptions.SetZone<X>   the setters the visibility code calls when the
+                             <X> preset changes; each case writes one field
+  [ModOption] on that field  the custom option the preset drives, its
+                             valueSourceName provider and defaultValueIndex
+  <X>PresetProvider option   the preset selector that drives it
+  <X>Provider body           the slider's parameter values (for loop or
+                             literal list), evaluated as float32
+  preset_tables.py           the value each preset writes per zone
+
+For every preset x zone the value is located on the slider once, here, so
+the game applies a preset with array reads instead of building "cat||name"
+keys and scanning ModOptionParameter[] for a matching float.
+
+Output: Core/OptionGraph.g.cs (slot = slider * ZoneCount + ZoneIndex(zone),
+parameter index = ParameterIndex[slot * PresetCount + preset], -1 when the
+preset value is not on the slider). The report lists the graph, every
+option no preset reaches, preset values that are off their slider and
+defaultValueIndex entries that disagree with the Default preset.
+
+--check regenerates in memory and exits 1 if OptionGraph.g.cs is stale;
+off-slider preset values are warnings (the game leaves that slider where
+it is, as FindParameterIndex did).
+
+Usage:
+    python gen_option_graph.py            # write OptionGraph.g.cs and print the report
+    python gen_option_graph.py --check
+    python gen_option_graph.py --report   # report only, no write
+"""
+
+import argparse
+import os
+import re
+import struct
+import sys
+
+import preset_tables
+from modoption_parser import MOD_OPTIONS_PATH, load_mod_options, scan
+from registry import PROJECT_ROOT
+
+VISIBILITY_PATH = os.path.join(PROJECT_ROOT, "Core", "DOTModOptionVisibility.cs")
+CS_PATH = os.path.join(PROJECT_ROOT, "Core", "OptionGraph.g.cs")
+
+# Slider order in the generated tables (OptionGraph.Damage = 0, ...)
+SLIDERS = ['Damage', 'Duration', 'Frequency', 'Chance']
+
+# FindParameterIndex's float tolerance
+MATCH_TOLERANCE = 0.0001
+
+SETTER_RE = re.compile(r'public static void SetZone(\w+)\(BodyZone zone, float value\)\s*\{(.*?)\n {8}\}', re.S)
+SETTER_CASE_RE = re.compile(r'case BodyZone\.(\w+):\s*(\w+)\s*=\s*value;')
+PROVIDER_RE = re.compile(r'public static ModOption(\w+)\[\] (\w+)\(\)\s*\{(.*?)\n {8}\}', re.S)
+LOOP_RE = re.compile(r'for \(int i = (\d+); i <= (\d+); i\+\+\).*?float val = i\s*([*/])\s*(\d+(?:\.\d+)?)f;', re.S)
+LITERAL_RE = re.compile(r'new ModOption(?:Int|Float)\("[^"]*",\s*(-?\d+(?:\.\d+)?)f?\)')
+STRING_VALUE_RE = re.compile(r'new ModOptionString\("[^"]*",\s*[^,]+,\s*"([^"]*)"\)')
+APPLY_CALL_RE = re.compile(r'DOTModOptions\.SetZone(\w+)\(')
+
+
+class GraphError(Exception):
+    """The code no longer has the shape the graph is derived from."""
+
+
+def _f32(value):
+    return struct.unpack('<f', struct.pack('<f', value))[0]
+
+
+# ========== PARSING ==========
+
+def parse_setters(source):
+    """{slider: {zone: field}} from the DOTModOptions.SetZone<X> methods."""
+    return {m.group(1): dict(SETTER_CASE_RE.findall(m.group(2))) for m in SETTER_RE.finditer(source)}
+
+
+def parse_providers(source):
+    """{provider name: [values]} for providers whose body can be evaluated; None otherwise."""
+    providers = {}
+    for m in PROVIDER_RE.finditer(source):
+        kind, name, body = m.groups()
+        loop = LOOP_RE.search(body)
+        if kind == 'String':
+            values = STRING_VALUE_RE.findall(body)
+        elif loop:
+            start, stop, op, operand = int(loop.group(1)), int(loop.group(2)), loop.group(3), float(loop.group(4))
+            values = [_f32(_f32(i) / _f32(operand) if op == '/' else _f32(i) * _f32(operand))
+                      for i in range(start, stop + 1)]
+        else:
+            values = [_f32(float(v)) for v in LITERAL_RE.findall(body)]
+        providers[name] = values or None
+    return providers
+
+
+def constant_names(source):
+    """{string value: identifier} for DOTModOptions string constants with a unique value."""
+    names = {}
+    for name, expr in scan(source)[0].items():
+        if '.' in name or len(expr) != 1 or expr[0][0] != 'string':
+            continue
+        names.setdefault(expr[0][1][1:-1], []).append(name)
+    return {value: idents[0] for value, idents in names.items() if len(idents) == 1}
+
+
+def find_index(values, value):
+    """FindParameterIndex, offline."""
+    for i, v in enumerate(values):
+        if abs(v - _f32(value)) < MATCH_TOLERANCE:
+            return i
+    return -1
+
+
+# ========== GRAPH ==========
+
+def build_graph(options_source=None, visibility_source=None, options=None):
+    """
+    Returns {'sliders': [...], 'unreachable': [...], 'constants': {...}}.
+    Each slider entry has the preset option, its labels and one entry per
+    zone: option, field, provider values, preset values and indices.
+    """
+    if options_source is None:
+        with open(MOD_OPTIONS_PATH, 'r', encoding='utf-8') as f:
+            options_source = f.read()
+    if visibility_source is None:
+        with open(VISIBILITY_PATH, 'r', encoding='utf-8') as f:
+            visibility_source = f.read()
+    if options is None:
+        options = load_mod_options()
+
+    setters = parse_setters(options_source)
+    providers = parse_providers(options_source)
+    applied = set(APPLY_CALL_RE.findall(visibility_source))
+    by_field = {o['field_name']: o for o in options}
+    by_source = {}
+    for o in options:
+        by_source.setdefault(o['valueSourceName'], []).append(o)
+
+    sliders, driven = [], set()
+    for slider in SLIDERS:
+        if slider not in setters:
+            raise GraphError(f"DOTModOptions.SetZone{slider} not found")
+        if slider not in applied:
+            raise GraphError(f"DOTModOptionVisibility never calls DOTModOptions.SetZone{slider}")
+        selectors = by_source.get(f"{slider}PresetProvider", [])
+        if len(selectors) != 1:
+            raise GraphError(f"expected one option using {slider}PresetProvider, found {len(selectors)}")
+        labels = providers.get(f"{slider}PresetProvider")
+        expected_labels = getattr(preset_tables, f"{slider.upper()}_PRESETS")
+        if labels != expected_labels:
+            raise GraphError(f"{slider}PresetProvider values {labels} != preset_tables {expected_labels}")
+        table = getattr(preset_tables, f"{slider.upper()}_VALUES")
+
+        zones = []
+        for zone in preset_tables.ZONES:
+            field = setters[slider].get(zone)
+            option = by_field.get(field)
+            if option is None:
+                raise GraphError(f"SetZone{slider}({zone}) writes {field!r}, which has no [ModOption]")
+            values = providers.get(option['valueSourceName'])
+            if values is None:
+                raise GraphError(f"cannot evaluate {option['valueSourceName']} for '{option['name']}'")
+            indices = [find_index(values, v) for v in table[zone]]
+            zones.append({'zone': zone, 'option': option, 'field': field, 'values': values,
+                          'presets': table[zone], 'indices': indices})
+            driven.add((option['category'], option['name']))
+        sliders.append({'slider': slider, 'selector': selectors[0], 'labels': labels, 'zones': zones})
+
+    selectors = {(s['selector']['category'], s['selector']['name']) for s in sliders}
+    unreachable = [o for o in options
+                   if (o['category'], o['name']) not in driven and (o['category'], o['name']) not in selectors]
+    return {'sliders': sliders, 'unreachable': unreachable, 'constants': constant_names(options_source)}
+
+
+def off_grid(graph):
+    """(slider, zone, preset label, value) for preset values missing from their slider."""
+    return [(s['slider'], z['zone'], s['labels'][p], z['presets'][p])
+            for s in graph['sliders'] for z in s['zones']
+            for p, index in enumerate(z['indices']) if index < 0]
+
+
+def default_mismatches(graph):
+    """Options whose defaultValueIndex is not the Default preset's index."""
+    default = preset_tables.DEFAULT_PRESET_INDEX
+    return [(z['option']['name'], z['option']['defaultValueIndex'], z['indices'][default])
+            for s in graph['sliders'] for z in s['zones']
+            if z['option']['defaultValueIndex'] != z['indices'][default]]
+
+
+# ========== C# OUTPUT ==========
+
+def _cs_ref(value, constants):
+    ident = constants.get(value)
+    return f"DOTModOptions.{ident}" if ident else '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def render_cs(graph):
+    constants = graph['constants']
+    preset_count = len(preset_tables.DAMAGE_PRESETS)
+    lines = [
+        "// <auto-generated>",
+        "// Generated by _agent/gen_option_graph.py from Configuration/DOTModOptions.cs,",
+        "// Core/DOTModOptionVisibility.cs and _agent/preset_tables.py. Do not edit by hand.",
+        "// </auto-generated>",
+        "using DOT.Configuration;",
+        "",
+        "namespace DOT.Core",
+        "{",
+        "    /// <summary>",
+        "    /// Preset -> custom option graph used to sync the menu when a preset changes.",
+        "    /// Slot = slider * ZoneCount + ZoneIndex(zone); the parameter index of a preset is",
+        "    /// ParameterIndex[slot * PresetCount + presetIndex], -1 if the value is not on the slider.",
+        "    /// </summary>",
+        "    public static class OptionGraph",
+        "    {",
+    ]
+    for i, s in enumerate(graph['sliders']):
+        lines.append(f"        public const int {s['slider']} = {i};")
+    lines += [
+        f"        public const int SliderCount = {len(graph['sliders'])};",
+        "        public const int SlotCount = SliderCount * PresetTables.ZoneCount;",
+        "",
+        "        public static int Slot(int slider, BodyZone zone)",
+        "        {",
+        "            int zoneIndex = PresetTables.ZoneIndex(zone);",
+        "            if ((uint)slider >= SliderCount || zoneIndex >= PresetTables.ZoneCount)",
+        "                return -1;",
+        "            return slider * PresetTables.ZoneCount + zoneIndex;",
+        "        }",
+        "",
+        "        public static readonly string[] SlotCategories =",
+        "        {",
+    ]
+    for s in graph['sliders']:
+        cells = ', '.join(_cs_ref(z['option']['category'], constants) for z in s['zones'])
+        lines.append(f"            {cells}, // {s['slider']}")
+    lines += ["        };", "", "        public static readonly string[] SlotNames =", "        {"]
+    for s in graph['sliders']:
+        for z in s['zones']:
+            lines.append(f"            {_cs_ref(z['option']['name'], constants)},")
+    lines += ["        };", "", f"        // {preset_count} presets per slot, in preset enum order",
+              "        public static readonly int[] ParameterIndex =", "        {"]
+    for s in graph['sliders']:
+        for z in s['zones']:
+            cells = ', '.join(str(i) for i in z['indices'])
+            lines.append(f"            {cells}, // {z['option']['name']}")
+    lines += ["        };", "    }", "}", ""]
+    return '\n'.join(lines)
+
+
+# ========== REPORT ==========
+
+def print_report(graph):
+    total = sum(len(s['zones']) for s in graph['sliders'])
+    print(f"Dependency graph: {len(graph['sliders'])} presets -> {total} options")
+    for s in graph['sliders']:
+        print(f"  {s['selector']['name']} ({', '.join(s['labels'])})")
+        for z in s['zones']:
+            print(f"    -> {z['option']['name']:<28} {z['option']['valueSourceName']:<18} "
+                  f"indices {z['indices']}")
+
+    print(f"\nNot reachable from any preset: {len(graph['unreachable'])} options")
+    by_category = {}
+    for o in graph['unreachable']:
+        by_category.setdefault(o['category'] or '(no category)', []).append(o['name'])
+    for category, names in by_category.items():
+        print(f"  {category}: {', '.join(names)}")
+
+    missing = off_grid(graph)
+    print(f"\nPreset values off their slider: {len(missing) or 'none'}")
+    for slider, zone, label, value in missing:
+        print(f"  {slider} {zone} {label}: {value:g}")
+
+    mismatches = default_mismatches(graph)
+    if mismatches:
+        print(f"\ndefaultValueIndex differs from the Default preset: {len(mismatches)}")
+        for name, declared, expected in mismatches:
+            print(f"  {name}: defaultValueIndex {declared}, Default preset is index {expected}")
+
+
+def _read(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def _write(path, text):
+    if _read(path) == text:
+        print(f"Unchanged: {path}")
+        return
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    print(f"Generated: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the preset -> option index tables.")
+    parser.add_argument('--check', action='store_true', help="Verify OptionGraph.g.cs is up to date")
+    parser.add_argument('--report', action='store_true', help="Print the report without writing")
+    args = parser.parse_args()
+
+    try:
+        graph = build_graph()
+    except GraphError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if args.check:
+        ok = True
+        if _read(CS_PATH) != render_cs(graph):
+            print(f"DRIFT: {CS_PATH} is out of date (rerun the generator)")
+            ok = False
+        for slider, zone, label, value in off_grid(graph):
+            print(f"WARNING: {slider} {zone} {label} value {value:g} is not on the slider")
+        if ok:
+            print("Option graph is in sync.")
+        sys.exit(0 if ok else 1)
+
+    print_report(graph)
+    if not args.report:
+        print()
+        _write(CS_PATH, render_cs(graph))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Generates the preset lookup tables from preset_tables.py (the single source).
+
+Targets:
+  cs   -> Core/PresetTables.g.cs (flat zone x preset float[] tables used by
+          DOTModOptionVisibility.GetPreset*Value)
+  md   -> _docs/PRESETS.md
+  xlsx -> _design/PRESETS.xlsx (via build_presets_xlsx, needs openpyxl)
+
+--check regenerates in memory and diffs every table cell against the C#
+and markdown on disk, exiting 1 on drift.
+
+Usage:
+    python gen_preset_tables.py                  # write cs, md, xlsx
+    python gen_preset_tables.py --targets cs,md
+    python gen_preset_tables.py --check
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from registry import PROJECT_ROOT
+from preset_tables import (
+    ZONES,
+    DAMAGE_PRESETS, DAMAGE_VALUES,
+    DURATION_PRESETS, DURATION_VALUES,
+    FREQUENCY_PRESETS, FREQUENCY_VALUES,
+    CHANCE_PRESETS, CHANCE_VALUES,
+    FALLBACK_VALUES, DEFAULT_PRESET_INDEX,
+)
+
+CS_PATH = os.path.join(PROJECT_ROOT, "Core", "PresetTables.g.cs")
+MD_PATH = os.path.join(PROJECT_ROOT, "_docs", "PRESETS.md")
+XLSX_PATH = os.path.join(PROJECT_ROOT, "_design", "PRESETS.xlsx")
+
+# (table name, preset labels, per-zone values, unit)
+CATEGORIES = [
+    ('Damage', DAMAGE_PRESETS, DAMAGE_VALUES, ''),
+    ('Duration', DURATION_PRESETS, DURATION_VALUES, 's'),
+    ('Frequency', FREQUENCY_PRESETS, FREQUENCY_VALUES, 's'),
+    ('Chance', CHANCE_PRESETS, CHANCE_VALUES, '%'),
+]
+
+CS_TABLE_RE = re.compile(r'public static readonly float\[\] (\w+) =\s*\{(.*?)\};', re.S)
+CS_FLOAT_RE = re.compile(r'-?\d+(?:\.\d+)?f')
+
+
+def table_rows(name, values):
+    """Rows of the flat table in zone order, plus the Unknown fallback row."""
+    return [(zone, values[zone]) for zone in ZONES] + [('Unknown', FALLBACK_VALUES[name])]
+
+
+def validate():
+    """Every table must be zones x presets with a fallback row of the same width."""
+    errors = []
+    for name, presets, values, _ in CATEGORIES:
+        for zone, row in table_rows(name, values):
+            if len(row) != len(presets):
+                errors.append(f"{name}.{zone}: {len(row)} values, expected {len(presets)}")
+        missing = [z for z in ZONES if z not in values]
+        if missing:
+            errors.append(f"{name}: missing zones {missing}")
+    return errors
+
+
+def _cs_float(value):
+    return f"{float(value)!r}f"
+
+
+def render_cs():
+    preset_count = len(DAMAGE_PRESETS)
+    lines = [
+        "// <auto-generated>",
+        "// Generated by _agent/gen_preset_tables.py from _agent/preset_tables.py.",
+        "// Do not edit by hand: change preset_tables.py and rerun the generator.",
+        "// </auto-generated>",
+        "using DOT.Configuration;",
+        "",
+        "namespace DOT.Core",
+        "{",
+        "    /// <summary>",
+        "    /// Flat zone x preset lookup tables for the preset system.",
+        "    /// Index = ZoneIndex(zone) * PresetCount + presetIndex; the last row holds the Unknown zone fallback.",
+        "    /// </summary>",
+        "    public static class PresetTables",
+        "    {",
+        f"        public const int PresetCount = {preset_count};",
+        f"        public const int DefaultPresetIndex = {DEFAULT_PRESET_INDEX};",
+        f"        public const int ZoneCount = {len(ZONES)};",
+        "",
+        "        public static int ZoneIndex(BodyZone zone)",
+        "        {",
+        "            switch (zone)",
+        "            {",
+    ]
+    for i, zone in enumerate(ZONES):
+        lines.append(f"                case BodyZone.{zone}: return {i};")
+    lines += [
+        "                default: return ZoneCount;",
+        "            }",
+        "        }",
+        "",
+        "        public static float Lookup(float[] table, BodyZone zone, int presetIndex)",
+        "        {",
+        "            if ((uint)presetIndex >= PresetCount)",
+        "                presetIndex = DefaultPresetIndex;",
+        "            return table[ZoneIndex(zone) * PresetCount + presetIndex];",
+        "        }",
+    ]
+    for name, presets, values, _ in CATEGORIES:
+        lines += [
+            "",
+            f"        // {' | '.join(presets)}",
+            f"        public static readonly float[] {name} =",
+            "        {",
+        ]
+        for zone, row in table_rows(name, values):
+            cells = ', '.join(_cs_float(v) for v in row)
+            lines.append(f"            {cells}, // {zone}")
+        lines.append("        };")
+    lines += ["    }", "}", ""]
+    return '\n'.join(lines)
+
+
+def _md_value(value, unit):
+    return f"{value:g}{unit}"
+
+
+def render_md():
+    lines = [
+        "# Preset Values",
+        "",
+        "Generated by `_agent/gen_preset_tables.py` from `_agent/preset_tables.py`. Do not edit by hand.",
+        "Default (index 2) is the middle column.",
+    ]
+    for name, presets, values, unit in CATEGORIES:
+        lines += ["", f"## {name}", "",
+                  "| Zone | " + " | ".join(presets) + " |",
+                  "|------|" + "|".join("-" * (len(p) + 2) for p in presets) + "|"]
+        for zone in ZONES:
+            lines.append(f"| {zone} | " + " | ".join(_md_value(v, unit) for v in values[zone]) + " |")
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def parse_cs_tables(text):
+    """Extract {table name: [floats]} from a C# source."""
+    return {m.group(1): [float(v[:-1]) for v in CS_FLOAT_RE.findall(m.group(2))]
+            for m in CS_TABLE_RE.finditer(text)}
+
+
+def diff_cs(text):
+    """Cell-by-cell differences between the canonical tables and C# text."""
+    actual = parse_cs_tables(text)
+    diffs = []
+    for name, presets, values, _ in CATEGORIES:
+        if name not in actual:
+            diffs.append(f"{name}: table missing from C#")
+            continue
+        expected = [v for _, row in table_rows(name, values) for v in row]
+        got = actual[name]
+        if len(got) != len(expected):
+            diffs.append(f"{name}: {len(got)} values in C#, expected {len(expected)}")
+        rows = table_rows(name, values)
+        for i, (want, have) in enumerate(zip(expected, got)):
+            if abs(want - have) > 1e-6:
+                zone = rows[i // len(presets)][0]
+                diffs.append(f"{name}[{zone}, {presets[i % len(presets)]}]: C# has {have:g}, source has {want:g}")
+    return diffs
+
+
+def _read(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def _write(path, text):
+    if _read(path) == text:
+        print(f"Unchanged: {path}")
+        return
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    print(f"Generated: {path}")
+
+
+def check():
+    ok = True
+    cs_text = _read(CS_PATH)
+    if cs_text is None:
+        print(f"DRIFT: {CS_PATH} does not exist")
+        ok = False
+    else:
+        for line in diff_cs(cs_text):
+            print(f"DRIFT: {line}")
+            ok = False
+        if ok and cs_text != render_cs():
+            print(f"DRIFT: {CS_PATH} values match but text differs (rerun the generator)")
+            ok = False
+    if _read(MD_PATH) != render_md():
+        print(f"DRIFT: {MD_PATH} is out of date")
+        ok = False
+    if ok:
+        print("Preset tables are in sync.")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate preset tables from preset_tables.py.")
+    parser.add_argument('--targets', default='cs,md,xlsx', help="Comma separated: cs, md, xlsx")
+    parser.add_argument('--check', action='store_true', help="Verify generated files match the source")
+    args = parser.parse_args()
+
+    errors = validate()
+    if errors:
+        for e in errors:
+            print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if args.check:
+        sys.exit(0 if check() else 1)
+
+    targets = {t.strip() for t in args.targets.split(',') if t.strip()}
+    if 'cs' in targets:
+        _write(CS_PATH, render_cs())
+    if 'md' in targets:
+        _write(MD_PATH, render_md())
+    if 'xlsx' in targets:
+        # Imported lazily: openpyxl is only needed for this target
+        from build_presets_xlsx import create_xlsx
+        create_xlsx(XLSX_PATH)
+
+
+if __name__ == "__main__":
+    main()
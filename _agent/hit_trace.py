@@ -0,0 +1,778 @@
+#!/usr/bin/env python3
+"""
+Recorded and synthetic hit traces: the inputs BleedManager.ApplyBleed sees,
+stored as fixed-width records so any playtest or stress scenario can be
+replayed offline against a bleed model, faster than real time.
+
+File layout (little-endian; a recorder appends one record per ApplyBleed
+call, after EventHooks' blunt / profile / unknown-zone / IsNewSlice filters):
+
+  header  16 bytes: b"DOTH", u16 version, u16 record size, u32 flags, u32 reserved
+  records 20 bytes: f64 time, i32 creature, u32 part_type, u8 zone,
+                    u8 damage_type, u8 sliced, u8 reserved
+
+  time         seconds since recording started (Time.realtimeSinceStartup
+               minus the start), non-decreasing
+  creature     Creature.GetInstanceID()
+  part_type    RagdollPart.Type flags of hitPart, 0 when hitPart is null
+  zone         BodyZone value (Configuration/BodyZone.cs)
+  damage_type  index into DAMAGE_TYPE_CODES; the recorder maps DamageType by
+               name, so the file does not depend on ThunderRoad's enum values
+  sliced       hitPart.isSliced
+
+open_trace() maps the records with numpy.memmap, so nothing is read until it
+is touched; time ranges are located with a binary search and returned as
+zero-copy views.
+
+Scenarios (generate --scenario):
+  arena          waves of 20 enemies, three engaged at a time, sword/spear mix
+  dismemberment  slash-heavy fights ending in one to three limb slices each
+  lightning      chain lightning casts jumping across a crowd of twelve
+  stress         --creatures enemies hit independently at --hit-rate (the
+                 bleed_sim workload)
+
+Zones come from the shipped ZoneDetector rules (zone_detector.classify with
+the 50% throat roll), so scenario traces carry the same zone mix the game
+would record for those parts.
+
+replay steps a bleed model frame by frame at --hz: every hit in the frame is
+passed to apply(), then step(dt) advances the model. Models:
+  bleed   BleedManager / BleedEffect for one preset combination (ApplyBleed
+          chance roll, AddStack, Update, expiry, ApplyBleedDamage calls)
+  count   hits per frame only; the replay loop's own overhead
+  module:Class  any class with the same interface (see BleedModel)
+
+Usage:
+    python hit_trace.py generate arena.bin --scenario arena --seconds 600
+    python hit_trace.py generate stress.bin --scenario stress --creatures 2000 --seconds 300
+    python hit_trace.py info arena.bin
+    python hit_trace.py replay arena.bin --hz 90 --damage High --duration Long
+    python hit_trace.py replay stress.bin --model my_models:CachedBleedModel --json replay.json
+"""
+
+import argparse
+import bisect
+import importlib
+import json
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from bleed_sim import (
+    DEFAULT_DAMAGE_TYPE_WEIGHTS, PRESET_AXES,
+    build_combo_params, parse_preset_list,
+)
+from preset_tables import ZONES, DAMAGE_TYPES, DAMAGE_TYPE_MULTIPLIERS
+from registry import BODY_ZONES
+from zone_detector import ZONE_NAMES, PART_TYPES, SYNTHETIC_PARTS, SLICED_SHARE, classify
+
+MAGIC = b'DOTH'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+FLAG_SYNTHETIC = 1
+
+RECORD_DTYPE = np.dtype([
+    ('time', '<f8'),
+    ('creature', '<i4'),
+    ('part_type', '<u4'),
+    ('zone', 'u1'),
+    ('damage_type', 'u1'),
+    ('sliced', 'u1'),
+    ('reserved', 'u1'),
+])
+assert RECORD_DTYPE.itemsize == 20
+
+DAMAGE_TYPE_CODES = ['Unknown', 'Pierce', 'Slash', 'Blunt', 'Fire', 'Lightning']
+DAMAGE_TYPE_CODE = {name: i for i, name in enumerate(DAMAGE_TYPE_CODES)}
+
+CHUNK_RECORDS = 1 << 22  # 80 MiB of records per replay / aggregation step
+
+DEFAULT_HZ = 90
+DEFAULT_TAIL = 10.0  # Seconds replayed after the last hit so in-flight effects finish
+
+# ========== SCENARIO TUNING ==========
+
+WAVE_SIZE = 20
+WAVE_ENGAGED = 3          # Enemies fighting the player at once
+WAVE_BREAK = 8.0          # Seconds between waves
+MELEE_HIT_RATE = 2.5      # Player hits per second while engaged
+HITS_TO_KILL = 4.0        # Mean hits an enemy takes (2 + Poisson)
+
+DISMEMBER_GROUP = 6
+DISMEMBER_TYPE_WEIGHTS = {'Pierce': 0.15, 'Slash': 0.85, 'Fire': 0.0, 'Lightning': 0.0}
+
+LIGHTNING_CROWD = 12
+LIGHTNING_CAST_RATE = 1.6  # Casts per second while the spell is held
+LIGHTNING_CHAIN = 4        # Extra creatures a cast can jump to
+LIGHTNING_JUMP = 0.05      # Seconds between chain jumps
+LIGHTNING_HITS_TO_KILL = 6.0
+
+STRESS_BLOCK = 10.0  # Seconds generated per chunk
+
+LIMB_PARTS = ['LeftArm', 'RightArm', 'LeftHand', 'RightHand', 'LeftLeg', 'RightLeg', 'LeftFoot', 'RightFoot']
+
+
+class TraceFormatError(Exception):
+    """Raised when a file is not a DOT hit trace this reader understands."""
+
+
+# ========== READING ==========
+
+def read_header(path):
+    """Return (version, record_size, flags) from a trace file header."""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise TraceFormatError(f"{path}: shorter than the {HEADER.size}-byte header")
+    magic, version, record_size, flags, _ = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise TraceFormatError(f"{path}: bad magic {magic!r}")
+    if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise TraceFormatError(f"{path}: unsupported version {version} / record size {record_size}")
+    return version, record_size, flags
+
+
+def open_trace(path):
+    """Memory-map a trace's records (read-only, zero-copy).
+
+    A trailing partial record (a recorder cut short by a crash) is ignored.
+    """
+    read_header(path)
+    count = (os.path.getsize(path) - HEADER.size) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+
+
+def time_slice(records, start=None, stop=None):
+    """View of the records with start <= time < stop (times are sorted)."""
+    times = records['time']
+    lo = 0 if start is None else bisect.bisect_left(times, start)
+    hi = len(records) if stop is None else bisect.bisect_left(times, stop, lo)
+    return records[lo:hi]
+
+
+def parse_time_range(text):
+    """'START:STOP' in seconds, either side optional, as (start, stop) with None for open ends."""
+    lo, sep, hi = text.partition(':')
+    try:
+        return (float(lo) if lo else None), (float(hi) if hi else None)
+    except ValueError:
+        raise ValueError(f"Invalid time range '{text}'. Expected START:STOP in seconds, e.g. 60:120 or 300:") from None
+
+
+def iter_chunks(records, chunk=CHUNK_RECORDS):
+    for start in range(0, len(records), chunk):
+        yield records[start:start + chunk]
+
+
+# ========== WRITING ==========
+
+class TraceWriter:
+    """Append record chunks to a new trace file.
+
+        with TraceWriter(path) as writer:
+            for chunk in scenario:
+                writer.write(chunk)
+    """
+
+    def __init__(self, path, flags=0):
+        self.path = path
+        self.count = 0
+        self._last_time = float('-inf')
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize, flags, 0))
+
+    def write(self, records):
+        if records.dtype != RECORD_DTYPE:
+            raise ValueError(f"records dtype {records.dtype} is not {RECORD_DTYPE}")
+        if len(records) == 0:
+            return
+        times = records['time']
+        if times[0] < self._last_time or np.any(times[1:] < times[:-1]):
+            raise ValueError(f"{self.path}: record times must be non-decreasing")
+        records.tofile(self._file)
+        self._last_time = float(times[-1])
+        self.count += len(records)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_trace(path, chunks, flags=0):
+    """Write an iterable of record arrays; returns the record count."""
+    with TraceWriter(path, flags) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.count
+
+
+# ========== SCENARIOS ==========
+
+_PART_NAMES = [p for p, _ in SYNTHETIC_PARTS]
+_PART_FLAGS = np.array([PART_TYPES.get(p, 0) for p in _PART_NAMES], dtype=np.uint32)
+_PART_WEIGHTS = np.array([w for _, w in SYNTHETIC_PARTS]) / sum(w for _, w in SYNTHETIC_PARTS)
+_LIMB_FLAGS = np.array([PART_TYPES[p] for p in LIMB_PARTS], dtype=np.uint32)
+_ZONE_VALUES = np.array([BODY_ZONES[name] for name in ZONE_NAMES], dtype=np.uint8)
+
+
+def _type_weights(weights):
+    vec = np.array([weights[t] for t in DAMAGE_TYPES], dtype=np.float64)
+    return vec / vec.sum()
+
+
+def _type_codes(rng, count, weights):
+    codes = np.array([DAMAGE_TYPE_CODE[t] for t in DAMAGE_TYPES], dtype=np.uint8)
+    return codes[rng.choice(len(DAMAGE_TYPES), size=count, p=weights)]
+
+
+def _random_parts(rng, count):
+    return _PART_FLAGS[rng.choice(len(_PART_FLAGS), size=count, p=_PART_WEIGHTS)]
+
+
+def make_records(rng, times, creatures, part_type, sliced, damage_type):
+    """Records for raw hits, filtered the way EventHooks filters before ApplyBleed.
+
+    Zones use the shipped ZoneDetector rules; Unknown-zone hits are dropped
+    and only the first slice of each (creature, part) is kept (IsNewSlice).
+    Rows are returned sorted by time.
+    """
+    sliced = np.asarray(sliced, dtype=bool)
+    zones = _ZONE_VALUES[classify(part_type, sliced, rng.random(len(times)) < 0.5)]
+    order = np.argsort(times, kind='stable')
+
+    keep = zones[order] != BODY_ZONES['Unknown']
+    cut = order[sliced[order]]
+    if cut.size:
+        keys = np.asarray(creatures, dtype=np.int64)[cut] << 32 | np.asarray(part_type, dtype=np.int64)[cut]
+        _, first = np.unique(keys, return_index=True)
+        repeat = np.ones(cut.size, dtype=bool)
+        repeat[first] = False
+        drop = np.zeros(len(times), dtype=bool)
+        drop[cut[repeat]] = True
+        keep &= ~drop[order]
+    order = order[keep]
+
+    rec = np.zeros(order.size, dtype=RECORD_DTYPE)
+    rec['time'] = np.asarray(times)[order]
+    rec['creature'] = np.asarray(creatures)[order]
+    rec['part_type'] = np.asarray(part_type)[order]
+    rec['zone'] = zones[order]
+    rec['damage_type'] = np.asarray(damage_type)[order]
+    rec['sliced'] = sliced[order]
+    return rec
+
+
+def _engaged_fight(rng, start, enemies, rate, hits_to_kill, engaged):
+    """Hit times and targets for enemies fought `engaged` at a time, each dying after its hits."""
+    remaining = 2 + rng.poisson(hits_to_kill - 2, size=len(enemies))
+    total = int(remaining.sum())
+    times = start + np.cumsum(rng.exponential(1.0 / rate, size=total))
+    targets = np.empty(total, dtype=np.int32)
+    queue = list(range(len(enemies)))
+    active = [queue.pop(0) for _ in range(min(engaged, len(queue)))]
+    picks = rng.random(total)
+    for i in range(total):
+        slot = int(picks[i] * len(active))
+        enemy = active[slot]
+        targets[i] = enemies[enemy]
+        remaining[enemy] -= 1
+        if remaining[enemy] == 0:
+            if queue:
+                active[slot] = queue.pop(0)
+            else:
+                active.pop(slot)
+    return times, targets
+
+
+def arena(rng, seconds, **_):
+    """Waves of WAVE_SIZE enemies with a short break between waves."""
+    weights = _type_weights(DEFAULT_DAMAGE_TYPE_WEIGHTS)
+    t, next_id = 0.0, 1000
+    while t < seconds:
+        enemies = np.arange(next_id, next_id + WAVE_SIZE, dtype=np.int32)
+        next_id += WAVE_SIZE
+        times, targets = _engaged_fight(rng, t, enemies, MELEE_HIT_RATE, HITS_TO_KILL, WAVE_ENGAGED)
+        types = _type_codes(rng, len(times), weights)
+        sliced = (types == DAMAGE_TYPE_CODE['Slash']) & (rng.random(len(times)) < SLICED_SHARE)
+        rec = make_records(rng, times, targets, _random_parts(rng, len(times)), sliced, types)
+        yield rec[rec['time'] < seconds]
+        t = float(times[-1]) + WAVE_BREAK
+
+
+def dismemberment(rng, seconds, **_):
+    """Slash-heavy group fights; every enemy ends with one to three limb slices."""
+    weights = _type_weights(DISMEMBER_TYPE_WEIGHTS)
+    t, next_id = 0.0, 5000
+    while t < seconds:
+        enemies = np.arange(next_id, next_id + DISMEMBER_GROUP, dtype=np.int32)
+        next_id += DISMEMBER_GROUP
+        times, targets = _engaged_fight(rng, t, enemies, MELEE_HIT_RATE, HITS_TO_KILL, 2)
+        parts = _random_parts(rng, len(times))
+        sliced = np.zeros(len(times), dtype=bool)
+
+        # Replace each enemy's last hits with slices through distinct limbs
+        for enemy in enemies:
+            idx = np.nonzero(targets == enemy)[0]
+            cuts = idx[-min(len(idx), 1 + rng.integers(0, 3)):]
+            parts[cuts] = rng.choice(_LIMB_FLAGS, size=cuts.size, replace=False)
+            sliced[cuts] = True
+        types = _type_codes(rng, len(times), weights)
+        types[sliced] = DAMAGE_TYPE_CODE['Slash']
+        rec = make_records(rng, times, targets, parts, sliced, types)
+        yield rec[rec['time'] < seconds]
+        t = float(times[-1]) + WAVE_BREAK
+
+
+def lightning(rng, seconds, **_):
+    """Chain lightning casts across a crowd; fallen enemies are replaced by new ones."""
+    crowd = np.arange(9000, 9000 + LIGHTNING_CROWD, dtype=np.int32)
+    health = 2 + rng.poisson(LIGHTNING_HITS_TO_KILL - 2, size=LIGHTNING_CROWD)
+    next_id = 9000 + LIGHTNING_CROWD
+    t = 0.0
+    while t < seconds:
+        times, targets = [], []
+        block_end = t + STRESS_BLOCK
+        while t < min(block_end, seconds):
+            jumps = 1 + rng.integers(0, LIGHTNING_CHAIN + 1)
+            chain = rng.choice(LIGHTNING_CROWD, size=jumps, replace=False)
+            for j, slot in enumerate(chain):
+                times.append(t + j * LIGHTNING_JUMP)
+                targets.append(crowd[slot])
+                health[slot] -= 1
+                if health[slot] == 0:
+                    crowd[slot] = next_id
+                    health[slot] = 2 + rng.poisson(LIGHTNING_HITS_TO_KILL - 2)
+                    next_id += 1
+            t += rng.exponential(1.0 / LIGHTNING_CAST_RATE)
+        times = np.array(times)
+        count = len(times)
+        parts = _random_parts(rng, count)
+        types = np.full(count, DAMAGE_TYPE_CODE['Lightning'], dtype=np.uint8)
+        rec = make_records(rng, times, np.array(targets, dtype=np.int32), parts, np.zeros(count, bool), types)
+        yield rec[rec['time'] < seconds]
+
+
+def stress(rng, seconds, creatures=1000, hit_rate=0.5, **_):
+    """Every creature hit independently (Poisson, hit_rate per second) with the bleed_sim mix."""
+    weights = _type_weights(DEFAULT_DAMAGE_TYPE_WEIGHTS)
+    for start in np.arange(0.0, seconds, STRESS_BLOCK):
+        span = min(STRESS_BLOCK, seconds - start)
+        count = int(rng.poisson(creatures * hit_rate * span))
+        times = start + rng.random(count) * span
+        targets = rng.integers(0, creatures, size=count, dtype=np.int32)
+        types = _type_codes(rng, count, weights)
+        sliced = (types == DAMAGE_TYPE_CODE['Slash']) & (rng.random(count) < SLICED_SHARE)
+        yield make_records(rng, times, targets, _random_parts(rng, count), sliced, types)
+
+
+SCENARIOS = {
+    'arena': arena,
+    'dismemberment': dismemberment,
+    'lightning': lightning,
+    'stress': stress,
+}
+
+
+def generate(path, scenario, seconds, seed=0, **options):
+    """Write a synthetic trace; returns the record count."""
+    rng = np.random.default_rng(seed)
+    return write_trace(path, SCENARIOS[scenario](rng, seconds, **options), flags=FLAG_SYNTHETIC)
+
+
+# ========== MODELS ==========
+
+class CountModel:
+    """Counts hits per frame; replaying with it measures the loop itself."""
+
+    STATS = ('hits',)
+
+    def __init__(self, creatures, presets=None, seed=0):
+        self._hits = 0
+
+    @property
+    def idle(self):
+        return True
+
+    def apply(self, creature, zone, damage_type, part_type, sliced):
+        self._hits += len(creature)
+
+    def step(self, dt):
+        hits, self._hits = self._hits, 0
+        return (hits,)
+
+
+class BleedModel:
+    """BleedManager / BleedEffect for one preset combination.
+
+    Model interface used by replay():
+      __init__(creatures, presets, seed)  creatures: dense creature count;
+                                          presets: {'damage': 'High', ...}
+      STATS                               names of the values step() returns
+      idle                                True when step() would return all
+                                          zeros with no hits (frames skipped)
+      apply(creature, zone, damage_type, part_type, sliced)
+                                          one frame's hits, in trace order:
+                                          dense creature index, index into
+                                          ZONES, DAMAGE_TYPE_CODES index,
+                                          part flags, sliced flags
+      step(dt)                            advance one frame, return the stats
+
+    apply mirrors ApplyBleed (chance roll, AddStack or a new effect) and step
+    mirrors BleedEffect.Update plus BleedManager's expiry and tick pass, with
+    the same float32 arithmetic as bleed_sim. Effects live in slot arrays
+    sized by peak concurrency rather than creatures x zones, with a dict
+    standing in for _effectsByZone; freed slots are reused. Creature kills
+    are not in the trace, so effects always run to expiry.
+    """
+
+    STATS = ('live_effects', 'ticks', 'damage_calls', 'new_effects', 'stacks_added', 'expired', 'damage')
+
+    def __init__(self, creatures, presets=None, seed=0, capacity=256):
+        presets = presets or {}
+        combo = [parse_preset_list(presets.get(name, 'Default'), labels)[0] for name, labels, _ in PRESET_AXES]
+        params = build_combo_params([combo])
+        self.damage = params['damage'][0].tolist()
+        self.duration = params['duration'][0].tolist()
+        self.interval = params['frequency'][0]
+        self.chance = params['chance'][0]
+        self.stack_limit = params['stack_limit'].tolist()
+        # GetDamageTypeMultiplier: 0 for Unknown / Blunt
+        self.type_mult = [DAMAGE_TYPE_MULTIPLIERS.get(t, 0.0) for t in DAMAGE_TYPE_CODES]
+        self.rng = np.random.default_rng(seed)
+
+        self.slots = {}  # creature * len(ZONES) + zone -> slot
+        self.free = []
+        self.used = 0    # High-water mark; step() works on [:used]
+        self.key = np.full(capacity, -1, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.remaining = np.zeros(capacity, dtype=np.float32)
+        self.since_tick = np.zeros(capacity, dtype=np.float32)
+        self.tick_interval = np.zeros(capacity, dtype=np.float32)
+        self.stacks = np.zeros(capacity, dtype=np.int16)
+        self.per_tick = np.zeros(capacity, dtype=np.float32)
+        self.mult = np.zeros(capacity, dtype=np.float32)
+        self._new = self._stacked = 0
+
+    @property
+    def idle(self):
+        return not self.slots
+
+    def _grow(self):
+        for name in ('key', 'active', 'remaining', 'since_tick', 'tick_interval', 'stacks', 'per_tick', 'mult'):
+            old = getattr(self, name)
+            new = np.zeros(len(old) * 2, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def apply(self, creature, zone, damage_type, part_type, sliced):
+        passed = (self.rng.random(len(creature)) * 100.0).astype(np.float32) <= self.chance[zone]
+        for c, z, t in zip(creature[passed].tolist(), zone[passed].tolist(), damage_type[passed].tolist()):
+            key = c * len(ZONES) + z
+            slot = self.slots.get(key)
+            if slot is not None:
+                # AddStack
+                if self.stacks[slot] < self.stack_limit[z]:
+                    self.stacks[slot] += 1
+                self.remaining[slot] = max(self.remaining[slot], self.duration[z])
+                self.per_tick[slot] = max(self.per_tick[slot], self.damage[z])
+                self._stacked += 1
+                continue
+            if self.free:
+                slot = self.free.pop()
+            else:
+                if self.used == len(self.key):
+                    self._grow()
+                slot = self.used
+                self.used += 1
+            self.slots[key] = slot
+            self.key[slot] = key
+            self.active[slot] = True
+            self.remaining[slot] = self.duration[z]
+            self.since_tick[slot] = 0.0
+            self.tick_interval[slot] = self.interval[z]
+            self.stacks[slot] = 1
+            self.per_tick[slot] = self.damage[z]
+            self.mult[slot] = self.type_mult[t]
+            self._new += 1
+
+    def step(self, dt):
+        new, stacked, self._new, self._stacked = self._new, self._stacked, 0, 0
+        if not self.slots:
+            return (0, 0, 0, new, stacked, 0, 0.0)
+        n = self.used
+        dt = np.float32(dt)
+        active = self.active[:n]
+        remaining = self.remaining[:n]
+        since_tick = self.since_tick[:n]
+        # Free slots keep counting down too; nothing reads them until reuse resets them
+        remaining -= dt
+        since_tick += dt
+
+        expired = active & (remaining <= 0.0)
+        ticking = np.flatnonzero(active & ~expired & (since_tick >= self.tick_interval[:n]))
+        since_tick[ticking] = 0.0
+        tick_damage = self.per_tick[ticking] * self.stacks[ticking] * self.mult[ticking]
+
+        gone = np.flatnonzero(expired)
+        if gone.size:
+            active[gone] = False
+            for slot, key in zip(gone.tolist(), self.key[gone].tolist()):
+                del self.slots[key]
+                self.free.append(slot)
+        return (len(self.slots), ticking.size, int(np.count_nonzero(tick_damage)), new, stacked,
+                gone.size, float(tick_damage.sum(dtype=np.float64)))
+
+
+MODELS = {
+    'bleed': BleedModel,
+    'count': CountModel,
+}
+
+
+def load_model(name):
+    """A model class from MODELS or a 'module:Class' path (importable from the working directory)."""
+    if name in MODELS:
+        return MODELS[name]
+    module, _, cls = name.partition(':')
+    if not cls:
+        raise ValueError(f"Unknown model '{name}'. Expected one of: {', '.join(MODELS)} or module:Class")
+    if os.getcwd() not in sys.path:
+        sys.path.append(os.getcwd())
+    return getattr(importlib.import_module(module), cls)
+
+
+# ========== REPLAY ==========
+
+def creature_ids(records, chunk=CHUNK_RECORDS):
+    """Sorted distinct creature IDs, collected chunk by chunk."""
+    ids = np.zeros(0, dtype=np.int32)
+    for part in iter_chunks(records, chunk):
+        ids = np.union1d(ids, part['creature'])
+    return ids
+
+
+def _zone_lookup():
+    lookup = np.full(256, -1, dtype=np.int16)
+    for i, name in enumerate(ZONES):
+        lookup[BODY_ZONES[name]] = i
+    return lookup
+
+
+def replay(records, model_class, hz=DEFAULT_HZ, presets=None, tail=DEFAULT_TAIL, seed=0,
+           chunk=CHUNK_RECORDS):
+    """Feed a trace through a model one frame at a time.
+
+    Hits land in the frame containing their timestamp, frames run from the
+    first hit to tail seconds after the last, and frames the model reports
+    idle with no hits are skipped. A frame's hits may straddle two chunks,
+    so the last frame of each chunk stays open until the next hit frame
+    differs. Returns (stats names, float64 array shaped (stats, frames),
+    first frame, hits applied).
+    """
+    if len(records) == 0:
+        return model_class.STATS, np.zeros((len(model_class.STATS), 0)), 0, 0
+    ids = creature_ids(records, chunk)
+    model = model_class(len(ids), presets, seed)
+    zone_lookup = _zone_lookup()
+    dt = 1.0 / hz
+
+    first = int(records['time'][0] * hz)
+    last = int(records['time'][-1] * hz) + int(round(tail * hz))
+    stats = np.zeros((len(model_class.STATS), last - first + 1), dtype=np.float64)
+    frame = first
+    open_frame = False  # Hits applied to `frame` but not yet stepped
+    applied = 0
+
+    for part in iter_chunks(records, chunk):
+        frames = (part['time'] * hz).astype(np.int64)
+        creature = np.searchsorted(ids, part['creature']).astype(np.intp)
+        zone = zone_lookup[part['zone']].astype(np.intp)
+        damage_type = part['damage_type'].astype(np.intp)
+        part_type = np.asarray(part['part_type'])
+        sliced = part['sliced'].astype(bool)
+        valid = zone >= 0
+
+        hit_frames, starts = np.unique(frames, return_index=True)
+        ends = np.append(starts[1:], len(part))
+        for f, lo, hi in zip(hit_frames.tolist(), starts.tolist(), ends.tolist()):
+            if open_frame and f != frame:
+                stats[:, frame - first] = model.step(dt)
+                frame += 1
+                open_frame = False
+            while frame < f:
+                if model.idle:
+                    frame = f
+                    break
+                stats[:, frame - first] = model.step(dt)
+                frame += 1
+            ok = valid[lo:hi]
+            model.apply(creature[lo:hi][ok], zone[lo:hi][ok], damage_type[lo:hi][ok],
+                        part_type[lo:hi][ok], sliced[lo:hi][ok])
+            applied += int(ok.sum())
+            open_frame = True
+
+    if open_frame:
+        stats[:, frame - first] = model.step(dt)
+        frame += 1
+    while frame <= last and not model.idle:
+        stats[:, frame - first] = model.step(dt)
+        frame += 1
+    return model_class.STATS, stats, first, applied
+
+
+def summarize_replay(names, stats, hz):
+    seconds = stats.shape[1] / hz
+    out = {'frames': int(stats.shape[1]), 'seconds': seconds}
+    for name, row in zip(names, stats):
+        if row.size == 0:
+            continue
+        out[name] = {
+            'mean': float(row.mean()),
+            'p95': float(np.percentile(row, 95)),
+            'max': float(row.max()),
+            'total': float(row.sum()),
+        }
+    return out
+
+
+# ========== INFO ==========
+
+def trace_info(records, chunk=CHUNK_RECORDS):
+    """Record counts by zone and damage type, creatures, duration and peak hits per second."""
+    if len(records) == 0:
+        return {'records': 0}
+    zones = np.zeros(256, dtype=np.int64)
+    types = np.zeros(256, dtype=np.int64)
+    per_second = np.zeros(0, dtype=np.int64)
+    sliced = 0
+    for part in iter_chunks(records, chunk):
+        zones += np.bincount(part['zone'], minlength=256)
+        types += np.bincount(part['damage_type'], minlength=256)
+        sliced += int(np.count_nonzero(part['sliced']))
+        seconds = np.bincount(part['time'].astype(np.int64))
+        if len(seconds) > len(per_second):
+            per_second = np.pad(per_second, (0, len(seconds) - len(per_second)))
+        per_second[:len(seconds)] += seconds
+    t0, t1 = float(records['time'][0]), float(records['time'][-1])
+    return {
+        'records': len(records),
+        'start': t0,
+        'end': t1,
+        'creatures': len(creature_ids(records, chunk)),
+        'hits_per_second': len(records) / max(t1 - t0, 1e-9),
+        'peak_hits_per_second': int(per_second.max()),
+        'sliced': sliced,
+        'zones': {name: int(zones[value]) for name, value in BODY_ZONES.items() if zones[value]},
+        'damage_types': {name: int(types[i]) for i, name in enumerate(DAMAGE_TYPE_CODES) if types[i]},
+    }
+
+
+def print_info(info, path, flags):
+    print(f"Hit trace: {path}{' (synthetic)' if flags & FLAG_SYNTHETIC else ''}")
+    if info['records'] == 0:
+        print("  No records")
+        return
+    print(f"  Records: {info['records']:,} over {info['end'] - info['start']:.1f}s "
+          f"({info['start']:.2f}-{info['end']:.2f}), {info['creatures']:,} creatures")
+    print(f"  Hits/s: mean={info['hits_per_second']:.1f} peak={info['peak_hits_per_second']}")
+    print(f"  Sliced: {info['sliced']:,}")
+    print("  Zones: " + ', '.join(f"{name}={n:,}" for name, n in info['zones'].items()))
+    print("  Damage types: " + ', '.join(f"{name}={n:,}" for name, n in info['damage_types'].items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write, inspect and replay DOT hit traces")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('generate', help="Write a synthetic scenario trace")
+    p.add_argument('path')
+    p.add_argument('--scenario', choices=list(SCENARIOS), default='arena')
+    p.add_argument('--seconds', type=float, default=600.0)
+    p.add_argument('--creatures', type=int, default=1000, help="stress: simulated creatures")
+    p.add_argument('--hit-rate', type=float, default=0.5, help="stress: hits per creature per second")
+    p.add_argument('--seed', type=int, default=0)
+
+    p = sub.add_parser('info', help="Summarize a trace")
+    p.add_argument('path')
+    p.add_argument('--json', action='store_true', help="Print the summary as JSON")
+
+    p = sub.add_parser('replay', help="Replay a trace through a bleed model")
+    p.add_argument('path')
+    p.add_argument('--model', default='bleed', help=f"{', '.join(MODELS)} or module:Class")
+    p.add_argument('--hz', type=int, default=DEFAULT_HZ)
+    for name, _, _ in PRESET_AXES:
+        p.add_argument(f'--{name}', default='Default', help=f"{name.capitalize()} preset")
+    p.add_argument('--time', help="Time range START:STOP in seconds (either side optional)")
+    p.add_argument('--tail', type=float, default=DEFAULT_TAIL, help="Seconds replayed after the last hit")
+    p.add_argument('--seed', type=int, default=0, help="Seed for the model's chance rolls")
+    p.add_argument('--json', default='', help="Write the replay summary to this JSON file")
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        start = time.perf_counter()
+        count = generate(args.path, args.scenario, args.seconds, seed=args.seed,
+                         creatures=args.creatures, hit_rate=args.hit_rate)
+        size = os.path.getsize(args.path)
+        print(f"Wrote {count:,} hits ({size / 1e6:.1f} MB, {args.scenario}, {args.seconds:g}s) to {args.path} "
+              f"in {time.perf_counter() - start:.1f}s")
+        return
+
+    try:
+        _, _, flags = read_header(args.path)
+        records = open_trace(args.path)
+    except (OSError, TraceFormatError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.command == 'info':
+        info = trace_info(records)
+        if args.json:
+            print(json.dumps(info, indent=2))
+        else:
+            print_info(info, args.path, flags)
+        return
+
+    try:
+        if args.time:
+            records = time_slice(records, *parse_time_range(args.time))
+        model_class = load_model(args.model)
+        presets = {name: getattr(args, name) for name, _, _ in PRESET_AXES}
+        start = time.perf_counter()
+        names, stats, _, applied = replay(records, model_class, args.hz, presets, args.tail, args.seed)
+    except (ValueError, ImportError, AttributeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    wall = time.perf_counter() - start
+    summary = summarize_replay(names, stats, args.hz)
+
+    print(f"Replayed {applied:,} hits through '{args.model}' at {args.hz} Hz: "
+          f"{summary['seconds']:.1f}s of frames in {wall:.2f}s ({summary['seconds'] / max(wall, 1e-9):.0f}x real time)")
+    print(f"  {'stat':<14} {'mean/f':>9} {'p95':>9} {'max':>9} {'total':>12}")
+    for name in names:
+        if name in summary:
+            s = summary[name]
+            print(f"  {name:<14} {s['mean']:>9.2f} {s['p95']:>9.1f} {s['max']:>9.1f} {s['total']:>12,.1f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'trace': args.path, 'model': args.model, 'hz': args.hz, 'presets': presets,
+                       'hits': applied, 'wall_seconds': wall, 'summary': summary}, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
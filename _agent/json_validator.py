@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Schema-driven validation for every JSON file in the mod tree.
+
+Schemas are declarative dicts (a small JSON Schema subset plus uniqueKey
+for arrays of objects) compiled once into checker functions. Files are
+matched to a schema by path:
+
+  manifest.json, builds/*/DOT/manifest.json  -> manifest
+  _translations/Texts/Text_*.json            -> ThunderRoad TextData
+  any other *.json                           -> must parse
+
+Per-file results are cached in _agent/.cache/ by content hash, so only
+changed files are re-checked; those run on a process pool when there are
+enough of them to pay for it. Cross-file rules (GameVersion/ModVersion
+agreement between the root manifest and the build copies) run on the
+cached facts. Diagnostics are structured: file, JSON pointer, code,
+severity, message.
+
+Usage:
+    python json_validator.py            # human-readable report
+    python json_validator.py --json     # machine-readable diagnostics
+    python json_validator.py --no-cache
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+import time
+import zlib
+
+from registry import AGENT_DIR, PROJECT_ROOT
+
+CACHE_PATH = os.path.join(AGENT_DIR, ".cache", "json_validator.json")
+
+EXCLUDED_DIRS = {'.git', '.cache', 'bin', 'obj', 'BasSDK', 'References', 'node_modules', '__pycache__'}
+
+# Below this many uncached files, checking inline beats starting a pool
+POOL_MIN_FILES = 16
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# ========== SCHEMAS ==========
+
+MANIFEST_SCHEMA = {
+    'type': 'object',
+    'required': ['Name', 'Description', 'Author', 'ModVersion', 'GameVersion'],
+    'properties': {
+        'Name': {'type': 'string', 'minLength': 1},
+        'Description': {'type': 'string'},
+        'Author': {'type': 'string', 'minLength': 1},
+        'ModVersion': {'type': 'string', 'pattern': r'^\d+\.\d+\.\d+$'},
+        'GameVersion': {'type': 'string', 'pattern': r'^\d+(\.\d+){1,3}$'},
+    },
+}
+
+TEXTDATA_SCHEMA = {
+    'type': 'object',
+    'required': ['$type', 'id', 'version', 'groupId', 'textList'],
+    'properties': {
+        '$type': {'const': 'ThunderRoad.TextData, ThunderRoad'},
+        'id': {'type': 'string', 'minLength': 1},
+        'version': {'type': 'integer'},
+        'groupId': {'type': 'string', 'minLength': 1},
+        'textList': {
+            'type': 'array',
+            'uniqueKey': 'id',
+            'items': {
+                'type': 'object',
+                'required': ['id', 'text'],
+                'additionalProperties': False,
+                'properties': {
+                    'id': {'type': 'string', 'minLength': 1},
+                    'text': {'type': 'string'},
+                },
+            },
+        },
+    },
+}
+
+# (glob relative to the project root, schema name); first match wins
+FILE_RULES = [
+    ('manifest.json', 'manifest'),
+    ('builds/*/DOT/manifest.json', 'manifest'),
+    ('_translations/Texts/Text_*.json', 'textdata'),
+]
+
+SCHEMAS = {
+    'manifest': MANIFEST_SCHEMA,
+    'textdata': TEXTDATA_SCHEMA,
+}
+
+# Bump when checks change in ways the schema dicts do not capture
+RULES_VERSION = 1
+
+
+# ========== SCHEMA COMPILER ==========
+
+_TYPES = {
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'string': lambda v: isinstance(v, str),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'boolean': lambda v: isinstance(v, bool),
+}
+
+
+def _pointer(path, key):
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def compile_schema(schema):
+    """Compile a schema dict into check(value, path, diags)."""
+    checks = []
+
+    if 'type' in schema:
+        type_name = schema['type']
+        is_type = _TYPES[type_name]
+
+        def check_type(value, path, diags):
+            if not is_type(value):
+                diags.append((path, 'type', f"expected {type_name}, got {type(value).__name__}"))
+                return False
+            return True
+        checks.append(check_type)
+
+    if 'const' in schema:
+        expected = schema['const']
+
+        def check_const(value, path, diags):
+            if value != expected:
+                diags.append((path, 'const', f"expected {expected!r}, got {value!r}"))
+        checks.append(check_const)
+
+    if 'enum' in schema:
+        allowed = schema['enum']
+
+        def check_enum(value, path, diags):
+            if value not in allowed:
+                diags.append((path, 'enum', f"{value!r} not one of {allowed}"))
+        checks.append(check_enum)
+
+    if 'minLength' in schema:
+        min_length = schema['minLength']
+
+        def check_min_length(value, path, diags):
+            if isinstance(value, str) and len(value) < min_length:
+                diags.append((path, 'minLength', f"shorter than {min_length} character(s)"))
+        checks.append(check_min_length)
+
+    if 'pattern' in schema:
+        pattern = re.compile(schema['pattern'])
+
+        def check_pattern(value, path, diags):
+            if isinstance(value, str) and not pattern.search(value):
+                diags.append((path, 'pattern', f"{value!r} does not match {pattern.pattern}"))
+        checks.append(check_pattern)
+
+    if 'required' in schema:
+        required = schema['required']
+
+        def check_required(value, path, diags):
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        diags.append((path, 'required', f"missing field {key!r}"))
+        checks.append(check_required)
+
+    if 'properties' in schema:
+        props = {k: compile_schema(v) for k, v in schema['properties'].items()}
+        closed = schema.get('additionalProperties', True) is False
+
+        def check_properties(value, path, diags):
+            if not isinstance(value, dict):
+                return
+            for key, item in value.items():
+                check = props.get(key)
+                if check is not None:
+                    check(item, _pointer(path, key), diags)
+                elif closed:
+                    diags.append((_pointer(path, key), 'additionalProperties', f"unexpected field {key!r}"))
+        checks.append(check_properties)
+
+    if 'items' in schema:
+        item_check = compile_schema(schema['items'])
+
+        def check_items(value, path, diags):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    item_check(item, _pointer(path, i), diags)
+        checks.append(check_items)
+
+    if 'uniqueKey' in schema:
+        unique_key = schema['uniqueKey']
+
+        def check_unique(value, path, diags):
+            if not isinstance(value, list):
+                return
+            seen = {}
+            for i, item in enumerate(value):
+                if not isinstance(item, dict) or unique_key not in item:
+                    continue
+                key = item[unique_key]
+                if key in seen:
+                    diags.append((_pointer(_pointer(path, i), unique_key), 'unique',
+                                  f"duplicate {unique_key} {key!r} (first at index {seen[key]})"))
+                else:
+                    seen[key] = i
+        checks.append(check_unique)
+
+    def check(value, path, diags):
+        for c in checks:
+            # A failed type check makes the remaining checks meaningless
+            if c(value, path, diags) is False:
+                return
+    return check
+
+
+_COMPILED = None
+
+
+def compiled_schemas():
+    global _COMPILED
+    if _COMPILED is None:
+        _COMPILED = {name: compile_schema(schema) for name, schema in SCHEMAS.items()}
+    return _COMPILED
+
+
+def rules_key():
+    """Changes whenever a schema or rule changes, invalidating cached results."""
+    blob = json.dumps([SCHEMAS, FILE_RULES, RULES_VERSION], sort_keys=True).encode('utf-8')
+    return f"{zlib.crc32(blob):08x}{len(blob):08x}"
+
+
+# ========== PER-FILE CHECKS ==========
+
+def schema_for(rel_path):
+    for pattern, name in FILE_RULES:
+        if fnmatch.fnmatchcase(rel_path, pattern):
+            return name
+    return None
+
+
+def _textdata_rules(data, diags):
+    """Text IDs must live under the file's groupId."""
+    group = data.get('groupId')
+    items = data.get('textList')
+    if not isinstance(group, str) or not isinstance(items, list):
+        return
+    prefix = f"{group}."
+    for i, item in enumerate(items):
+        text_id = item.get('id') if isinstance(item, dict) else None
+        if isinstance(text_id, str) and not text_id.startswith(prefix):
+            diags.append((f"/textList/{i}/id", 'groupPrefix', f"{text_id!r} is not under group {group!r}"))
+
+
+def _facts(schema_name, data):
+    """Values the cross-file rules need, kept in the cache with the result."""
+    if schema_name == 'manifest' and isinstance(data, dict):
+        return {k: data.get(k) for k in ('Name', 'ModVersion', 'GameVersion')}
+    if schema_name == 'textdata' and isinstance(data, dict) and isinstance(data.get('textList'), list):
+        return {'groupId': data.get('groupId'), 'texts': len(data['textList'])}
+    return {}
+
+
+def check_file(rel_path, raw):
+    """Validate one file's bytes. Returns {'schema', 'diagnostics', 'facts'}."""
+    schema_name = schema_for(rel_path)
+    diags = []
+    try:
+        data = json.loads(raw.decode('utf-8-sig'))
+    except UnicodeDecodeError as e:
+        return {'schema': schema_name, 'facts': {},
+                'diagnostics': [_diag('', 'encoding', ERROR, f"not UTF-8: {e}")]}
+    except json.JSONDecodeError as e:
+        return {'schema': schema_name, 'facts': {},
+                'diagnostics': [_diag('', 'parse', ERROR, f"line {e.lineno} col {e.colno}: {e.msg}")]}
+    if raw.startswith(b'\xef\xbb\xbf'):
+        diags.append(('', 'bom', 'UTF-8 byte order mark'))
+
+    if schema_name is not None:
+        compiled_schemas()[schema_name](data, '', diags)
+        if schema_name == 'textdata' and isinstance(data, dict):
+            _textdata_rules(data, diags)
+    severity = {'bom': WARNING}
+    return {
+        'schema': schema_name,
+        'facts': _facts(schema_name, data),
+        'diagnostics': [_diag(path, code, severity.get(code, ERROR), msg) for path, code, msg in diags],
+    }
+
+
+def _diag(pointer, code, severity, message):
+    return {'pointer': pointer, 'code': code, 'severity': severity, 'message': message}
+
+
+def _check_path(args):
+    # Imported here: a warm run (every file's stat unchanged) never hashes
+    import hashlib
+    rel_path, full_path = args
+    with open(full_path, 'rb') as f:
+        raw = f.read()
+    return rel_path, hashlib.sha256(raw).hexdigest(), check_file(rel_path, raw)
+
+
+# ========== CROSS-FILE CHECKS ==========
+
+def cross_file_diagnostics(results):
+    """GameVersion must agree across manifests; ModVersion should."""
+    diags = []
+    manifests = {p: r['facts'] for p, r in results.items() if r['schema'] == 'manifest'}
+    root = manifests.get('manifest.json')
+    if root is None:
+        return diags
+    for path, facts in sorted(manifests.items()):
+        if path == 'manifest.json':
+            continue
+        for field, severity in (('GameVersion', ERROR), ('ModVersion', WARNING)):
+            if facts.get(field) != root.get(field):
+                diags.append(dict(_diag(f"/{field}", f"mismatch{field}", severity,
+                                        f"{facts.get(field)!r} differs from manifest.json ({root.get(field)!r})"),
+                                  file=path))
+    return diags
+
+
+# ========== DRIVER ==========
+
+def json_files(root=PROJECT_ROOT):
+    """Every .json file in the tree as (relative path, full path), sorted."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+        for f in filenames:
+            if f.endswith('.json'):
+                full = os.path.join(dirpath, f)
+                found.append((os.path.relpath(full, root).replace(os.sep, '/'), full))
+    return sorted(found)
+
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('rules') != rules_key():
+        return {}
+    return cache.get('files', {})
+
+
+def _save_cache(path, files):
+    import tempfile  # Imported here: only a run that checked something writes the cache
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'rules': rules_key(), 'files': files}, f)
+    os.replace(tmp, path)
+
+
+def validate_tree(root=PROJECT_ROOT, cache_path=CACHE_PATH, use_cache=True, jobs=None):
+    """Validate every JSON file under root. Returns a report dict."""
+    start = time.perf_counter()
+    files = json_files(root)
+    cache = _load_cache(cache_path) if use_cache else {}
+
+    results = {}
+    pending = []
+    for rel, full in files:
+        entry = cache.get(rel)
+        if entry is not None:
+            st = os.stat(full)
+            if entry.get('stat') == [st.st_size, st.st_mtime_ns]:
+                results[rel] = entry
+                continue
+        pending.append((rel, full))
+
+    checked = 0
+    if pending:
+        if len(pending) >= POOL_MIN_FILES and jobs != 1:
+            # Imported here: the pool costs ~15 ms to import and a warm run never needs it
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                outcomes = list(pool.map(_check_path, pending, chunksize=8))
+        else:
+            outcomes = [_check_path(p) for p in pending]
+        by_rel = dict(pending)
+        for rel, digest, result in outcomes:
+            entry = cache.get(rel)
+            if entry is not None and entry.get('sha256') == digest:
+                # Touched but unchanged: keep the cached result
+                result = {k: entry[k] for k in ('schema', 'facts', 'diagnostics')}
+            else:
+                checked += 1
+            st = os.stat(by_rel[rel])
+            results[rel] = dict(result, sha256=digest, stat=[st.st_size, st.st_mtime_ns])
+
+    if use_cache and (pending or results.keys() != cache.keys()):
+        _save_cache(cache_path, results)
+
+    diagnostics = [dict(d, file=rel) for rel, r in sorted(results.items()) for d in r['diagnostics']]
+    diagnostics += cross_file_diagnostics(results)
+    return {
+        'files': len(files),
+        'checked': checked,
+        'cached': len(files) - checked,
+        'seconds': round(time.perf_counter() - start, 4),
+        'schemas': {rel: r['schema'] for rel, r in sorted(results.items())},
+        'diagnostics': diagnostics,
+        'errors': sum(1 for d in diagnostics if d['severity'] == ERROR),
+        'warnings': sum(1 for d in diagnostics if d['severity'] == WARNING),
+    }
+
+
+def print_report(report):
+    for d in report['diagnostics']:
+        where = f"{d['file']}{'#' + d['pointer'] if d['pointer'] else ''}"
+        print(f"{d['severity'].upper()}: {where}: {d['message']} [{d['code']}]")
+    print(f"{report['files']} JSON files ({report['checked']} checked, {report['cached']} cached) "
+          f"in {report['seconds'] * 1000:.0f} ms: {report['errors']} error(s), {report['warnings']} warning(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate every JSON file in the mod tree.")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    parser.add_argument('--no-cache', action='store_true', help="Re-check every file")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes (1 = inline)")
+    args = parser.parse_args()
+
+    report = validate_tree(use_cache=not args.no_cache, jobs=args.jobs)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report)
+    sys.exit(1 if report['errors'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Localization coverage: joins the IDs the C# code references with every
+_translations/Texts/Text_*.json file.
+
+References are taken from the token stream of every mod source file
+(modoption_parser.tokenize): `nameLocalizationId`/`categoryLocalizationId`
+attribute values, `ModOptionString` IDs and any other `<const> + ".X"`
+expression whose constant resolves to the localization group, plus string
+literals that already start with "DOT_Options.". Each language file is
+loaded once into an {id: text} index; the report is then a handful of set
+operations per language, linear in the number of keys.
+
+Per language it reports:
+  missing       referenced by the code, absent from the file
+  orphaned      in the file, never referenced
+  untranslated  identical to the English text (non-English files only;
+                texts without letters, such as "0.5x", are skipped)
+  shape         file/entry structure problems: wrong $type/groupId, entries
+                that are not {id, text} strings, IDs outside the group,
+                duplicate IDs, empty texts, placeholders ({0}, {name}) that
+                differ from English
+
+Missing keys and shape problems fail the run (exit 1); orphaned and
+untranslated keys are warnings unless --strict.
+
+Usage:
+    python loc_coverage.py
+    python loc_coverage.py --verbose          # list every key, not just counts
+    python loc_coverage.py --lang French,Thai --json
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+
+from modoption_parser import Evaluator, Unresolved, project_sources, scan, tokenize
+from registry import PROJECT_ROOT, TRANSLATIONS_DIR
+
+sys.path.insert(0, TRANSLATIONS_DIR)
+
+from _build_translations import GROUP_ID, LANG_MAP, TEXTS_DIR  # noqa: E402
+
+ENGLISH = 'English'
+TEXTDATA_TYPE = "ThunderRoad.TextData, ThunderRoad"
+KEY_PATTERN = r'[A-Za-z0-9_]+\Z'
+PLACEHOLDER_RE = re.compile(r'\{[^{}]*\}')
+LETTER_RE = re.compile(r'[^\W\d_]')
+
+CATEGORIES = ['missing', 'orphaned', 'untranslated', 'shape']
+FAILING = {'missing', 'shape'}
+
+
+# ========== CODE REFERENCES ==========
+
+def extract_references(paths, group_id=GROUP_ID):
+    """Localization IDs referenced by the sources.
+
+    Returns ({full id: [(relative path, line, context)]}, bad) where bad lists
+    references under the group that are not `<group>.<Key>` shaped.
+    """
+    sources = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            source = f.read()
+        sources[path] = (source, tokenize(source))
+
+    constants = {}
+    for source, tokens in sources.values():
+        constants.update(scan(source, tokens)[0])
+    evaluator = Evaluator(constants)
+    prefix = group_id + '.'
+    id_re = re.compile(re.escape(prefix) + KEY_PATTERN)
+
+    refs, bad = {}, []
+    for path, (source, tokens) in sources.items():
+        rel = os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '/')
+        line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+        n = len(tokens)
+        for i, (kind, text, pos) in enumerate(tokens):
+            value = None
+            if kind == 'ident' and i + 2 < n and tokens[i + 1][1] == '+' and tokens[i + 2][0] == 'string' \
+                    and (i == 0 or tokens[i - 1][1] != '.'):
+                try:
+                    head = evaluator.lookup(text)
+                except Unresolved:
+                    continue
+                if head != group_id:
+                    continue
+                value = head + tokens[i + 2][1][1:-1]
+            elif kind == 'string' and text[1:-1].startswith(prefix):
+                if i >= 2 and tokens[i - 1][1] == '+' and tokens[i - 2][0] == 'ident':
+                    continue
+                value = text[1:-1]
+            else:
+                continue
+            # Context: the attribute argument name, or the constructor called
+            context = 'expression'
+            if i >= 2 and tokens[i - 1][1] == '=' and tokens[i - 2][0] == 'ident':
+                context = tokens[i - 2][1]
+            else:
+                depth = 0
+                for j in range(i - 1, max(i - 16, -1), -1):
+                    t = tokens[j][1]
+                    if t == ')':
+                        depth += 1
+                    elif t == '(':
+                        if depth == 0:
+                            if j > 0 and tokens[j - 1][0] == 'ident':
+                                context = tokens[j - 1][1]
+                            break
+                        depth -= 1
+            where = (rel, bisect.bisect_right(line_starts, pos), context)
+            if not id_re.match(value):
+                bad.append({'id': value, 'where': where})
+                continue
+            refs.setdefault(value, []).append(where)
+    return refs, bad
+
+
+# ========== LANGUAGE FILES ==========
+
+def load_language(path, group_id=GROUP_ID):
+    """Index one Text_*.json. Returns ({id: text}, [shape problems])."""
+    problems = []
+
+    def problem(code, message, text_id=''):
+        problems.append({'code': code, 'id': text_id, 'message': message})
+
+    try:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            data = json.load(f)
+    except OSError as e:
+        problem('file', f"cannot read: {e.strerror}")
+        return {}, problems
+    except ValueError as e:
+        problem('file', f"invalid JSON: {e}")
+        return {}, problems
+
+    if not isinstance(data, dict):
+        problem('file', "top level is not an object")
+        return {}, problems
+    if data.get('$type') != TEXTDATA_TYPE:
+        problem('file', f"$type is {data.get('$type')!r}, expected {TEXTDATA_TYPE!r}")
+    if data.get('groupId') != group_id:
+        problem('file', f"groupId is {data.get('groupId')!r}, expected {group_id!r}")
+    items = data.get('textList')
+    if not isinstance(items, list):
+        legacy = ' (legacy textGroups layout)' if 'textGroups' in data else ''
+        problem('file', f"textList is missing or not a list{legacy}")
+        return {}, problems
+
+    prefix = group_id + '.'
+    id_match = re.compile(re.escape(prefix) + KEY_PATTERN).match
+    index = {}
+    for pos, item in enumerate(items):
+        try:
+            text_id, text = item['id'], item['text']
+        except (TypeError, KeyError):
+            text_id = text = None
+        if type(text_id) is not str or type(text) is not str:
+            problem('entry', f"textList[{pos}] is not an {{id, text}} pair of strings")
+            continue
+        if len(item) != 2:
+            problem('entry', f"unexpected keys {sorted(set(item) - {'id', 'text'})}", text_id)
+        if not id_match(text_id):
+            problem('id', f"ID is not {prefix}<Key>", text_id)
+        if text_id in index:
+            problem('duplicate', "duplicate ID (the later entry wins in game)", text_id)
+        if not text.strip():
+            problem('empty', "empty text", text_id)
+        index[text_id] = text
+    return index, problems
+
+
+def load_languages(suffixes, texts_dir=TEXTS_DIR, group_id=GROUP_ID):
+    return {s: load_language(os.path.join(texts_dir, f"Text_{s}.json"), group_id) for s in suffixes}
+
+
+# ========== COVERAGE ==========
+
+def _placeholders(text):
+    return sorted(PLACEHOLDER_RE.findall(text))
+
+
+def coverage(references, languages, english=ENGLISH):
+    """Per-language report {suffix: {category: [{'id', ...}]}} from indexed inputs."""
+    referenced = set(references)
+    english_index = languages.get(english, ({}, []))[0]
+    english_placeholders = {k: _placeholders(v) for k, v in english_index.items() if '{' in v}
+
+    report = {}
+    for suffix, (index, problems) in languages.items():
+        keys = index.keys()
+        result = {
+            'missing': [{'id': k, 'where': references[k][0]} for k in sorted(referenced - keys)],
+            'orphaned': [{'id': k} for k in sorted(keys - referenced)],
+            'untranslated': [],
+            'shape': list(problems),
+        }
+        if suffix != english:
+            for k, text in index.items():
+                source = english_index.get(k)
+                if source is not None and text == source and LETTER_RE.search(text):
+                    result['untranslated'].append({'id': k, 'text': text})
+            result['untranslated'].sort(key=lambda r: r['id'])
+        for k, expected in english_placeholders.items():
+            text = index.get(k)
+            if text is not None and _placeholders(text) != expected:
+                result['shape'].append({'code': 'placeholders', 'id': k,
+                                        'message': f"placeholders {_placeholders(text)} != English {expected}"})
+        report[suffix] = result
+    return report
+
+
+# ========== REPORTING ==========
+
+def print_report(report, bad_refs, reference_count, verbose=False):
+    print(f"Code references: {reference_count} IDs")
+    for r in bad_refs:
+        rel, line, context = r['where']
+        print(f"  BAD REFERENCE {r['id']!r} ({context}) at {rel}:{line}")
+    print(f"\n{'language':<20}" + ''.join(f"{c:>14}" for c in CATEGORIES))
+    for suffix, result in report.items():
+        print(f"{suffix:<20}" + ''.join(f"{len(result[c]):>14}" for c in CATEGORIES))
+    if not verbose:
+        return
+    for suffix, result in report.items():
+        if not any(result.values()):
+            continue
+        print(f"\n{suffix}:")
+        for r in result['missing']:
+            rel, line, context = r['where']
+            print(f"  missing       {r['id']} ({context} at {rel}:{line})")
+        for r in result['orphaned']:
+            print(f"  orphaned      {r['id']}")
+        for r in result['untranslated']:
+            print(f"  untranslated  {r['id']} = {r['text']!r}")
+        for r in result['shape']:
+            label = f" {r['id']}" if r['id'] else ''
+            print(f"  shape         [{r['code']}]{label}: {r['message']}")
+
+
+def failed(report, bad_refs, strict=False):
+    categories = set(CATEGORIES) if strict else FAILING
+    return bool(bad_refs) or any(result[c] for result in report.values() for c in categories)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check localization coverage between the C# code and Text_*.json.")
+    parser.add_argument('--lang', default='', help="Comma separated language suffixes (default: all)")
+    parser.add_argument('--verbose', '-v', action='store_true', help="List every key")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    parser.add_argument('--strict', action='store_true', help="Also fail on orphaned and untranslated keys")
+    args = parser.parse_args()
+
+    suffixes = [s.strip() for s in args.lang.split(',') if s.strip()] or list(LANG_MAP.values())
+    unknown = [s for s in suffixes if s not in LANG_MAP.values()]
+    if unknown:
+        parser.error(f"unknown language(s): {', '.join(unknown)}")
+    if ENGLISH not in suffixes:
+        # English is the reference for untranslated/placeholder checks
+        suffixes = [ENGLISH] + suffixes
+
+    references, bad_refs = extract_references(project_sources())
+    report = coverage(references, load_languages(suffixes))
+    if args.json:
+        print(json.dumps({'references': len(references), 'bad_references': bad_refs, 'languages': report},
+                         indent=2, ensure_ascii=False))
+    else:
+        print_report(report, bad_refs, len(references), args.verbose)
+    sys.exit(1 if failed(report, bad_refs, args.strict) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Streaming analyzer for Unity Player.log files produced with DOT debug logging.
+
+Extracts the [DOT] lines written by PerformanceMetrics and BleedManager:
+  - "Slow tick: X ms (N effects)"
+  - "Performance: T ticks, avg=..ms, worst=..ms, peak=N effects, total dmg=D"
+  - "EXPIRED: Zone on Creature (reason)"
+  - "--- Active Bleeds Status ---" blocks
+
+Each file is memory-mapped and scanned with one compiled bytes regex, so
+multi-gigabyte logs are never read into memory. Latency percentiles come
+from a fixed log-spaced histogram (about 5% bin resolution), which keeps
+memory constant regardless of log size. Files are analyzed in parallel,
+one per worker process.
+
+Sessions are split on the "=== DOT vX (Platform) ===" banner that
+DOTModule.ScriptEnable prints.
+
+Usage:
+    python log_analyzer.py Player.log
+    python log_analyzer.py logs/*.log --json report.json --bucket 5
+"""
+
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+EVENT_RE = re.compile(
+    rb'\[DOT\] (?:'
+    rb'Slow tick: (?P<slow_ms>[\d.,]+) ?ms \((?P<slow_n>\d+) effects\)'
+    rb'|Performance: (?P<perf_ticks>\d+) ticks, avg=(?P<perf_avg>[\d.,]+) ?ms, '
+    rb'worst=(?P<perf_worst>[\d.,]+) ?ms, peak=(?P<perf_peak>\d+) effects'
+    rb'|EXPIRED: (?P<exp_zone>\w+) on .*? \((?P<exp_reason>duration ended|target invalid/killed)\)'
+    rb'|(?P<status_start>--- Active Bleeds Status ---)'
+    rb'|Creatures: (?P<st_creatures>\d+) \| Effects: (?P<st_effects>\d+)'
+    rb'|(?P<status_end>-{32})'
+    rb'|  (?P<st_line>\S[^\r\n]*)'
+    rb'|=== DOT v(?P<version>[\w.]+) \((?P<platform>[^)\r\n]+)\) ==='
+    rb')'
+)
+
+# "Throat x2 (3.4s)" entries inside an Active Bleeds Status creature line
+STATUS_ENTRY_RE = re.compile(rb'(\w+) x(\d+) \(([\d.,]+)s\)')
+
+# Log-spaced latency histogram: 0.01 ms .. 100 s, 50 bins per decade
+HIST_MIN_MS = 0.01
+HIST_BINS_PER_DECADE = 50
+HIST_DECADES = 7
+HIST_SIZE = HIST_BINS_PER_DECADE * HIST_DECADES + 2  # + underflow/overflow
+
+PERCENTILES = (50, 95, 99)
+
+
+def _num(raw):
+    """Parse a float printed with F2 in any culture (2.34 or 2,34)."""
+    return float(raw.replace(b',', b'.'))
+
+
+def iter_events(path):
+    """
+    Yield DOT events from a log file without reading it into memory.
+
+    Events are tuples whose first element is the kind:
+      ('session', version, platform)
+      ('slow', ms, effects)
+      ('perf', ticks, avg_ms, worst_ms, peak_effects)
+      ('expired', zone, reason)
+      ('status', creatures, effects, [(zone, stacks, remaining_s), ...])
+    Status blocks are emitted once, when their closing dashes line is seen.
+    """
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        status = None
+        for m in EVENT_RE.finditer(mm):
+            group = m.group
+            if group('slow_ms') is not None:
+                yield ('slow', _num(group('slow_ms')), int(group('slow_n')))
+            elif group('perf_ticks') is not None:
+                yield ('perf', int(group('perf_ticks')), _num(group('perf_avg')),
+                       _num(group('perf_worst')), int(group('perf_peak')))
+            elif group('exp_zone') is not None:
+                yield ('expired', group('exp_zone').decode(), group('exp_reason').decode())
+            elif group('status_start') is not None:
+                status = [0, 0, []]
+            elif status is not None and group('st_creatures') is not None:
+                status[0] = int(group('st_creatures'))
+                status[1] = int(group('st_effects'))
+            elif status is not None and group('st_line') is not None:
+                status[2].extend((zone.decode(), int(stacks), _num(remaining))
+                                 for zone, stacks, remaining in STATUS_ENTRY_RE.findall(group('st_line')))
+            elif group('status_end') is not None:
+                if status is not None:
+                    yield ('status', status[0], status[1], status[2])
+                status = None
+            elif group('version') is not None:
+                yield ('session', group('version').decode(), group('platform').decode())
+
+
+def _hist_index(ms):
+    if ms < HIST_MIN_MS:
+        return 0
+    idx = int(math.log10(ms / HIST_MIN_MS) * HIST_BINS_PER_DECADE) + 1
+    return min(idx, HIST_SIZE - 1)
+
+
+def _hist_value(idx):
+    """Geometric centre of a histogram bin in ms."""
+    if idx == 0:
+        return HIST_MIN_MS
+    return HIST_MIN_MS * 10 ** ((idx - 0.5) / HIST_BINS_PER_DECADE)
+
+
+def hist_percentiles(hist, percentiles=PERCENTILES):
+    total = sum(hist)
+    result = {}
+    if total == 0:
+        return {f"p{p}": None for p in percentiles}
+    for p in percentiles:
+        target = total * p / 100.0
+        running = 0
+        for idx, count in enumerate(hist):
+            running += count
+            if running >= target:
+                result[f"p{p}"] = round(_hist_value(idx), 3)
+                break
+    return result
+
+
+def new_session(version='?', platform='?'):
+    return {
+        'version': version,
+        'platform': platform,
+        'slow_hist': [0] * HIST_SIZE,
+        'slow_count': 0,
+        'slow_sum_ms': 0.0,
+        'slow_max_ms': 0.0,
+        'slow_by_bucket': {},       # bucket -> [count, sum_ms, max_ms]
+        'perf_windows': 0,
+        'perf_ticks': 0,            # PerformanceMetrics counters are cumulative; keep the last
+        'perf_avg_max_ms': 0.0,
+        'perf_worst_ms': 0.0,
+        'perf_peak_effects': 0,
+        'expired_by_zone': {},
+        'expired_by_reason': {},
+        'status_dumps': 0,
+        'status_by_bucket': {},     # bucket -> dumps seen at that effect count
+        'status_max_creatures': 0,
+        'status_max_effects': 0,
+        'status_max_stacks': 0,
+        'status_zone_live': {},
+    }
+
+
+def _bump(d, key, amount=1):
+    d[key] = d.get(key, 0) + amount
+
+
+def analyze_file(path, bucket_width=10):
+    """Fold the event stream of one log file into per-session summaries."""
+    sessions = []
+    session = None
+    for event in iter_events(path):
+        kind = event[0]
+        if kind == 'session':
+            session = new_session(event[1], event[2])
+            sessions.append(session)
+            continue
+        if session is None:
+            session = new_session()
+            sessions.append(session)
+
+        if kind == 'slow':
+            _, ms, effects = event
+            session['slow_hist'][_hist_index(ms)] += 1
+            session['slow_count'] += 1
+            session['slow_sum_ms'] += ms
+            session['slow_max_ms'] = max(session['slow_max_ms'], ms)
+            entry = session['slow_by_bucket'].setdefault(effects // bucket_width * bucket_width, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += ms
+            entry[2] = max(entry[2], ms)
+        elif kind == 'perf':
+            _, ticks, avg_ms, worst_ms, peak = event
+            session['perf_windows'] += 1
+            session['perf_ticks'] = max(session['perf_ticks'], ticks)
+            session['perf_avg_max_ms'] = max(session['perf_avg_max_ms'], avg_ms)
+            session['perf_worst_ms'] = max(session['perf_worst_ms'], worst_ms)
+            session['perf_peak_effects'] = max(session['perf_peak_effects'], peak)
+        elif kind == 'expired':
+            _bump(session['expired_by_zone'], event[1])
+            _bump(session['expired_by_reason'], event[2])
+        elif kind == 'status':
+            _, creatures, effects, entries = event
+            session['status_dumps'] += 1
+            _bump(session['status_by_bucket'], effects // bucket_width * bucket_width)
+            session['status_max_creatures'] = max(session['status_max_creatures'], creatures)
+            session['status_max_effects'] = max(session['status_max_effects'], effects)
+            for zone, stacks, _ in entries:
+                _bump(session['status_zone_live'], zone)
+                session['status_max_stacks'] = max(session['status_max_stacks'], stacks)
+    return {'path': path, 'sessions': sessions}
+
+
+def merge_sessions(sessions):
+    """Combine session summaries into one total."""
+    total = new_session('*', '*')
+    for s in sessions:
+        total['slow_hist'] = [a + b for a, b in zip(total['slow_hist'], s['slow_hist'])]
+        for key in ('slow_count', 'slow_sum_ms', 'perf_windows', 'perf_ticks', 'status_dumps'):
+            total[key] += s[key]
+        for key in ('slow_max_ms', 'perf_avg_max_ms', 'perf_worst_ms', 'perf_peak_effects',
+                    'status_max_creatures', 'status_max_effects', 'status_max_stacks'):
+            total[key] = max(total[key], s[key])
+        for key in ('expired_by_zone', 'expired_by_reason', 'status_by_bucket', 'status_zone_live'):
+            for k, v in s[key].items():
+                _bump(total[key], k, v)
+        for bucket, (count, sum_ms, max_ms) in s['slow_by_bucket'].items():
+            entry = total['slow_by_bucket'].setdefault(bucket, [0, 0.0, 0.0])
+            entry[0] += count
+            entry[1] += sum_ms
+            entry[2] = max(entry[2], max_ms)
+    return total
+
+
+def finalize(session):
+    """Derive the reported statistics from a session accumulator."""
+    slow = session['slow_count']
+    dumps = session['status_dumps']
+    by_bucket = []
+    for bucket in sorted(set(session['slow_by_bucket']) | set(session['status_by_bucket'])):
+        count, sum_ms, max_ms = session['slow_by_bucket'].get(bucket, [0, 0.0, 0.0])
+        seen = session['status_by_bucket'].get(bucket, 0)
+        slow_share = count / slow if slow else 0.0
+        seen_share = seen / dumps if dumps else 0.0
+        by_bucket.append({
+            'effects': bucket,
+            'slow_ticks': count,
+            'mean_ms': round(sum_ms / count, 3) if count else None,
+            'max_ms': round(max_ms, 3) if count else None,
+            'status_share': round(seen_share, 4),
+            # >1 means slow ticks are over-represented at this load level
+            'relative_rate': round(slow_share / seen_share, 3) if seen_share else None,
+        })
+    return {
+        'version': session['version'],
+        'platform': session['platform'],
+        'slow_ticks': slow,
+        'slow_tick_rate': round(slow / session['perf_ticks'], 6) if session['perf_ticks'] else None,
+        'latency_ms': {**hist_percentiles(session['slow_hist']),
+                       'max': round(session['slow_max_ms'], 3),
+                       'mean': round(session['slow_sum_ms'] / slow, 3) if slow else None},
+        'perf_windows': session['perf_windows'],
+        'total_ticks': session['perf_ticks'],
+        'worst_tick_ms': session['perf_worst_ms'],
+        'peak_effects': max(session['perf_peak_effects'], session['status_max_effects']),
+        'slow_ticks_by_effects': by_bucket,
+        'expired_by_zone': dict(sorted(session['expired_by_zone'].items())),
+        'expired_by_reason': session['expired_by_reason'],
+        'status_dumps': dumps,
+        'status_max_creatures': session['status_max_creatures'],
+        'status_max_stacks': session['status_max_stacks'],
+        'status_zone_live': dict(sorted(session['status_zone_live'].items())),
+    }
+
+
+def print_summary(title, s):
+    lat = s['latency_ms']
+    print(f"--- {title} ---")
+    print(f"  Slow ticks: {s['slow_ticks']}"
+          + (f" ({s['slow_tick_rate'] * 100:.3f}% of {s['total_ticks']} ticks)" if s['slow_tick_rate'] is not None else ""))
+    if s['slow_ticks']:
+        print(f"  Latency ms: p50={lat['p50']} p95={lat['p95']} p99={lat['p99']} max={lat['max']} mean={lat['mean']}")
+    if s['perf_windows']:
+        print(f"  Performance windows: {s['perf_windows']} | worst={s['worst_tick_ms']:.2f}ms | peak={s['peak_effects']} effects")
+    if s['slow_ticks_by_effects']:
+        print(f"  {'effects':>9} {'slow':>7} {'mean ms':>8} {'max ms':>8} {'status%':>8} {'rel rate':>8}")
+        for row in s['slow_ticks_by_effects']:
+            print(f"  {row['effects']:>8}+ {row['slow_ticks']:>7} {row['mean_ms'] or '-':>8} {row['max_ms'] or '-':>8} "
+                  f"{row['status_share'] * 100:>7.1f}% {row['relative_rate'] or '-':>8}")
+    if s['expired_by_zone']:
+        print("  Expired: " + ", ".join(f"{k}={v}" for k, v in s['expired_by_zone'].items())
+              + " | " + ", ".join(f"{k}={v}" for k, v in s['expired_by_reason'].items()))
+    if s['status_dumps']:
+        print(f"  Status dumps: {s['status_dumps']} | max creatures={s['status_max_creatures']} "
+              f"| max stacks={s['status_max_stacks']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze DOT performance output in Unity Player.log files.")
+    parser.add_argument('logs', nargs='+', help="Player.log files")
+    parser.add_argument('--bucket', type=int, default=10, help="Effect-count bucket width")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Parallel worker processes")
+    parser.add_argument('--json', default='', help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    missing = [p for p in args.logs if not os.path.isfile(p)]
+    if missing:
+        print(f"Error: not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    if len(args.logs) == 1 or args.workers <= 1:
+        results = [analyze_file(p, args.bucket) for p in args.logs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(args.logs))) as pool:
+            results = list(pool.map(analyze_file, args.logs, [args.bucket] * len(args.logs)))
+
+    report = {'files': [], 'overall': None}
+    all_sessions = []
+    for result in results:
+        print(f"\n=== {result['path']} ({len(result['sessions'])} session(s)) ===")
+        sessions = []
+        for i, session in enumerate(result['sessions'], 1):
+            summary = finalize(session)
+            sessions.append(summary)
+            print_summary(f"Session {i}: v{summary['version']} ({summary['platform']})", summary)
+        all_sessions.extend(result['sessions'])
+        report['files'].append({'path': result['path'], 'sessions': sessions})
+
+    report['overall'] = finalize(merge_sessions(all_sessions))
+    print()
+    print_summary(f"Overall ({len(all_sessions)} session(s))", report['overall'])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+Single-pass parser for [ModOption(...)] declarations in C# sources.
+
+The source is tokenized once with one compiled regex. The token stream is
+then walked once, collecting `const` declarations (from every project file,
+so constants defined elsewhere resolve) and ModOption attributes together
+with the field they decorate. Attribute values are evaluated as C# constant
+expressions: literals, constants, `nameof(...)`, casts and `+`
+concatenation. Anything that cannot be resolved is kept as raw source text
+and listed under the option's 'unresolved' key rather than dropped.
+
+Parsed results are cached as JSON under _agent/.cache, keyed by a hash of
+every input file's content, so repeat runs load in milliseconds.
+"""
+
+import gc
+import hashlib
+import json
+import os
+import re
+
+from registry import AGENT_DIR, PROJECT_ROOT
+
+MOD_OPTIONS_PATH = os.path.join(PROJECT_ROOT, "Configuration", "DOTModOptions.cs")
+CACHE_DIR = os.path.join(AGENT_DIR, ".cache")
+
+# Bump when the parse output format changes so stale cache entries are ignored
+PARSER_VERSION = 1
+
+# Folders that are not part of the mod assembly (mirrors DOT.csproj excludes)
+EXCLUDED_DIRS = {'bin', 'obj', 'builds', 'BasSDK', 'References', 'DOT.Tests', '.git'}
+
+TOKEN_RE = re.compile(r'''
+  \s*(?:
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<vstring>@"(?:[^"]|"")*")
+  | (?P<string>"(?:[^"\\\n]|\\.)*")
+  | (?P<char>'(?:[^'\\\n]|\\.)+')
+  | (?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?[fFdDmMlLuU]*)
+  | (?P<ident>@?[A-Za-z_]\w*)
+  | (?P<op>=>|==|!=|<=|>=|&&|\|\||\+\+|--|\+=|-=|\?\?|::|[{}()\[\];,.=+\-*/%<>!&|^~?:])
+  | (?P<other>.)
+  )
+''', re.X | re.S)
+
+ESCAPE_RE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{1,4}|.)')
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0', '\\': '\\', '"': '"', "'": "'"}
+
+# ModOption attribute fields and their defaults (as used by the xlsx builders)
+OPTION_DEFAULTS = {
+    'name': '',
+    'category': 'Main',
+    'categoryOrder': 0,
+    'order': 0,
+    'tooltip': '',
+    'valueSourceName': '',
+    'defaultValueIndex': 0,
+    'nameLocalizationId': '',
+    'categoryLocalizationId': '',
+    'interactionType': 0,
+}
+
+
+class Unresolved(Exception):
+    """Raised when an expression references something the parser cannot evaluate."""
+
+
+def tokenize(source):
+    """Return significant tokens as (kind, text, start) tuples; whitespace and comments are dropped."""
+    tokens = []
+    append = tokens.append
+    # The token list is large and acyclic; keep the cyclic GC from rescanning it
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for m in TOKEN_RE.finditer(source):
+            kind = m.lastgroup
+            if kind is not None and kind != 'comment':
+                append((kind, m.group(kind), m.start(kind)))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return tokens
+
+
+def _unescape(body):
+    def repl(m):
+        esc = m.group(1)
+        if esc[0] in 'ux' and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        return SIMPLE_ESCAPES.get(esc, esc)
+    return ESCAPE_RE.sub(repl, body)
+
+
+def _skip_balanced(tokens, i, open_text, close_text):
+    """Given tokens[i] == open_text, return the index just past the matching close."""
+    depth = 0
+    n = len(tokens)
+    while i < n:
+        text = tokens[i][1]
+        if text == open_text:
+            depth += 1
+        elif text == close_text:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def _split_args(tokens):
+    """Split an argument token list on top-level commas."""
+    args, current, depth = [], [], 0
+    for tok in tokens:
+        text = tok[1]
+        if text in '([{':
+            depth += 1
+        elif text in ')]}':
+            depth -= 1
+        if text == ',' and depth == 0:
+            args.append(current)
+            current = []
+        else:
+            current.append(tok)
+    if current:
+        args.append(current)
+    return args
+
+
+def scan(source, tokens=None):
+    """
+    Walk the token stream of one file once (tokens: a tokenize(source)
+    result the caller already has).
+
+    Returns (constants, options) where constants maps both `Name` and
+    `Class.Name` to raw expression tokens, and options is a list of
+    (attribute argument token lists, field tokens, field source span).
+    """
+    if tokens is None:
+        tokens = tokenize(source)
+    constants = {}
+    options = []
+    class_stack = []  # (class name, brace depth)
+    pending_class = None
+    depth = 0
+    i = 0
+    n = len(tokens)
+    while i < n:
+        kind, text, _ = tokens[i]
+        if text == '{':
+            depth += 1
+            if pending_class:
+                class_stack.append((pending_class, depth))
+                pending_class = None
+        elif text == '}':
+            if class_stack and class_stack[-1][1] == depth:
+                class_stack.pop()
+            depth -= 1
+        elif kind == 'ident' and text in ('class', 'struct') and i + 1 < n:
+            pending_class = tokens[i + 1][1]
+        elif kind == 'ident' and text == 'const':
+            # const <type> <Name> = <expr> ;
+            j = i + 1
+            while j < n and tokens[j][1] != '=':
+                j += 1
+            name = tokens[j - 1][1]
+            end = j + 1
+            while end < n and tokens[end][1] != ';':
+                end += 1
+            expr = tokens[j + 1:end]
+            constants[name] = expr
+            if class_stack:
+                constants[f"{class_stack[-1][0]}.{name}"] = expr
+            i = end
+        elif text == '[' and i + 2 < n and tokens[i + 1][1] == 'ModOption' and tokens[i + 2][1] == '(':
+            close = _skip_balanced(tokens, i + 2, '(', ')')
+            attr_args = _split_args(tokens[i + 3:close - 1])
+            # Skip to the end of the attribute, then take the decorated field
+            j = _skip_balanced(tokens, i, '[', ']')
+            end = j
+            while end < n and tokens[end][1] not in (';', '{'):
+                end += 1
+            field = tokens[j:end]
+            start_pos = field[0][2] if field else tokens[j][2]
+            end_pos = tokens[end][2] if end < n else len(source)
+            options.append((attr_args, field, (start_pos, end_pos)))
+            i = end - 1
+        i += 1
+    return constants, options
+
+
+class Evaluator:
+    """Evaluates C# constant expressions against a shared constant table."""
+
+    def __init__(self, constants):
+        self.constants = constants
+        self.cache = {}
+        self.resolving = set()
+
+    def lookup(self, name):
+        if name in self.cache:
+            return self.cache[name]
+        key = name if name in self.constants else name.rsplit('.', 1)[-1]
+        if key not in self.constants or key in self.resolving:
+            raise Unresolved(name)
+        self.resolving.add(key)
+        try:
+            value = self.evaluate(self.constants[key])
+        finally:
+            self.resolving.discard(key)
+        self.cache[name] = value
+        return value
+
+    def evaluate(self, tokens):
+        value, pos = self._sum(tokens, 0)
+        if pos != len(tokens):
+            raise Unresolved(' '.join(t[1] for t in tokens))
+        return value
+
+    def _sum(self, tokens, pos):
+        value, pos = self._term(tokens, pos)
+        while pos < len(tokens) and tokens[pos][1] in ('+', '-'):
+            op = tokens[pos][1]
+            rhs, pos = self._term(tokens, pos + 1)
+            if op == '+' and (isinstance(value, str) or isinstance(rhs, str)):
+                value = _cs_str(value) + _cs_str(rhs)
+            elif isinstance(value, str) or isinstance(rhs, str):
+                raise Unresolved('string subtraction')
+            else:
+                value = value + rhs if op == '+' else value - rhs
+        return value, pos
+
+    def _term(self, tokens, pos):
+        if pos >= len(tokens):
+            raise Unresolved('unexpected end of expression')
+        kind, text, _ = tokens[pos]
+        if kind == 'string':
+            return _unescape(text[1:-1]), pos + 1
+        if kind == 'vstring':
+            return text[2:-1].replace('""', '"'), pos + 1
+        if kind == 'number':
+            return _cs_number(text), pos + 1
+        if text == '-':
+            value, pos = self._term(tokens, pos + 1)
+            return -value, pos
+        if text == '(':
+            close = _skip_balanced(tokens, pos, '(', ')')
+            inner = tokens[pos + 1:close - 1]
+            # Cast: (Type.Name)operand
+            if close < len(tokens) and all(t[0] == 'ident' or t[1] == '.' for t in inner) and \
+                    (tokens[close][0] in ('number', 'ident', 'string') or tokens[close][1] in ('(', '-')):
+                return self._term(tokens, close)
+            return self.evaluate(inner), close
+        if kind == 'ident':
+            if text in ('true', 'false'):
+                return text == 'true', pos + 1
+            if text == 'null':
+                return None, pos + 1
+            if text == 'nameof' and pos + 1 < len(tokens) and tokens[pos + 1][1] == '(':
+                close = _skip_balanced(tokens, pos + 1, '(', ')')
+                return tokens[close - 2][1].lstrip('@'), close
+            # Qualified identifier A.B.C
+            parts = [text]
+            pos += 1
+            while pos + 1 < len(tokens) and tokens[pos][1] == '.' and tokens[pos + 1][0] == 'ident':
+                parts.append(tokens[pos + 1][1])
+                pos += 2
+            return self.lookup('.'.join(parts)), pos
+        raise Unresolved(text)
+
+
+def _cs_number(text):
+    body = text.rstrip('fFdDmMlLuU')
+    if '.' in body or 'e' in body.lower() or text[-1:] in 'fFdDmM':
+        return float(body)
+    return int(body)
+
+
+def _cs_str(value):
+    """String conversion as C# concatenation would do it."""
+    if isinstance(value, bool):
+        return 'True' if value else 'False'
+    if value is None:
+        return ''
+    return str(value)
+
+
+def project_sources(root=PROJECT_ROOT):
+    """All .cs files that belong to the mod assembly, in a stable order."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith('.'))
+        paths.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith('.cs'))
+    return paths
+
+
+def parse_sources(options_source, constant_sources=()):
+    """Parse ModOption declarations from options_source, resolving constants across all sources."""
+    constants = {}
+    for source in constant_sources:
+        constants.update(scan(source)[0])
+    file_constants, raw_options = scan(options_source)
+    constants.update(file_constants)
+    evaluator = Evaluator(constants)
+
+    options = []
+    for attr_args, field, (start, end) in raw_options:
+        option = {
+            'field_name': '',
+            'field_type': '',
+            'default_value': '',
+            **OPTION_DEFAULTS,
+            'unresolved': [],
+        }
+        # Field: [modifiers] <type> <name> [= <default>]
+        eq = next((k for k, t in enumerate(field) if t[1] == '='), len(field))
+        if eq >= 2:
+            option['field_name'] = field[eq - 1][1]
+            option['field_type'] = field[eq - 2][1]
+        if eq < len(field):
+            option['default_value'] = options_source[field[eq + 1][2]:end].strip()
+
+        for arg in attr_args:
+            if len(arg) >= 2 and arg[0][0] == 'ident' and arg[1][1] == '=':
+                key, expr = arg[0][1], arg[2:]
+            else:
+                continue
+            raw = options_source[expr[0][2]:expr[-1][2] + len(expr[-1][1])] if expr else ''
+            try:
+                option[key] = evaluator.evaluate(expr)
+            except Unresolved:
+                option[key] = raw
+                option['unresolved'].append(key)
+        options.append(option)
+    return options
+
+
+def _cache_key(paths):
+    digest = hashlib.sha256(f"modoption-parser-v{PARSER_VERSION}".encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(os.path.basename(path).encode())
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_mod_options(filepath=MOD_OPTIONS_PATH, constant_paths=None, cache_dir=CACHE_DIR):
+    """
+    Parse ModOption declarations from filepath, using the on-disk cache when
+    none of the input files changed. constant_paths defaults to every mod
+    source file so constants declared in other files resolve.
+    """
+    if constant_paths is None:
+        constant_paths = project_sources()
+    constant_paths = [p for p in constant_paths if os.path.abspath(p) != os.path.abspath(filepath)]
+
+    key = _cache_key([filepath] + constant_paths)
+    prefix = f"modoptions-{os.path.splitext(os.path.basename(filepath))[0]}-"
+    cache_path = os.path.join(cache_dir, f"{prefix}{key[:20]}.json") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        options_source = f.read()
+    constant_sources = []
+    for path in constant_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            constant_sources.append(f.read())
+    options = parse_sources(options_source, constant_sources)
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(options, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+        # Drop stale entries for the same options file
+        for name in os.listdir(cache_dir):
+            if name.startswith(prefix) and name.endswith('.json') and name != os.path.basename(cache_path):
+                os.remove(os.path.join(cache_dir, name))
+    return options
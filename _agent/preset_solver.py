@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Inverse preset solver: find per-zone preset values that meet design targets.
+
+Targets:
+  --ttk  "Throat:Default=4@50"        Throat kills a 50 HP enemy in 4 s (one
+                                      application, 1 stack). The level names one
+                                      column shared by the damage, duration and
+                                      frequency rows: Default means Damage,
+                                      Duration and Frequency all at Default,
+                                      High means Damage High, Duration Long
+                                      and Frequency Fast.
+                                      Optional ":Slash" suffix picks the damage
+                                      type (else --damage-type).
+  --calls "Rapid<=600@20"             With the frequency preset at Rapid, 20
+                                      creatures bleeding on every zone cause at
+                                      most 600 damage calls per second.
+
+The search only proposes values the in-game sliders can hold (DOTModOptions
+providers: damage 0.25-20 in 0.25 steps, duration 0.5-30 s in 0.5 s steps,
+frequency 0.1-5.0 s in 0.1 s steps) and keeps the 5 levels of every row
+monotone (damage/duration rising, tick interval falling from left to right,
+one slider step apart unless --allow-ties). Among all tables meeting the
+targets it returns the one with
+the smallest total relative change from preset_tables.py.
+
+Each zone's candidates are evaluated as one NumPy batch over the whole
+damage x duration x frequency grid (240k points per TTK target), zones run
+on a process pool, and a shared calls budget is resolved by merging the
+per-zone (calls/s, cost) frontiers. Tick and expiry frames use the same
+float32 frame model as ttk_matrix.py.
+
+Output: the proposed tables, a per-cell diff against the current ones, and
+optionally a unified diff of preset_tables.py (--patch) that applies with
+`git apply`.
+
+Usage:
+    python preset_solver.py --ttk "Throat:Default=4@50"
+    python preset_solver.py --ttk "Throat:Default=4@50" --ttk "Torso:High=6@50" --calls "Rapid<=600@20"
+    python preset_solver.py --calls "Rapid<=400@20" --patch presets.diff
+"""
+
+import argparse
+import difflib
+import itertools
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from preset_tables import (
+    ZONES,
+    DAMAGE_PRESETS, DAMAGE_VALUES,
+    DURATION_PRESETS, DURATION_VALUES,
+    FREQUENCY_PRESETS, FREQUENCY_VALUES,
+    DAMAGE_TYPES, DAMAGE_TYPE_MULTIPLIERS,
+)
+from registry import AGENT_DIR, PROJECT_ROOT
+from ttk_matrix import DEFAULT_HZ, frames_to_reach, frames_until_expired
+
+TABLES_PATH = os.path.join(AGENT_DIR, "preset_tables.py")
+
+# (table name, current values, slider grid, increasing left to right)
+CATEGORIES = {
+    'Damage': (DAMAGE_VALUES, np.round(np.arange(1, 81) * 0.25, 2), True),
+    'Duration': (DURATION_VALUES, np.round(np.arange(1, 61) * 0.5, 1), True),
+    'Frequency': (FREQUENCY_VALUES, np.round(np.arange(1, 51) * 0.1, 1), False),
+}
+TABLE_VARIABLES = {'Damage': 'DAMAGE_VALUES', 'Duration': 'DURATION_VALUES', 'Frequency': 'FREQUENCY_VALUES'}
+LEVELS = len(DAMAGE_PRESETS)
+
+# Candidates kept per level and budgeted interval when a zone has several targeted levels
+KEEP_PER_LEVEL = 8
+FRONTIER_LIMIT = 4000
+
+_TTK_RE = re.compile(r'^\s*(\w+)\s*:\s*([\w ]+?)\s*=\s*([\d.]+)\s*@\s*([\d.]+)\s*(?::\s*(\w+))?\s*$')
+_CALLS_RE = re.compile(r'^\s*([\w ]+?)\s*<=\s*([\d.]+)\s*@\s*(\d+)\s*$')
+
+
+class TargetError(ValueError):
+    """Raised for a target string that cannot be parsed."""
+
+
+# ========== TARGETS ==========
+
+def _level(label, labels):
+    lookup = {l.replace(' ', '').lower(): i for i, l in enumerate(labels)}
+    key = label.replace(' ', '').lower()
+    if key not in lookup:
+        raise TargetError(f"Unknown preset '{label}'. Expected one of: {', '.join(labels)}")
+    return lookup[key]
+
+
+def parse_ttk(text, default_type):
+    m = _TTK_RE.match(text)
+    if not m:
+        raise TargetError(f"Bad --ttk '{text}'. Expected ZONE:PRESET=SECONDS@HP[:TYPE]")
+    zone, preset, seconds, health, damage_type = m.groups()
+    if zone not in ZONES:
+        raise TargetError(f"Unknown zone '{zone}'. Expected one of: {', '.join(ZONES)}")
+    damage_type = damage_type or default_type
+    if damage_type not in DAMAGE_TYPES:
+        raise TargetError(f"Unknown damage type '{damage_type}'. Expected one of: {', '.join(DAMAGE_TYPES)}")
+    return {'zone': zone, 'level': _level(preset, DAMAGE_PRESETS), 'seconds': float(seconds),
+            'health': float(health), 'damage_type': damage_type, 'text': text.strip()}
+
+
+def parse_calls(text):
+    m = _CALLS_RE.match(text)
+    if not m:
+        raise TargetError(f"Bad --calls '{text}'. Expected FREQUENCY_PRESET<=CALLS@CREATURES")
+    preset, calls, creatures = m.groups()
+    return {'level': _level(preset, FREQUENCY_PRESETS), 'calls': float(calls),
+            'creatures': int(creatures), 'text': text.strip()}
+
+
+# ========== TABLE HELPERS ==========
+
+def current_rows(zone):
+    return {name: np.array(values[zone], dtype=np.float64) for name, (values, _, _) in CATEGORIES.items()}
+
+
+def snap(values, grid):
+    """Nearest slider value for each entry."""
+    idx = np.abs(np.asarray(values, dtype=np.float64)[..., None] - grid).argmin(axis=-1)
+    return grid[idx]
+
+
+def repair(current, pins, increasing, step=0.0):
+    """Fill unpinned levels: keep current values, clamped so the row stays monotone.
+
+    current: (5,) row; pins: {level: (N,) candidate values}. With step > 0,
+    levels are kept at least one slider step apart from the pinned ones, so
+    a row that was strictly ordered stays strictly ordered. Returns (rows
+    (N, 5), ok (N,)) where ok is False if the pinned values themselves are
+    out of order.
+    """
+    n = len(next(iter(pins.values()))) if pins else 1
+    sign = 1.0 if increasing else -1.0
+    rows = np.broadcast_to(current * sign, (n, LEVELS)).copy()
+    for level, values in pins.items():
+        rows[:, level] = values * sign
+    ok = np.ones(n, dtype=bool)
+    pinned = sorted(pins)
+    for a, b in zip(pinned, pinned[1:]):
+        ok &= rows[:, a] + (b - a) * step <= rows[:, b] + 1e-9
+    for k in range(LEVELS):
+        if k in pins:
+            continue
+        lower = [j for j in pinned if j < k]
+        upper = [j for j in pinned if j > k]
+        if lower:
+            j = max(lower)
+            rows[:, k] = np.maximum(rows[:, k], rows[:, j] + (k - j) * step)
+        if upper:
+            j = min(upper)
+            rows[:, k] = np.minimum(rows[:, k], rows[:, j] - (j - k) * step)
+    return np.round(rows * sign, 2), ok
+
+
+def change_cost(rows, current):
+    """Total relative change of each candidate row from the current row."""
+    return (np.abs(rows - current) / current).sum(axis=-1)
+
+
+def calls_per_second(intervals, creatures, hz):
+    """Damage calls/s for `creatures` each bleeding on every given zone interval."""
+    return creatures * (hz / frames_to_reach(intervals, hz)).sum(axis=-1)
+
+
+# ========== PER-ZONE SEARCH ==========
+
+def solve_zone(zone, ttk_targets, call_levels, hz, strict=True):
+    """Enumerate a zone's candidate rows that meet its TTK targets.
+
+    Returns a list of candidates {'rows', 'cost', 'rates_key'}, where
+    rates_key holds the tick interval at each budgeted frequency level, or
+    None if no grid values satisfy the targets.
+    """
+    current = current_rows(zone)
+    snapped = {name: snap(row, CATEGORIES[name][1]) for name, row in current.items()}
+    grids = {name: grid for name, (_, grid, _) in CATEGORIES.items()}
+
+    tick_frames = frames_to_reach(grids['Frequency'], hz)
+    expiry_frames = frames_until_expired(grids['Duration'], hz)
+
+    # Feasible (d, u, f) grid points per targeted level; targets sharing a
+    # level must all hold at once
+    ticks = ((expiry_frames[:, None] - 1) // tick_frames[None, :])[None]          # (1, U, F)
+    feasible_by_level = {}
+    for t in ttk_targets:
+        tick_damage = grids['Damage'] * DAMAGE_TYPE_MULTIPLIERS[t['damage_type']]
+        needed = np.ceil(t['health'] / tick_damage - 1e-9)[:, None, None]         # (D, 1, 1)
+        ttk = needed * (tick_frames / hz)[None, None, :]                            # (D, 1, F)
+        feasible = (needed <= ticks) & (np.abs(ttk - t['seconds']) <= t['tolerance'] + 1e-9)
+        level = t['level']
+        feasible_by_level[level] = feasible & feasible_by_level.get(level, True)
+
+    budget_levels = sorted(set(call_levels))
+    if not feasible_by_level:
+        # Budget-only zone: every grid interval at each budgeted level
+        if not budget_levels:
+            return [{'rows': snapped, 'cost': _total_cost(snapped, current), 'rates_key': ()}]
+        combos = np.array(list(itertools.product(range(len(grids['Frequency'])), repeat=len(budget_levels))))
+        pins = {'Frequency': {lvl: grids['Frequency'][combos[:, i]] for i, lvl in enumerate(budget_levels)}}
+        return _evaluate(pins, snapped, current, budget_levels, strict) or None
+
+    points = {}
+    for level, feasible in sorted(feasible_by_level.items()):
+        d, u, f = np.nonzero(feasible)
+        if len(d) == 0:
+            return None
+        points[level] = (d, u, f)
+
+    if len(points) > 1:
+        # Several targeted levels: shortlist each level on its own (cheapest
+        # few per budgeted interval), then evaluate the cross product in one batch
+        for level, (d, u, f) in points.items():
+            pins = {'Damage': {level: grids['Damage'][d]}, 'Duration': {level: grids['Duration'][u]},
+                    'Frequency': {level: grids['Frequency'][f]}}
+            keep = _evaluate(pins, snapped, current, budget_levels, strict, per_key=KEEP_PER_LEVEL, indices=True)
+            points[level] = (d[keep], u[keep], f[keep])
+        grid_idx = np.meshgrid(*(np.arange(len(p[0])) for p in points.values()), indexing='ij')
+        grid_idx = [g.ravel() for g in grid_idx]
+    else:
+        grid_idx = [np.arange(len(next(iter(points.values()))[0]))]
+
+    pins = {name: {} for name in CATEGORIES}
+    for (level, (d, u, f)), sel in zip(points.items(), grid_idx):
+        pins['Damage'][level] = grids['Damage'][d[sel]]
+        pins['Duration'][level] = grids['Duration'][u[sel]]
+        pins['Frequency'][level] = grids['Frequency'][f[sel]]
+    return _evaluate(pins, snapped, current, budget_levels, strict) or None
+
+
+def _evaluate(pins, snapped, current, budget_levels, strict, per_key=1, indices=False):
+    """Repair and cost a batch of pinned values in one pass.
+
+    Keeps the cheapest `per_key` valid candidates per distinct tick interval
+    at the budgeted levels (only the cheapest overall when there is no
+    budget). Returns candidate dicts, or the kept batch indices.
+    """
+    n = len(next(iter(next(iter(pins.values())).values())))
+    rows = {}
+    ok = np.ones(n, dtype=bool)
+    for name, (_, grid, increasing) in CATEGORIES.items():
+        r, good = repair(snapped[name], pins.get(name, {}), increasing, step=_step(grid) if strict else 0.0)
+        rows[name] = np.broadcast_to(r, (n, LEVELS))
+        ok &= good & np.all((rows[name] >= grid[0] - 1e-9) & (rows[name] <= grid[-1] + 1e-9), axis=1)
+    cost = sum(change_cost(rows[name], current[name]) for name in CATEGORIES)
+    idx = np.nonzero(ok)[0]
+    idx = idx[np.argsort(cost[idx], kind='stable')]
+    kept = []
+    counts = {}
+    for i in idx:
+        key = tuple(float(rows['Frequency'][i, lvl]) for lvl in budget_levels)
+        if counts.get(key, 0) >= per_key:
+            continue
+        counts[key] = counts.get(key, 0) + 1
+        kept.append(i)
+    if indices:
+        return np.array(kept, dtype=np.int64)
+    return [{'rows': {name: rows[name][i].copy() for name in CATEGORIES},
+             'cost': float(cost[i]),
+             'rates_key': tuple(float(rows['Frequency'][i, lvl]) for lvl in budget_levels)}
+            for i in kept]
+
+
+def _step(grid):
+    return float(grid[1] - grid[0])
+
+
+def _total_cost(rows, current):
+    return float(sum(change_cost(rows[name], current[name]) for name in CATEGORIES))
+
+
+def _solve_zone_job(args):
+    return args[0], solve_zone(*args)
+
+
+# ========== CROSS-ZONE BUDGET ==========
+
+def pareto(rates, cost):
+    """Indices of entries no other entry beats on cost and every rate.
+
+    Ties on (rates, cost) keep the first entry. Single-budget frontiers use
+    a sort; with several budgets, each entry is compared to the cheaper ones.
+    """
+    order = np.lexsort(tuple(rates[:, ::-1].T) + (cost,))
+    rates, cost = rates[order], cost[order]
+    if rates.shape[1] == 0:
+        return order[:1]
+    if rates.shape[1] == 1:
+        prior_min = np.minimum.accumulate(np.concatenate([[np.inf], rates[:-1, 0]]))
+        return order[rates[:, 0] < prior_min]
+    keep = []
+    for i in range(len(cost)):
+        if keep and np.any(np.all(rates[keep] <= rates[i], axis=1)):
+            continue
+        keep.append(i)
+    return order[keep]
+
+
+def combine(zone_candidates, budgets, hz):
+    """Pick one candidate per zone minimizing cost within every calls budget.
+
+    Merges the zones' (calls/s, cost) options one zone at a time, dropping
+    partial sums that cannot fit the budget even with the cheapest-rate
+    options of the remaining zones and keeping only the Pareto frontier.
+    With a single budget the result is exact; with several, the frontier is
+    additionally capped at the FRONTIER_LIMIT cheapest entries.
+    """
+    adds, costs, index = [], [], []
+    for zone in ZONES:
+        cands = zone_candidates[zone]
+        add = np.array([[b['creatures'] * hz / frames_to_reach(np.array([c['rows']['Frequency'][b['level']]]), hz)[0]
+                         for b in budgets] for c in cands]).reshape(len(cands), len(budgets))
+        cost = np.array([c['cost'] for c in cands])
+        keep = pareto(add, cost)
+        adds.append(add[keep])
+        costs.append(cost[keep])
+        index.append(keep)
+    limits = np.array([b['calls'] for b in budgets]) + 1e-9
+    remaining_min = np.cumsum([a.min(axis=0) for a in adds[::-1]], axis=0)[::-1]
+
+    rates = np.zeros((1, len(budgets)))
+    cost = np.zeros(1)
+    picks = np.zeros((1, 0), dtype=np.int64)
+    for z, zone in enumerate(ZONES):
+        m, k = len(picks), len(costs[z])
+        rates = (rates[:, None, :] + adds[z][None, :, :]).reshape(m * k, len(budgets))
+        cost = (cost[:, None] + costs[z][None, :]).ravel()
+        picks = np.hstack([np.repeat(picks, k, axis=0), np.tile(index[z], m)[:, None]])
+
+        floor = remaining_min[z + 1] if z + 1 < len(ZONES) else 0.0
+        keep = np.nonzero(np.all(rates + floor <= limits, axis=1))[0]
+        if len(keep) == 0:
+            return None
+        if len(budgets) > 1:
+            keep = keep[np.argsort(cost[keep], kind='stable')[:FRONTIER_LIMIT]]
+        keep = keep[pareto(rates[keep], cost[keep])]
+        rates, cost, picks = rates[keep], cost[keep], picks[keep]
+
+    best = int(np.argmin(cost))
+    return {zone: zone_candidates[zone][int(ci)] for zone, ci in zip(ZONES, picks[best])}
+
+
+# ========== REPORTING ==========
+
+def _fmt(value):
+    return repr(round(float(value), 2))
+
+
+def render_row(values):
+    parts = [f"{_fmt(v)}," for v in values[:-1]] + [_fmt(values[-1])]
+    return '[' + ''.join(p.ljust(6) for p in parts[:-1]) + parts[-1] + ']'
+
+
+def render_patch(proposal, path=TABLES_PATH):
+    """Unified diff of preset_tables.py with the proposed rows substituted."""
+    with open(path, 'r', encoding='utf-8') as f:
+        original = f.read()
+    text = original
+    for name, var in TABLE_VARIABLES.items():
+        start = text.index(f"{var} = {{")
+        end = text.index("}", start)
+        block = text[start:end]
+        for zone in ZONES:
+            block = re.sub(rf"('{zone}':\s*)\[[^\]]*\]", lambda m: m.group(1) + render_row(proposal[zone][name]), block)
+        text = text[:start] + block + text[end:]
+    rel = os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '/')
+    return ''.join(difflib.unified_diff(original.splitlines(True), text.splitlines(True),
+                                        fromfile=f"a/{rel}", tofile=f"b/{rel}"))
+
+
+def evaluate_ttk(rows, target, hz):
+    """One-application TTK (inf if the bleed expires first) for a zone's rows."""
+    level = target['level']
+    tick_damage = rows['Damage'][level] * DAMAGE_TYPE_MULTIPLIERS[target['damage_type']]
+    f = frames_to_reach(np.array([rows['Frequency'][level]]), hz)[0]
+    e = frames_until_expired(np.array([rows['Duration'][level]]), hz)[0]
+    needed = math.ceil(target['health'] / tick_damage - 1e-9)
+    return needed * f / hz if needed <= (e - 1) // f else math.inf
+
+
+def print_report(proposal, ttk_targets, budgets, hz):
+    current = {zone: current_rows(zone) for zone in ZONES}
+    labels = {'Damage': DAMAGE_PRESETS, 'Duration': DURATION_PRESETS, 'Frequency': FREQUENCY_PRESETS}
+
+    print("\nTargets:")
+    for t in ttk_targets:
+        before = evaluate_ttk(current[t['zone']], t, hz)
+        after = evaluate_ttk(proposal[t['zone']], t, hz)
+        print(f"  ttk {t['text']:<32} current {_secs(before):>8}  proposed {_secs(after):>8}  "
+              f"(target {t['seconds']:g}s +/- {t['tolerance']:g})")
+    for b in budgets:
+        before = calls_per_second(np.array([current[z]['Frequency'][b['level']] for z in ZONES]), b['creatures'], hz)
+        after = calls_per_second(np.array([proposal[z]['Frequency'][b['level']] for z in ZONES]), b['creatures'], hz)
+        print(f"  calls {b['text']:<30} current {before:>8.1f}/s proposed {after:>8.1f}/s")
+
+    print("\nProposed tables:")
+    for name in CATEGORIES:
+        print(f"  {TABLE_VARIABLES[name]} = {{")
+        for zone in ZONES:
+            print(f"      {repr(zone) + ':':<15} {render_row(proposal[zone][name])},")
+        print("  }")
+
+    print("\nChanges:")
+    changed = 0
+    for name in CATEGORIES:
+        for zone in ZONES:
+            for level in range(LEVELS):
+                old, new = current[zone][name][level], proposal[zone][name][level]
+                if abs(old - new) > 1e-9:
+                    changed += 1
+                    print(f"  {name:<9} {zone:<13} {labels[name][level]:<10} {_fmt(old):>6} -> {_fmt(new)}")
+    if not changed:
+        print("  (none)")
+
+
+def _secs(value):
+    return "never" if math.isinf(value) else f"{value:.2f}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search preset values that meet TTK and damage-call targets.")
+    parser.add_argument('--ttk', action='append', default=[], help="ZONE:PRESET=SECONDS@HP[:TYPE] (repeatable)")
+    parser.add_argument('--calls', action='append', default=[], help="FREQUENCY_PRESET<=CALLS@CREATURES (repeatable)")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed TTK error in seconds")
+    parser.add_argument('--damage-type', default='Pierce', help="Damage type for TTK targets without one")
+    parser.add_argument('--hz', type=int, default=DEFAULT_HZ, help="Frame rate for tick/expiry timing")
+    parser.add_argument('--allow-ties', action='store_true',
+                        help="Allow neighbouring levels to share a value (default keeps them a slider step apart)")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes (1 = inline)")
+    parser.add_argument('--patch', default='', help="Write a unified diff of preset_tables.py here")
+    args = parser.parse_args()
+
+    try:
+        ttk_targets = [parse_ttk(t, args.damage_type) for t in args.ttk]
+        budgets = [parse_calls(c) for c in args.calls]
+    except TargetError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not ttk_targets and not budgets:
+        parser.error("give at least one --ttk or --calls target")
+    for t in ttk_targets:
+        t['tolerance'] = args.tolerance
+
+    start = time.perf_counter()
+    call_levels = [b['level'] for b in budgets]
+    jobs = [(zone, [t for t in ttk_targets if t['zone'] == zone], call_levels, args.hz, not args.allow_ties)
+            for zone in ZONES]
+    if args.jobs == 1:
+        results = dict(map(_solve_zone_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = dict(pool.map(_solve_zone_job, jobs))
+
+    unsolvable = [zone for zone, cands in results.items() if not cands]
+    if unsolvable:
+        print(f"No slider values meet the TTK target(s) for: {', '.join(unsolvable)}")
+        sys.exit(1)
+
+    picks = combine(results, budgets, args.hz)
+    if picks is None:
+        print("No combination of per-zone values fits the damage-call budget(s)")
+        sys.exit(1)
+    proposal = {zone: picks[zone]['rows'] for zone in ZONES}
+    elapsed = time.perf_counter() - start
+    candidates = sum(len(c) for c in results.values())
+    print(f"Solved in {elapsed:.2f}s ({candidates:,} zone candidates, total relative change "
+          f"{sum(picks[z]['cost'] for z in ZONES):.2f})")
+
+    print_report(proposal, ttk_targets, budgets, args.hz)
+
+    if args.patch:
+        with open(args.patch, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(render_patch(proposal))
+        print(f"\nWrote {args.patch} (git apply {args.patch})")
+
+
+if __name__ == "__main__":
+    main()
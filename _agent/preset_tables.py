@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Per-zone preset tables shared by the _agent tools.
+
+Canonical source for the preset values: gen_preset_tables.py emits
+Core/PresetTables.g.cs, _docs/PRESETS.md and _design/PRESETS.xlsx from it.
+Also holds the DOTModOptions defaults the offline tools need.
+Kept free of third-party imports so any tool can load it.
+"""
+
+# Zone order (shared with the other tools through registry.py)
+from registry import ZONES  # noqa: F401
+
+# ========== DAMAGE PRESET VALUES ==========
+# 5 presets: Minimal (0), Low (1), Default (2), High (3), Extreme (4)
+DAMAGE_PRESETS = ['Minimal', 'Low', 'Default', 'High', 'Extreme']
+DAMAGE_VALUES = {
+    'Throat':        [0.5,  1.25, 2.5,  5.0,  10.0],
+    'Head':          [0.25, 0.75, 1.5,  3.0,  6.0],
+    'Neck':          [0.5,  1.0,  2.0,  4.0,  8.0],
+    'Torso':         [0.25, 0.5,  1.0,  2.0,  4.0],
+    'Arm':           [0.25, 0.25, 0.5,  1.0,  2.0],
+    'Leg':           [0.25, 0.5,  0.75, 1.5,  3.0],
+    'Dismemberment': [1.0,  2.0,  3.0,  6.0,  12.0],
+}
+
+# ========== DURATION PRESET VALUES ==========
+# 5 presets: VeryShort (0), Short (1), Default (2), Long (3), Extended (4)
+DURATION_PRESETS = ['Very Short', 'Short', 'Default', 'Long', 'Extended']
+DURATION_VALUES = {
+    'Throat':        [2.0,  4.0,  6.0,  10.0, 15.0],
+    'Head':          [1.5,  3.0,  5.0,  8.0,  12.0],
+    'Neck':          [2.0,  3.5,  5.5,  9.0,  14.0],
+    'Torso':         [1.5,  2.5,  4.0,  7.0,  10.0],
+    'Arm':           [1.0,  2.0,  3.0,  5.0,  8.0],
+    'Leg':           [1.0,  2.5,  3.5,  6.0,  9.0],
+    'Dismemberment': [3.0,  5.0,  8.0,  12.0, 20.0],
+}
+
+# ========== FREQUENCY PRESET VALUES (per-zone) ==========
+# 5 presets: VerySlow (0), Slow (1), Default (2), Fast (3), Rapid (4)
+# Values are tick intervals in seconds (lower = faster ticks)
+FREQUENCY_PRESETS = ['Very Slow', 'Slow', 'Default', 'Fast', 'Rapid']
+FREQUENCY_VALUES = {
+    'Throat':        [2.0,  1.0,  0.5,  0.3,  0.1],
+    'Head':          [2.5,  1.2,  0.6,  0.3,  0.1],
+    'Neck':          [2.0,  1.0,  0.5,  0.25, 0.1],
+    'Torso':         [3.0,  1.5,  0.8,  0.4,  0.2],
+    'Arm':           [3.5,  1.8,  1.0,  0.5,  0.2],
+    'Leg':           [3.0,  1.5,  0.8,  0.4,  0.2],
+    'Dismemberment': [1.5,  0.8,  0.4,  0.2,  0.1],
+}
+
+# ========== CHANCE PRESET VALUES ==========
+# 5 presets: Off (0), Rare (1), Default (2), Frequent (3), Always (4)
+CHANCE_PRESETS = ['Off', 'Rare', 'Default', 'Frequent', 'Always']
+CHANCE_VALUES = {
+    'Throat':        [0,  30, 60, 85,  100],
+    'Head':          [0,  20, 40, 65,  100],
+    'Neck':          [0,  25, 55, 80,  100],
+    'Torso':         [0,  15, 35, 55,  100],
+    'Arm':           [0,  10, 25, 45,  100],
+    'Leg':           [0,  15, 30, 50,  100],
+    'Dismemberment': [0,  40, 80, 95,  100],
+}
+
+# ========== UNKNOWN ZONE FALLBACKS ==========
+# Returned for BodyZone.Unknown, one value per preset index
+FALLBACK_VALUES = {
+    'Damage':    [1.0, 1.0, 1.0, 1.0, 1.0],
+    'Duration':  [4.0, 4.0, 4.0, 4.0, 4.0],
+    'Frequency': [0.5, 0.5, 0.5, 0.5, 0.5],
+    'Chance':    [0,   15,  35,  60,  100],
+}
+
+# Preset index used when a preset value is out of range
+DEFAULT_PRESET_INDEX = 2
+
+# ========== NON-PRESET DEFAULTS ==========
+# Default *StackLimit values from DOTModOptions (not driven by presets)
+STACK_LIMITS = {
+    'Throat': 3,
+    'Head': 3,
+    'Neck': 3,
+    'Torso': 5,
+    'Arm': 4,
+    'Leg': 4,
+    'Dismemberment': 1,
+}
+
+# Default damage type multipliers from DOTModOptions (Blunt never bleeds)
+DAMAGE_TYPES = ['Pierce', 'Slash', 'Fire', 'Lightning']
+DAMAGE_TYPE_MULTIPLIERS = {
+    'Pierce': 1.2,
+    'Slash': 0.8,
+    'Fire': 0.3,
+    'Lightning': 1.5,
+}
+
+# BloodAmount preset -> blood VFX intensity multiplier (DOTModOptions.GetBloodAmountMultiplier)
+BLOOD_AMOUNT_PRESETS = ['Very Low', 'Low', 'Default', 'High', 'Extreme']
+BLOOD_AMOUNT_MULTIPLIERS = [0.5, 1.0, 2.0, 3.0, 4.0]
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Span tracing shared by the _agent and _translations tools.
+
+Tools mark their phases with named spans:
+
+    with profiling.span('parse', file=path):
+        ...
+
+    @profiling.traced('write xlsx')
+    def save(...): ...
+
+and expose --profile through add_arguments() + session(). With --profile
+the spans of every thread are recorded and written on exit as a
+Chrome/Perfetto trace (open in https://ui.perfetto.dev or chrome://tracing):
+one complete ("X") event per span, thread names, and an "RSS" counter track
+sampled in the background. --profile-cprofile also runs cProfile on the
+main thread, writes <trace>.prof and prints the top functions.
+
+When no session is active span() returns a shared no-op context manager and
+traced() functions pay one global check: well under a microsecond per span,
+and spans mark phases, not inner loops.
+
+RSS comes from psutil when installed, else /proc/self/statm; without
+either only the end-of-run peak from the resource module is reported (not
+on Windows). Child processes (dotnet) are not in the samples; the largest
+child that ran during the session is reported separately where the platform
+provides it.
+
+Usage (inside a tool):
+    parser = argparse.ArgumentParser(...)
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    with profiling.session(args, 'release'):
+        ...
+
+    python _release.py --build-only --profile                # -> _agent/.cache/traces/release.trace.json
+    python build_menu_mock_xlsx.py --profile menu.json --profile-cprofile
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from registry import AGENT_DIR
+
+TRACE_DIR = os.path.join(AGENT_DIR, ".cache", "traces")
+
+DEFAULT_RSS_INTERVAL = 0.02  # Seconds between RSS samples
+CPROFILE_TOP = 25
+
+# Only a recording session needs these (_load_recording), so tools run
+# without --profile do not pay for the imports
+threading = psutil = resource = None
+
+_tracer = None
+
+
+def _load_recording():
+    global threading, psutil, resource
+    if threading is not None:
+        return
+    import threading as threading_module
+    try:
+        import psutil as psutil_module
+    except ImportError:
+        psutil_module = None
+    try:
+        import resource as resource_module
+    except ImportError:  # Windows
+        resource_module = None
+    threading, psutil, resource = threading_module, psutil_module, resource_module
+
+
+# ========== NO-OP PATH ==========
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, **args):
+    """Context manager timing one named phase; a shared no-op when not tracing."""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+
+def traced(name=None):
+    """Decorator: run the function inside a span (default name: the function's)."""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _Span(_tracer, label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# ========== RECORDING ==========
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args = dict(self.args, error=exc_type.__name__)
+        self.tracer.record(self.name, self.start, end, self.args)
+        return False
+
+
+def rss_bytes():
+    """Current resident set size of this process, or None if unavailable."""
+    _load_recording()
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_bytes(children=False):
+    """Peak RSS from getrusage (ru_maxrss is KB on Linux, bytes on macOS)."""
+    _load_recording()
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+class Tracer:
+    """Collects span events (list.append is atomic, so threads share one list)."""
+
+    def __init__(self, name, rss_interval=DEFAULT_RSS_INTERVAL):
+        _load_recording()
+        self.name = name
+        self.origin = time.perf_counter_ns()
+        self.events = []
+        self.threads = {}
+        self.rss_samples = []
+        # ru_maxrss of children survives exec, so only a rise during the session counts
+        self.children_baseline = peak_rss_bytes(children=True)
+        self._stop = threading.Event()
+        self._sampler = None
+        if rss_interval and rss_bytes() is not None:
+            self._sampler = threading.Thread(target=self._sample_rss, args=(rss_interval,),
+                                             name='rss sampler', daemon=True)
+            self._sampler.start()
+
+    def record(self, name, start, end, args):
+        tid = threading.get_ident()
+        if tid not in self.threads:
+            self.threads[tid] = threading.current_thread().name
+        self.events.append((name, start, end, tid, args))
+
+    def _sample_rss(self, interval):
+        while not self._stop.is_set():
+            self.rss_samples.append((time.perf_counter_ns(), rss_bytes()))
+            self._stop.wait(interval)
+
+    def close(self):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self.rss_samples.append((time.perf_counter_ns(), rss_bytes()))
+
+    def children_peak_rss(self):
+        peak = peak_rss_bytes(children=True)
+        return peak if peak and peak != self.children_baseline else None
+
+    def peak_rss(self):
+        # Samples can miss a short spike between them; getrusage cannot
+        sampled = max((rss for _, rss in self.rss_samples if rss is not None), default=None)
+        return max((v for v in (sampled, peak_rss_bytes()) if v), default=None)
+
+    def chrome_trace(self):
+        """The trace as a Chrome trace-event JSON object."""
+        pid = os.getpid()
+
+        def us(ns):
+            return (ns - self.origin) / 1000
+
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': self.name}}]
+        for tid, thread_name in self.threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}})
+        for name, start, end, tid, args in self.events:
+            event = {'name': name, 'cat': self.name, 'ph': 'X', 'pid': pid, 'tid': tid,
+                     'ts': us(start), 'dur': (end - start) / 1000}
+            if args:
+                event['args'] = {k: v if isinstance(v, (int, float, bool)) or v is None else str(v)
+                                 for k, v in args.items()}
+            events.append(event)
+        for ns, rss in self.rss_samples:
+            if rss is not None:
+                events.append({'name': 'RSS', 'ph': 'C', 'pid': pid, 'tid': 0, 'ts': us(ns),
+                               'args': {'MB': round(rss / 1048576, 2)}})
+        metadata = {'tool': self.name, 'argv': sys.argv,
+                    'peak_rss_bytes': self.peak_rss(), 'children_peak_rss_bytes': self.children_peak_rss()}
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': metadata}
+
+    def summary(self, limit=15):
+        """(name, calls, total seconds, max seconds) per span name, slowest first."""
+        totals = {}
+        for name, start, end, _, _ in self.events:
+            calls, total, longest = totals.get(name, (0, 0, 0))
+            totals[name] = (calls + 1, total + end - start, max(longest, end - start))
+        rows = sorted(totals.items(), key=lambda item: -item[1][1])[:limit]
+        return [(name, calls, total / 1e9, longest / 1e9) for name, (calls, total, longest) in rows]
+
+
+# ========== SESSIONS ==========
+
+def add_arguments(parser):
+    """Add --profile [PATH], --profile-cprofile and --profile-rss-interval to an argparse parser."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', nargs='?', const='', default=None, metavar='TRACE.json',
+                       help=f"Write a Chrome/Perfetto trace (default: {os.path.relpath(TRACE_DIR)}/<tool>.trace.json)")
+    group.add_argument('--profile-cprofile', action='store_true',
+                       help="With --profile: also run cProfile (main thread) and write <trace>.prof")
+    group.add_argument('--profile-rss-interval', type=float, default=DEFAULT_RSS_INTERVAL, metavar='SEC',
+                       help="With --profile: RSS sampling interval, 0 to disable")
+
+
+@contextmanager
+def session(args, name):
+    """Trace the body when args.profile is set; a no-op otherwise or inside another session."""
+    global _tracer
+    path = getattr(args, 'profile', None)
+    if path is None or _tracer is not None:
+        yield
+        return
+    path = path or os.path.join(TRACE_DIR, f"{name}.trace.json")
+    profiler = None
+    if getattr(args, 'profile_cprofile', False):
+        import cProfile
+        profiler = cProfile.Profile()
+
+    tracer = Tracer(name, getattr(args, 'profile_rss_interval', DEFAULT_RSS_INTERVAL))
+    _tracer = tracer
+    if profiler is not None:
+        profiler.enable()
+    try:
+        with _Span(tracer, name, {}):
+            yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        _tracer = None
+        tracer.close()
+        write_trace(tracer, path)
+        print_summary(tracer, path)
+        if profiler is not None:
+            write_cprofile(profiler, os.path.splitext(path)[0] + '.prof')
+
+
+def write_trace(tracer, path):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(tracer.chrome_trace(), f)
+
+
+def print_summary(tracer, path):
+    print(f"\n{'span':<36} {'calls':>6} {'total s':>9} {'max s':>9}", file=sys.stderr)
+    for name, calls, total, longest in tracer.summary():
+        print(f"{name:<36} {calls:>6} {total:>9.3f} {longest:>9.3f}", file=sys.stderr)
+    peak, children = tracer.peak_rss(), tracer.children_peak_rss()
+    memory = f"peak RSS {peak / 1048576:.1f} MB" if peak else "peak RSS unavailable"
+    if children:
+        memory += f", children {children / 1048576:.1f} MB"
+    print(f"Trace: {path} ({len(tracer.events)} spans, {memory})", file=sys.stderr)
+
+
+def write_cprofile(profiler, path):
+    import pstats
+    profiler.dump_stats(path)
+    print(f"cProfile: {path} (top {CPROFILE_TOP} by cumulative time)", file=sys.stderr)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(CPROFILE_TOP)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Project paths, body zones and languages shared by every tool.
+
+Standard library only and cheap to import, so light dot_tools commands
+stay fast; the translation, preset and validation scripts take their
+tables from here instead of keeping their own copies.
+"""
+
+import os
+
+AGENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(AGENT_DIR)
+TRANSLATIONS_DIR = os.path.join(PROJECT_ROOT, "_translations")
+
+# Configuration/BodyZone.cs: member -> value
+BODY_ZONES = {
+    'Unknown': 0,
+    'Throat': 10,
+    'Head': 20,
+    'Neck': 30,
+    'Torso': 40,
+    'Arm': 50,
+    'Leg': 60,
+    'Dismemberment': 100,
+}
+
+# BodyZone members with per-zone settings, in option/table order (Unknown excluded)
+ZONES = [name for name in BODY_ZONES if name != 'Unknown']
+
+# Localization group of every DOT text ID (DOTModOptions.LocalizationGroupId)
+LOCALIZATION_GROUP_ID = 'DOT_Options'
+
+# (_translations.csv column, Texts/Text_<suffix>.json, Google Translate code)
+LANGUAGES = [
+    ('English', 'English', 'en'),
+    ('French', 'French', 'fr'),
+    ('German', 'German', 'de'),
+    ('Spanish', 'Spanish', 'es'),
+    ('Italian', 'Italian', 'it'),
+    ('Portuguese', 'Portuguese', 'pt'),
+    ('Japanese', 'Japanese', 'ja'),
+    ('Korean', 'Korean', 'ko'),
+    ('Chinese_Simplified', 'ChineseSimplified', 'zh-CN'),
+    ('Chinese_Traditional', 'ChineseTraditional', 'zh-TW'),
+    ('Thai', 'Thai', 'th'),
+]
+SOURCE_LANGUAGE = 'English'
+
+# CSV column -> Text_<suffix>.json
+LANG_MAP = {column: suffix for column, suffix, _ in LANGUAGES}
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Cached, parallel release builds for the PCVR and Nomad configurations.
+
+Each configuration's inputs (mod .cs files minus DOT.csproj's
+<Compile Remove> patterns, DOT.csproj, manifest.json and
+the translation texts) are hashed. When the hash matches a cached artifact
+in _agent/.cache/release/ the dotnet build is skipped; configurations whose
+inputs changed are built concurrently after a single shared restore.
+Artifacts are staged into builds/DOT-PCVR/DOT and builds/DOT-Nomad/DOT and
+zipped deterministically (sorted entries, fixed timestamps and permissions)
+to builds/DOT-PCVR.zip and builds/DOT-Nomad.zip. Files whose bytes would
+not change are left untouched.
+
+Texts are not shipped by default (see the B&S TextData note in DOT.csproj).
+--texts stages them in the packed layout from
+_translations/_pack_translations.py (minified, deduplicated, sorted) under
+DOT/Texts; the pretty-printed files in the repo stay the editable source.
+
+Usage:
+    python release_builder.py                # build what changed, stage, zip
+    python release_builder.py --dry-run      # show what would be rebuilt
+    python release_builder.py --force        # ignore the cache
+    python release_builder.py --config Nomad
+    python release_builder.py --texts        # also ship packed Text_*.json
+    python release_builder.py --profile      # Chrome trace of every phase (see profiling.py)
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import profiling
+from modoption_parser import project_sources
+from registry import AGENT_DIR, PROJECT_ROOT, TRANSLATIONS_DIR
+
+sys.path.insert(0, TRANSLATIONS_DIR)
+
+from _pack_translations import pack  # noqa: E402
+
+CSPROJ = os.path.join(PROJECT_ROOT, "DOT.csproj")
+MANIFEST = os.path.join(PROJECT_ROOT, "manifest.json")
+TEXTS_DIR = os.path.join(TRANSLATIONS_DIR, "Texts")
+BUILDS_DIR = os.path.join(PROJECT_ROOT, "builds")
+CACHE_DIR = os.path.join(AGENT_DIR, ".cache", "release")
+
+# Release name -> dotnet configuration and its OutputPath from DOT.csproj
+CONFIGS = {
+    'PCVR': {'configuration': 'Release', 'output': os.path.join('bin', 'Release', 'PCVR', 'DOT')},
+    'Nomad': {'configuration': 'Nomad', 'output': os.path.join('bin', 'Release', 'Nomad', 'DOT')},
+}
+
+# Files shipped in builds/DOT-<name>/DOT and in the zip
+ARTIFACT_FILES = ['DOT.dll', 'manifest.json']
+MOD_FOLDER = 'DOT'
+TEXTS_FOLDER = 'Texts'
+
+# Cached artifacts kept per configuration
+CACHE_KEEP = 3
+
+# 1980-01-01 is the earliest timestamp a zip entry can hold
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE = 0o644
+
+
+def compile_removed():
+    """fnmatch patterns for the <Compile Remove="..."> items in DOT.csproj (e.g. Patches\\**\\*.cs)."""
+    with open(CSPROJ, encoding='utf-8') as f:
+        removes = re.findall(r'<Compile\s+Remove="([^"]+)"', f.read())
+    # fnmatch's * already crosses directories, so "**/" collapses to nothing
+    return [p.strip().replace('\\', '/').replace('**/', '') for r in removes for p in r.split(';') if p.strip()]
+
+
+def input_files():
+    """Every file that affects a build, as project-relative paths in stable order."""
+    paths = list(project_sources(PROJECT_ROOT)) + [CSPROJ, MANIFEST]
+    if os.path.isdir(TEXTS_DIR):
+        paths += [os.path.join(TEXTS_DIR, f) for f in sorted(os.listdir(TEXTS_DIR)) if f.endswith('.json')]
+    removed = compile_removed()
+    files = (os.path.relpath(p, PROJECT_ROOT).replace(os.sep, '/') for p in paths)
+    return sorted(rel for rel in files if not any(fnmatch.fnmatchcase(rel, pat) for pat in removed))
+
+
+def hash_inputs(files):
+    """{relative path: sha256} for the given project files."""
+    hashes = {}
+    for rel in files:
+        with open(os.path.join(PROJECT_ROOT, rel), 'rb') as f:
+            hashes[rel] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def config_key(name, file_hashes):
+    h = hashlib.sha256(f"{name}|{CONFIGS[name]['configuration']}".encode('utf-8'))
+    for rel, digest in sorted(file_hashes.items()):
+        h.update(f"\n{rel}\0{digest}".encode('utf-8'))
+    return h.hexdigest()
+
+
+def _state_path(name):
+    return os.path.join(CACHE_DIR, f"{name}.json")
+
+
+def _artifact_dir(name, key):
+    return os.path.join(CACHE_DIR, name, key[:20])
+
+
+def load_state(name):
+    try:
+        with open(_state_path(name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(name, key, file_hashes):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _atomic_write(_state_path(name), json.dumps({'key': key, 'files': file_hashes}, indent=1).encode('utf-8'))
+
+
+def cache_hit(name, key):
+    artifact = _artifact_dir(name, key)
+    return all(os.path.isfile(os.path.join(artifact, f)) for f in ARTIFACT_FILES)
+
+
+def input_changes(old_files, new_files):
+    """(changed, added, removed) relative paths between two input hash maps."""
+    changed = sorted(p for p in new_files if p in old_files and old_files[p] != new_files[p])
+    added = sorted(p for p in new_files if p not in old_files)
+    removed = sorted(p for p in old_files if p not in new_files)
+    return changed, added, removed
+
+
+def _atomic_write(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _write_if_changed(path, data):
+    """Write bytes unless the file already holds them. Returns True if written."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    _atomic_write(path, data)
+    return True
+
+
+def dotnet(args, log_path):
+    """Run dotnet with output captured to log_path; raise with the log tail on failure."""
+    cmd = ['dotnet'] + args
+    with profiling.span(f"dotnet {args[0]}", command=' '.join(cmd)), open(log_path, 'w', encoding='utf-8') as log:
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT, stdout=log, stderr=subprocess.STDOUT)
+    if result.returncode != 0:
+        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+            tail = ''.join(f.readlines()[-20:])
+        raise RuntimeError(f"{' '.join(cmd)} failed (exit {result.returncode}), log: {log_path}\n{tail}")
+
+
+def build_config(name, key):
+    """Build one configuration and store its artifacts in the cache."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    log_path = os.path.join(CACHE_DIR, f"{name}.log")
+    start = time.perf_counter()
+    dotnet(['build', CSPROJ, '-c', CONFIGS[name]['configuration'], '--no-restore', '-nologo'], log_path)
+    elapsed = time.perf_counter() - start
+
+    output = os.path.join(PROJECT_ROOT, CONFIGS[name]['output'])
+    artifact = _artifact_dir(name, key)
+    os.makedirs(artifact, exist_ok=True)
+    with profiling.span('cache artifacts', config=name):
+        for f in ARTIFACT_FILES:
+            shutil.copyfile(os.path.join(output, f), os.path.join(artifact, f))
+        prune_cache(name, keep=os.path.basename(artifact))
+    return elapsed
+
+
+def prune_cache(name, keep):
+    """Keep the newest CACHE_KEEP artifact directories for a configuration."""
+    root = os.path.join(CACHE_DIR, name)
+    entries = sorted((os.path.join(root, d) for d in os.listdir(root)), key=os.path.getmtime, reverse=True)
+    for path in entries[CACHE_KEEP:]:
+        if os.path.basename(path) != keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def stage(name, key, texts=False):
+    """Copy cached artifacts into builds/DOT-<name>/DOT. Returns files written.
+
+    With texts, packed Text_*.json files go to DOT/Texts; without, a Texts
+    folder left by an earlier --texts run is removed so it is not zipped.
+    """
+    artifact = _artifact_dir(name, key)
+    dest = os.path.join(BUILDS_DIR, f"DOT-{name}", MOD_FOLDER)
+    os.makedirs(dest, exist_ok=True)
+    written = []
+    for f in ARTIFACT_FILES:
+        with open(os.path.join(artifact, f), 'rb') as src:
+            if _write_if_changed(os.path.join(dest, f), src.read()):
+                written.append(f)
+    texts_dest = os.path.join(dest, TEXTS_FOLDER)
+    if texts:
+        with profiling.span('pack texts', config=name):
+            written += [f"{TEXTS_FOLDER}/{r['file']}" for r in pack(texts_dest, TEXTS_DIR) if r['stale']]
+    elif os.path.isdir(texts_dest):
+        shutil.rmtree(texts_dest)
+        written.append(f"{TEXTS_FOLDER}/ (removed)")
+    return written
+
+
+def deterministic_zip(src_dir, arc_root):
+    """Zip bytes for src_dir with sorted entries, fixed timestamps and modes."""
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(src_dir):
+        dirnames.sort()
+        for f in filenames:
+            path = os.path.join(dirpath, f)
+            rel = os.path.relpath(path, src_dir).replace(os.sep, '/')
+            entries.append((f"{arc_root}/{rel}", path))
+    entries.sort()
+
+    buf = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+    with zipfile.ZipFile(buf, 'w') as zf:
+        for arcname, path in entries:
+            info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = (0o100000 | ZIP_FILE_MODE) << 16
+            with open(path, 'rb') as f:
+                zf.writestr(info, f.read(), compresslevel=9)
+    buf.seek(0)
+    return buf.read()
+
+
+def package(name):
+    """Write builds/DOT-<name>.zip. Returns True if the zip changed."""
+    src = os.path.join(BUILDS_DIR, f"DOT-{name}", MOD_FOLDER)
+    with profiling.span('compress', config=name):
+        data = deterministic_zip(src, MOD_FOLDER)
+    with profiling.span('write zip', config=name):
+        return _write_if_changed(os.path.join(BUILDS_DIR, f"DOT-{name}.zip"), data)
+
+
+class Timings:
+    """Wall-clock time per release phase, printed as a breakdown (and traced as spans)."""
+
+    def __init__(self):
+        self.phases = []
+        self.start = time.perf_counter()
+
+    def add(self, label, seconds):
+        self.phases.append((label, seconds))
+
+    def measure(self, label, func, *args):
+        start = time.perf_counter()
+        with profiling.span(label):
+            result = func(*args)
+        self.add(label, time.perf_counter() - start)
+        return result
+
+    def report(self):
+        total = time.perf_counter() - self.start
+        print(f"\n{'phase':<28} {'seconds':>8} {'share':>6}")
+        for label, seconds in self.phases:
+            share = seconds / total * 100 if total else 0.0
+            print(f"{label:<28} {seconds:>8.2f} {share:>5.0f}%")
+        print(f"{'total (wall)':<28} {total:>8.2f}")
+
+
+def plan(names, force=False):
+    """Decide per configuration whether to rebuild. Returns (file_hashes, [(name, key, reason)])."""
+    file_hashes = hash_inputs(input_files())
+    decisions = []
+    for name in names:
+        key = config_key(name, file_hashes)
+        state = load_state(name)
+        if force:
+            reason = 'forced'
+        elif cache_hit(name, key):
+            reason = None
+        elif not state:
+            reason = 'no cached build'
+        else:
+            changed, added, removed = input_changes(state.get('files', {}), file_hashes)
+            parts = [f"{len(l)} {what}" for l, what in ((changed, 'changed'), (added, 'added'), (removed, 'removed')) if l]
+            reason = ', '.join(parts) or 'cached artifact missing'
+        decisions.append((name, key, reason))
+    return file_hashes, decisions
+
+
+def print_plan(file_hashes, decisions, verbose=False):
+    print(f"Inputs: {len(file_hashes)} files")
+    for name, key, reason in decisions:
+        if reason is None:
+            print(f"  {name:<6} cached  ({key[:12]})")
+        else:
+            print(f"  {name:<6} rebuild ({reason})")
+            previous = load_state(name).get('files')
+            if verbose and previous:
+                changed, added, removed = input_changes(previous, file_hashes)
+                for label, paths in (('M', changed), ('A', added), ('D', removed)):
+                    for p in paths:
+                        print(f"           {label} {p}")
+
+
+def release(names, force=False, dry_run=False, verbose=False, texts=False):
+    """Build, stage and zip the given configurations. Returns the list of zips that changed."""
+    timings = Timings()
+    file_hashes, decisions = timings.measure('hash inputs', plan, names, force)
+    print_plan(file_hashes, decisions, verbose or dry_run)
+    if dry_run:
+        return []
+
+    to_build = [(name, key) for name, key, reason in decisions if reason is not None]
+    if to_build:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        timings.measure('dotnet restore', dotnet, ['restore', CSPROJ, '-nologo'],
+                        os.path.join(CACHE_DIR, 'restore.log'))
+        start = time.perf_counter()
+        with profiling.span('dotnet build (wall)'), \
+                ThreadPoolExecutor(max_workers=len(to_build), thread_name_prefix='build') as pool:
+            futures = {name: pool.submit(build_config, name, key) for name, key in to_build}
+            errors = []
+            for name, future in futures.items():
+                try:
+                    timings.add(f"  build {name} (concurrent)", future.result())
+                except Exception as e:
+                    errors.append(str(e))
+        timings.add('dotnet build (wall)', time.perf_counter() - start)
+        if errors:
+            raise RuntimeError('\n'.join(errors))
+    for name, key, _ in decisions:
+        save_state(name, key, file_hashes)
+
+    changed_zips = []
+    start = time.perf_counter()
+    for name, key, _ in decisions:
+        with profiling.span('stage', config=name):
+            written = stage(name, key, texts)
+        if written:
+            print(f"Staged builds/DOT-{name}/{MOD_FOLDER}: {', '.join(written)}")
+    timings.add('stage artifacts', time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for name, _, _ in decisions:
+        zip_path = os.path.join(BUILDS_DIR, f"DOT-{name}.zip")
+        with profiling.span('zip', config=name):
+            changed = package(name)
+        if changed:
+            changed_zips.append(zip_path)
+            print(f"Zipped {os.path.relpath(zip_path, PROJECT_ROOT)}")
+        else:
+            print(f"Unchanged {os.path.relpath(zip_path, PROJECT_ROOT)}")
+    timings.add('zip', time.perf_counter() - start)
+    timings.report()
+    return changed_zips
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cached, parallel PCVR/Nomad release builds.")
+    parser.add_argument('--config', default=','.join(CONFIGS), help="Comma separated: PCVR, Nomad")
+    parser.add_argument('--dry-run', action='store_true', help="Show what would be rebuilt and why")
+    parser.add_argument('--force', action='store_true', help="Rebuild even on a cache hit")
+    parser.add_argument('-v', '--verbose', action='store_true', help="List changed input files")
+    parser.add_argument('--texts', action='store_true', help="Stage packed Text_*.json files under DOT/Texts")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.config.split(',') if n.strip()]
+    unknown = [n for n in names if n not in CONFIGS]
+    if unknown:
+        parser.error(f"unknown configuration(s): {', '.join(unknown)}")
+    try:
+        with profiling.session(args, 'release_builder'):
+            release(names, force=args.force, dry_run=args.dry_run, verbose=args.verbose, texts=args.texts)
+    except (RuntimeError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
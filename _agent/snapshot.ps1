@@ -4,6 +4,9 @@ param(
     [string]$TagPrefix = "snapshot"
 )
 
+# Commit + tag as before; the working tree is also stored in the
+# content-addressed snapshot store (see snapshot.py).
+
 $ErrorActionPreference = "Stop"
 
 $repoRoot = Split-Path -Parent $PSScriptRoot
@@ -11,31 +14,14 @@ Set-Location $repoRoot
 
 git rev-parse --show-toplevel | Out-Null
 
-$timestamp = Get-Date -Format "yyyyMMdd-HHmmss"
-if (-not $Message -or $Message.Trim().Length -eq 0) {
-    $Message = "snapshot: $timestamp"
-}
-
-git add -A
-git diff --cached --quiet
-if ($LASTEXITCODE -eq 0) {
-    Write-Host "No staged changes. Snapshot not created."
-    exit 0
+$python = if (Get-Command python -ErrorAction SilentlyContinue) { "python" } else { "py" }
+$snapshotArgs = @("create", "--commit", "--tag-prefix", $TagPrefix)
+if ($Message -and $Message.Trim().Length -gt 0) {
+    $snapshotArgs += @("-m", $Message)
 }
-
-git commit -m $Message
-
-$tagName = "$TagPrefix-$timestamp"
-git tag $tagName
-
 if ($Zip) {
-    $outDir = Join-Path $repoRoot "builds\\snapshots"
-    if (-not (Test-Path $outDir)) {
-        New-Item -ItemType Directory -Path $outDir | Out-Null
-    }
-    $zipPath = Join-Path $outDir "$tagName.zip"
-    git archive --format=zip -o $zipPath HEAD
-    Write-Host "Wrote $zipPath"
+    $snapshotArgs += "--zip"
 }
 
-Write-Host "Snapshot commit and tag created: $tagName"
+& $python (Join-Path $PSScriptRoot "snapshot.py") @snapshotArgs
+exit $LASTEXITCODE
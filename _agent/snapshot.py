@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshots of the working tree (replaces the zip path of
+snapshot.ps1, which now calls this script).
+
+Store layout under .snapshots/ (gitignored):
+
+  objects/ab/cdef...    one blob per distinct file content, named by its
+                        SHA-256; first byte b'z' (zlib) or b'r' (raw, for
+                        content that does not compress: xlsx, zip, images)
+  manifests/<name>.json path -> [hash, size, executable] for every file,
+                        plus message, time and the git commit
+  index.json            stat cache: path -> [size, mtime_ns, hash]
+
+A snapshot stats every file but hashes only those whose size or mtime
+changed since the index was written, and stores only blobs the store does
+not already hold. Identical content (the PCVR and Nomad DLLs, an xlsx that
+was regenerated unchanged, a file restored from an older snapshot) is kept
+once across all snapshots, so time and disk grow with what changed, not
+with the size of the tree. Files are the ones git would see (tracked plus
+untracked, minus .gitignore), or every file outside .git when git is not
+available.
+
+restore rewrites only files whose content differs from the snapshot and,
+unless --no-backup, snapshots the current tree first so a restore can be
+undone. create --commit keeps snapshot.ps1's git behavior: commit
+everything and tag snapshot-YYYYMMDD-HHMMSS.
+
+Usage:
+    python snapshot.py create -m "before Extreme damage sweep"
+    python snapshot.py create -m "Release fix" --commit     # also git commit + tag
+    python snapshot.py list
+    python snapshot.py diff snapshot-20260101-120000          # vs working tree
+    python snapshot.py restore snapshot-20260101-120000 [--paths "_design/*"] [--delete]
+    python snapshot.py export snapshot-20260101-120000        # builds/snapshots/<name>.zip
+    python snapshot.py delete snapshot-20260101-120000 && python snapshot.py gc
+"""
+
+import argparse
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from registry import PROJECT_ROOT
+
+STORE_DIR = os.path.join(PROJECT_ROOT, ".snapshots")
+EXPORT_DIR = os.path.join(PROJECT_ROOT, "builds", "snapshots")
+
+DEFAULT_TAG_PREFIX = "snapshot"
+READ_CHUNK = 1 << 20
+COMPRESS_LEVEL = 6
+COMPRESS_PROBE = 64 * 1024  # Bytes test-compressed before committing to zlib
+MIN_SAVING = 0.10           # Store raw unless zlib saves at least this share
+# Already-compressed formats: stored raw without probing
+RAW_EXTENSIONS = {'.zip', '.xlsx', '.docx', '.png', '.jpg', '.jpeg', '.gz', '.7z', '.mp4', '.ogg', '.bundle'}
+WALK_SKIP = {'.git', '.snapshots', '__pycache__'}
+
+BLOB_ZLIB = b'z'
+BLOB_RAW = b'r'
+
+
+class SnapshotError(Exception):
+    """Raised for a missing snapshot, a damaged blob or a failed git step."""
+
+
+# ========== FILES ==========
+
+def _git(*args, check=True):
+    result = subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True)
+    if check and result.returncode != 0:
+        raise SnapshotError(f"git {' '.join(args)}: {result.stderr.decode(errors='replace').strip()}")
+    return result
+
+
+def list_files(root=PROJECT_ROOT):
+    """Relative POSIX paths of the files a snapshot covers."""
+    try:
+        result = _git('ls-files', '-z', '--cached', '--others', '--exclude-standard', check=False)
+    except OSError:
+        result = None
+    if result is not None and result.returncode == 0:
+        paths = sorted({p for p in result.stdout.decode('utf-8').split('\0') if p})
+        return [p for p in paths if os.path.isfile(os.path.join(root, p))]
+
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in WALK_SKIP]
+        rel = os.path.relpath(dirpath, root)
+        for name in filenames:
+            paths.append(name if rel == '.' else f"{rel}/{name}".replace(os.sep, '/'))
+    return sorted(paths)
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_executable(st):
+    return bool(st.st_mode & stat.S_IXUSR)
+
+
+# ========== STORE ==========
+
+class Store:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+        self.manifests = os.path.join(root, "manifests")
+        self.index_path = os.path.join(root, "index.json")
+        self.tmp = os.path.join(root, "tmp")
+
+    def blob_path(self, digest):
+        return os.path.join(self.objects, digest[:2], digest[2:])
+
+    def has_blob(self, digest):
+        return os.path.exists(self.blob_path(digest))
+
+    def put_blob(self, digest, source):
+        """Copy a file into the store under the hash of the bytes actually copied.
+
+        digest is the hash scan() saw; if the file was rewritten since, its
+        new content is stored under its new hash instead, so a blob's name
+        always matches its content. Returns (hash, bytes written to the store
+        or 0 when deduplicated, os.stat_result of the file as it was read).
+        """
+        if self.has_blob(digest):
+            return digest, 0, None
+        os.makedirs(self.tmp, exist_ok=True)
+        check = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.tmp, suffix='.blob')
+        try:
+            with open(source, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                st = os.fstat(src.fileno())
+                head = src.read(COMPRESS_PROBE)
+                check.update(head)
+                raw = os.path.splitext(source)[1].lower() in RAW_EXTENSIONS or (
+                    len(head) > 0 and len(zlib.compress(head, 1)) > len(head) * (1 - MIN_SAVING))
+                packer = None if raw else zlib.compressobj(COMPRESS_LEVEL)
+                dst.write(BLOB_RAW if raw else BLOB_ZLIB)
+                dst.write(head if raw else packer.compress(head))
+                for block in iter(lambda: src.read(READ_CHUNK), b''):
+                    check.update(block)
+                    dst.write(block if raw else packer.compress(block))
+                if packer is not None:
+                    dst.write(packer.flush())
+            actual = check.hexdigest()
+            target = self.blob_path(actual)
+            if os.path.exists(target):
+                os.remove(tmp)
+                return actual, 0, st
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(tmp, target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return actual, os.path.getsize(target), st
+
+    def read_blob(self, digest, out):
+        """Write a blob's content to the open binary file `out`, verifying its hash."""
+        check = hashlib.sha256()
+        try:
+            f = open(self.blob_path(digest), 'rb')
+        except FileNotFoundError:
+            raise SnapshotError(f"blob {digest} is missing from {self.objects}")
+        with f:
+            kind = f.read(1)
+            unpacker = zlib.decompressobj() if kind == BLOB_ZLIB else None
+            for block in iter(lambda: f.read(READ_CHUNK), b''):
+                if unpacker is not None:
+                    block = unpacker.decompress(block)
+                check.update(block)
+                out.write(block)
+            if unpacker is not None:
+                tail = unpacker.flush()
+                check.update(tail)
+                out.write(tail)
+        if check.hexdigest() != digest:
+            raise SnapshotError(f"blob {digest} is damaged")
+
+    def blob_hashes(self):
+        found = set()
+        if not os.path.isdir(self.objects):
+            return found
+        for prefix in os.listdir(self.objects):
+            folder = os.path.join(self.objects, prefix)
+            for rest in os.listdir(folder):
+                if not rest.endswith('.tmp'):
+                    found.add(prefix + rest)
+        return found
+
+    # Manifests
+
+    def manifest_path(self, name):
+        return os.path.join(self.manifests, f"{name}.json")
+
+    def names(self):
+        """Snapshot names, oldest first."""
+        if not os.path.isdir(self.manifests):
+            return []
+        names = [n[:-5] for n in os.listdir(self.manifests) if n.endswith('.json')]
+        return sorted(names, key=lambda n: (os.path.getmtime(self.manifest_path(n)), n))
+
+    def load(self, name):
+        try:
+            with open(self.manifest_path(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            known = self.names()
+            hint = f" Known: {', '.join(known[-5:])}" if known else " The store is empty."
+            raise SnapshotError(f"No snapshot '{name}'.{hint}")
+
+    def save(self, manifest):
+        os.makedirs(self.manifests, exist_ok=True)
+        path = self.manifest_path(manifest['name'])
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp, path)
+
+    def resolve(self, name):
+        """A snapshot name, or 'latest'."""
+        if name == 'latest':
+            names = self.names()
+            if not names:
+                raise SnapshotError("The store is empty.")
+            return names[-1]
+        return name
+
+    # Stat cache
+
+    def load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_index(self, index):
+        os.makedirs(self.root, exist_ok=True)
+        tmp = f"{self.index_path}.tmp"
+        with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(index, f, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp, self.index_path)
+
+
+# ========== SCANNING ==========
+
+def scan(store, paths=None, workers=None):
+    """Hash the tree through the stat cache.
+
+    Returns ({path: [hash, size, executable]}, stats dict). Only files whose
+    size or mtime changed since the index was written are read.
+    """
+    paths = list_files() if paths is None else paths
+    index = store.load_index()
+    files, stale = {}, []
+    for rel in paths:
+        try:
+            st = os.stat(os.path.join(PROJECT_ROOT, rel))
+        except FileNotFoundError:
+            continue
+        cached = index.get(rel)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            files[rel] = [cached[2], st.st_size, _is_executable(st)]
+        else:
+            stale.append((rel, st))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = pool.map(lambda item: hash_file(os.path.join(PROJECT_ROOT, item[0])), stale)
+        for (rel, st), digest in zip(stale, digests):
+            files[rel] = [digest, st.st_size, _is_executable(st)]
+            index[rel] = [st.st_size, st.st_mtime_ns, digest]
+
+    for rel in set(index) - set(files):
+        del index[rel]
+    store.save_index(index)
+    return files, {'files': len(files), 'hashed': len(stale)}
+
+
+def store_blobs(store, files, workers=None):
+    """Copy every blob the store lacks; returns (new blobs, bytes written).
+
+    A file rewritten since scan() is stored under the hash of what was
+    copied, and its entry in files and in the stat cache follow.
+    """
+    missing = {}
+    for rel, (digest, _, _) in files.items():
+        if not store.has_blob(digest):
+            missing.setdefault(digest, []).append(rel)
+
+    def copy(item):
+        digest, rels = item
+        stored, written, changed = 0, 0, {}
+        for rel in rels:
+            actual, size, st = store.put_blob(digest, os.path.join(PROJECT_ROOT, rel))
+            stored, written = stored + (size > 0), written + size
+            if actual == digest:
+                break  # The other paths with this content are covered by the blob
+            changed[rel] = (actual, st)
+        return stored, written, changed
+
+    new_blobs = written = 0
+    updates = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for stored, size, changed in pool.map(copy, missing.items()):
+            new_blobs, written = new_blobs + stored, written + size
+            updates.update(changed)
+
+    if updates:
+        index = store.load_index()
+        for rel, (digest, st) in updates.items():
+            files[rel] = [digest, st.st_size, _is_executable(st)]
+            index[rel] = [st.st_size, st.st_mtime_ns, digest]
+        store.save_index(index)
+    return new_blobs, written
+
+
+# ========== COMMANDS ==========
+
+def _timestamp():
+    return datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+def _git_head():
+    try:
+        result = _git('rev-parse', 'HEAD', check=False)
+    except OSError:
+        return None
+    return result.stdout.decode().strip() if result.returncode == 0 else None
+
+
+def git_commit(message, tag):
+    """snapshot.ps1's git step: commit everything and tag. Returns False if nothing changed."""
+    _git('add', '-A')
+    if _git('diff', '--cached', '--quiet', check=False).returncode == 0:
+        return False
+    _git('commit', '-m', message)
+    _git('tag', tag)
+    return True
+
+
+def create(store, message='', name=None, commit=False, tag_prefix=DEFAULT_TAG_PREFIX, force=False, workers=None):
+    """Snapshot the working tree. Returns (manifest or None if unchanged, stats)."""
+    start = time.perf_counter()
+    stamp = _timestamp()
+    if name and os.path.exists(store.manifest_path(name)):
+        raise SnapshotError(f"Snapshot '{name}' already exists")
+    if not name:
+        name, n = f"{tag_prefix}-{stamp}", 2
+        while os.path.exists(store.manifest_path(name)):
+            name, n = f"{tag_prefix}-{stamp}-{n}", n + 1
+    message = message.strip() or f"snapshot: {stamp}"
+
+    git = None
+    if commit:
+        if git_commit(message, name):
+            git = {'commit': _git_head(), 'tag': name}
+            print(f"Git commit and tag created: {name}")
+        else:
+            print("No staged changes. Git commit not created.")
+
+    files, stats = scan(store, workers=workers)
+    names = store.names()
+    if names and not force and git is None:
+        previous = store.load(names[-1])
+        if previous['files'] == files:
+            stats['seconds'] = time.perf_counter() - start
+            stats['unchanged_since'] = names[-1]
+            return None, stats
+
+    stats['new_blobs'], stats['stored_bytes'] = store_blobs(store, files, workers)
+    manifest = {
+        'name': name,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'message': message,
+        'git': git or {'commit': _git_head(), 'tag': None},
+        'files': files,
+    }
+    store.save(manifest)
+    stats['seconds'] = time.perf_counter() - start
+    return manifest, stats
+
+
+def diff_files(old, new):
+    """(added, removed, modified) path lists between two path -> entry maps."""
+    added = sorted(set(new) - set(old))
+    removed = sorted(set(old) - set(new))
+    modified = sorted(p for p in set(old) & set(new) if old[p][0] != new[p][0])
+    return added, removed, modified
+
+
+def _selected(paths, patterns):
+    if not patterns:
+        return list(paths)
+    return [p for p in paths if any(fnmatch.fnmatch(p, pat) for pat in patterns)]
+
+
+def restore(store, name, dest=None, patterns=None, delete=False, backup=True, workers=None):
+    """Write a snapshot's files back, skipping those already identical.
+
+    Into the project (default) the current tree is compared through the stat
+    cache and, with backup, snapshotted first. Returns a stats dict.
+    """
+    start = time.perf_counter()
+    manifest = store.load(name)
+    wanted = {p: manifest['files'][p] for p in _selected(manifest['files'], patterns)}
+    in_place = dest is None
+    root = PROJECT_ROOT if in_place else os.path.abspath(dest)
+    stats = {'backup': None}
+
+    if in_place:
+        current, _ = scan(store, workers=workers)
+        current = {p: current[p] for p in _selected(current, patterns)}
+        if backup:
+            backup_manifest, _ = create(store, f"before restoring {name}", tag_prefix='pre-restore',
+                                        workers=workers)
+            stats['backup'] = backup_manifest['name'] if backup_manifest else store.names()[-1]
+    else:
+        current = {}
+
+    added, removed, modified = diff_files(current, wanted)
+    for rel in added + modified:
+        digest, _, executable = wanted[rel]
+        target = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(target) or root, exist_ok=True)
+        tmp = f"{target}.snapshot.tmp"
+        with open(tmp, 'wb') as out:
+            store.read_blob(digest, out)
+        if executable and os.name == 'posix':
+            os.chmod(tmp, os.stat(tmp).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.replace(tmp, target)
+
+    deleted = []
+    if delete and in_place:
+        for rel in removed:
+            os.remove(os.path.join(root, rel))
+            deleted.append(rel)
+
+    if in_place:
+        # Refresh the stat cache for what was written so the next snapshot skips it
+        index = store.load_index()
+        for rel in added + modified:
+            st = os.stat(os.path.join(root, rel))
+            index[rel] = [st.st_size, st.st_mtime_ns, wanted[rel][0]]
+        for rel in deleted:
+            index.pop(rel, None)
+        store.save_index(index)
+
+    stats.update({'written': len(added) + len(modified), 'unchanged': len(wanted) - len(added) - len(modified),
+                  'deleted': len(deleted), 'extra': len(removed) - len(deleted),
+                  'seconds': time.perf_counter() - start})
+    return stats
+
+
+def export_zip(store, name, path):
+    manifest = store.load(name)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for rel, (digest, _, _) in sorted(manifest['files'].items()):
+            with archive.open(rel, 'w') as out:
+                store.read_blob(digest, out)
+    return len(manifest['files'])
+
+
+def delete(store, name):
+    store.load(name)
+    os.remove(store.manifest_path(name))
+
+
+def gc(store):
+    """Remove blobs no manifest references. Returns (blobs removed, bytes freed)."""
+    referenced = set()
+    for name in store.names():
+        referenced.update(entry[0] for entry in store.load(name)['files'].values())
+    removed = freed = 0
+    for digest in store.blob_hashes() - referenced:
+        path = store.blob_path(digest)
+        freed += os.path.getsize(path)
+        os.remove(path)
+        removed += 1
+    return removed, freed
+
+
+def store_usage(store):
+    """(blob count, bytes on disk) of the object store."""
+    count = size = 0
+    for digest in store.blob_hashes():
+        count += 1
+        size += os.path.getsize(store.blob_path(digest))
+    return count, size
+
+
+def _mb(n):
+    return f"{n / 1e6:.1f} MB" if n >= 1e5 else f"{n / 1e3:.1f} KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed snapshots of the working tree")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('create', help="Snapshot the working tree")
+    p.add_argument('-m', '--message', default='')
+    p.add_argument('--name', help="Snapshot name (default <tag-prefix>-YYYYMMDD-HHMMSS)")
+    p.add_argument('--commit', action='store_true', help="Also git commit everything and tag it (snapshot.ps1)")
+    p.add_argument('--tag-prefix', default=DEFAULT_TAG_PREFIX)
+    p.add_argument('--force', action='store_true', help="Write a manifest even if nothing changed")
+    p.add_argument('--zip', action='store_true', help="Also export the snapshot to builds/snapshots/<name>.zip")
+
+    sub.add_parser('list', help="Snapshots, oldest first, and store usage")
+
+    p = sub.add_parser('diff', help="Changed paths between two snapshots or a snapshot and the tree")
+    p.add_argument('old')
+    p.add_argument('new', nargs='?', help="Second snapshot (default: working tree)")
+
+    p = sub.add_parser('restore', help="Write a snapshot's files back")
+    p.add_argument('name', help="Snapshot name or 'latest'")
+    p.add_argument('--paths', nargs='+', help="Glob patterns limiting the restore (e.g. '_design/*')")
+    p.add_argument('--dest', help="Restore into this directory instead of the project")
+    p.add_argument('--delete', action='store_true', help="Remove files the snapshot does not have")
+    p.add_argument('--no-backup', action='store_true', help="Skip the pre-restore snapshot")
+
+    p = sub.add_parser('export', help="Write a snapshot as a zip")
+    p.add_argument('name', help="Snapshot name or 'latest'")
+    p.add_argument('--out', help="Zip path (default builds/snapshots/<name>.zip)")
+
+    p = sub.add_parser('delete', help="Remove a snapshot's manifest (run gc to free its blobs)")
+    p.add_argument('name')
+
+    sub.add_parser('gc', help="Remove blobs no snapshot references")
+
+    args = parser.parse_args()
+    store = Store()
+
+    try:
+        if args.command == 'create':
+            manifest, stats = create(store, args.message, args.name, args.commit, args.tag_prefix, args.force)
+            if manifest is None:
+                print(f"No changes since {stats['unchanged_since']}. Snapshot not created "
+                      f"({stats['files']} files checked, {stats['hashed']} hashed, {stats['seconds']:.2f}s).")
+                return
+            size = sum(entry[1] for entry in manifest['files'].values())
+            print(f"Snapshot {manifest['name']}: {stats['files']} files ({_mb(size)}), {stats['hashed']} hashed, "
+                  f"{stats['new_blobs']} new blobs ({_mb(stats['stored_bytes'])} stored) in {stats['seconds']:.2f}s")
+            if args.zip:
+                path = os.path.join(EXPORT_DIR, f"{manifest['name']}.zip")
+                export_zip(store, manifest['name'], path)
+                print(f"Wrote {path}")
+
+        elif args.command == 'list':
+            names = store.names()
+            if not names:
+                print("No snapshots.")
+                return
+            for name in names:
+                m = store.load(name)
+                size = sum(entry[1] for entry in m['files'].values())
+                tag = f" [{m['git']['tag']}]" if m['git'].get('tag') else ''
+                print(f"{name:<32} {m['created']}  {len(m['files']):>5} files {_mb(size):>9}  {m['message']}{tag}")
+            count, used = store_usage(store)
+            print(f"\nStore: {count} blobs, {_mb(used)} on disk for {len(names)} snapshots")
+
+        elif args.command == 'diff':
+            old = store.load(store.resolve(args.old))['files']
+            if args.new:
+                new = store.load(store.resolve(args.new))['files']
+            else:
+                new, _ = scan(store)
+            added, removed, modified = diff_files(old, new)
+            for marker, paths in (('A', added), ('D', removed), ('M', modified)):
+                for rel in paths:
+                    print(f"{marker} {rel}")
+            print(f"{len(added)} added, {len(removed)} removed, {len(modified)} modified")
+
+        elif args.command == 'restore':
+            name = store.resolve(args.name)
+            stats = restore(store, name, args.dest, args.paths, args.delete, not args.no_backup)
+            if stats['backup']:
+                print(f"Current tree saved as {stats['backup']}")
+            extra = f", {stats['extra']} files not in the snapshot left in place (--delete removes them)" \
+                if stats['extra'] else ''
+            print(f"Restored {name}: {stats['written']} written, {stats['unchanged']} already identical, "
+                  f"{stats['deleted']} deleted{extra} in {stats['seconds']:.2f}s")
+
+        elif args.command == 'export':
+            name = store.resolve(args.name)
+            path = args.out or os.path.join(EXPORT_DIR, f"{name}.zip")
+            count = export_zip(store, name, path)
+            print(f"Wrote {count} files to {path}")
+
+        elif args.command == 'delete':
+            delete(store, args.name)
+            print(f"Deleted {args.name} (run gc to free unreferenced blobs)")
+
+        elif args.command == 'gc':
+            removed, freed = gc(store)
+            print(f"Removed {removed} unreferenced blobs ({_mb(freed)})")
+
+    except SnapshotError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
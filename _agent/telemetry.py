@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Reader and synthetic generator for DOT binary telemetry files.
+
+PerformanceMetrics appends one 16-byte record per BleedManager tick to a
+ring buffer and, on PCVR with debug logging on, flushes it in bulk to
+persistentDataPath/DOT_telemetry_<timestamp>.bin (see Core/TelemetryRing.cs):
+
+  header  16 bytes: b"DOTT", u16 version, u16 record size, u32 flags, u32 reserved
+  records 16 bytes: u32 frame, f32 tick_ms, u16 active_effects, u16 creatures, f32 damage
+
+open_telemetry() maps the records with numpy.memmap and a structured dtype,
+so nothing is read until it is touched. Aggregations walk the map in fixed
+chunks, keeping memory flat for files of hundreds of millions of records.
+Frames are written in increasing order, so frame ranges are located with a
+binary search and returned as zero-copy views.
+
+Usage:
+    python telemetry.py summary DOT_telemetry_20260101_120000.bin
+    python telemetry.py summary trace.bin --frames 1000:5000 --json
+    python telemetry.py generate trace.bin --records 100000000
+"""
+
+import argparse
+import bisect
+import json
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+MAGIC = b'DOTT'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+FLAG_NOMAD = 1
+
+RECORD_DTYPE = np.dtype([
+    ('frame', '<u4'),
+    ('tick_ms', '<f4'),
+    ('active_effects', '<u2'),
+    ('creatures', '<u2'),
+    ('damage', '<f4'),
+])
+assert RECORD_DTYPE.itemsize == 16
+
+# Same threshold PerformanceMetrics warns at
+SLOW_TICK_MS = 2.0
+
+# Tick duration histogram used for percentiles: 0-100 ms at 1 us resolution,
+# last bin catches everything slower
+HIST_MAX_MS = 100.0
+HIST_BINS = 100_000
+
+CHUNK_RECORDS = 1 << 22  # 64 MiB of records per aggregation step
+
+WAVE_TICKS = 4096  # Length of a synthetic enemy wave
+
+
+class TelemetryFormatError(Exception):
+    """Raised when a file is not a DOT telemetry file this reader understands."""
+
+
+# ========== READING ==========
+
+def read_header(path):
+    """Return (version, record_size, flags) from a telemetry file header."""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise TelemetryFormatError(f"{path}: shorter than the {HEADER.size}-byte header")
+    magic, version, record_size, flags, _ = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise TelemetryFormatError(f"{path}: bad magic {magic!r}")
+    if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise TelemetryFormatError(f"{path}: unsupported version {version} / record size {record_size}")
+    return version, record_size, flags
+
+
+def open_telemetry(path):
+    """Memory-map a telemetry file's records (read-only, zero-copy).
+
+    A trailing partial record (a flush cut short by a crash) is ignored.
+    """
+    read_header(path)
+    count = (os.path.getsize(path) - HEADER.size) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+
+
+def frame_slice(records, start=None, stop=None):
+    """View of the records with start <= frame < stop (frames are sorted).
+
+    bisect probes ~log2(n) records; np.searchsorted would first copy the
+    strided frame column out of the map.
+    """
+    frames = records['frame']
+    lo = 0 if start is None else bisect.bisect_left(frames, start)
+    hi = len(records) if stop is None else bisect.bisect_left(frames, stop, lo)
+    return records[lo:hi]
+
+
+def iter_chunks(records, chunk=CHUNK_RECORDS):
+    for start in range(0, len(records), chunk):
+        yield records[start:start + chunk]
+
+
+# ========== AGGREGATION ==========
+
+def _percentile(hist, q, worst_ms):
+    """Upper edge of the histogram bin holding quantile q (0-1), capped at the worst tick."""
+    total = hist.sum()
+    if total == 0:
+        return 0.0
+    idx = int(np.searchsorted(np.cumsum(hist), q * total, side='left'))
+    return min(min(idx + 1, HIST_BINS) * HIST_MAX_MS / HIST_BINS, worst_ms)
+
+
+def summarize(records, chunk=CHUNK_RECORDS):
+    """Aggregate tick statistics without materializing the records.
+
+    Percentiles come from a fixed 1 us histogram, so they are exact to the
+    bin width regardless of record count, and never exceed worst_ms.
+    """
+    hist = np.zeros(HIST_BINS, dtype=np.int64)
+    by_effects_ticks = np.zeros(65536, dtype=np.int64)
+    by_effects_ms = np.zeros(65536, dtype=np.float64)
+    count = slow = 0
+    total_ms = total_damage = 0.0
+    worst_ms = 0.0
+    peak_effects = peak_creatures = 0
+    worst_frame = None
+
+    for part in iter_chunks(records, chunk):
+        tick = part['tick_ms'].astype(np.float64)
+        effects = part['active_effects']
+        count += len(part)
+        total_ms += tick.sum()
+        total_damage += part['damage'].sum(dtype=np.float64)
+        slow += int(np.count_nonzero(tick > SLOW_TICK_MS))
+
+        i = int(tick.argmax())
+        if tick[i] > worst_ms or worst_frame is None:
+            worst_ms, worst_frame = float(tick[i]), int(part['frame'][i])
+        peak_effects = max(peak_effects, int(effects.max()))
+        peak_creatures = max(peak_creatures, int(part['creatures'].max()))
+
+        bins = np.minimum((tick * (HIST_BINS / HIST_MAX_MS)).astype(np.int64), HIST_BINS - 1)
+        hist += np.bincount(bins, minlength=HIST_BINS)
+        by_effects_ticks += np.bincount(effects, minlength=65536)
+        by_effects_ms += np.bincount(effects, weights=tick, minlength=65536)
+
+    if count == 0:
+        return {'records': 0}
+
+    used = np.nonzero(by_effects_ticks)[0]
+    return {
+        'records': count,
+        'first_frame': int(records['frame'][0]),
+        'last_frame': int(records['frame'][-1]),
+        'mean_ms': total_ms / count,
+        'p50_ms': _percentile(hist, 0.50, worst_ms),
+        'p95_ms': _percentile(hist, 0.95, worst_ms),
+        'p99_ms': _percentile(hist, 0.99, worst_ms),
+        'worst_ms': worst_ms,
+        'worst_frame': worst_frame,
+        'slow_ticks': slow,
+        'peak_effects': peak_effects,
+        'peak_creatures': peak_creatures,
+        'total_damage': total_damage,
+        'by_effects': {
+            int(n): {'ticks': int(by_effects_ticks[n]), 'mean_ms': float(by_effects_ms[n] / by_effects_ticks[n])}
+            for n in used
+        },
+    }
+
+
+def print_summary(summary, path):
+    print(f"Telemetry: {path}")
+    if summary['records'] == 0:
+        print("  No records")
+        return
+    s = summary
+    print(f"  Records: {s['records']:,} (frames {s['first_frame']}-{s['last_frame']})")
+    print(f"  Tick ms: mean={s['mean_ms']:.3f} p50={s['p50_ms']:.3f} p95={s['p95_ms']:.3f} "
+          f"p99={s['p99_ms']:.3f} worst={s['worst_ms']:.3f} (frame {s['worst_frame']})")
+    print(f"  Slow ticks (>{SLOW_TICK_MS:g}ms): {s['slow_ticks']:,}")
+    print(f"  Peak: {s['peak_effects']} effects, {s['peak_creatures']} creatures")
+    print(f"  Total damage: {s['total_damage']:,.1f}")
+    print("  Mean tick by active effects:")
+    for n, row in sorted(s['by_effects'].items()):
+        print(f"    {n:>5} effects: {row['mean_ms']:.3f} ms over {row['ticks']:,} ticks")
+
+
+# ========== SYNTHETIC FILES ==========
+
+def write_header(f, flags=0):
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize, flags, 0))
+
+
+def synthetic_records(count, rng, frame_start=0):
+    """A chunk of plausible tick records.
+
+    Active effects follow a bounded random walk plus occasional waves lasting
+    a few thousand ticks; tick cost grows linearly with effect count plus
+    log-normal jitter, and damage scales with effects. Frames skip ahead a
+    little when the mod had nothing to tick.
+    """
+    rec = np.empty(count, dtype=RECORD_DTYPE)
+    steps = rng.integers(1, 4, size=count, dtype=np.uint32)
+    rec['frame'] = frame_start + np.cumsum(steps, dtype=np.uint64).astype(np.uint32)
+
+    walk = rng.integers(-1, 2, size=count).cumsum()
+    base = np.abs((walk + 32) % 128 - 64)  # Reflect the walk into 0-64
+    blocks = count // WAVE_TICKS + 1
+    waves = (rng.random(blocks) < 0.1) * rng.integers(10, 120, size=blocks)
+    effects = np.clip(base + np.repeat(waves, WAVE_TICKS)[:count], 1, 400)
+    rec['active_effects'] = effects
+    rec['creatures'] = np.maximum(1, effects // 3)
+    rec['tick_ms'] = 0.02 + effects * 0.004 + rng.lognormal(-4.0, 1.0, size=count)
+    rec['damage'] = effects * rng.random(count, dtype=np.float32) * 0.5
+    return rec
+
+
+def generate(path, records, seed=0, flags=0, chunk=CHUNK_RECORDS):
+    """Write a synthetic telemetry file of the given size in bounded memory."""
+    rng = np.random.default_rng(seed)
+    frame = 0
+    with open(path, 'wb') as f:
+        write_header(f, flags)
+        for start in range(0, records, chunk):
+            rec = synthetic_records(min(chunk, records - start), rng, frame)
+            frame = int(rec['frame'][-1])
+            rec.tofile(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read and generate DOT binary telemetry files")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('summary', help="Aggregate tick statistics")
+    p.add_argument('path')
+    p.add_argument('--frames', help="Frame range START:STOP (either side optional)")
+    p.add_argument('--json', action='store_true', help="Print the summary as JSON")
+
+    p = sub.add_parser('generate', help="Write a synthetic telemetry file")
+    p.add_argument('path')
+    p.add_argument('--records', type=int, default=1_000_000)
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--nomad', action='store_true', help="Set the Nomad flag in the header")
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        start = time.perf_counter()
+        generate(args.path, args.records, seed=args.seed, flags=FLAG_NOMAD if args.nomad else 0)
+        size = os.path.getsize(args.path)
+        print(f"Wrote {args.records:,} records ({size / 1e6:.1f} MB) to {args.path} "
+              f"in {time.perf_counter() - start:.1f}s")
+        return
+
+    try:
+        records = open_telemetry(args.path)
+    except (OSError, TelemetryFormatError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.frames:
+        lo, _, hi = args.frames.partition(':')
+        records = frame_slice(records, int(lo) if lo else None, int(hi) if hi else None)
+
+    start = time.perf_counter()
+    summary = summarize(records)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary, args.path)
+        print(f"  ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Closed-form time-to-kill matrix for the full preset cross-product.
+
+A single bleed effect with a fixed stack count is deterministic: it ticks
+every F frames (the first frame whose accumulated float32 delta time
+reaches TickInterval) and expires after E frames (RemainingDuration <= 0),
+so it fires floor((E - 1) / F) ticks of DamagePerTick * stacks * type
+multiplier. F and E are found once per distinct interval/duration by
+replaying BleedEffect.Update's float32 accumulation, then every
+damage x duration x frequency x chance x zone x damage type x stack count
+combination is evaluated in one broadcast NumPy pass.
+
+Columns per combination:
+  tick_damage, tick_interval, ticks   one application at this stack count
+  dot_damage                          total damage of that application
+  expected_damage                     dot_damage x chance (per qualifying hit)
+  dps                                 tick_damage / tick_interval while bleeding
+  ttk_sustained                       seconds to kill a --health target once the
+                                      bleed has applied, if it is kept refreshed
+                                      at this stack count; inf at chance 0
+  ttk_single                          same, but inf unless one application is
+                                      enough
+
+Both TTK columns are conditional on the bleed applying: chance only makes
+them inf when it is 0 (Chance=Off), it does not lengthen them.
+  reachable                           stacks <= the zone's default stack limit
+
+Usage:
+    python ttk_matrix.py                                 # summary + timing
+    python ttk_matrix.py --damage High --frequency Rapid --zone Throat
+    python ttk_matrix.py --out ttk.csv                   # or ttk.parquet (needs pyarrow)
+"""
+
+import argparse
+import csv
+import math
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from preset_tables import (
+    ZONES,
+    DAMAGE_PRESETS, DAMAGE_VALUES,
+    DURATION_PRESETS, DURATION_VALUES,
+    FREQUENCY_PRESETS, FREQUENCY_VALUES,
+    CHANCE_PRESETS, CHANCE_VALUES,
+    STACK_LIMITS,
+    DAMAGE_TYPES, DAMAGE_TYPE_MULTIPLIERS,
+)
+
+DEFAULT_HZ = 90
+DEFAULT_HEALTH = 100.0  # Target health used for TTK
+
+# Axis order of the broadcast result
+AXES = ['damage', 'duration', 'frequency', 'chance', 'zone', 'damage_type', 'stacks']
+
+METRICS = ['tick_damage', 'tick_interval', 'ticks', 'dot_damage', 'expected_damage',
+           'dps', 'ttk_sustained', 'ttk_single', 'reachable']
+
+
+def default_tables():
+    return {
+        'Damage': DAMAGE_VALUES,
+        'Duration': DURATION_VALUES,
+        'Frequency': FREQUENCY_VALUES,
+        'Chance': CHANCE_VALUES,
+    }
+
+
+def _zone_table(values, zones):
+    return np.array([values[zone] for zone in zones], dtype=np.float64)  # (zones, 5)
+
+
+def frames_to_reach(seconds, hz):
+    """Updates until a float32 accumulator of 1/hz steps reaches each value.
+
+    Mirrors TimeSinceLastTick += deltaTime; tick when >= TickInterval.
+    """
+    seconds = np.asarray(seconds, dtype=np.float32)
+    limit = int(math.ceil(float(seconds.max()) * hz)) + 2
+    elapsed = np.cumsum(np.full(limit, np.float32(1.0 / hz), dtype=np.float32))  # Sequential float32 adds
+    return np.searchsorted(elapsed, seconds, side='left') + 1
+
+
+def frames_until_expired(durations, hz):
+    """Updates until RemainingDuration -= deltaTime reaches <= 0 (float32)."""
+    durations = np.asarray(durations, dtype=np.float32)
+    unique, inverse = np.unique(durations, return_inverse=True)
+    limit = int(math.ceil(float(unique.max()) * hz)) + 2
+    steps = np.full((len(unique), limit + 1), np.float32(1.0 / hz), dtype=np.float32)
+    steps[:, 0] = unique
+    remaining = np.subtract.accumulate(steps, axis=1)  # Sequential float32 subtracts
+    return np.argmax(remaining <= 0, axis=1)[inverse].reshape(durations.shape)
+
+
+def compute(zones=ZONES, tables=None, hz=DEFAULT_HZ, health=DEFAULT_HEALTH,
+            multipliers=None, stack_limits=None, max_stacks=None, metrics=METRICS):
+    """Evaluate every combination; returns a dict of arrays shaped like AXES.
+
+    Results are broadcast views where possible; only the requested metrics
+    are computed. hz <= 0 uses continuous time (ticks at exact multiples of
+    the interval).
+    """
+    tables = tables or default_tables()
+    multipliers = multipliers or DAMAGE_TYPE_MULTIPLIERS
+    stack_limits = stack_limits or STACK_LIMITS
+    limits = np.array([stack_limits.get(zone, 1) for zone in zones])
+    max_stacks = max_stacks or int(limits.max())
+
+    damage = _zone_table(tables['Damage'], zones).T       # (5, zones)
+    duration = _zone_table(tables['Duration'], zones).T
+    frequency = _zone_table(tables['Frequency'], zones).T
+    chance = _zone_table(tables['Chance'], zones).T / 100.0
+
+    if hz and hz > 0:
+        tick_frames = frames_to_reach(frequency, hz)
+        expiry_frames = frames_until_expired(duration, hz)
+        interval = tick_frames / hz                                   # (freq, zones)
+        # Tick k fires on update k * F if the effect has not expired by then
+        dur_frames = expiry_frames[:, None, :]                        # (dur, 1, zones)
+        ticks = (dur_frames - 1) // tick_frames[None, :, :]           # (dur, freq, zones)
+    else:
+        interval = frequency
+        ticks = (np.ceil(duration[:, None, :] / frequency[None, :, :] - 1e-9) - 1).astype(np.int64)
+
+    type_mult = np.array([multipliers[t] for t in DAMAGE_TYPES])
+    stacks = np.arange(1, max_stacks + 1)
+
+    # Broadcast shapes follow AXES: (damage, duration, frequency, chance, zone, type, stacks)
+    tick_damage = (damage[:, None, None, None, :, None, None]
+                   * type_mult[None, None, None, None, None, :, None]
+                   * stacks[None, None, None, None, None, None, :])
+    ticks = ticks[None, :, :, None, :, None, None]
+    interval = interval[None, None, :, None, :, None, None]
+    chance = chance[None, None, None, :, :, None, None]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Chance 0 never applies the bleed, so it never kills
+        needed = np.where((tick_damage > 0) & (chance > 0), np.ceil(health / tick_damage - 1e-9), np.inf)
+
+    shape = (len(DAMAGE_PRESETS), len(DURATION_PRESETS), len(FREQUENCY_PRESETS), len(CHANCE_PRESETS),
+             len(zones), len(DAMAGE_TYPES), max_stacks)
+    builders = {
+        'tick_damage': lambda: tick_damage,
+        'tick_interval': lambda: interval,
+        'ticks': lambda: ticks,
+        'dot_damage': lambda: ticks * tick_damage,
+        'expected_damage': lambda: ticks * tick_damage * chance,
+        'dps': lambda: tick_damage / interval,
+        'ttk_sustained': lambda: needed * interval,
+        'ttk_single': lambda: np.where(needed <= ticks, needed * interval, np.inf),
+        'reachable': lambda: (stacks[None, None, None, None, None, None, :]
+                              <= limits[None, None, None, None, :, None, None]),
+    }
+    return {name: np.broadcast_to(builders[name](), shape) for name in metrics}
+
+
+def axis_labels(zones=ZONES, max_stacks=None):
+    max_stacks = max_stacks or max(STACK_LIMITS.values())
+    return {
+        'damage': DAMAGE_PRESETS,
+        'duration': DURATION_PRESETS,
+        'frequency': FREQUENCY_PRESETS,
+        'chance': CHANCE_PRESETS,
+        'zone': list(zones),
+        'damage_type': DAMAGE_TYPES,
+        'stacks': list(range(1, max_stacks + 1)),
+    }
+
+
+def flatten(result, labels, selection=None):
+    """Long-format columns: one row per combination, coordinate columns first.
+
+    selection maps an axis name to the indices to keep.
+    """
+    index = tuple(np.asarray(selection.get(axis, range(len(labels[axis]))))
+                  for axis in AXES) if selection else None
+    if index is not None:
+        result = {k: v[np.ix_(*index)] for k, v in result.items()}
+    shape = result['ticks'].shape
+    coords = np.indices(shape).reshape(len(AXES), -1)
+    columns = {}
+    for axis, idx in zip(AXES, coords):
+        values = np.asarray(labels[axis], dtype=object)
+        if index is not None:
+            values = values[index[AXES.index(axis)]]
+        columns[axis] = values[idx]
+    for name in METRICS:
+        columns[name] = np.ascontiguousarray(result[name]).reshape(-1)
+    return columns
+
+
+def write_csv(columns, path):
+    names = list(columns)
+    rows = zip(*(columns[n].tolist() for n in names))
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        writer.writerows(rows)
+
+
+def write_parquet(columns, path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("Error: pyarrow not installed. Run: pip install pyarrow")
+        sys.exit(1)
+    table = pa.table({name: (col.tolist() if col.dtype == object else col) for name, col in columns.items()})
+    pq.write_table(table, path)
+
+
+def workbook_rows(zones=ZONES, tables=None, hz=DEFAULT_HZ, health=DEFAULT_HEALTH):
+    """Yield rows for the PRESETS.xlsx 'Time To Kill' sheet, header first.
+
+    Sustained TTK per damage type at Default duration and 1 stack, for every
+    zone x damage preset x frequency preset.
+    """
+    result = compute(zones, tables, hz=hz, health=health, max_stacks=1, metrics=['ttk_sustained'])
+    # Default duration/chance; a non-zero chance does not affect TTK
+    ttk = result['ttk_sustained'][:, 2, :, 2, :, :, 0]  # (damage, frequency, zone, type)
+    yield ["Zone", "Damage", "Frequency"] + DAMAGE_TYPES
+    for z, zone in enumerate(zones):
+        for d, damage in enumerate(DAMAGE_PRESETS):
+            for f, frequency in enumerate(FREQUENCY_PRESETS):
+                yield [zone, damage, frequency] + [_format_seconds(v) for v in ttk[d, f, z].tolist()]
+
+
+def _format_seconds(value):
+    return "never" if math.isinf(value) else f"{value:.1f}s"
+
+
+def _parse_filter(arg, labels):
+    if not arg:
+        return None
+    lookup = {str(label).replace(' ', '').lower(): i for i, label in enumerate(labels)}
+    indices = []
+    for part in arg.split(','):
+        key = part.strip().replace(' ', '').lower()
+        if key not in lookup:
+            raise ValueError(f"Unknown value '{part}'. Expected one of: {', '.join(map(str, labels))}")
+        indices.append(lookup[key])
+    return indices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Closed-form TTK/DPS matrix over all preset combinations.")
+    for axis in AXES:
+        parser.add_argument(f"--{axis.replace('_', '-')}", default='', help=f"Filter {axis} (comma separated)")
+    parser.add_argument('--health', type=float, default=DEFAULT_HEALTH, help="Target health for TTK")
+    parser.add_argument('--hz', type=int, default=DEFAULT_HZ, help="Frame rate; 0 = continuous time")
+    parser.add_argument('--out', default='', help="Write the table to .csv or .parquet")
+    parser.add_argument('--limit', type=int, default=20, help="Rows to print (fastest TTK first)")
+    args = parser.parse_args()
+
+    labels = axis_labels()
+    try:
+        selection = {axis: idx for axis in AXES
+                     if (idx := _parse_filter(getattr(args, axis), labels[axis])) is not None}
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    result = compute(hz=args.hz, health=args.health)
+    compute_ms = (time.perf_counter() - start) * 1000
+    columns = flatten(result, labels, selection)
+    total = result['ticks'].size
+    print(f"Evaluated {total:,} combinations in {compute_ms:.1f} ms "
+          f"({args.hz or 'continuous'} Hz, {args.health:g} HP target); {len(columns['ticks']):,} selected")
+
+    if args.out:
+        if os.path.splitext(args.out)[1].lower() == '.parquet':
+            write_parquet(columns, args.out)
+        else:
+            write_csv(columns, args.out)
+        print(f"Wrote {args.out}")
+
+    order = np.lexsort((columns['dps'] * -1, columns['ttk_sustained']))
+    order = order[columns['reachable'][order]][:args.limit]
+    print(f"\n{'damage':<8} {'duration':<10} {'frequency':<9} {'chance':<8} {'zone':<13} {'type':<9} {'stk':>3} "
+          f"{'tick':>6} {'every':>6} {'ticks':>5} {'DPS':>7} {'exp dmg':>8} {'TTK':>7} {'1 app':>7}")
+    for i in order:
+        print(f"{columns['damage'][i]:<8} {columns['duration'][i]:<10} {columns['frequency'][i]:<9} "
+              f"{columns['chance'][i]:<8} {columns['zone'][i]:<13} {columns['damage_type'][i]:<9} "
+              f"{columns['stacks'][i]:>3} {columns['tick_damage'][i]:>6.2f} {columns['tick_interval'][i]:>5.2f}s "
+              f"{int(columns['ticks'][i]):>5} {columns['dps'][i]:>7.2f} {columns['expected_damage'][i]:>8.1f} "
+              f"{_format_seconds(columns['ttk_sustained'][i]):>7} {_format_seconds(columns['ttk_single'][i]):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Blood VFX cost model for BleedEffect's refresh/respawn cadence.
+
+Every live BleedEffect calls RefreshBloodEffect (EffectInstance.SetIntensity)
+each EFFECT_REFRESH_INTERVAL, and RespawnBloodEffect (End + EffectData.Spawn)
+each EFFECT_RESPAWN_INTERVAL unless it is in its last FADE_OUT_DURATION;
+OnStackAdded refreshes once more per stack. This predicts, for every
+Damage x Duration x Chance x BloodAmount preset combination at once:
+
+  - EffectData.Spawn calls per second (first spawn + respawns)
+  - SetIntensity calls per frame
+  - concurrent EffectInstances (current + ended ones still fading out)
+  - mean CalculateBloodIntensity (stacks, zone multiplier, BloodAmount,
+    fade-out, clamped to MIN/MAX_BLOOD_INTENSITY)
+
+and flags the combinations whose frame cost exceeds a budget. Pass several
+--refresh/--respawn values to sweep the intervals themselves.
+
+The model is closed form rather than simulated. Each hit resets an effect's
+remaining duration to at least D, so a (creature, zone) effect is live
+exactly when a hit passed its chance roll within the last D seconds: with
+passing hits arriving at rate r, P(live) = 1 - exp(-rD), new effects start
+at r * exp(-rD), and the stack count of a live effect is geometric, capped
+at the zone's StackLimit. Intervals are quantized to whole frames the way
+the float32 timers in BleedEffect.Update fire. Peaks are mean + --sigma
+standard deviations over independent creatures and zones; effects created
+in the same frame stay in phase, which this does not model. Creatures are
+immortal (worst case, like bleed_sim.py). Frequency presets do not touch
+the VFX path and are not an axis.
+
+The per-call costs are placeholders: measure them on the target device
+(e.g. with the Unity profiler on Quest) and pass them in.
+
+Usage:
+    python vfx_cost.py
+    python vfx_cost.py --creatures 4,8,16 --budget-ms 0.5 --top 20
+    python vfx_cost.py --blood Default,Extreme --refresh 0.1,0.2,0.3 --respawn 0.8,1.2,1.6
+    python vfx_cost.py --hz 72,90 --json vfx_cost.json
+"""
+
+import argparse
+import itertools
+import json
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from bleed_sim import DEFAULT_ZONE_WEIGHTS, FADE_OUT_DURATION, parse_preset_list, parse_weights
+from preset_tables import (
+    ZONES,
+    DAMAGE_PRESETS, DAMAGE_VALUES,
+    DURATION_PRESETS, DURATION_VALUES,
+    CHANCE_PRESETS, CHANCE_VALUES,
+    STACK_LIMITS,
+    BLOOD_AMOUNT_PRESETS, BLOOD_AMOUNT_MULTIPLIERS,
+)
+
+# Mirrors BleedEffect
+EFFECT_REFRESH_INTERVAL = 0.1
+EFFECT_RESPAWN_INTERVAL = 0.8
+INTENSITY_BASE_DIVISOR = 5.0
+MIN_BLOOD_INTENSITY = 0.05
+MAX_BLOOD_INTENSITY = 5.0
+ZONE_INTENSITY_MULTIPLIERS = {
+    'Throat': 1.5,
+    'Head': 1.2,
+    'Neck': 1.3,
+    'Torso': 1.0,
+    'Arm': 0.7,
+    'Leg': 0.8,
+    'Dismemberment': 2.0,
+}
+
+DEFAULT_HZ = [72]                   # Quest
+DEFAULT_CREATURES = [1, 4, 8, 16]   # Bleeding creatures in view
+DEFAULT_LINGER = 1.0                # Seconds an ended instance keeps its particles
+DEFAULT_BUDGET_MS = 1.0
+DEFAULT_SIGMA = 3.0
+FADE_SAMPLES = 16
+
+# Placeholder per-call costs in microseconds; calibrate on device
+DEFAULT_COST_SPAWN_US = 60.0        # EffectData.Spawn + Play (pooled)
+DEFAULT_COST_INTENSITY_US = 4.0     # EffectInstance.SetIntensity
+DEFAULT_COST_INSTANCE_US = 3.0      # Per live instance per frame, per unit intensity
+
+# (axis name, preset labels)
+PRESET_AXES = [
+    ('damage', DAMAGE_PRESETS),
+    ('duration', DURATION_PRESETS),
+    ('chance', CHANCE_PRESETS),
+    ('blood', BLOOD_AMOUNT_PRESETS),
+]
+
+
+# ========== MODEL ==========
+
+def build_params(combos):
+    """(combos, zones) float64 parameter arrays for each preset combination."""
+    combos = np.asarray(combos, dtype=np.intp).reshape(-1, len(PRESET_AXES))
+
+    def table(values):
+        return np.array([values[zone] for zone in ZONES], dtype=np.float64)  # (zones, 5)
+
+    return {
+        'damage': table(DAMAGE_VALUES)[:, combos[:, 0]].T,
+        'duration': table(DURATION_VALUES)[:, combos[:, 1]].T,
+        'chance': table(CHANCE_VALUES)[:, combos[:, 2]].T / 100.0,
+        'blood': np.asarray(BLOOD_AMOUNT_MULTIPLIERS, dtype=np.float64)[combos[:, 3]][:, None],
+        'zone_mult': np.array([ZONE_INTENSITY_MULTIPLIERS[zone] for zone in ZONES]),
+        'stack_limit': np.array([STACK_LIMITS[zone] for zone in ZONES], dtype=np.intp),
+    }
+
+
+def frames_per_interval(interval, hz):
+    """Frames between timer firings: a float32 accumulator of 1/hz reaching the interval."""
+    interval = np.asarray(interval, dtype=np.float32)
+    dt = (np.float32(1.0) / np.asarray(hz, dtype=np.float32)).astype(np.float32)
+    interval, dt = np.broadcast_arrays(interval, dt)
+    elapsed = np.zeros(interval.shape, dtype=np.float32)
+    frames = np.zeros(interval.shape, dtype=np.int64)
+    pending = np.ones(interval.shape, dtype=bool)
+    while pending.any():
+        elapsed = np.where(pending, (elapsed + dt).astype(np.float32), elapsed)
+        frames += pending
+        pending &= elapsed < interval
+    return frames
+
+
+def zone_state(params, hit_rate, zone_weights):
+    """Per (combo, zone) steady-state probabilities and rates for one creature."""
+    rate = hit_rate * zone_weights[None, :] * params['chance']   # passing hits/s
+    duration = params['duration']
+    steady_duration = np.maximum(duration - FADE_OUT_DURATION, 0.0)
+    p_live = -np.expm1(-rate * duration)
+    p_steady = -np.expm1(-rate * steady_duration)               # live, not fading
+    return {
+        'rate': rate,
+        'p_live': p_live,
+        'p_steady': p_steady,
+        'p_fade': p_live - p_steady,
+        'new_per_s': rate * np.exp(-rate * duration),
+        'stack_per_s': rate * p_live,
+    }
+
+
+def mean_intensity(params, state):
+    """Mean CalculateBloodIntensity of a live effect, per (combo, zone)."""
+    max_limit = int(params['stack_limit'].max())
+    stacks = np.arange(1, max_limit + 1, dtype=np.float64)                 # (S,)
+    q = state['p_live'][..., None]                                         # previous gap < D
+    limit = params['stack_limit'][None, :, None]
+    # Hits since the effect was created, counted back from now: geometric, capped at StackLimit
+    p_stacks = np.where(stacks < limit, q ** (stacks - 1) * (1 - q),
+                        np.where(stacks == limit, q ** (stacks - 1), 0.0))
+    base = (stacks * params['damage'][..., None] * params['zone_mult'][None, :, None]
+            / INTENSITY_BASE_DIVISOR * params['blood'][..., None])          # (K, Z, S)
+    steady = (p_stacks * np.clip(base, MIN_BLOOD_INTENSITY, MAX_BLOOD_INTENSITY)).sum(axis=-1)
+    fade = (np.arange(FADE_SAMPLES) + 0.5) / FADE_SAMPLES                  # remaining / FADE_OUT_DURATION
+    faded = np.clip(base[..., None] * fade, MIN_BLOOD_INTENSITY, MAX_BLOOD_INTENSITY).mean(axis=-1)
+    fading = (p_stacks * faded).sum(axis=-1)
+    p_live = state['p_live']
+    weighted = state['p_steady'] * steady + state['p_fade'] * fading
+    return np.divide(weighted, p_live, out=np.zeros_like(p_live), where=p_live > 0)
+
+
+def cost_model(params, hit_rate, zone_weights, hz, creatures, refresh, respawn,
+               linger=DEFAULT_LINGER, costs=None, sigma=DEFAULT_SIGMA):
+    """
+    Per-frame VFX load for every combination of the given axes.
+
+    Returns arrays shaped (combos, hz, refresh, respawn, creatures).
+    costs: (spawn_us, intensity_us, instance_us); defaults to the placeholders.
+    """
+    spawn_us, intensity_us, instance_us = costs or (
+        DEFAULT_COST_SPAWN_US, DEFAULT_COST_INTENSITY_US, DEFAULT_COST_INSTANCE_US)
+    state = zone_state(params, hit_rate, zone_weights)
+    intensity = mean_intensity(params, state)
+
+    # Axes: K combos, Z zones | H hz, R refresh, S respawn, C creatures
+    hz = np.asarray(hz, dtype=np.float64)[:, None, None]
+    refresh_frames = frames_per_interval(np.asarray(refresh)[None, :, None], hz)  # (H, R, 1)
+    respawn_frames = frames_per_interval(np.asarray(respawn)[None, None, :], hz)  # (H, 1, S)
+    n = np.asarray(creatures, dtype=np.float64)
+
+    def per_zone(x):
+        return x[:, :, None, None, None]                    # (K, Z, 1, 1, 1)
+
+    p_live, p_steady = per_zone(state['p_live']), per_zone(state['p_steady'])
+    new_per_s, stack_per_s = per_zone(state['new_per_s']), per_zone(state['stack_per_s'])
+    respawn_per_s = p_steady * hz / respawn_frames
+    spawn_per_s = new_per_s + respawn_per_s
+    intensity_per_s = p_live * hz / refresh_frames + stack_per_s
+    # Little's law: ended instances (respawned or released) linger for `linger` seconds
+    instances = p_live + (respawn_per_s + new_per_s) * linger
+
+    # Per creature and frame: Bernoulli per zone, independent across zones and creatures
+    spawn_pf = spawn_per_s / hz
+    intensity_pf = intensity_per_s / hz
+
+    def total(x):
+        return x.sum(axis=1)[..., None] * n                 # (K, H, R, S, C)
+
+    def peak(p):
+        p = np.minimum(p, 1.0)
+        return total(p) + sigma * np.sqrt(total(p * (1 - p)))
+
+    instances_total = total(instances)
+    weighted_instances = total(instances * per_zone(intensity))
+    out = {
+        'live': total(p_live),
+        'live_peak': peak(p_live),
+        'spawn_per_s': total(spawn_per_s),
+        'spawn_pf': total(spawn_pf),
+        'spawn_pf_peak': peak(spawn_pf),
+        'intensity_pf': total(intensity_pf),
+        'intensity_pf_peak': peak(intensity_pf),
+        'instances': instances_total,
+        # An instance count per zone is not 0/1; treat the total as Poisson
+        'instances_peak': instances_total + sigma * np.sqrt(instances_total),
+        'intensity': np.divide(weighted_instances, instances_total,
+                               out=np.zeros_like(weighted_instances), where=instances_total > 0),
+    }
+    out['cost_ms'] = (out['spawn_pf'] * spawn_us + out['intensity_pf'] * intensity_us
+                      + weighted_instances * instance_us) / 1000.0
+    out['cost_peak_ms'] = (out['spawn_pf_peak'] * spawn_us + out['intensity_pf_peak'] * intensity_us
+                           + out['instances_peak'] * out['intensity'] * instance_us) / 1000.0
+    shape = np.broadcast_shapes(*(value.shape for value in out.values()))
+    return {key: np.broadcast_to(value, shape) for key, value in out.items()}
+
+
+# ========== REPORT ==========
+
+def combo_label(combo):
+    return ' / '.join(labels[i] for (_, labels), i in zip(PRESET_AXES, combo))
+
+
+def parse_list(arg, cast=float):
+    return [cast(part) for part in arg.split(',') if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model blood VFX spawn/refresh cost for every preset combination.")
+    parser.add_argument('--damage', default='all', help="Damage preset(s), comma separated or 'all'")
+    parser.add_argument('--duration', default='all', help="Duration preset(s), comma separated or 'all'")
+    parser.add_argument('--chance', default='all', help="Chance preset(s), comma separated or 'all'")
+    parser.add_argument('--blood', default='all', help="BloodAmount preset(s), comma separated or 'all'")
+    parser.add_argument('--hz', default=','.join(str(h) for h in DEFAULT_HZ), help="Frame rates, comma separated")
+    parser.add_argument('--creatures', default=','.join(str(c) for c in DEFAULT_CREATURES),
+                        help="Bleeding creature counts to evaluate, comma separated")
+    parser.add_argument('--hit-rate', type=float, default=0.5, help="Hits per creature per second")
+    parser.add_argument('--zone-weights', default='', help="e.g. Torso=0.5,Head=0.2 (others keep defaults)")
+    parser.add_argument('--refresh', default=str(EFFECT_REFRESH_INTERVAL),
+                        help="EFFECT_REFRESH_INTERVAL value(s) in seconds, comma separated")
+    parser.add_argument('--respawn', default=str(EFFECT_RESPAWN_INTERVAL),
+                        help="EFFECT_RESPAWN_INTERVAL value(s) in seconds, comma separated")
+    parser.add_argument('--linger', type=float, default=DEFAULT_LINGER,
+                        help="Seconds an ended instance keeps rendering particles")
+    parser.add_argument('--cost-spawn-us', type=float, default=DEFAULT_COST_SPAWN_US, help="Cost of one Spawn (placeholder)")
+    parser.add_argument('--cost-intensity-us', type=float, default=DEFAULT_COST_INTENSITY_US,
+                        help="Cost of one SetIntensity (placeholder)")
+    parser.add_argument('--cost-instance-us', type=float, default=DEFAULT_COST_INSTANCE_US,
+                        help="Per-frame cost of one live instance per unit intensity (placeholder)")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="Per-frame VFX budget")
+    parser.add_argument('--sigma', type=float, default=DEFAULT_SIGMA, help="Peak = mean + sigma * std")
+    parser.add_argument('--top', type=int, default=15, help="Over-budget rows to list")
+    parser.add_argument('--json', default='', help="Write every row to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        axes = [parse_preset_list(getattr(args, name), labels) for name, labels in PRESET_AXES]
+        zone_weights = parse_weights(args.zone_weights, ZONES, DEFAULT_ZONE_WEIGHTS)
+        rates = parse_list(args.hz, int)
+        creatures = parse_list(args.creatures, int)
+        refresh = parse_list(args.refresh)
+        respawn = parse_list(args.respawn)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    combos = list(itertools.product(*axes))
+    out = cost_model(build_params(combos), args.hit_rate, zone_weights, rates, creatures, refresh, respawn,
+                     args.linger, (args.cost_spawn_us, args.cost_intensity_us, args.cost_instance_us), args.sigma)
+    over = out['cost_peak_ms'] > args.budget_ms
+    refresh_frames = frames_per_interval(np.asarray(refresh)[None, :], np.asarray(rates)[:, None])
+    respawn_frames = frames_per_interval(np.asarray(respawn)[None, :], np.asarray(rates)[:, None])
+
+    print(f"{len(combos)} preset combination(s) x {len(rates)} frame rate(s) x {len(refresh)} refresh x "
+          f"{len(respawn)} respawn interval(s) x creatures {', '.join(str(c) for c in creatures)}; "
+          f"budget {args.budget_ms:g} ms/frame at mean + {args.sigma:g} sigma")
+    for h, hz in enumerate(rates):
+        print(f"  {hz} Hz: refresh every " + ", ".join(f"{r:g}s={f} frames" for r, f in zip(refresh, refresh_frames[h]))
+              + "; respawn every " + ", ".join(f"{r:g}s={f} frames" for r, f in zip(respawn, respawn_frames[h])))
+
+    print(f"\nOver budget: {int(over.sum())} of {over.size} rows")
+    blood_axis = np.array([combo[3] for combo in combos])
+    print(f"  {'creatures':>9} " + ' '.join(f"{BLOOD_AMOUNT_PRESETS[b]:>9}" for b in axes[3]))
+    rows_per_count = over[..., 0].size // len(axes[3])
+    for c, count in enumerate(creatures):
+        cells = [f"{int(over[blood_axis == b, ..., c].sum())}/{rows_per_count}" for b in axes[3]]
+        print(f"  {count:>9} " + ' '.join(f"{cell:>9}" for cell in cells))
+
+    if len(refresh) > 1 or len(respawn) > 1:
+        print("\nInterval sweep (over-budget combinations, all creature counts):")
+        print(f"  {'refresh':>8} " + ' '.join(f"{'respawn ' + format(r, 'g'):>12}" for r in respawn))
+        for r, value in enumerate(refresh):
+            print(f"  {value:>8g} " + ' '.join(f"{int(over[:, :, r, s, :].sum()):>12}" for s in range(len(respawn))))
+
+    rows = []
+    for index in zip(*np.nonzero(over)):
+        k, h, r, s, c = index
+        rows.append((float(out['cost_peak_ms'][index]), combos[k], rates[h], refresh[r], respawn[s], creatures[c], index))
+    rows.sort(key=lambda row: -row[0])
+    if rows and args.top:
+        print(f"\nMost expensive over-budget rows (top {min(args.top, len(rows))}):")
+        print(f"  {'Preset (dmg / dur / chance / blood)':<42} {'n':>3} {'Hz':>4} {'ref':>5} {'resp':>5} "
+              f"{'live':>6} {'spawn/s':>8} {'set/f':>6} {'inst':>6} {'int':>5} {'ms':>6} {'peak ms':>8}")
+        for cost, combo, hz, ref, resp, count, index in rows[:args.top]:
+            print(f"  {combo_label(combo):<42} {count:>3} {hz:>4} {ref:>5g} {resp:>5g} "
+                  f"{out['live'][index]:>6.1f} {out['spawn_per_s'][index]:>8.1f} {out['intensity_pf'][index]:>6.2f} "
+                  f"{out['instances'][index]:>6.1f} {out['intensity'][index]:>5.2f} {out['cost_ms'][index]:>6.3f} "
+                  f"{cost:>8.3f}")
+
+    if args.json:
+        keys = list(out)
+        results = []
+        for index in np.ndindex(over.shape):
+            k, h, r, s, c = index
+            results.append({
+                'presets': dict(zip([name for name, _ in PRESET_AXES],
+                                    [labels[j] for (_, labels), j in zip(PRESET_AXES, combos[k])])),
+                'hz': rates[h], 'refresh': refresh[r], 'respawn': respawn[s], 'creatures': creatures[c],
+                **{key: round(float(out[key][index]), 4) for key in keys},
+                'over_budget': bool(over[index]),
+            })
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
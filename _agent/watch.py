@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Watch mode: rebuild only the derived artifacts affected by a source change.
+
+Holds a dependency graph from inputs to generators to outputs:
+
+  preset_tables  _agent/preset_tables.py           -> Core/PresetTables.g.cs, _docs/PRESETS.md,
+                                                       _design/PRESETS.xlsx
+  option_graph   preset_tables.py, DOTModOptions.cs, -> Core/OptionGraph.g.cs
+                 DOTModOptionVisibility.cs
+  menu_mock      Configuration, Core, Hooks,        -> _design/MENU_MOCK.xlsx
+                 Integration *.cs
+  translations   _translations/_translations.csv    -> _translations/Texts/Text_*.json
+  builds         mod *.cs, DOT.csproj, manifest.json,-> builds/DOT-PCVR, builds/DOT-Nomad (+ zips)
+                 _translations/Texts/Text_*.json       (only with --builds; needs dotnet)
+
+Generators run in this process, so imported modules, the ModOption parse
+cache and the translation manifests stay warm between rebuilds. A burst of
+saves is debounced into one cycle; files whose content hash did not change
+(an editor touching mtime, a generator rewriting identical bytes) are
+ignored. Outputs that do change feed generators further down the graph in
+the same cycle (preset_tables -> PresetTables.g.cs -> menu_mock/builds).
+
+Change notification uses Linux inotify through ctypes and falls back to
+polling file stats (Windows, macOS, or --poll).
+
+Usage:
+    python watch.py                  # watch, rebuild xlsx/json on change
+    python watch.py --builds         # also rebuild and stage release builds
+    python watch.py --graph          # print the dependency graph and exit
+    python watch.py --poll --interval 0.5
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import fnmatch
+import glob
+import hashlib
+import importlib
+import os
+import select
+import struct
+import sys
+import time
+import traceback
+
+from registry import PROJECT_ROOT, TRANSLATIONS_DIR
+
+
+if TRANSLATIONS_DIR not in sys.path:
+    sys.path.insert(0, TRANSLATIONS_DIR)
+
+SOURCE_PATTERNS = ['Configuration/*.cs', 'Core/*.cs', 'Hooks/*.cs', 'Integration/*.cs']
+
+DEFAULT_DEBOUNCE = 0.15  # Quiet time that ends a burst of saves
+MAX_DEBOUNCE = 2.0       # Rebuild anyway if saves keep arriving this long
+DEFAULT_INTERVAL = 0.25  # Poll interval when inotify is unavailable
+
+
+# ========== GENERATORS ==========
+
+def run_preset_tables():
+    # preset_tables.py is the edited input, so it and its importers are reloaded
+    import preset_tables
+    import ttk_matrix
+    import build_presets_xlsx
+    import gen_preset_tables
+    for module in (preset_tables, ttk_matrix, build_presets_xlsx, gen_preset_tables):
+        importlib.reload(module)
+    errors = gen_preset_tables.validate()
+    if errors:
+        raise ValueError('; '.join(errors))
+    gen_preset_tables._write(gen_preset_tables.CS_PATH, gen_preset_tables.render_cs())
+    gen_preset_tables._write(gen_preset_tables.MD_PATH, gen_preset_tables.render_md())
+    build_presets_xlsx.create_xlsx(gen_preset_tables.XLSX_PATH)
+
+
+def run_option_graph():
+    import preset_tables
+    import gen_option_graph
+    for module in (preset_tables, gen_option_graph):
+        importlib.reload(module)
+    gen_option_graph._write(gen_option_graph.CS_PATH, gen_option_graph.render_cs(gen_option_graph.build_graph()))
+
+
+def run_menu_mock():
+    import build_menu_mock_xlsx as menu
+    menu.create_xlsx(menu.parse_mod_options(menu.MOD_OPTIONS_PATH), menu.OUTPUT_PATH)
+
+
+def run_translations():
+    import _build_translations
+    results = _build_translations.build()
+    _build_translations.print_results([r for r in results if r['status'] == 'written'])
+
+
+def run_builds():
+    import release_builder
+    release_builder.release(list(release_builder.CONFIGS))
+
+
+# name -> inputs (project-relative globs), outputs, run, enabled by default
+GENERATORS = {
+    'preset_tables': {
+        'inputs': ['_agent/preset_tables.py'],
+        'outputs': ['Core/PresetTables.g.cs', '_docs/PRESETS.md', '_design/PRESETS.xlsx'],
+        'run': run_preset_tables,
+        'default': True,
+    },
+    'option_graph': {
+        'inputs': ['_agent/preset_tables.py', 'Configuration/DOTModOptions.cs', 'Core/DOTModOptionVisibility.cs'],
+        'outputs': ['Core/OptionGraph.g.cs'],
+        'run': run_option_graph,
+        'default': True,
+    },
+    'menu_mock': {
+        'inputs': SOURCE_PATTERNS,
+        'outputs': ['_design/MENU_MOCK.xlsx'],
+        'run': run_menu_mock,
+        'default': True,
+    },
+    'translations': {
+        'inputs': ['_translations/_translations.csv'],
+        'outputs': ['_translations/Texts/Text_*.json'],
+        'run': run_translations,
+        'default': True,
+    },
+    'builds': {
+        'inputs': SOURCE_PATTERNS + ['DOT.csproj', 'manifest.json', '_translations/Texts/Text_*.json'],
+        'outputs': ['builds/DOT-*/DOT/*', 'builds/DOT-*.zip'],
+        'run': run_builds,
+        'default': False,
+    },
+}
+
+
+def _matches(path, patterns):
+    return any(fnmatch.fnmatchcase(path, p) for p in patterns)
+
+
+def build_order(generators):
+    """Generators sorted so every producer runs before the generators reading its outputs."""
+    feeds = {name: [other for other, o in generators.items()
+                    if other != name and any(_matches_pattern(out, o['inputs']) for out in g['outputs'])]
+             for name, g in generators.items()}
+    order, visiting, done = [], set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"dependency cycle through {name}")
+        visiting.add(name)
+        for downstream in feeds[name]:
+            visit(downstream)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in generators:
+        visit(name)
+    return order[::-1], feeds
+
+
+def _matches_pattern(output_pattern, input_patterns):
+    """True if files matching output_pattern can match one of input_patterns."""
+    probe = output_pattern.replace('*', 'x')
+    return _matches(probe, input_patterns) or any(fnmatch.fnmatchcase(p.replace('*', 'x'), output_pattern)
+                                                  for p in input_patterns)
+
+
+def print_graph(generators, enabled):
+    order, feeds = build_order(generators)
+    for name in order:
+        g = generators[name]
+        state = '' if name in enabled else '  (disabled)'
+        print(f"{name}{state}")
+        print(f"  inputs:  {', '.join(g['inputs'])}")
+        print(f"  outputs: {', '.join(g['outputs'])}")
+        if feeds[name]:
+            print(f"  feeds:   {', '.join(feeds[name])}")
+
+
+# ========== CHANGE TRACKING ==========
+
+def _rel(path):
+    return os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '/')
+
+
+def _hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None  # Deleted (or mid-replace)
+
+
+def input_patterns(generators):
+    return sorted({p for g in generators.values() for p in g['inputs']})
+
+
+def watched_patterns(generators):
+    """Inputs plus outputs: outputs are hashed too so regenerated files cascade."""
+    return sorted({p for g in generators.values() for p in g['inputs'] + g['outputs']})
+
+
+def expand(patterns):
+    """Project-relative paths currently matching the patterns."""
+    found = set()
+    for p in patterns:
+        found.update(_rel(f) for f in glob.glob(os.path.join(PROJECT_ROOT, p)))
+    return found
+
+
+class ContentIndex:
+    """Last known content hash per file, so no-op saves never trigger a rebuild."""
+
+    def __init__(self, patterns):
+        self.hashes = {path: _hash(os.path.join(PROJECT_ROOT, path)) for path in expand(patterns)}
+
+    def changed(self, paths):
+        """Subset of paths whose content differs from the last seen; updates the index."""
+        out = []
+        for path in sorted(paths):
+            digest = _hash(os.path.join(PROJECT_ROOT, path))
+            if self.hashes.get(path) != digest:
+                self.hashes[path] = digest
+                out.append(path)
+        return out
+
+
+# ========== WATCHERS ==========
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Directory watches via libc inotify; poll() returns changed relative paths."""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, patterns):
+        libc_name = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or not libc_name:
+            raise OSError("inotify needs Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._patterns = patterns
+        self._dirs = {}
+        for directory in sorted({os.path.dirname(p) for p in patterns}):
+            path = os.path.join(PROJECT_ROOT, directory)
+            if not os.path.isdir(path):
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+            self._dirs[wd] = directory
+        self.overflowed = False
+
+    def poll(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = f"{directory}/{name}" if directory else name
+            if _matches(path, self._patterns):
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Fallback: compare (mtime, size) of every matching file each interval."""
+
+    def __init__(self, patterns, interval=DEFAULT_INTERVAL):
+        self._patterns = patterns
+        self._interval = interval
+        self._stats = self._scan()
+        self.overflowed = False
+
+    def _scan(self):
+        stats = {}
+        for path in expand(self._patterns):
+            try:
+                st = os.stat(os.path.join(PROJECT_ROOT, path))
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def poll(self, timeout):
+        time.sleep(min(timeout, self._interval) if timeout is not None else self._interval)
+        stats = self._scan()
+        changed = {p for p in stats.keys() | self._stats.keys() if stats.get(p) != self._stats.get(p)}
+        self._stats = stats
+        return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(patterns, force_poll=False, interval=DEFAULT_INTERVAL):
+    if not force_poll:
+        try:
+            return InotifyWatcher(patterns), 'inotify'
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(patterns, interval), f"polling every {interval:g}s"
+
+
+# ========== REBUILD LOOP ==========
+
+class Rebuilder:
+    """Runs the generators affected by a set of changed files, in dependency order."""
+
+    def __init__(self, generators, enabled):
+        self.generators = generators
+        self.enabled = enabled
+        self.order, _ = build_order(generators)
+        self.index = ContentIndex(watched_patterns(generators))
+
+    def affected(self, paths):
+        return [name for name in self.order
+                if name in self.enabled and any(_matches(p, self.generators[name]['inputs']) for p in paths)]
+
+    def rebuild(self, paths, run_all=False):
+        """Run affected generators; outputs they change cascade downstream. Returns timings."""
+        pending = set(paths)
+        timings = []
+        for name in self.order:
+            g = self.generators[name]
+            if name not in self.enabled:
+                continue
+            if not run_all and not any(_matches(p, g['inputs']) for p in pending):
+                continue
+            start = time.perf_counter()
+            try:
+                g['run']()
+                ok = True
+            except Exception:
+                traceback.print_exc()
+                ok = False
+            timings.append((name, time.perf_counter() - start, ok))
+            # Whatever it wrote is now the known content; changed outputs feed
+            # later generators. Known paths are included to catch deletions.
+            outputs = expand(g['outputs']) | {p for p in self.index.hashes if _matches(p, g['outputs'])}
+            pending.update(self.index.changed(outputs))
+        return timings
+
+
+def _stamp():
+    return time.strftime('%H:%M:%S')
+
+
+def report(trigger, timings, elapsed):
+    if not timings:
+        return
+    parts = [f"{name} {seconds * 1000:.0f}ms{'' if ok else ' FAILED'}" for name, seconds, ok in timings]
+    label = ', '.join(trigger[:3]) + (f" (+{len(trigger) - 3})" if len(trigger) > 3 else '')
+    print(f"[{_stamp()}] {label} -> {'; '.join(parts)} [{elapsed * 1000:.0f}ms]", flush=True)
+
+
+def watch(rebuilder, watcher, debounce=DEFAULT_DEBOUNCE):
+    while True:
+        paths = watcher.poll(None)
+        if not paths and not watcher.overflowed:
+            continue
+        burst_start = time.perf_counter()
+        # Debounce: keep collecting until the tree has been quiet for `debounce`
+        while time.perf_counter() - burst_start < MAX_DEBOUNCE:
+            more = watcher.poll(debounce)
+            if not more:
+                break
+            paths |= more
+        if watcher.overflowed:
+            # Events were lost: rescan everything we track
+            watcher.overflowed = False
+            paths |= expand(watched_patterns(rebuilder.generators)) | set(rebuilder.index.hashes)
+        start = time.perf_counter()
+        changed = rebuilder.index.changed(paths)
+        if not changed:
+            continue
+        timings = rebuilder.rebuild(changed)
+        report(changed, timings, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild derived artifacts when their inputs change.")
+    parser.add_argument('--builds', action='store_true', help="Also rebuild and stage release builds (needs dotnet)")
+    parser.add_argument('--poll', action='store_true', help="Poll file stats instead of using inotify")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="Poll interval in seconds")
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE, help="Quiet seconds that end a burst")
+    parser.add_argument('--no-initial', action='store_true', help="Skip the catch-up run at startup")
+    parser.add_argument('--graph', action='store_true', help="Print the dependency graph and exit")
+    args = parser.parse_args()
+
+    enabled = {name for name, g in GENERATORS.items() if g['default'] or (name == 'builds' and args.builds)}
+    if args.graph:
+        print_graph(GENERATORS, enabled)
+        return
+
+    rebuilder = Rebuilder(GENERATORS, enabled)
+    if not args.no_initial:
+        # Every generator skips unchanged outputs, so this is cheap when up to date
+        start = time.perf_counter()
+        report(['startup'], rebuilder.rebuild([], run_all=True), time.perf_counter() - start)
+
+    watcher, mode = make_watcher(input_patterns(GENERATORS), args.poll, args.interval)
+    active = ', '.join(name for name in rebuilder.order if name in enabled)
+    print(f"Watching {len(expand(input_patterns(GENERATORS)))} inputs ({mode}); generators: {active}. Ctrl+C to stop.",
+          flush=True)
+    try:
+        watch(rebuilder, watcher, args.debounce)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
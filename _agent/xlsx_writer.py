@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Shared write-only workbook helpers for the _design/*.xlsx generators.
+
+Workbooks are built in openpyxl's write-only mode: rows are streamed to the
+sheet XML as they are appended, so time and memory stay flat as the row
+count grows. Formatting goes through a fixed set of named styles registered
+once per workbook instead of per-cell Font/Fill/Border objects.
+
+Each workbook stores a hash of its inputs (the rendered row data plus the
+generator's own source) as the custom document property SourceHash.
+save() compares against the hash already in the file and leaves the file
+untouched, byte for byte, when nothing changed. This keeps binary churn out
+of git when the generators are re-run. The hash read from each workbook is
+remembered in _agent/.cache/xlsx_hashes.json with the file's size and mtime,
+so an up-to-date check only opens the zip after the workbook itself changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+import profiling
+from registry import AGENT_DIR
+
+HASH_PROPERTY = "SourceHash"
+STAMPS_PATH = os.path.join(AGENT_DIR, ".cache", "xlsx_hashes.json")
+
+# openpyxl is only imported once a workbook is actually built (_load_openpyxl),
+# so the up-to-date check and --help stay cheap
+Workbook = WriteOnlyCell = StringProperty = NamedStyle = get_column_letter = None
+
+# Named styles shared by every generated workbook (built by _load_openpyxl)
+STYLES = {}
+
+
+def _load_openpyxl():
+    global Workbook, WriteOnlyCell, StringProperty, NamedStyle, get_column_letter
+    if Workbook is not None:
+        return
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.packaging.custom import StringProperty
+        from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+        from openpyxl.utils import get_column_letter
+    except ImportError:
+        print("Error: openpyxl not installed. Run: pip install openpyxl")
+        sys.exit(1)
+
+    thin = Side(style='thin')
+    box = Border(left=thin, right=thin, top=thin, bottom=thin)
+    center = Alignment(horizontal='center')
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    default_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Light green
+    STYLES.update({
+        'DOT Header': dict(font=Font(color="FFFFFF", bold=True), fill=header_fill, alignment=center),
+        'DOT Header Boxed': dict(font=Font(color="FFFFFF", bold=True), fill=header_fill, alignment=center, border=box),
+        'DOT Zone': dict(font=Font(bold=True), border=box),
+        'DOT Value': dict(alignment=center, border=box),
+        'DOT Default Value': dict(alignment=center, border=box, fill=default_fill),
+        'DOT Title': dict(font=Font(bold=True, size=14)),
+        'DOT Bold': dict(font=Font(bold=True)),
+    })
+
+
+_HASH_RE = re.compile(rf'name="{HASH_PROPERTY}"[^>]*>\s*<vt:lpwstr>([0-9a-f]+)</vt:lpwstr>')
+
+
+def new_workbook():
+    """Return a write-only workbook with the shared named styles registered."""
+    _load_openpyxl()
+    wb = Workbook(write_only=True)
+    for name, attrs in STYLES.items():
+        wb.add_named_style(NamedStyle(name=name, **attrs))
+    return wb
+
+
+def cell(ws, value, style=None):
+    """A streamed cell, optionally carrying one of the shared named styles."""
+    c = WriteOnlyCell(ws, value=value)
+    if style:
+        c.style = style
+    return c
+
+
+def set_widths(ws, widths):
+    """Set column widths; in write-only mode this must happen before any append()."""
+    for col, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+
+def source_hash(parts, generator_file):
+    """Hash of an iterable of JSON-serializable parts plus the generator's source.
+
+    Parts are serialized one at a time, so row generators can be hashed
+    without materializing the whole sheet.
+    """
+    h = hashlib.sha256()
+    for path in (generator_file, __file__):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    dumps = json.JSONEncoder(sort_keys=True, ensure_ascii=False, default=str).encode
+    for part in parts:
+        h.update(dumps(part).encode('utf-8'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+def _load_stamps():
+    try:
+        with open(STAMPS_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _remember(path, digest):
+    """Record digest as the hash of the workbook currently at path."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    stamps = _load_stamps()
+    stamps[os.path.abspath(path)] = [st.st_size, st.st_mtime_ns, digest]
+    os.makedirs(os.path.dirname(STAMPS_PATH), exist_ok=True)
+    tmp = f"{STAMPS_PATH}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(stamps, f)
+    os.replace(tmp, STAMPS_PATH)
+
+
+def stored_hash(path):
+    """The SourceHash property of an existing workbook, or None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    stamp = _load_stamps().get(os.path.abspath(path))
+    if stamp and stamp[:2] == [st.st_size, st.st_mtime_ns]:
+        return stamp[2]
+
+    import zipfile  # Imported here: only needed after the workbook changed on disk
+    try:
+        with zipfile.ZipFile(path) as z:
+            xml = z.read('docProps/custom.xml').decode('utf-8')
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    m = _HASH_RE.search(xml)
+    digest = m.group(1) if m else None
+    if digest:
+        _remember(path, digest)
+    return digest
+
+
+def is_current(path, digest):
+    return stored_hash(path) == digest
+
+
+@profiling.traced('save xlsx')
+def save(wb, path, digest):
+    """Stamp the source hash and write the workbook atomically."""
+    import tempfile
+    wb.custom_doc_props.append(StringProperty(name=HASH_PROPERTY, value=digest))
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.xlsx.tmp')
+    os.close(fd)
+    try:
+        wb.save(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    _remember(path, digest)
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Python reference port of Core/ZoneDetector.cs for replaying recorded hits.
+
+Classifies batches of hit samples with NumPy, mirroring the C# precedence:
+sliced -> Dismemberment, then Head, Neck (Throat or Neck), Torso, Arm
+(arms and hands), Leg (legs and feet), else Unknown. A sample is
+
+  part_type  RagdollPart.Type flags of the hit part
+  sliced     isSliced || part.isSliced
+  x, y, z    hit point relative to the neck bone, in the neck's local
+             space (x right, y up, z forward = the creature's facing), metres
+
+Zone rules (compared pairwise as confusion matrices):
+  part_type      GetZoneFromPartType: neck hits are always Neck
+  get_zone       GetZone as shipped: IsThroatHit is a 50% Random.value roll,
+                 drawn only for neck hits (seeded here, so runs are
+                 reproducible)
+  throat_cone    GetZone with a positional throat test: the hit lies within
+                 --cone degrees of forward in the horizontal plane
+  throat_front   cheaper positional test: any hit in front of the neck (z > 0),
+                 a single compare with no square root
+
+`golden` writes DOT.Tests/Golden/zone_from_part_type.csv: GetZoneFromPartType
+over every combination of up to three part flags, both sliced states, the
+empty mask and the full humanoid mask. Part types are written by name, so
+ZoneDetectorGoldenTests parses them with Enum.Parse rather than trusting the
+flag values below.
+
+Usage:
+    python zone_detector.py compare --synthetic 1000000
+    python zone_detector.py compare --samples hits.csv --cone 45
+    python zone_detector.py golden
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from registry import BODY_ZONES, PROJECT_ROOT  # noqa: E402
+
+GOLDEN_PATH = os.path.join(PROJECT_ROOT, "DOT.Tests", "Golden", "zone_from_part_type.csv")
+
+# ThunderRoad RagdollPart.Type (humanoid flags)
+PART_TYPES = {
+    'Head': 1 << 0,
+    'Neck': 1 << 1,
+    'Torso': 1 << 2,
+    'LeftArm': 1 << 3,
+    'RightArm': 1 << 4,
+    'LeftHand': 1 << 5,
+    'RightHand': 1 << 6,
+    'LeftLeg': 1 << 7,
+    'RightLeg': 1 << 8,
+    'LeftFoot': 1 << 9,
+    'RightFoot': 1 << 10,
+}
+HEAD = PART_TYPES['Head']
+NECK = PART_TYPES['Neck']
+TORSO = PART_TYPES['Torso']
+ARM_MASK = PART_TYPES['LeftArm'] | PART_TYPES['RightArm'] | PART_TYPES['LeftHand'] | PART_TYPES['RightHand']
+LEG_MASK = PART_TYPES['LeftLeg'] | PART_TYPES['RightLeg'] | PART_TYPES['LeftFoot'] | PART_TYPES['RightFoot']
+
+# classify() returns indices into this (registry.BODY_ZONES order)
+ZONE_NAMES = list(BODY_ZONES)
+ZONE_INDEX = {name: i for i, name in enumerate(ZONE_NAMES)}
+
+HIT_DTYPE = np.dtype([
+    ('part_type', '<u4'),
+    ('sliced', 'u1'),
+    ('x', '<f4'),
+    ('y', '<f4'),
+    ('z', '<f4'),
+])
+
+DEFAULT_CONE = 60.0  # Half-angle of the throat cone, degrees
+
+# Synthetic hit mix: (part name, share of hits)
+SYNTHETIC_PARTS = [
+    ('Torso', 0.34), ('Head', 0.09), ('Neck', 0.08),
+    ('LeftArm', 0.08), ('RightArm', 0.10), ('LeftHand', 0.03), ('RightHand', 0.04),
+    ('LeftLeg', 0.08), ('RightLeg', 0.08), ('LeftFoot', 0.03), ('RightFoot', 0.03),
+    ('None', 0.02),
+]
+SLICED_SHARE = 0.04
+NECK_RADIUS = 0.06
+
+
+# ========== CLASSIFICATION ==========
+
+def classify(part_type, sliced, throat):
+    """Zone index (into ZONE_NAMES) per sample; throat is a bool array or False."""
+    part_type = np.asarray(part_type, dtype=np.uint32)
+    neck_zone = np.where(throat, ZONE_INDEX['Throat'], ZONE_INDEX['Neck'])
+    zones = np.select(
+        [np.asarray(sliced, dtype=bool),
+         (part_type & HEAD) != 0,
+         (part_type & NECK) != 0,
+         (part_type & TORSO) != 0,
+         (part_type & ARM_MASK) != 0,
+         (part_type & LEG_MASK) != 0],
+        [ZONE_INDEX['Dismemberment'], ZONE_INDEX['Head'], neck_zone,
+         ZONE_INDEX['Torso'], ZONE_INDEX['Arm'], ZONE_INDEX['Leg']],
+        default=ZONE_INDEX['Unknown'])
+    return zones.astype(np.uint8)
+
+
+def throat_random(samples, rng):
+    # Random.value > 0.5f, rolled only for the hits GetZone sends to IsThroatHit
+    part_type = samples['part_type']
+    neck = ~samples['sliced'].astype(bool) & ((part_type & HEAD) == 0) & ((part_type & NECK) != 0)
+    throat = np.zeros(len(samples), dtype=bool)
+    throat[neck] = rng.random(int(neck.sum()), dtype=np.float32) > 0.5
+    return throat
+
+
+def throat_cone(samples, cone=DEFAULT_CONE):
+    x, z = samples['x'], samples['z']
+    cos = np.float32(np.cos(np.radians(cone)))
+    # z / |(x, z)| >= cos(cone), without dividing: z >= 0 and z^2 >= cos^2 (x^2 + z^2)
+    return (z > 0) & (z * z >= cos * cos * (x * x + z * z))
+
+
+def throat_front(samples):
+    return samples['z'] > 0
+
+
+def zone_rules(cone=DEFAULT_CONE, seed=0):
+    """name -> function(samples) -> zone indices."""
+    return {
+        'part_type': lambda s: classify(s['part_type'], s['sliced'], False),
+        'get_zone': lambda s: classify(s['part_type'], s['sliced'], throat_random(s, np.random.default_rng(seed))),
+        'throat_cone': lambda s: classify(s['part_type'], s['sliced'], throat_cone(s, cone)),
+        'throat_front': lambda s: classify(s['part_type'], s['sliced'], throat_front(s)),
+    }
+
+
+def confusion(a, b, size=len(ZONE_NAMES)):
+    """size x size counts: rows are rule a's zone, columns rule b's."""
+    return np.bincount(a.astype(np.int64) * size + b, minlength=size * size).reshape(size, size)
+
+
+# ========== SAMPLES ==========
+
+def synthetic_samples(count, rng):
+    """Hits with a plausible part mix; neck hits land around the neck at random angles."""
+    names = [p for p, _ in SYNTHETIC_PARTS]
+    weights = np.array([w for _, w in SYNTHETIC_PARTS])
+    flags = np.array([PART_TYPES.get(p, 0) for p in names], dtype=np.uint32)
+    samples = np.empty(count, dtype=HIT_DTYPE)
+    samples['part_type'] = flags[rng.choice(len(names), size=count, p=weights / weights.sum())]
+    samples['sliced'] = rng.random(count) < SLICED_SHARE
+    angle = rng.uniform(-np.pi, np.pi, size=count).astype(np.float32)
+    radius = NECK_RADIUS * (1 + 0.2 * rng.standard_normal(count)).astype(np.float32)
+    samples['x'] = radius * np.sin(angle)
+    samples['z'] = radius * np.cos(angle)
+    samples['y'] = rng.normal(0.0, 0.03, size=count)
+    return samples
+
+
+def load_samples(path):
+    """Hit samples from .npy (HIT_DTYPE records) or CSV (part_type,sliced,x,y,z with a header)."""
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+        if data.dtype != HIT_DTYPE:
+            raise ValueError(f"{path}: dtype {data.dtype} is not {HIT_DTYPE}")
+        return data
+    raw = np.loadtxt(path, delimiter=',', skiprows=1, ndmin=2)
+    samples = np.empty(len(raw), dtype=HIT_DTYPE)
+    for i, name in enumerate(HIT_DTYPE.names):
+        samples[name] = raw[:, i]
+    return samples
+
+
+# ========== REPORTING ==========
+
+def print_confusion(name_a, name_b, matrix):
+    used = [i for i in range(len(ZONE_NAMES)) if matrix[i].any() or matrix[:, i].any()]
+    total = matrix.sum()
+    agree = np.trace(matrix)
+    print(f"\n{name_a} (rows) vs {name_b} (columns): "
+          f"{agree / total * 100 if total else 100:.2f}% agree, {total - agree:,} differ")
+    print(f"  {'':<14}" + ''.join(f"{ZONE_NAMES[j]:>14}" for j in used))
+    for i in used:
+        print(f"  {ZONE_NAMES[i]:<14}" + ''.join(f"{matrix[i, j]:>14,}" for j in used))
+
+
+def throughput(rules, samples, repeat=3):
+    """Best samples/second per rule."""
+    rates = {}
+    for name, rule in rules.items():
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rule(samples)
+            best = min(best, time.perf_counter() - start)
+        rates[name] = len(samples) / best if best > 0 else float('inf')
+    return rates
+
+
+# ========== GOLDEN VECTORS ==========
+
+def golden_rows(max_flags=3):
+    """(part type names, sliced, expected zone name) for GetZoneFromPartType."""
+    names = list(PART_TYPES)
+    masks = [()]
+    for k in range(1, max_flags + 1):
+        masks.extend(itertools.combinations(names, k))
+    masks.append(tuple(names))
+    flags = np.array([sum(PART_TYPES[n] for n in m) for m in masks], dtype=np.uint32)
+    rows = []
+    for sliced in (False, True):
+        zones = classify(flags, np.full(len(flags), sliced), False)
+        rows.extend((m, sliced, ZONE_NAMES[z]) for m, z in zip(masks, zones))
+    return rows
+
+
+def write_golden(path=GOLDEN_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rows = golden_rows()
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("# Generated by _agent/zone_detector.py golden - do not edit\n")
+        f.write("part_type,sliced,zone\n")
+        for mask, sliced, zone in rows:
+            f.write(f"{'|'.join(mask) or 'None'},{'true' if sliced else 'false'},{zone}\n")
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay hit samples through ZoneDetector's rules.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('compare', help="Confusion matrices and throughput of the zone rules")
+    p.add_argument('--samples', help="Hit samples (.csv or .npy); default: synthetic")
+    p.add_argument('--synthetic', type=int, default=1_000_000, help="Synthetic sample count")
+    p.add_argument('--cone', type=float, default=DEFAULT_CONE, help="Throat cone half-angle in degrees")
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--baseline', default='get_zone', help="Rule every other rule is compared against")
+
+    p = sub.add_parser('golden', help="Write the DOT.Tests golden vectors")
+    p.add_argument('--out', default=GOLDEN_PATH)
+
+    args = parser.parse_args()
+
+    if args.command == 'golden':
+        count = write_golden(args.out)
+        print(f"Wrote {count} vectors to {os.path.relpath(args.out, PROJECT_ROOT)}")
+        return
+
+    if args.samples:
+        try:
+            samples = load_samples(args.samples)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        source = args.samples
+    else:
+        samples = synthetic_samples(args.synthetic, np.random.default_rng(args.seed))
+        source = "synthetic"
+    rules = zone_rules(args.cone, args.seed)
+    if args.baseline not in rules:
+        parser.error(f"unknown rule '{args.baseline}'. Expected one of: {', '.join(rules)}")
+
+    print(f"Samples: {len(samples):,} ({source}), throat cone {args.cone:g} deg")
+    zones = {name: rule(samples) for name, rule in rules.items()}
+
+    counts = {name: np.bincount(z, minlength=len(ZONE_NAMES)) for name, z in zones.items()}
+    print(f"\n  {'zone':<14}" + ''.join(f"{name:>14}" for name in rules))
+    for i, zone in enumerate(ZONE_NAMES):
+        print(f"  {zone:<14}" + ''.join(f"{counts[name][i]:>14,}" for name in rules))
+
+    for name in rules:
+        if name != args.baseline:
+            print_confusion(args.baseline, name, confusion(zones[args.baseline], zones[name]))
+
+    print("\nThroughput:")
+    for name, rate in throughput(rules, samples).items():
+        print(f"  {name:<14} {rate / 1e6:>8.1f} M samples/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Benchmark game-load cost of the Text_*.json layouts.
+
+Every language file is parsed when the game starts, so this times what a
+loader does with each candidate layout of all 11 Texts/Text_*.json files:
+decode the UTF-8 bytes, parse the JSON and index textList by ID. Python's
+json module stands in for the game's JSON reader; absolute numbers differ
+(and are several times higher on Quest), but both scale with the bytes and
+tokens in the file, which is what the layouts change.
+
+Layouts:
+  indent4-ascii   json.dump(indent=4) with \\u escapes (the old import output)
+  pretty          the repo files: indent=2, UTF-8 (_build_translations.render)
+  minified-ascii  no whitespace, \\u escapes
+  packed          no whitespace, UTF-8, deduplicated, sorted
+                  (_build_translations.render_packed, what builds ship)
+
+Peak allocation is measured with tracemalloc in a separate pass.
+
+Usage:
+    python _bench_text_formats.py [--scale 10] [--repeat 20]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from _build_translations import GROUP_ID, TEXTS_DIR, render, render_packed
+
+
+def load_sources(scale=1):
+    """{file name: [(full id, text)]} from the repo files, entries repeated scale times."""
+    sources = {}
+    for path in sorted(TEXTS_DIR.glob('Text_*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            items = [(item['id'], item['text']) for item in json.load(f)['textList']]
+        if scale > 1:
+            items = [(f'{text_id}_{k}' if k else text_id, text) for k in range(scale) for text_id, text in items]
+        sources[path.name] = items
+    return sources
+
+
+def _document(items):
+    return {
+        "$type": "ThunderRoad.TextData, ThunderRoad",
+        "id": GROUP_ID,
+        "version": 1,
+        "groupId": GROUP_ID,
+        "textList": [{"id": text_id, "text": text} for text_id, text in items],
+    }
+
+
+def _short_ids(items):
+    prefix = f'{GROUP_ID}.'
+    return [(text_id[len(prefix):] if text_id.startswith(prefix) else text_id, text) for text_id, text in items]
+
+
+LAYOUTS = {
+    'indent4-ascii': lambda items: json.dumps(_document(items), indent=4).encode('utf-8'),
+    'pretty': lambda items: render(_short_ids(items)),
+    'minified-ascii': lambda items: json.dumps(_document(items), separators=(',', ':')).encode('utf-8'),
+    'packed': render_packed,
+}
+
+
+def load(raw):
+    """Stand-in game loader: decode, parse, index by ID."""
+    data = json.loads(raw.decode('utf-8'))
+    return {item['id']: item['text'] for item in data['textList']}
+
+
+def measure(files, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for raw in files:
+            load(raw)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        for raw in files:
+            load(raw)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time loading each Text_*.json layout.")
+    parser.add_argument('--scale', type=int, default=1, help="Repeat every entry this many times")
+    parser.add_argument('--repeat', type=int, default=20, help="Timed runs per layout (best is reported)")
+    args = parser.parse_args()
+
+    sources = load_sources(args.scale)
+    entries = sum(len(items) for items in sources.values())
+    print(f"{len(sources)} files, {entries} entries (scale {args.scale})\n")
+    print(f"{'layout':<16} {'bytes':>10} {'Thai bytes':>11} {'load ms':>9} {'peak KB':>9}")
+
+    reference = None
+    for name, render_layout in LAYOUTS.items():
+        files = {f: render_layout(items) for f, items in sources.items()}
+        parsed = [load(raw) for raw in files.values()]
+        if reference is None:
+            reference = parsed
+        elif parsed != reference:
+            raise SystemExit(f"{name}: loads different texts than {next(iter(LAYOUTS))}")
+        seconds, peak = measure(list(files.values()), args.repeat)
+        size = sum(len(raw) for raw in files.values())
+        thai = len(files.get('Text_Thai.json', b''))
+        print(f"{name:<16} {size:>10} {thai:>11} {seconds * 1000:>9.2f} {peak / 1024:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Benchmark _translation_memory.py on a synthetic 100k-entry memory.
+
+Builds a memory of multi-word option-style labels with 10 translations
+each, persists and reloads it, then times exact, one-word-changed and
+no-match lookups. Fails if the mean lookup exceeds the budget.
+
+Usage:
+    python _bench_translation_memory.py [--entries 100000] [--queries 2000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _translation_memory import TARGET_COLUMNS, TranslationMemory, load_cached, save_memory
+
+BUDGET_MS = 1.0
+# Rough English letter frequencies so trigram statistics resemble real labels
+LETTERS = 'etaoinshrdlcumwfgypbvkjxqz'
+LETTER_WEIGHTS = [12.7, 9.1, 8.2, 7.5, 7.0, 6.7, 6.3, 6.1, 6.0, 4.3, 4.0, 2.8, 2.8, 2.4, 2.4, 2.2, 2.0, 2.0,
+                  1.9, 1.5, 1.0, 0.8, 0.2, 0.2, 0.1, 0.1]
+
+
+def vocabulary(rng, size):
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choices(LETTERS, LETTER_WEIGHTS, k=rng.randint(3, 10))))
+    return sorted(words)
+
+
+def synthetic_memory(rng, words, entries):
+    tm = TranslationMemory()
+    while len(tm) < entries:
+        label = ' '.join(rng.choice(words) for _ in range(rng.randint(2, 5))).title()
+        tm.add(label, {col: f'{label} [{col}]' for col in TARGET_COLUMNS})
+    return tm
+
+
+def time_lookups(tm, queries, **kwargs):
+    times = []
+    found = 0
+    for text in queries:
+        start = time.perf_counter()
+        found += bool(tm.lookup(text, **kwargs))
+        times.append(time.perf_counter() - start)
+    times.sort()
+    mean = sum(times) / len(times) * 1000
+    p99 = times[int(len(times) * 0.99)] * 1000
+    return mean, p99, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the translation memory.")
+    parser.add_argument('--entries', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = vocabulary(rng, 5000)
+    start = time.perf_counter()
+    tm = synthetic_memory(rng, words, args.entries)
+    build_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'tm.pickle'
+        start = time.perf_counter()
+        save_memory(tm, path, 'bench')
+        save_s = time.perf_counter() - start
+        size_mb = path.stat().st_size / 1e6
+        start = time.perf_counter()
+        tm = load_cached(path, 'bench')
+        load_s = time.perf_counter() - start
+
+    print(f"{len(tm)} entries, {len(tm.postings)} trigrams")
+    print(f"build {build_s:.2f} s, save {save_s:.2f} s ({size_mb:.1f} MB), load {load_s:.2f} s\n")
+
+    sample = rng.sample(tm.sources, args.queries)
+    exact = sample
+    fuzzy = []
+    for text in sample:
+        parts = text.split(' ')
+        parts[rng.randrange(len(parts))] = rng.choice(words).title()
+        fuzzy.append(' '.join(parts))
+    miss = [' '.join(rng.choice(words) + 'x' for _ in range(3)) for _ in range(args.queries)]
+
+    print(f"{'queries':<10} {'mean ms':>8} {'p99 ms':>8} {'matched':>8}")
+    worst = 0.0
+    for label, queries, kwargs in [
+        ('exact', exact, {}),
+        ('fuzzy', fuzzy, {}),
+        ('fuzzy/fr', fuzzy, {'language': 'French'}),
+        ('no match', miss, {}),
+    ]:
+        mean, p99, found = time_lookups(tm, queries, **kwargs)
+        worst = max(worst, mean)
+        print(f"{label:<10} {mean:>8.3f} {p99:>8.3f} {found:>8}")
+
+    if worst > BUDGET_MS:
+        print(f"\nFAIL: mean lookup {worst:.3f} ms exceeds {BUDGET_MS} ms")
+        sys.exit(1)
+    print(f"\nOK: every mean lookup under {BUDGET_MS} ms")
+
+
+if __name__ == '__main__':
+    main()
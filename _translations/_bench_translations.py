@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Benchmark _build_translations.py on a synthetic CSV.
+
+Builds a temporary project with N string IDs x 11 languages and times:
+  full      - legacy behaviour: json.dump every language on every run
+  cold      - incremental build with no manifests
+  no-op     - rerun with nothing changed (no file is touched)
+  one cell  - one French string edited (only Text_French.json rewritten)
+  new row   - one string ID appended (every language rewritten)
+
+Usage:
+    python _bench_translations.py [--strings 50000] [--jobs N]
+"""
+import argparse
+import csv
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from _build_translations import GROUP_ID, LANG_MAP, build, read_csv
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Text_ID'] + list(LANG_MAP))
+        writer.writerows(rows)
+
+
+def synthetic_rows(count):
+    columns = list(LANG_MAP)
+    return [[f'Option{i}'] + [f'{col} text for option {i}, ü ß 默认 ค่า' for col in columns]
+            for i in range(count)]
+
+
+def legacy_full(csv_path, texts_dir):
+    """What _generate_all_translations.py used to do: json.dump every language."""
+    entries = read_csv(Path(csv_path).read_bytes(), list(LANG_MAP))
+    for col, suffix in LANG_MAP.items():
+        data = {
+            "$type": "ThunderRoad.TextData, ThunderRoad",
+            "id": GROUP_ID,
+            "version": 1,
+            "groupId": GROUP_ID,
+            "textList": [{"id": f"{GROUP_ID}.{text_id}", "text": text} for text_id, text in entries[col]],
+        }
+        with open(texts_dir / f'Text_{suffix}.json', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    if results is None:
+        written = len(LANG_MAP)
+    else:
+        written = sum(1 for r in results if r['status'] == 'written')
+    print(f"{label:<10} {elapsed * 1000:>10.1f} ms   {written:>2} files written")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the incremental translation build.")
+    parser.add_argument('--strings', type=int, default=50000, help="String IDs in the synthetic CSV")
+    parser.add_argument('--jobs', type=int, default=None, help="Writer threads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path = tmp / '_translations.csv'
+        texts_dir = tmp / 'Texts'
+        cache_dir = tmp / '.cache'
+        texts_dir.mkdir()
+        rows = synthetic_rows(args.strings)
+        write_csv(csv_path, rows)
+        size_mb = csv_path.stat().st_size / 1e6
+        print(f"{args.strings} strings x {len(LANG_MAP)} languages ({size_mb:.1f} MB CSV)\n")
+
+        def run():
+            return build(csv_path=csv_path, texts_dir=texts_dir, cache_dir=cache_dir, jobs=args.jobs)
+
+        timed('full', lambda: legacy_full(csv_path, texts_dir))
+        timed('cold', run)
+        mtimes = {p.name: p.stat().st_mtime_ns for p in texts_dir.iterdir()}
+        timed('no-op', run)
+        if any(p.stat().st_mtime_ns != mtimes[p.name] for p in texts_dir.iterdir()):
+            print("FAIL: no-op build touched a file")
+
+        rows[args.strings // 2][2] = 'Texte modifié'
+        write_csv(csv_path, rows)
+        timed('one cell', run)
+        untouched = [p.name for p in texts_dir.iterdir()
+                     if p.name != 'Text_French.json' and p.stat().st_mtime_ns == mtimes[p.name]]
+        print(f"{'':<10} {len(untouched)} of {len(LANG_MAP) - 1} other files kept their mtime")
+
+        rows.append([f'Option{args.strings}'] + ['new'] * len(LANG_MAP))
+        write_csv(csv_path, rows)
+        timed('new row', run)
+
+
+if __name__ == '__main__':
+    main()
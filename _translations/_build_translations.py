@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""Incremental build of Texts/Text_*.json from _translations.csv.
+
+Each language keeps a manifest in .cache/ with the CSV hash, a digest of
+its (string ID, text) column, and the size/mtime of the JSON it last wrote,
+plus a content hash per string ID used to report what changed. An unchanged
+CSV is not even parsed, and one whose size/mtime match the last build is
+not even read or hashed. Otherwise only languages whose entries changed (or
+whose JSON was touched by hand) are re-rendered, and a file is only
+rewritten when its bytes differ, so unchanged files keep their bytes and
+mtimes. Writes are atomic (temp file + os.replace) and run on a thread
+pool, one task per language.
+
+Usage:
+    python _build_translations.py [--force] [--jobs N] [--lang French,German]
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+BASE = Path(__file__).parent
+sys.path.insert(0, str(BASE.parent / '_agent'))
+
+import profiling  # noqa: E402
+from registry import LANG_MAP, LOCALIZATION_GROUP_ID as GROUP_ID  # noqa: E402,F401
+
+INPUT = BASE / '_translations.csv'
+TEXTS_DIR = BASE / 'Texts'
+CACHE_DIR = BASE / '.cache'
+MANIFEST_VERSION = 2
+
+
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _digest(data):
+    # Imported here, like csv and tempfile below: an up-to-date build needs none of them
+    import hashlib
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def read_csv(csv_bytes, columns):
+    """Parse the CSV once into {column: [(text_id, text), ...]} in row order.
+
+    Empty cells and unresolved GOOGLETRANSLATE formulas are not shipped.
+    """
+    import csv
+    import io
+    reader = csv.reader(io.StringIO(csv_bytes.decode('utf-8')))
+    header = next(reader, [])
+    index = {name: i for i, name in enumerate(header)}
+    id_col = index.get('Text_ID')
+    if id_col is None:
+        return {col: [] for col in columns}
+    rows = [row for row in reader if len(row) > id_col and row[id_col]]
+    if len({row[id_col] for row in rows}) != len(rows):
+        # A repeated Text_ID keeps its first position and its last row's texts
+        rows = list({row[id_col]: row for row in rows}.values())
+    entries = {}
+    for col in columns:
+        i = index.get(col)
+        if i is None:
+            entries[col] = []
+            continue
+        entries[col] = [(row[id_col], row[i]) for row in rows
+                        if len(row) > i and row[i] and not row[i].startswith('=GOOGLETRANSLATE')]
+    return entries
+
+
+def render(entries):
+    """Serialize one language exactly as json.dump(indent=2, ensure_ascii=False) would.
+
+    The layout is fixed, so only the strings go through the (C) JSON encoder;
+    json.dumps with indent falls back to the much slower pure-Python encoder.
+    """
+    head = (
+        '{\n'
+        '  "$type": "ThunderRoad.TextData, ThunderRoad",\n'
+        f'  "id": {_encode(GROUP_ID)},\n'
+        '  "version": 1,\n'
+        f'  "groupId": {_encode(GROUP_ID)},\n'
+        '  "textList": '
+    )
+    if not entries:
+        return (head + '[]\n}').encode('utf-8')
+    items = ',\n'.join(
+        f'    {{\n      "id": {_encode(f"{GROUP_ID}.{text_id}")},\n      "text": {_encode(text)}\n    }}'
+        for text_id, text in entries)
+    return (head + '[\n' + items + '\n  ]\n}').encode('utf-8')
+
+
+_encode_packed = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+def render_packed(text_list):
+    """Serialize full-ID (id, text) pairs in the shipped layout: minified UTF-8,
+    one entry per ID (the last one wins, as in game), sorted by ID.
+
+    "$type" stays the first key: Newtonsoft only honours type metadata that
+    comes before the other properties.
+    """
+    unique = dict(text_list)
+    head = (
+        '{"$type":"ThunderRoad.TextData, ThunderRoad",'
+        f'"id":{_encode_packed(GROUP_ID)},"version":1,"groupId":{_encode_packed(GROUP_ID)},"textList":['
+    )
+    items = ','.join(f'{{"id":{_encode_packed(text_id)},"text":{_encode_packed(unique[text_id])}}}'
+                     for text_id in sorted(unique))
+    return (head + items + ']}').encode('utf-8')
+
+
+def column_digest(entries):
+    """One hash over every (id, text) pair in order; equal digests mean identical output."""
+    return _digest('\x1e'.join(f'{text_id}\x1f{text}' for text_id, text in entries).encode('utf-8'))
+
+
+def entry_hashes(entries):
+    return {text_id: _digest(text.encode('utf-8')) for text_id, text in entries}
+
+
+def atomic_write(path, data):
+    """Write data to path via a temp file in the same directory and os.replace."""
+    import tempfile
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _read_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, obj):
+    atomic_write(path, json.dumps(obj, ensure_ascii=False).encode('utf-8'))
+
+
+def load_manifest(cache_dir, suffix):
+    """Small per-language header: CSV hash, column digest, output size/mtime."""
+    manifest = _read_json(cache_dir / f'manifest_{suffix}.json')
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def _stat_key(path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _output_untouched(manifest, json_path):
+    return manifest is not None and manifest.get('stat') == _stat_key(json_path)
+
+
+def build_language(suffix, entries, source_hash, texts_dir, cache_dir, force=False):
+    """Bring Text_<suffix>.json up to date. Returns a result dict for reporting."""
+    with profiling.span('build language', language=suffix):
+        return _build_language(suffix, entries, source_hash, texts_dir, cache_dir, force)
+
+
+def _build_language(suffix, entries, source_hash, texts_dir, cache_dir, force):
+    json_path = texts_dir / f'Text_{suffix}.json'
+    manifest = load_manifest(cache_dir, suffix)
+    digest = column_digest(entries)
+    result = {'language': suffix, 'entries': len(entries), 'changed': [],
+              'removed': [], 'status': 'unchanged'}
+
+    if (not force and manifest is not None and manifest.get('digest') == digest
+            and _output_untouched(manifest, json_path)):
+        if manifest.get('source') != source_hash:
+            manifest['source'] = source_hash
+            _write_json(cache_dir / f'manifest_{suffix}.json', manifest)
+        return result
+
+    # Per-entry hashes are only needed (and only loaded) when the column changed
+    hashes_path = cache_dir / f'entries_{suffix}.json'
+    old = _read_json(hashes_path) or {}
+    hashes = entry_hashes(entries)
+    result['changed'] = [k for k, v in hashes.items() if old.get(k) != v]
+    result['removed'] = [k for k in old if k not in hashes]
+
+    with profiling.span('render', language=suffix):
+        data = render(entries)
+    try:
+        current = json_path.read_bytes()
+    except OSError:
+        current = None
+    if current != data:
+        with profiling.span('write', language=suffix):
+            atomic_write(json_path, data)
+        result['status'] = 'written'
+
+    _write_json(hashes_path, hashes)
+    _write_json(cache_dir / f'manifest_{suffix}.json',
+                {'version': MANIFEST_VERSION, 'source': source_hash, 'digest': digest,
+                 'entries': len(entries), 'stat': _stat_key(json_path)})
+    return result
+
+
+def build(columns=None, csv_path=INPUT, texts_dir=TEXTS_DIR, cache_dir=CACHE_DIR,
+          force=False, jobs=None):
+    """Build the requested CSV columns (default: every language). Returns per-language results."""
+    columns = list(columns or LANG_MAP)
+    texts_dir = Path(texts_dir)
+    cache_dir = Path(cache_dir)
+    texts_dir.mkdir(exist_ok=True)
+    cache_dir.mkdir(exist_ok=True)
+
+    # The CSV hash is reused while the CSV's size/mtime match the last build's
+    csv_path = Path(csv_path)
+    source_key = [str(csv_path.resolve()), _stat_key(csv_path)]
+    stamp_path = cache_dir / 'source.json'
+    stamp = _read_json(stamp_path)
+    if not force and isinstance(stamp, dict) and source_key[1] and stamp.get('key') == source_key:
+        csv_bytes, source_hash = None, stamp['hash']
+    else:
+        csv_bytes = csv_path.read_bytes()
+        source_hash = _digest(csv_bytes)
+        _write_json(stamp_path, {'key': source_key, 'hash': source_hash})
+
+    # Fast path: same CSV and every output untouched since the last build
+    if not force:
+        results = []
+        for col in columns:
+            suffix = LANG_MAP[col]
+            manifest = load_manifest(cache_dir, suffix)
+            if manifest is None or manifest.get('source') != source_hash:
+                break
+            if not _output_untouched(manifest, texts_dir / f'Text_{suffix}.json'):
+                break
+            results.append({'language': suffix, 'entries': manifest['entries'],
+                            'changed': [], 'removed': [], 'status': 'unchanged'})
+        else:
+            return results
+
+    if csv_bytes is None:
+        csv_bytes = csv_path.read_bytes()
+    with profiling.span('parse csv'):
+        entries = read_csv(csv_bytes, columns)
+    # Imported here: the unchanged-CSV fast path above never needs a pool (~10 ms to import)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='language') as pool:
+        futures = [pool.submit(build_language, LANG_MAP[col], entries[col], source_hash,
+                               texts_dir, cache_dir, force)
+                   for col in columns]
+        return [f.result() for f in futures]
+
+
+def print_results(results):
+    for r in results:
+        if r['status'] == 'written':
+            detail = f"{len(r['changed'])} changed, {len(r['removed'])} removed"
+            print(f"Generated Text_{r['language']}.json: {r['entries']} entries ({detail})")
+        else:
+            print(f"Unchanged Text_{r['language']}.json: {r['entries']} entries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally build Texts/Text_*.json from the CSV.")
+    parser.add_argument('--force', action='store_true', help="Ignore manifests and re-render every language")
+    parser.add_argument('--jobs', type=int, default=None, help="Writer threads (default: Python's default)")
+    parser.add_argument('--lang', default='', help="Comma separated CSV columns (default: all)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    columns = [c.strip() for c in args.lang.split(',') if c.strip()] or None
+    unknown = [c for c in columns or [] if c not in LANG_MAP]
+    if unknown:
+        parser.error(f"unknown language column(s): {', '.join(unknown)}")
+    with profiling.session(args, 'build_translations'):
+        print_results(build(columns, force=args.force, jobs=args.jobs))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,42 +1,42 @@
 # -*- coding: utf-8 -*-
 """Export DOT translation strings to CSV with GOOGLETRANSLATE formulas."""
+import argparse
 import json
 import csv
+import sys
 from pathlib import Path
 
 BASE = Path(__file__).parent
 OUTPUT = BASE / '_translations.csv'
+sys.path.insert(0, str(BASE.parent / '_agent'))
 
-LANGUAGES = [
-    ('en', 'English'),
-    ('fr', 'French'),
-    ('de', 'German'),
-    ('es', 'Spanish'),
-    ('it', 'Italian'),
-    ('pt', 'Portuguese'),
-    ('ja', 'Japanese'),
-    ('ko', 'Korean'),
-    ('zh-CN', 'Chinese_Simplified'),
-    ('zh-TW', 'Chinese_Traditional'),
-    ('th', 'Thai'),
-]
-
-def load_english_texts():
-    path = BASE / 'Texts' / 'Text_English.json'
+import profiling  # noqa: E402
+import registry  # noqa: E402
+
+# (Google Translate code, CSV column), English first
+LANGUAGES = [(code, column) for column, _, code in registry.LANGUAGES]
+
+def load_english_texts(path=BASE / 'Texts' / 'Text_English.json'):
     with open(path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     entries = []
-    for group in data.get('textGroups', []):
-        for text_item in group.get('texts', []):
-            entries.append({
-                'id': text_item.get('id', ''),
-                'text': text_item.get('text', '')
-            })
+    # Generated files carry a flat textList; older ones nested textGroups/texts
+    items = data.get('textList')
+    if items is None:
+        items = [t for group in data.get('textGroups', []) for t in group.get('texts', [])]
+    prefix = f"{data.get('groupId', '')}."
+    for text_item in items:
+        text_id = text_item.get('id', '')
+        if prefix != '.' and text_id.startswith(prefix):
+            text_id = text_id[len(prefix):]
+        entries.append({
+            'id': text_id,
+            'text': text_item.get('text', '')
+        })
     return entries
 
-def main():
-    entries = load_english_texts()
-    with open(OUTPUT, 'w', encoding='utf-8', newline='') as f:
+def export_csv(entries, output=OUTPUT):
+    with open(output, 'w', encoding='utf-8', newline='') as f:
         writer = csv.writer(f)
         headers = ['Text_ID', 'English'] + [lang[1] for lang in LANGUAGES[1:]]
         writer.writerow(headers)
@@ -45,6 +45,17 @@ def main():
             for lang_code, _ in LANGUAGES[1:]:
                 row.append(f'=GOOGLETRANSLATE(B{row_num},"en","{lang_code}")')
             writer.writerow(row)
+
+def main():
+    parser = argparse.ArgumentParser(description="Export English texts to the translation CSV.")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+
+    with profiling.session(args, 'export_translations'):
+        with profiling.span('load english'):
+            entries = load_english_texts()
+        with profiling.span('write csv'):
+            export_csv(entries)
     print(f"Exported {len(entries)} strings to {OUTPUT}")
 
 if __name__ == '__main__':
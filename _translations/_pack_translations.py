@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Pack Texts/Text_*.json into the minified layout shipped with a build.
+
+The pretty-printed files in Texts/ stay the editable, diffable source. The
+packed copies are minified UTF-8 (no \\u escapes, which triple the size of
+Thai/CJK text), hold one entry per ID and are sorted by ID, so the game's
+JSON reader has the fewest bytes and tokens to get through at load. Files
+are only rewritten when their bytes change.
+
+Usage:
+    python _pack_translations.py OUT_DIR
+    python _pack_translations.py OUT_DIR --check   # exit 1 if OUT_DIR is stale
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from _build_translations import TEXTS_DIR, atomic_write, render_packed
+
+
+def packed_bytes(path):
+    """Packed form of one pretty Text_*.json file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return render_packed((item['id'], item['text']) for item in data.get('textList', []))
+
+
+def pack(out_dir, texts_dir=TEXTS_DIR, check=False):
+    """Pack every Text_*.json into out_dir. Returns per-file results."""
+    texts_dir, out_dir = Path(texts_dir), Path(out_dir)
+    if not check:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for src in sorted(texts_dir.glob('Text_*.json')):
+        data = packed_bytes(src)
+        dest = out_dir / src.name
+        current = dest.read_bytes() if dest.exists() else None
+        stale = current != data
+        if stale and not check:
+            atomic_write(dest, data)
+        results.append({'file': src.name, 'source_bytes': src.stat().st_size,
+                        'packed_bytes': len(data), 'stale': stale})
+    return results
+
+
+def print_results(results, check=False):
+    total_src = total_packed = 0
+    for r in results:
+        total_src += r['source_bytes']
+        total_packed += r['packed_bytes']
+        if check:
+            status = 'STALE' if r['stale'] else 'ok'
+        else:
+            status = 'written' if r['stale'] else 'unchanged'
+        print(f"{r['file']:<30} {r['source_bytes']:>8} -> {r['packed_bytes']:>8} bytes  {status}")
+    if total_src:
+        print(f"{'total':<30} {total_src:>8} -> {total_packed:>8} bytes  "
+              f"({(1 - total_packed / total_src) * 100:.0f}% smaller)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write minified Text_*.json files for a build.")
+    parser.add_argument('out_dir', help="Directory for the packed files (e.g. a build's Texts folder)")
+    parser.add_argument('--check', action='store_true', help="Only report whether out_dir is up to date")
+    args = parser.parse_args()
+
+    results = pack(args.out_dir, check=args.check)
+    print_results(results, args.check)
+    if args.check and any(r['stale'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+"""Offline translation memory for _translations.csv.
+
+Builds a memory of English source strings -> translations from
+_translations.csv and Texts/Text_*.json, indexed by character trigrams.
+Lookups return the exact match (if any) and fuzzy matches ranked by Dice
+similarity over trigram sets, so a new label like "Slash Multiplier" finds
+"Slash Mult" and "Extreme Damage" finds the "Extreme" preset label.
+
+Fuzzy search only probes the rarest query trigrams (any match above the
+threshold must contain at least one of them), prunes candidates that cannot
+reach the threshold, and counts the remaining grams with binary searches on
+sorted NumPy postings, which keeps the mean lookup under 1 ms on 100k
+entries (_bench_translation_memory.py).
+The index is pickled to .cache/ keyed by the hash of its source files.
+
+Usage:
+    python _translation_memory.py lookup "Slash Multiplier" [--lang French]
+    python _translation_memory.py prefill [--min-score 0.7] [--write]
+
+prefill fills empty and =GOOGLETRANSLATE cells that have an exact (1.0)
+match and writes _tm_review.csv listing every suggestion with its score.
+Fuzzy suggestions are flagged there for review and never reach the CSV, so
+_build_translations.py cannot ship them unreviewed.
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import math
+import os
+import pickle
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from _build_translations import LANG_MAP, GROUP_ID
+
+BASE = Path(__file__).parent
+INPUT = BASE / '_translations.csv'
+TEXTS_DIR = BASE / 'Texts'
+CACHE_PATH = BASE / '.cache' / 'translation_memory.pickle'
+REVIEW_PATH = BASE / '_tm_review.csv'
+INDEX_VERSION = 2
+
+SOURCE_COLUMN = 'English'
+TARGET_COLUMNS = [col for col in LANG_MAP if col != SOURCE_COLUMN]
+FORMULA_PREFIX = '=GOOGLETRANSLATE'
+
+DEFAULT_MIN_SCORE = 0.6
+GRAM = 3
+
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize(text):
+    return _SPACE_RE.sub(' ', text.strip().lower())
+
+
+def grams(norm):
+    """Set of character trigrams of a normalized string, padded with spaces."""
+    padded = f' {norm} '
+    return {padded[i:i + GRAM] for i in range(max(1, len(padded) - GRAM + 1))}
+
+
+class TranslationMemory:
+    """English source strings with their translations and a trigram index.
+
+    Postings are sorted int32 arrays of entry indices. Strings added after
+    the last lookup sit in plain lists until the next lookup freezes them.
+    """
+
+    def __init__(self):
+        self.sources = []       # original English text per entry
+        self.norms = []         # normalized English text per entry
+        self.targets = []       # {csv column: text} per entry
+        self.exact = {}         # normalized English -> entry index
+        self.postings = {}      # trigram -> np.int32 array of entry indices
+        self.gram_counts = np.zeros(0, dtype=np.int32)
+        self._pending = {}      # trigram -> [entry index] not yet in postings
+        self._pending_counts = []
+
+    def __len__(self):
+        return len(self.sources)
+
+    def add(self, source, translations):
+        """Add or merge a source string. Existing translations are kept."""
+        norm = normalize(source)
+        if not norm:
+            return
+        idx = self.exact.get(norm)
+        if idx is not None:
+            target = self.targets[idx]
+            for col, text in translations.items():
+                target.setdefault(col, text)
+            return
+        idx = len(self.sources)
+        self.sources.append(source)
+        self.norms.append(norm)
+        self.targets.append(dict(translations))
+        self.exact[norm] = idx
+        entry_grams = grams(norm)
+        self._pending_counts.append(len(entry_grams))
+        for g in entry_grams:
+            self._pending.setdefault(g, []).append(idx)
+
+    def freeze(self):
+        """Merge pending entries into the posting arrays."""
+        if not self._pending_counts:
+            return
+        for g, ids in self._pending.items():
+            new = np.asarray(ids, dtype=np.int32)
+            old = self.postings.get(g)
+            self.postings[g] = new if old is None else np.concatenate((old, new))
+        self.gram_counts = np.concatenate(
+            (self.gram_counts, np.asarray(self._pending_counts, dtype=np.int32)))
+        self._pending = {}
+        self._pending_counts = []
+
+    def _match(self, idx, score, exact):
+        return {'score': round(float(score), 4), 'exact': exact, 'source': self.sources[idx],
+                'translations': self.targets[idx]}
+
+    def lookup(self, text, language=None, limit=3, min_score=DEFAULT_MIN_SCORE):
+        """Best matches for an English string, highest score first.
+
+        language restricts results to entries that have a translation in
+        that CSV column. The exact match, if present, always comes first.
+        """
+        norm = normalize(text)
+        if not norm:
+            return []
+        results = []
+        exact_idx = self.exact.get(norm)
+        if exact_idx is not None and (language is None or language in self.targets[exact_idx]):
+            results.append(self._match(exact_idx, 1.0, True))
+            if limit == 1:
+                return results
+        self.freeze()
+
+        query = grams(norm)
+        q = len(query)
+        postings = self.postings
+        known = sorted((postings[g] for g in query if g in postings), key=len)
+        if not known:
+            return results
+        # Dice >= t needs overlap >= t * q / (2 - t), so a match must contain
+        # at least one of the len(known) - min_overlap + 1 rarest grams
+        min_overlap = max(1, math.ceil(min_score * q / (2.0 - min_score) - 1e-9))
+        probe_count = len(known) - min_overlap + 1
+        if probe_count <= 0:
+            return results
+        probes, rest = known[:probe_count], known[probe_count:]
+
+        cand, overlap = np.unique(np.concatenate(probes), return_counts=True)
+        n = self.gram_counts[cand]
+        # Drop candidates that cannot reach min_score even if they hold every other gram
+        best = np.minimum(overlap + len(rest), n)
+        keep = 2.0 * best >= min_score * (q + n)
+        cand, overlap, n = cand[keep], overlap[keep], n[keep]
+        for posting in rest:
+            if not len(cand):
+                break
+            pos = np.searchsorted(posting, cand)
+            np.minimum(pos, len(posting) - 1, out=pos)
+            overlap += posting[pos] == cand
+
+        scores = 2.0 * overlap / (q + n)
+        keep = scores >= min_score
+        if exact_idx is not None:
+            keep &= cand != exact_idx
+        cand, scores = cand[keep], scores[keep]
+        # Highest score first, ties by insertion order
+        order = np.lexsort((cand, -scores))
+        wanted = limit - len(results)
+        for i in order:
+            if wanted <= 0:
+                break
+            idx = int(cand[i])
+            if language is not None and language not in self.targets[idx]:
+                continue
+            results.append(self._match(idx, scores[i], False))
+            wanted -= 1
+        return results
+
+    def state(self):
+        self.freeze()
+        return (self.sources, self.norms, self.targets, self.gram_counts, self.postings)
+
+    @classmethod
+    def from_state(cls, state):
+        tm = cls()
+        tm.sources, tm.norms, tm.targets, tm.gram_counts, tm.postings = state
+        tm.exact = {norm: i for i, norm in enumerate(tm.norms)}
+        return tm
+
+
+def is_translated(value):
+    return bool(value) and not value.startswith(FORMULA_PREFIX)
+
+
+def read_rows(csv_path=INPUT):
+    """Header and rows of the CSV, plus whether the file ended with a newline."""
+    raw = Path(csv_path).read_text(encoding='utf-8')
+    rows = list(csv.reader(io.StringIO(raw)))
+    return rows[0] if rows else [], rows[1:], raw.endswith('\n')
+
+
+def _json_texts(texts_dir):
+    """{csv column: {text_id: text}} from the generated Text_*.json files."""
+    texts = {}
+    prefix = f'{GROUP_ID}.'
+    for col, suffix in LANG_MAP.items():
+        path = Path(texts_dir) / f'Text_{suffix}.json'
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        column = texts[col] = {}
+        for item in data.get('textList', []):
+            text_id = item.get('id', '')
+            if text_id.startswith(prefix):
+                text_id = text_id[len(prefix):]
+            if text_id and is_translated(item.get('text', '')):
+                column[text_id] = item['text']
+    return texts
+
+
+def build_memory(csv_path=INPUT, texts_dir=TEXTS_DIR):
+    """Memory from the CSV (preferred) and the shipped Text_*.json corpora."""
+    by_id = {}
+    header, rows, _ = read_rows(csv_path)
+    index = {name: i for i, name in enumerate(header)}
+    id_col = index.get('Text_ID')
+    if id_col is not None:
+        for row in rows:
+            if len(row) <= id_col or not row[id_col]:
+                continue
+            by_id[row[id_col]] = {col: row[i] for col, i in index.items()
+                                  if col in LANG_MAP and i < len(row) and is_translated(row[i])}
+    for col, column in _json_texts(texts_dir).items():
+        for text_id, text in column.items():
+            by_id.setdefault(text_id, {}).setdefault(col, text)
+
+    tm = TranslationMemory()
+    for texts in by_id.values():
+        source = texts.get(SOURCE_COLUMN)
+        if source:
+            tm.add(source, {col: text for col, text in texts.items() if col != SOURCE_COLUMN})
+    return tm
+
+
+def source_key(csv_path=INPUT, texts_dir=TEXTS_DIR):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'v{INDEX_VERSION}'.encode())
+    paths = [Path(csv_path)] + [Path(texts_dir) / f'Text_{s}.json' for s in LANG_MAP.values()]
+    for path in paths:
+        h.update(path.name.encode('utf-8'))
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            h.update(b'\0missing')
+    return h.hexdigest()
+
+
+def save_memory(tm, path, key):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'version': INDEX_VERSION, 'key': key, 'state': tm.state()}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_cached(path, key):
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != INDEX_VERSION or data.get('key') != key:
+        return None
+    return TranslationMemory.from_state(data['state'])
+
+
+def load_memory(csv_path=INPUT, texts_dir=TEXTS_DIR, cache_path=CACHE_PATH):
+    """Load the persisted index, rebuilding it only when a source file changed."""
+    key = source_key(csv_path, texts_dir)
+    tm = load_cached(cache_path, key)
+    if tm is None:
+        tm = build_memory(csv_path, texts_dir)
+        save_memory(tm, cache_path, key)
+    return tm
+
+
+def prefill(tm, header, rows, min_score=DEFAULT_MIN_SCORE):
+    """Fill empty/formula cells with exact matches in place. Returns review records.
+
+    Fuzzy matches are only reported (Review = yes); their cells are left as
+    they were.
+    """
+    index = {name: i for i, name in enumerate(header)}
+    id_col = index.get('Text_ID')
+    src_col = index.get(SOURCE_COLUMN)
+    if id_col is None or src_col is None:
+        return []
+    review = []
+    for row in rows:
+        if len(row) <= src_col or not row[src_col]:
+            continue
+        for col in TARGET_COLUMNS:
+            i = index.get(col)
+            if i is None:
+                continue
+            if i < len(row) and is_translated(row[i]):
+                continue
+            matches = tm.lookup(row[src_col], language=col, limit=1, min_score=min_score)
+            if not matches:
+                continue
+            match = matches[0]
+            suggestion = match['translations'][col]
+            if match['exact']:
+                while len(row) <= i:
+                    row.append('')
+                row[i] = suggestion
+            review.append({
+                'Text_ID': row[id_col],
+                'Language': col,
+                'Score': f"{match['score']:.3f}",
+                'Review': 'no' if match['exact'] else 'yes',
+                'English': row[src_col],
+                'Matched_English': match['source'],
+                'Suggestion': suggestion,
+            })
+    return review
+
+
+def write_rows(path, header, rows, trailing_newline):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(rows)
+    text = out.getvalue()
+    if not trailing_newline:
+        text = text[:-1]
+    Path(path).write_text(text, encoding='utf-8', newline='')
+
+
+def write_review(path, review):
+    fields = ['Text_ID', 'Language', 'Score', 'Review', 'English', 'Matched_English', 'Suggestion']
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(review)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline translation memory for _translations.csv.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_lookup = sub.add_parser('lookup', help="Show matches for English strings")
+    p_lookup.add_argument('text', nargs='+')
+    p_lookup.add_argument('--lang', default=None, help="Only entries translated into this CSV column")
+    p_lookup.add_argument('--limit', type=int, default=3)
+    p_lookup.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE)
+
+    p_fill = sub.add_parser('prefill', help="Fill untranslated CSV cells from the memory")
+    p_fill.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE)
+    p_fill.add_argument('--write', action='store_true', help="Write exact-match cells back to the CSV")
+    p_fill.add_argument('--review', default=str(REVIEW_PATH), help="Review report path")
+
+    sub.add_parser('rebuild', help="Rebuild the persisted index")
+    args = parser.parse_args()
+
+    if args.command == 'rebuild':
+        tm = build_memory()
+        save_memory(tm, CACHE_PATH, source_key())
+        print(f"Indexed {len(tm)} source strings, {len(tm.postings)} trigrams -> {CACHE_PATH}")
+        return
+
+    tm = load_memory()
+    if args.command == 'lookup':
+        for text in args.text:
+            matches = tm.lookup(text, language=args.lang, limit=args.limit, min_score=args.min_score)
+            print(f"{text}: {len(matches)} match(es)")
+            for m in matches:
+                kind = 'exact' if m['exact'] else 'fuzzy'
+                shown = {args.lang: m['translations'][args.lang]} if args.lang else m['translations']
+                print(f"  {m['score']:.3f} {kind:<5} {m['source']!r} {shown}")
+        return
+
+    header, rows, trailing_newline = read_rows()
+    review = prefill(tm, header, rows, args.min_score)
+    flagged = sum(1 for r in review if r['Review'] == 'yes')
+    print(f"{len(review) - flagged} cell(s) filled from exact matches, {flagged} fuzzy suggestion(s) for review")
+    if review:
+        write_review(args.review, review)
+        print(f"Review report: {args.review}")
+    if args.write and len(review) > flagged:
+        write_rows(INPUT, header, rows, trailing_newline)
+        print(f"Updated {INPUT}")
+
+
+if __name__ == '__main__':
+    main()